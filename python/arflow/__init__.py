@@ -1,17 +1,45 @@
 """.. include:: ../README.md"""  # noqa: D415
 
 # Imported symbols are private by default. By aliasing them here, we make it clear that they are part of the public API.
+from arflow._admission import AdmissionController as AdmissionController
+from arflow._admission import RateLimit as RateLimit
+from arflow._aio import AsyncARFlowServicer as AsyncARFlowServicer
+from arflow._aio import run_async_server as run_async_server
+from arflow._batches import ColorBatch as ColorBatch
+from arflow._batches import DepthBatch as DepthBatch
+from arflow._batches import TransformBatch as TransformBatch
 from arflow._core import ARFlowServicer as ARFlowServicer
 from arflow._core import run_server as run_server
+from arflow._decode_pool import DecodePool as DecodePool
+from arflow._decoded_frames import DecodedFrame as DecodedFrame
+from arflow._decoded_frames import DecodedFrameCache as DecodedFrameCache
+from arflow._hook_executor import HookExecutor as HookExecutor
+from arflow._hook_executor import HookStats as HookStats
+from arflow._ingest_queue import IngestQueue as IngestQueue
+from arflow._metrics import ARFlowMetrics as ARFlowMetrics
+from arflow._point_store import PointChunk as PointChunk
+from arflow._point_store import PointCloudChanges as PointCloudChanges
+from arflow._point_store import PointCloudStore as PointCloudStore
 from arflow._session_stream import (
     SessionStream as SessionStream,
 )
+from arflow._sharding import ShardedARFlowServicer as ShardedARFlowServicer
+from arflow._sharding import run_sharded_server as run_sharded_server
+from arflow._tracing import Tracer as Tracer
+from arflow._tracing import tracer as tracer
+from arflow._types import DepthCodec as DepthCodec
+from arflow._types import OverflowPolicy as OverflowPolicy
+from arflow._types import YuvLayout as YuvLayout
 from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame as ARFrame
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import (
+    AudioChunkFrame as AudioChunkFrame,
+)
 from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame as AudioFrame
 from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame as ColorFrame
 from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame as DepthFrame
 from cakelab.arflow_grpc.v1.device_pb2 import Device as Device
 from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame as GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame as ImuBatchFrame
 from cakelab.arflow_grpc.v1.mesh_detection_frame_pb2 import (
     MeshDetectionFrame as MeshDetectionFrame,
 )
@@ -29,7 +57,11 @@ __docformat__ = "google"  # Should match Ruff docstring format in ../pyproject.t
 # https://pdoc.dev/docs/pdoc.html#exclude-submodules-from-being-documented
 __all__ = [
     "run_server",
+    "run_async_server",
+    "run_sharded_server",
     "ARFlowServicer",
+    "AsyncARFlowServicer",
+    "ShardedARFlowServicer",
     "ARFrame",
     "TransformFrame",
     "ColorFrame",
@@ -39,7 +71,29 @@ __all__ = [
     "PlaneDetectionFrame",
     "PointCloudDetectionFrame",
     "MeshDetectionFrame",
+    "ImuBatchFrame",
+    "AudioChunkFrame",
+    "TransformBatch",
+    "ColorBatch",
+    "DepthBatch",
+    "DepthCodec",
+    "YuvLayout",
+    "DecodedFrame",
+    "DecodedFrameCache",
+    "DecodePool",
+    "PointCloudStore",
+    "PointCloudChanges",
+    "PointChunk",
     "SessionStream",
+    "IngestQueue",
+    "OverflowPolicy",
+    "AdmissionController",
+    "RateLimit",
+    "ARFlowMetrics",
+    "HookExecutor",
+    "HookStats",
+    "Tracer",
+    "tracer",
     "Session",
     "Device",
 ]
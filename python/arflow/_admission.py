@@ -0,0 +1,255 @@
+"""Token-bucket admission control for incoming frames."""
+
+import threading
+import time
+
+from grpc_interceptor.exceptions import ResourceExhausted
+
+RETRY_PUSHBACK_METADATA_KEY = "grpc-retry-pushback-ms"
+"""Trailing metadata key of the retry-after hint, in milliseconds, sent with rejected calls.
+
+gRPC clients with a retry policy wait this long before retrying.
+"""
+
+DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH = 256 * 1024 * 1024
+"""Largest request in bytes that the servers receive by default."""
+
+_REQUEST_ENVELOPE_BYTES = 64 * 1024
+"""Room for the session, the device, and the framing of a request around its frames."""
+
+
+class RateLimit:
+    """Sustained rate of frames and bytes that a device, a session, or the whole server may send."""
+
+    def __init__(
+        self,
+        frames_per_second: float | None = None,
+        bytes_per_second: float | None = None,
+        burst_seconds: float = 1.0,
+    ) -> None:
+        """Initialize the rate limit.
+
+        Args:
+            frames_per_second: Sustained number of frames per second. `None` does not limit frames.
+            bytes_per_second: Sustained number of request bytes per second. `None` does not limit bytes.
+            burst_seconds: How many seconds of the sustained rate may arrive at once. A single
+                request larger than the burst is never admitted.
+
+        Raises:
+            ValueError: If a rate or `burst_seconds` is not positive.
+        """
+        if frames_per_second is not None and frames_per_second <= 0:
+            raise ValueError("Frames per second must be positive.")
+        if bytes_per_second is not None and bytes_per_second <= 0:
+            raise ValueError("Bytes per second must be positive.")
+        if burst_seconds <= 0:
+            raise ValueError("Burst seconds must be positive.")
+        self.frames_per_second = frames_per_second
+        self.bytes_per_second = bytes_per_second
+        self.burst_seconds = burst_seconds
+
+
+class RateLimited(ResourceExhausted):
+    """A call was rejected because it exceeds a rate limit, and may be retried later."""
+
+    def __init__(self, details: str, retry_after: float) -> None:
+        super().__init__(details)
+        self.retry_after = retry_after
+        """Seconds until the call would be admitted, if nothing else is admitted in the meantime."""
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Refill the bucket and return how long until it holds `amount` tokens."""
+        if now > self.updated:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+
+class _RateLimitBuckets:
+    """The frame and byte buckets of one device, session, or the whole server."""
+
+    def __init__(self, scope: str, limit: RateLimit, now: float) -> None:
+        self.scope = scope
+        self.frames = (
+            _TokenBucket(
+                limit.frames_per_second,
+                limit.frames_per_second * limit.burst_seconds,
+                now,
+            )
+            if limit.frames_per_second is not None
+            else None
+        )
+        self.bytes = (
+            _TokenBucket(
+                limit.bytes_per_second,
+                limit.bytes_per_second * limit.burst_seconds,
+                now,
+            )
+            if limit.bytes_per_second is not None
+            else None
+        )
+
+
+class AdmissionController:
+    """Admits frames only while every device, session, and the server stay within their rate limits.
+
+    Each limit is a pair of token buckets, one for frames and one for bytes. A call is admitted
+    only if all buckets it draws from hold enough tokens, and then takes from all of them, so a
+    rejected call costs nothing. Rejected calls raise `RateLimited` with the time until they
+    would be admitted.
+    """
+
+    def __init__(
+        self,
+        per_device: RateLimit | None = None,
+        per_session: RateLimit | None = None,
+        total: RateLimit | None = None,
+    ) -> None:
+        """Initialize the admission controller.
+
+        Args:
+            per_device: Limit of each device in each session.
+            per_session: Limit of each session, shared by its devices.
+            total: Limit of the whole server, shared by all sessions.
+        """
+        self.per_device = per_device
+        self.per_session = per_session
+        self.total = total
+        self._total_buckets = (
+            _RateLimitBuckets("server", total, time.monotonic())
+            if total is not None
+            else None
+        )
+        self._session_buckets: dict[str, _RateLimitBuckets] = {}
+        self._device_buckets: dict[str, dict[str, _RateLimitBuckets]] = {}
+        """Buckets of each device, indexed by session ID and device UID."""
+        self._lock = threading.Lock()
+
+    @property
+    def max_call_bytes(self) -> float | None:
+        """Bytes of frames in the largest call that can ever be admitted, or `None` if bytes are not limited."""
+        bursts = [
+            limit.bytes_per_second * limit.burst_seconds
+            for limit in (self.per_device, self.per_session, self.total)
+            if limit is not None and limit.bytes_per_second is not None
+        ]
+        return min(bursts) if len(bursts) != 0 else None
+
+    def admit(
+        self,
+        session_id: str,
+        device_uid: str,
+        num_frames: int,
+        num_bytes: int,
+        now: float | None = None,
+    ) -> None:
+        """Admit a call of `device_uid` in `session_id` carrying `num_frames` frames in `num_bytes` bytes.
+
+        Args:
+            session_id: The session the frames are saved to.
+            device_uid: The device sending the frames.
+            num_frames: Number of frames in the call.
+            num_bytes: Size of the call in bytes.
+            now: Monotonic time of the call. Defaults to the current time.
+
+        Raises:
+            RateLimited: If admitting the call would exceed a rate limit.
+            ResourceExhausted: If the call is larger than the burst of a rate limit, so it can never be admitted.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            all_buckets: list[_RateLimitBuckets] = []
+            if self.per_device is not None:
+                session_device_buckets = self._device_buckets.setdefault(session_id, {})
+                if device_uid not in session_device_buckets:
+                    session_device_buckets[device_uid] = _RateLimitBuckets(
+                        "device", self.per_device, now
+                    )
+                all_buckets.append(session_device_buckets[device_uid])
+            if self.per_session is not None:
+                if session_id not in self._session_buckets:
+                    self._session_buckets[session_id] = _RateLimitBuckets(
+                        "session", self.per_session, now
+                    )
+                all_buckets.append(self._session_buckets[session_id])
+            if self._total_buckets is not None:
+                all_buckets.append(self._total_buckets)
+
+            retry_after = 0.0
+            exceeded: list[str] = []
+            for buckets in all_buckets:
+                for bucket, amount, unit in (
+                    (buckets.frames, num_frames, "frames"),
+                    (buckets.bytes, num_bytes, "bytes"),
+                ):
+                    if bucket is None:
+                        continue
+                    if amount > bucket.capacity:
+                        raise ResourceExhausted(
+                            f"Call of {amount} {unit} exceeds the {buckets.scope} burst of {bucket.capacity:g} {unit}"
+                        )
+                    wait_time = bucket.wait_time(amount, now)
+                    if wait_time > 0:
+                        exceeded.append(f"{buckets.scope} {unit} per second")
+                        retry_after = max(retry_after, wait_time)
+            if len(exceeded) != 0:
+                raise RateLimited(
+                    f"Rate limit exceeded: {', '.join(exceeded)}",
+                    retry_after=retry_after,
+                )
+
+            for buckets in all_buckets:
+                if buckets.frames is not None:
+                    buckets.frames.tokens -= num_frames
+                if buckets.bytes is not None:
+                    buckets.bytes.tokens -= num_bytes
+
+    def forget_device(self, session_id: str, device_uid: str) -> None:
+        """Drop the buckets of a device that left `session_id`."""
+        with self._lock:
+            self._device_buckets.get(session_id, {}).pop(device_uid, None)
+
+    def forget_session(self, session_id: str) -> None:
+        """Drop the buckets of a deleted session and its devices."""
+        with self._lock:
+            self._session_buckets.pop(session_id, None)
+            self._device_buckets.pop(session_id, None)
+
+
+def max_receive_message_length(
+    admission_controller: AdmissionController | None,
+    max_length: int = DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+) -> int:
+    """Largest request in bytes that a server should receive.
+
+    gRPC receives and parses a whole request before it reaches admission control, so a request
+    that could never be admitted is still buffered in full unless gRPC refuses it first. With a
+    byte rate limit, requests are refused beyond its smallest burst.
+
+    Args:
+        admission_controller: The rate limits of the server, if any.
+        max_length: Largest request in bytes without a byte rate limit.
+
+    Raises:
+        ValueError: If `max_length` is not positive.
+    """
+    if max_length <= 0:
+        raise ValueError("Maximum receive message length must be positive.")
+    if admission_controller is None or admission_controller.max_call_bytes is None:
+        return max_length
+    return min(
+        max_length, int(admission_controller.max_call_bytes) + _REQUEST_ENVELOPE_BYTES
+    )
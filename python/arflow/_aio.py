@@ -0,0 +1,970 @@
+"""The ARFlow gRPC server implementation on top of `grpc.aio`."""
+
+import asyncio
+import logging
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from concurrent import futures
+from functools import partial
+from pathlib import Path
+from signal import SIGINT, SIGTERM
+from typing import Any, Type, TypeVar
+
+import grpc
+from grpc_interceptor.exceptions import InvalidArgument
+
+from arflow._admission import (
+    DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+    AdmissionController,
+    max_receive_message_length,
+)
+from arflow._batches import ColorBatch, DepthBatch, TransformBatch
+from arflow._core import _BaseARFlowServicer  # pyright: ignore [reportPrivateUsage]
+from arflow._decoded_frames import DEFAULT_DECODED_FRAME_BUDGET
+from arflow._error_interceptor import AsyncErrorInterceptor
+from arflow._metrics import ARFlowMetrics, start_metrics_server
+from arflow._metrics_interceptor import AsyncMetricsInterceptor
+from arflow._session_stream import SessionStream
+from arflow._tracing import tracer
+from arflow._types import DepthCodec
+from arflow._utils import classify_frames
+from cakelab.arflow_grpc.v1 import arflow_service_pb2_grpc
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import AudioChunkFrame
+from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.create_session_response_pb2 import CreateSessionResponse
+from cakelab.arflow_grpc.v1.delete_session_request_pb2 import DeleteSessionRequest
+from cakelab.arflow_grpc.v1.delete_session_response_pb2 import DeleteSessionResponse
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.get_session_request_pb2 import GetSessionRequest
+from cakelab.arflow_grpc.v1.get_session_response_pb2 import GetSessionResponse
+from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
+from cakelab.arflow_grpc.v1.join_session_request_pb2 import JoinSessionRequest
+from cakelab.arflow_grpc.v1.join_session_response_pb2 import JoinSessionResponse
+from cakelab.arflow_grpc.v1.leave_session_request_pb2 import LeaveSessionRequest
+from cakelab.arflow_grpc.v1.leave_session_response_pb2 import LeaveSessionResponse
+from cakelab.arflow_grpc.v1.list_sessions_request_pb2 import ListSessionsRequest
+from cakelab.arflow_grpc.v1.list_sessions_response_pb2 import ListSessionsResponse
+from cakelab.arflow_grpc.v1.mesh_detection_frame_pb2 import MeshDetectionFrame
+from cakelab.arflow_grpc.v1.plane_detection_frame_pb2 import PlaneDetectionFrame
+from cakelab.arflow_grpc.v1.point_cloud_detection_frame_pb2 import (
+    PointCloudDetectionFrame,
+)
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import (
+    SaveARFramesRequest,
+)
+from cakelab.arflow_grpc.v1.save_ar_frames_response_pb2 import (
+    SaveARFramesResponse,
+)
+from cakelab.arflow_grpc.v1.save_synchronized_ar_frame_request_pb2 import (
+    SaveSynchronizedARFrameRequest,
+)
+from cakelab.arflow_grpc.v1.save_synchronized_ar_frame_response_pb2 import (
+    SaveSynchronizedARFrameResponse,
+)
+from cakelab.arflow_grpc.v1.stream_ar_frames_request_pb2 import (
+    StreamARFramesRequest,
+)
+from cakelab.arflow_grpc.v1.stream_ar_frames_response_pb2 import (
+    StreamARFramesResponse,
+)
+from cakelab.arflow_grpc.v1.synchronized_ar_frame_pb2 import SynchronizedARFrame
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+F = TypeVar("F")
+
+
+class AsyncARFlowServicer(_BaseARFlowServicer):
+    """Provides methods that implement the functionality of the ARFlow gRPC server on an asyncio event loop.
+
+    RPCs and `on_*` hooks are coroutines. Decoding frames and logging them to Rerun is CPU-bound,
+    so it runs on `executor` and the event loop stays free to serve other devices. The calls
+    carrying frames of a session are saved one at a time, in the order they arrived.
+    """
+
+    def __init__(
+        self,
+        spawn_viewer: bool = True,
+        save_dir: Path | None = None,
+        application_id: str = "arflow",
+        executor: futures.Executor | None = None,
+        idle_timeout: float | None = None,
+        admission_controller: AdmissionController | None = None,
+        metrics: ARFlowMetrics | None = None,
+        decoded_frame_budget: int = DEFAULT_DECODED_FRAME_BUDGET,
+        log_encoded_images: bool = False,
+        decode_workers: int | None = None,
+        depth_codec: DepthCodec = DepthCodec.NONE,
+        point_cloud_budget: int = 0,
+    ) -> None:
+        """Initialize the AsyncARFlowServicer.
+
+        Args:
+            spawn_viewer: Whether to spawn the Rerun Viewer in another process.
+            save_dir: The path to save the data to. Assumed to be an existing directory.
+            application_id: The application ID to store recordings under.
+            executor: The executor to run blocking work on. Defaults to a thread pool sized to the available cores.
+            idle_timeout: Seconds without frames after which a device is removed from its session,
+                and a session whose devices are all gone is deleted. `run_async_server` checks for
+                idle sessions every `idle_timeout / 2` seconds. `None` keeps them forever.
+            admission_controller: Rate limits that calls carrying frames must stay within. See `ARFlowServicer`.
+            metrics: Metrics to record into. See `ARFlowServicer`.
+            decoded_frame_budget: Bytes of decoded frames each session keeps. See `ARFlowServicer`.
+            log_encoded_images: Whether to log JPEG and PNG color frames undecoded. See `ARFlowServicer`.
+            decode_workers: Threads decoding JPEG and PNG color frames. See `ARFlowServicer`.
+            depth_codec: How depth images are stored in the recordings. See `ARFlowServicer`.
+            point_cloud_budget: Points of the point clouds each session remembers. See `ARFlowServicer`.
+
+        Raises:
+            ValueError: If neither or both operational modes are selected, if `idle_timeout` is not positive,
+                or if `decoded_frame_budget`, `decode_workers`, or `point_cloud_budget` is negative.
+        """
+        super().__init__(
+            spawn_viewer=spawn_viewer,
+            save_dir=save_dir,
+            application_id=application_id,
+            idle_timeout=idle_timeout,
+            admission_controller=admission_controller,
+            metrics=metrics,
+            decoded_frame_budget=decoded_frame_budget,
+            log_encoded_images=log_encoded_images,
+            decode_workers=decode_workers,
+            depth_codec=depth_codec,
+            point_cloud_budget=point_cloud_budget,
+        )
+        self.executor = (
+            executor
+            if executor is not None
+            else futures.ThreadPoolExecutor(thread_name_prefix="arflow")
+        )
+        """Executor running the blocking decoding and logging work off the event loop."""
+        self._save_locks: weakref.WeakKeyDictionary[SessionStream, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+        """Lock of each session held while saving its frames, so that they are saved one call at a time, in order."""
+
+    def _save_lock(self, session_stream: SessionStream) -> asyncio.Lock:
+        lock = self._save_locks.get(session_stream)
+        if lock is None:
+            lock = self._save_locks[session_stream] = asyncio.Lock()
+        return lock
+
+    async def _run_in_executor(self, fn: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(fn, *args)
+        )
+
+    async def CreateSession(
+        self,
+        request: CreateSessionRequest,
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> CreateSessionResponse:
+        new_session_stream = await self._run_in_executor(
+            self._create_session_stream, request
+        )
+
+        await self.on_create_session(
+            session_stream=new_session_stream,
+            device=request.device,
+        )
+
+        return CreateSessionResponse(session=new_session_stream.info)
+
+    async def on_create_session(
+        self, session_stream: SessionStream, device: Device
+    ) -> None:
+        """Hook for user-defined procedures when a session is created.
+
+        Args:
+            session_stream: The session stream.
+            device: The device that created the session.
+        """
+        pass
+
+    async def DeleteSession(
+        self,
+        request: DeleteSessionRequest,
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> DeleteSessionResponse:
+        # Disconnecting flushes the recording, which can block.
+        session_stream = await self._run_in_executor(
+            self._delete_session_stream, request.session_id.value
+        )
+
+        await self.on_delete_session(session_stream=session_stream)
+
+        return DeleteSessionResponse()
+
+    async def on_delete_session(
+        self,
+        session_stream: SessionStream,
+    ) -> None:
+        """Hook for user-defined procedures when a session is deleted.
+
+        Args:
+            session_stream: The deleted session stream.
+        """
+        pass
+
+    async def GetSession(
+        self,
+        request: GetSessionRequest,
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> GetSessionResponse:
+        session_stream = self._get_session_stream(request.session_id.value)
+
+        logger.info("Retrieved session: %s", session_stream.info)
+
+        return GetSessionResponse(session=session_stream.info)
+
+    async def ListSessions(
+        self,
+        request: ListSessionsRequest,
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> ListSessionsResponse:
+        current_sessions = [
+            session_stream.info for session_stream in self._list_session_streams()
+        ]
+
+        logger.info("Listed %s current sessions", len(current_sessions))
+
+        return ListSessionsResponse(sessions=current_sessions)
+
+    async def JoinSession(
+        self,
+        request: JoinSessionRequest,
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> JoinSessionResponse:
+        """Join a session.
+
+        @private
+        """
+        session_stream = self._add_device_to_session(request)
+
+        await self.on_join_session(session_stream=session_stream, device=request.device)
+
+        return JoinSessionResponse(session=session_stream.info)
+
+    async def on_join_session(
+        self,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when a new device joined a session.
+
+        Args:
+            session_stream: The session stream.
+            device: The device that joined the session.
+        """
+        pass
+
+    async def LeaveSession(
+        self,
+        request: LeaveSessionRequest,
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> LeaveSessionResponse:
+        """Leave a session.
+
+        @private
+        """
+        session_stream = self._remove_device_from_session(request)
+
+        await self.on_leave_session(
+            session_stream=session_stream,
+            device=request.device,
+        )
+
+        return LeaveSessionResponse()
+
+    async def on_leave_session(
+        self, session_stream: SessionStream, device: Device
+    ) -> None:
+        """Hook for user-defined procedures when a device leaves a session.
+
+        Args:
+            session_stream: The session stream.
+            device: The device that left the session.
+        """
+        pass
+
+    async def SaveARFrames(
+        self,
+        request: SaveARFramesRequest,
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> SaveARFramesResponse:
+        """Save AR frames to a session. Frames can be of different types and chronologically unordered."""
+        if len(request.frames) == 0:
+            raise InvalidArgument("No frames provided")
+
+        session_stream = self._get_session_stream_of_device(
+            request.session_id.value, request.device
+        )
+        self._check_frames(request.frames)
+        self._admit_frames(session_stream, request.device, request.frames)
+
+        async with self._save_lock(session_stream):
+            await self._save_ar_frames(
+                frames=request.frames,
+                session_stream=session_stream,
+                device=request.device,
+            )
+
+        return SaveARFramesResponse()
+
+    async def StreamARFrames(
+        self,
+        request_iterator: AsyncIterator[StreamARFramesRequest],
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> AsyncIterator[StreamARFramesResponse]:
+        """Save AR frames to a session as they arrive on a stream.
+
+        See `ARFlowServicer.StreamARFrames` for the binding and flow-control semantics.
+        """
+        yield StreamARFramesResponse(credits=self.stream_window)
+
+        session_stream: SessionStream | None = None
+        device = Device()
+        acked_messages = 0
+        async for request in request_iterator:
+            if session_stream is None:
+                session_stream, device = self._bind_frame_stream(request)
+            self._check_frames(request.frames)
+            self._admit_frames(session_stream, device, request.frames)
+
+            if len(request.frames) != 0:
+                async with self._save_lock(session_stream):
+                    await self._save_ar_frames(
+                        frames=request.frames,
+                        session_stream=session_stream,
+                        device=device,
+                    )
+
+            acked_messages += 1
+            ack = self._stream_ack(acked_messages)
+            if ack is not None:
+                yield ack
+
+        ack = self._final_stream_ack(acked_messages)
+        if ack is not None:
+            yield ack
+
+    async def _save_ar_frames(
+        self,
+        frames: Sequence[ARFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        with tracer.span("classify_frames"):
+            classified = classify_frames(frames)
+        self._record_received_frames(classified)
+        if len(classified.transform_frames) != 0:
+            await self._process_frames(
+                classified.transform_frames,
+                save=session_stream.save_transform_frames,
+                hook=self.on_save_transform_frames,
+                batch_hook=self.on_save_transform_batch,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.color_frames) != 0:
+            await self._process_frames(
+                classified.color_frames,
+                save=partial(
+                    session_stream.save_color_frames,
+                    grouped_frames=classified.color_frame_groups,
+                ),
+                hook=self.on_save_color_frames,
+                batch_hook=self.on_save_color_batch,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.depth_frames) != 0:
+            await self._process_frames(
+                classified.depth_frames,
+                save=partial(
+                    session_stream.save_depth_frames,
+                    grouped_frames=classified.depth_frame_groups,
+                ),
+                hook=self.on_save_depth_frames,
+                batch_hook=self.on_save_depth_batch,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.gyroscope_frames) != 0:
+            await self._process_frames(
+                classified.gyroscope_frames,
+                save=session_stream.save_gyroscope_frames,
+                hook=self.on_save_gyroscope_frames,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.audio_frames) != 0:
+            await self._process_frames(
+                classified.audio_frames,
+                save=session_stream.save_audio_frames,
+                hook=self.on_save_audio_frames,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.plane_detection_frames) != 0:
+            await self._process_frames(
+                classified.plane_detection_frames,
+                save=session_stream.save_plane_detection_frames,
+                hook=self.on_save_plane_detection_frames,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.point_cloud_detection_frames) != 0:
+            await self._process_frames(
+                classified.point_cloud_detection_frames,
+                save=session_stream.save_point_cloud_detection_frames,
+                hook=self.on_save_point_cloud_detection_frames,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.mesh_detection_frames) != 0:
+            await self._process_frames(
+                classified.mesh_detection_frames,
+                save=session_stream.save_mesh_detection_frames,
+                hook=self.on_save_mesh_detection_frames,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.imu_batch_frames) != 0:
+            await self._process_frames(
+                classified.imu_batch_frames,
+                save=session_stream.save_imu_batch_frames,
+                hook=self.on_save_imu_batch_frames,
+                session_stream=session_stream,
+                device=device,
+            )
+        if len(classified.audio_chunk_frames) != 0:
+            await self._process_frames(
+                classified.audio_chunk_frames,
+                save=session_stream.save_audio_chunk_frames,
+                hook=self.on_save_audio_chunk_frames,
+                session_stream=session_stream,
+                device=device,
+            )
+
+        logger.debug(
+            "Saved AR frames of device %s to session %s",
+            device,
+            session_stream.info.id.value,
+        )
+
+        await self.on_save_ar_frames(
+            frames=frames,
+            session_stream=session_stream,
+            device=device,
+        )
+
+    async def _process_frames(
+        self,
+        frames: Sequence[F],
+        save: Callable[[Sequence[F], Device], Sequence[Any] | None],
+        hook: Callable[..., Awaitable[None]],
+        session_stream: SessionStream,
+        device: Device,
+        batch_hook: Callable[..., Awaitable[None]] | None = None,
+    ) -> None:
+        # Time the save on the executor thread, where the spans of its stages are recorded.
+        batches = await self._run_in_executor(
+            tracer.traced(hook.__name__.removeprefix("on_"), save), frames, device
+        )
+        with tracer.span(hook.__name__):
+            await hook(
+                frames=frames,
+                session_stream=session_stream,
+                device=device,
+            )
+        if batch_hook is None or batches is None:
+            return
+        for batch in batches:
+            with tracer.span(batch_hook.__name__):
+                await batch_hook(
+                    batch=batch,
+                    session_stream=session_stream,
+                    device=device,
+                )
+        session_stream.decoded_frames.release(
+            frame for frame in frames if isinstance(frame, ColorFrame | DepthFrame)
+        )
+
+    async def on_save_ar_frames(
+        self,
+        frames: Sequence[ARFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when AR frames are saved to a recording stream.
+
+        Args:
+            frames: The AR frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_transform_frames(
+        self,
+        frames: Sequence[TransformFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when transform frames are saved to a recording stream.
+
+        Args:
+            frames: The transform frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_color_frames(
+        self,
+        frames: Sequence[ColorFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when color frames are saved to a recording stream. These frames are NOT homogenous in format or resolution.
+
+        Args:
+            frames: The color frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_depth_frames(
+        self,
+        frames: Sequence[DepthFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when depth frames are saved to a recording stream. These frames are NOT homogenous in format, resolution or smoothness.
+
+        Args:
+            frames: The depth frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_transform_batch(
+        self,
+        batch: TransformBatch,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when transform frames are saved to a recording stream, with their decoded poses.
+
+        Called after `on_save_transform_frames` with the same frames.
+
+        Args:
+            batch: The poses that were logged.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_color_batch(
+        self,
+        batch: ColorBatch,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when color frames are saved to a recording stream, with their decoded images.
+
+        Called after `on_save_color_frames`, once for each group of frames with the same format and resolution.
+
+        Args:
+            batch: The images that were logged.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_depth_batch(
+        self,
+        batch: DepthBatch,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when depth frames are saved to a recording stream, with their decoded depth images.
+
+        Called after `on_save_depth_frames`, once for each group of frames with the same format, resolution and smoothness.
+
+        Args:
+            batch: The depth images that were logged.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_gyroscope_frames(
+        self,
+        frames: Sequence[GyroscopeFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when gyroscope frames are saved to a recording stream.
+
+        Args:
+            frames: The gyroscope frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_audio_frames(
+        self,
+        frames: Sequence[AudioFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when audio frames are saved to a recording stream.
+
+        Args:
+            frames: The audio frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_imu_batch_frames(
+        self,
+        frames: Sequence[ImuBatchFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when packed IMU batch frames are saved to a recording stream.
+
+        Args:
+            frames: The IMU batch frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_audio_chunk_frames(
+        self,
+        frames: Sequence[AudioChunkFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when packed audio chunk frames are saved to a recording stream.
+
+        Args:
+            frames: The audio chunk frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_plane_detection_frames(
+        self,
+        frames: Sequence[PlaneDetectionFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when plane detection frames are saved to a recording stream.
+
+        Args:
+            frames: The plane detection frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_point_cloud_detection_frames(
+        self,
+        frames: Sequence[PointCloudDetectionFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when point cloud detection frames are saved to a recording stream.
+
+        Args:
+            frames: The point cloud detection frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def on_save_mesh_detection_frames(
+        self,
+        frames: Sequence[MeshDetectionFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when mesh detection frames are saved to a recording stream.
+
+        Args:
+            frames: The mesh detection frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    async def SaveSynchronizedARFrame(
+        self,
+        request: SaveSynchronizedARFrameRequest,
+        context: grpc.aio.ServicerContext[Any, Any] | None = None,
+    ) -> SaveSynchronizedARFrameResponse:
+        session_stream = self._get_session_stream_of_device(
+            request.session_id.value, request.device
+        )
+        self._check_frames([request.frame])
+        self._admit_frames(session_stream, request.device, [request.frame])
+
+        async with self._save_lock(session_stream):
+            await self._save_synchronized_ar_frame(
+                frame=request.frame,
+                session_stream=session_stream,
+                device=request.device,
+            )
+
+        return SaveSynchronizedARFrameResponse()
+
+    async def _save_synchronized_ar_frame(
+        self,
+        frame: SynchronizedARFrame,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        await self._process_frames(
+            [frame.transform_frame],
+            save=session_stream.save_transform_frames,
+            hook=self.on_save_transform_frames,
+            batch_hook=self.on_save_transform_batch,
+            session_stream=session_stream,
+            device=device,
+        )
+        await self._process_frames(
+            [frame.depth_frame],
+            save=session_stream.save_depth_frames,
+            hook=self.on_save_depth_frames,
+            batch_hook=self.on_save_depth_batch,
+            session_stream=session_stream,
+            device=device,
+        )
+        await self._process_frames(
+            [frame.color_frame],
+            save=session_stream.save_color_frames,
+            hook=self.on_save_color_frames,
+            batch_hook=self.on_save_color_batch,
+            session_stream=session_stream,
+            device=device,
+        )
+        await self._process_frames(
+            [frame.gyroscope_frame],
+            save=session_stream.save_gyroscope_frames,
+            hook=self.on_save_gyroscope_frames,
+            session_stream=session_stream,
+            device=device,
+        )
+        await self._process_frames(
+            [frame.audio_frame],
+            save=session_stream.save_audio_frames,
+            hook=self.on_save_audio_frames,
+            session_stream=session_stream,
+            device=device,
+        )
+        await self._process_frames(
+            [frame.plane_detection_frame],
+            save=session_stream.save_plane_detection_frames,
+            hook=self.on_save_plane_detection_frames,
+            session_stream=session_stream,
+            device=device,
+        )
+        await self._process_frames(
+            [frame.point_cloud_detection_frame],
+            save=session_stream.save_point_cloud_detection_frames,
+            hook=self.on_save_point_cloud_detection_frames,
+            session_stream=session_stream,
+            device=device,
+        )
+        await self._process_frames(
+            [frame.mesh_detection_frame],
+            save=session_stream.save_mesh_detection_frames,
+            hook=self.on_save_mesh_detection_frames,
+            session_stream=session_stream,
+            device=device,
+        )
+
+        logger.info(
+            "Saved synchronized AR frame of device %s to session %s",
+            device,
+            session_stream.info.id.value,
+        )
+
+    async def reap_idle_sessions(self, now: float | None = None) -> list[SessionStream]:
+        """Delete sessions and remove devices that have been idle for longer than `idle_timeout`.
+
+        See `ARFlowServicer.reap_idle_sessions`.
+        """
+        # Disconnecting flushes the recordings, which can block.
+        reaped_session_streams, removed_devices = await self._run_in_executor(
+            self._reap_idle_session_streams, now
+        )
+        for session_stream, device in removed_devices:
+            await self.on_leave_session(session_stream=session_stream, device=device)
+        for session_stream in reaped_session_streams:
+            await self.on_delete_session(session_stream=session_stream)
+        return reaped_session_streams
+
+    def on_server_exit(self) -> None:
+        """Closes all TCP connections, servers, and files, then shuts down the executor.
+
+        @private
+        """
+        super().on_server_exit()
+        self.executor.shutdown(wait=True)
+
+
+# TODO: Integration tests once more infrastructure work has been done (e.g., Docker). Remove pragma once implemented.
+def run_async_server(  # pragma: no cover
+    service: Type[AsyncARFlowServicer],
+    spawn_viewer: bool = True,
+    save_dir: Path | None = None,
+    application_id: str = "arflow",
+    port: int = 8500,
+    idle_timeout: float | None = None,
+    admission_controller: AdmissionController | None = None,
+    metrics_port: int | None = None,
+    log_encoded_images: bool = False,
+    decode_workers: int | None = None,
+    depth_codec: DepthCodec = DepthCodec.NONE,
+    point_cloud_budget: int = 0,
+    max_message_length: int = DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+) -> None:
+    """Run gRPC server on an asyncio event loop.
+
+    Args:
+        service: The service class to use. Custom servers should subclass `arflow.AsyncARFlowServicer`.
+        spawn_viewer: Whether to spawn the Rerun Viewer in another process.
+        save_dir: The path to save the data to.
+        port: The port to listen on.
+        idle_timeout: Seconds without frames after which devices and sessions are reaped. `None` keeps them forever.
+        admission_controller: Rate limits that calls carrying frames must stay within. `None` admits all frames.
+        metrics_port: Local port to serve metrics on in the Prometheus text format. `None` disables metrics.
+        log_encoded_images: Whether to log JPEG and PNG color frames undecoded, leaving their decoding to the viewer.
+        decode_workers: Threads decoding JPEG and PNG color frames, shared by all sessions. `None` uses one per
+            available core, and 0 decodes them on the thread saving the frames.
+        depth_codec: How depth images are stored in the recordings. See `arflow.DepthCodec`.
+        point_cloud_budget: Points of the point clouds each session remembers to log only their changes. 0 logs every cloud whole.
+        max_message_length: Largest request in bytes that the server receives. Lowered to the smallest
+            byte burst of `admission_controller`, since larger requests are never admitted.
+
+    Raises:
+        ValueError: If neither or both operational modes are selected, or if `max_message_length` is not positive.
+    """
+    asyncio.run(
+        _serve(
+            service,
+            spawn_viewer=spawn_viewer,
+            save_dir=save_dir,
+            application_id=application_id,
+            port=port,
+            idle_timeout=idle_timeout,
+            admission_controller=admission_controller,
+            metrics_port=metrics_port,
+            log_encoded_images=log_encoded_images,
+            decode_workers=decode_workers,
+            depth_codec=depth_codec,
+            point_cloud_budget=point_cloud_budget,
+            max_message_length=max_message_length,
+        )
+    )
+
+
+async def _serve(  # pragma: no cover
+    service: Type[AsyncARFlowServicer],
+    spawn_viewer: bool,
+    save_dir: Path | None,
+    application_id: str,
+    port: int,
+    idle_timeout: float | None,
+    admission_controller: AdmissionController | None,
+    metrics_port: int | None,
+    log_encoded_images: bool,
+    decode_workers: int | None,
+    depth_codec: DepthCodec,
+    point_cloud_budget: int,
+    max_message_length: int,
+) -> None:
+    receive_message_length = max_receive_message_length(
+        admission_controller, max_message_length
+    )
+    metrics = ARFlowMetrics() if metrics_port is not None else None
+    servicer = service(
+        spawn_viewer=spawn_viewer,
+        save_dir=save_dir,
+        application_id=application_id,
+        idle_timeout=idle_timeout,
+        admission_controller=admission_controller,
+        metrics=metrics,
+        log_encoded_images=log_encoded_images,
+        decode_workers=decode_workers,
+        depth_codec=depth_codec,
+        point_cloud_budget=point_cloud_budget,
+    )
+    interceptors: list[grpc.aio.ServerInterceptor] = [AsyncErrorInterceptor()]
+    metrics_server = None
+    if metrics is not None and metrics_port is not None:
+        interceptors.append(AsyncMetricsInterceptor(metrics))
+        metrics_server = start_metrics_server(metrics, metrics_port)
+    server = grpc.aio.server(
+        compression=grpc.Compression.Gzip,
+        interceptors=interceptors,
+        options=[
+            # ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", receive_message_length),
+        ],
+    )
+    arflow_service_pb2_grpc.add_ARFlowServiceServicer_to_server(servicer, server)  # pyright: ignore [reportUnknownMemberType]
+    server.add_insecure_port("[::]:%s" % port)
+    await server.start()
+    logger.info("Server started on asyncio event loop, listening on %s", port)
+
+    # See `arflow.run_server` for the shutdown procedure.
+    shutdown_requested = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(SIGTERM, shutdown_requested.set)
+    loop.add_signal_handler(SIGINT, shutdown_requested.set)
+    reaper = (
+        asyncio.create_task(_reap_periodically(servicer, interval=idle_timeout / 2))
+        if idle_timeout is not None
+        else None
+    )
+    await shutdown_requested.wait()
+
+    logger.debug("Shutting down gracefully")
+    if reaper is not None:
+        reaper.cancel()
+    await server.stop(30)
+
+    servicer.on_server_exit()
+    if metrics_server is not None:
+        metrics_server.shutdown()
+
+    logger.info("Server shut down gracefully")
+
+
+async def _reap_periodically(  # pragma: no cover
+    servicer: AsyncARFlowServicer, interval: float
+) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await servicer.reap_idle_sessions()
+        except Exception:
+            logger.exception("Failed to reap idle sessions")
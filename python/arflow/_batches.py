@@ -0,0 +1,162 @@
+"""Columnar batches of decoded frames, handed to the `on_save_*_batch` hooks.
+
+The arrays of a batch are the ones logged to the recording, so hooks get the decoded
+frames without decoding them again. They are read-only: copy them before modifying them.
+"""
+
+from collections.abc import Sequence
+from functools import cached_property
+
+import numpy as np
+import numpy.typing as npt
+
+from arflow._decoded_frames import DecodedFrame, stack_decoded
+from arflow._types import YuvLayout
+from arflow._yuv import YUV_FORMATS
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+
+def _read_only(array: npt.NDArray[np.generic]) -> None:
+    array.flags.writeable = False
+
+
+class TransformBatch:
+    """The poses of a batch of transform frames."""
+
+    def __init__(
+        self,
+        timestamps: npt.NDArray[np.int64],
+        poses: npt.NDArray[np.float32],
+    ) -> None:
+        self.timestamps = timestamps
+        """Device timestamps of the frames, in nanoseconds. Shape `(N,)`."""
+        self.poses = poses
+        """Poses of the device as homogeneous matrices in the Y-up world frame of the recording. Shape `(N, 4, 4)`."""
+        _read_only(timestamps)
+        _read_only(poses)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class ColorBatch:
+    """The decoded images of a batch of color frames with the same format and dimensions."""
+
+    def __init__(
+        self,
+        format: XRCpuImage.Format.ValueType,
+        width: int,
+        height: int,
+        timestamps: npt.NDArray[np.int64],
+        image_timestamps: npt.NDArray[np.float64],
+        buffers: npt.NDArray[np.uint8] | None,
+        intrinsics: npt.NDArray[np.float32],
+        decoded_frames: Sequence[DecodedFrame],
+        yuv_layout: YuvLayout | None = None,
+        encoded: Sequence[bytes] | None = None,
+    ) -> None:
+        self.format = format
+        """Format the frames were sent in."""
+        self.width = width
+        """Width of the images, in pixels."""
+        self.height = height
+        """Height of the images, in pixels."""
+        self.timestamps = timestamps
+        """Device timestamps of the frames, in nanoseconds. Shape `(N,)`."""
+        self.image_timestamps = image_timestamps
+        """Capture timestamps of the images, in seconds. Shape `(N,)`."""
+        self._buffers = buffers
+        self.intrinsics = intrinsics
+        """Camera matrices of the frames. Shape `(N, 3, 3)`."""
+        self.decoded_frames = decoded_frames
+        """The frames, whose other representations are decoded on demand. Their logged representation is a row of `buffers`, or of `encoded` when set."""
+        self.yuv_layout = yuv_layout
+        """Layout of the YUV images in `buffers`, NV12 or I420. `None` for other formats."""
+        self.encoded = encoded
+        """The JPEG or PNG images as received, when they were logged without decoding them. `None` otherwise."""
+        _read_only(timestamps)
+        _read_only(image_timestamps)
+        if buffers is not None:
+            _read_only(buffers)
+        _read_only(intrinsics)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def buffers(self) -> npt.NDArray[np.uint8]:
+        """Decoded images, one flattened image per row. Shape `(N, num_bytes)`.
+
+        Images logged without decoding them are decoded on first access, sharing the decoding
+        with `decoded_frames`.
+        """
+        if self._buffers is None:
+            self._buffers = stack_decoded(self.decoded_frames, "bgr").reshape(
+                (len(self), -1)
+            )
+        return self._buffers
+
+    @cached_property
+    def images(self) -> npt.NDArray[np.uint8]:
+        """A view of `buffers` as stacked images.
+
+        RGB24 frames are RGB and JPEG and PNG frames are BGR, both of shape `(N, H, W, 3)`.
+        YUV_420_888 and iOS YpCbCr frames are planes of shape `(N, H * 3 // 2, W)` laid out as `yuv_layout`,
+        which `cv2.cvtColor(image, cv2.COLOR_YUV2RGB_I420)` or `cv2.COLOR_YUV2RGB_NV12` converts to RGB.
+        OpenCV reads them in the limited range of YUV_420_888 frames, while iOS YpCbCr frames span the
+        full range; `decoded_frames` converts both correctly.
+        """
+        if self.format in YUV_FORMATS:
+            return self.buffers.reshape((len(self), self.height * 3 // 2, self.width))
+        return self.buffers.reshape((len(self), self.height, self.width, 3))
+
+
+class DepthBatch:
+    """The depth images of a batch of depth frames with the same format, dimensions, and smoothness."""
+
+    def __init__(
+        self,
+        format: XRCpuImage.Format.ValueType,
+        width: int,
+        height: int,
+        smoothed: bool,
+        timestamps: npt.NDArray[np.int64],
+        image_timestamps: npt.NDArray[np.float64],
+        buffers: npt.NDArray[np.uint8],
+        decoded_frames: Sequence[DecodedFrame],
+    ) -> None:
+        self.format = format
+        """Format the frames were sent in, `FORMAT_DEPTHFLOAT32` or `FORMAT_DEPTHUINT16`."""
+        self.width = width
+        """Width of the images, in pixels."""
+        self.height = height
+        """Height of the images, in pixels."""
+        self.smoothed = smoothed
+        """Whether environment depth temporal smoothing was enabled."""
+        self.timestamps = timestamps
+        """Device timestamps of the frames, in nanoseconds. Shape `(N,)`."""
+        self.image_timestamps = image_timestamps
+        """Capture timestamps of the images, in seconds. Shape `(N,)`."""
+        self.buffers = buffers
+        """Raw depth images as sent, one image per row. Shape `(N, num_bytes)`."""
+        self.decoded_frames = decoded_frames
+        """The frames, decoded on demand."""
+        _read_only(timestamps)
+        _read_only(image_timestamps)
+        _read_only(buffers)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @cached_property
+    def depth(self) -> npt.NDArray[np.float32]:
+        """Depth in meters. Shape `(N, H, W)`.
+
+        A view of `buffers` for `FORMAT_DEPTHFLOAT32` frames. `FORMAT_DEPTHUINT16` frames are
+        converted from millimeters on first access, sharing the conversion with `decoded_frames`.
+        """
+        if self.format == XRCpuImage.FORMAT_DEPTHUINT16:
+            return stack_decoded(self.decoded_frames, "depth")
+        return self.buffers.view(np.float32).reshape(
+            (len(self), self.height, self.width)
+        )
@@ -3,11 +3,24 @@
 import argparse
 import logging
 import os
+import signal
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
 from tempfile import gettempdir
 from typing import Any, Sequence
 
+from arflow._admission import (
+    DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+    AdmissionController,
+    RateLimit,
+)
+from arflow._aio import AsyncARFlowServicer, run_async_server
 from arflow._core import ARFlowServicer, run_server
+from arflow._hook_executor import HookExecutor
+from arflow._sharding import run_sharded_server
+from arflow._tracing import tracer
+from arflow._types import DepthCodec, OverflowPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -39,26 +52,296 @@ def _prompt_until_valid_dir(path_as_str: str) -> str:
             logger.warning("Please enter 'y' or 'n'.")
 
 
+def _admission_controller(args: Any) -> AdmissionController | None:
+    """Build the admission controller for the rate limits given on the command line, if any."""
+    limits: dict[str, RateLimit | None] = {}
+    for scope in ("device", "session", "total"):
+        frames_per_second = getattr(args, f"{scope}_frame_rate")
+        bytes_per_second = getattr(args, f"{scope}_byte_rate")
+        limits[scope] = (
+            RateLimit(
+                frames_per_second=frames_per_second,
+                bytes_per_second=bytes_per_second,
+                burst_seconds=args.rate_limit_burst,
+            )
+            if frames_per_second is not None or bytes_per_second is not None
+            else None
+        )
+    if all(limit is None for limit in limits.values()):
+        return None
+    return AdmissionController(
+        per_device=limits["device"],
+        per_session=limits["session"],
+        total=limits["total"],
+    )
+
+
+def _add_rate_limit_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group(
+        "rate limits",
+        "Calls carrying frames over a limit fail with RESOURCE_EXHAUSTED and a retry-after hint. Limits are off by default.",
+    )
+    for scope, description in (
+        ("device", "from each device"),
+        ("session", "into each session"),
+        ("total", "across the whole server"),
+    ):
+        group.add_argument(
+            f"--{scope}-frame-rate",
+            type=float,
+            default=None,
+            help=f"Frames per second admitted {description}.",
+        )
+        group.add_argument(
+            f"--{scope}-byte-rate",
+            type=float,
+            default=None,
+            help=f"Request bytes per second admitted {description}.",
+        )
+    group.add_argument(
+        "--rate-limit-burst",
+        type=float,
+        default=1.0,
+        help="Seconds of each rate that may arrive at once (default: %(default)s).",
+    )
+
+
+def _hook_concurrency(value: str) -> tuple[str, int]:
+    """Parse a `NAME=LIMIT` concurrency limit of a hook."""
+    name, sep, limit = value.partition("=")
+    if not sep or not name or not limit.isdigit():
+        raise argparse.ArgumentTypeError(f"Expected NAME=LIMIT, got '{value}'.")
+    return name, int(limit)
+
+
+def _hook_executor(args: Any) -> HookExecutor | None:
+    """Build the hook executor for the hook options given on the command line, if any."""
+    if (
+        args.hook_workers is None
+        and not args.hook_concurrency
+        and args.hook_max_pending is None
+        and not args.hook_drop_when_busy
+    ):
+        return None
+    return HookExecutor(
+        max_workers=args.hook_workers if args.hook_workers is not None else 4,
+        max_concurrency=dict(args.hook_concurrency or ()),
+        max_pending=args.hook_max_pending,
+        drop_when_busy=args.hook_drop_when_busy,
+    )
+
+
+def _add_hook_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group(
+        "hooks",
+        "Run the on_save_* hooks on a thread pool instead of the threads that save frames. Hooks run inline unless one of these is given. Ignored with --aio, and applied to each worker with --workers.",
+    )
+    group.add_argument(
+        "--hook-workers",
+        type=int,
+        default=None,
+        help="Number of threads that run hooks (default: 4 when hooks run on a thread pool).",
+    )
+    group.add_argument(
+        "--hook-concurrency",
+        type=_hook_concurrency,
+        action="append",
+        default=None,
+        metavar="NAME=LIMIT",
+        help="Maximum number of concurrent calls of the hook NAME, e.g. on_save_ar_frames=1. May be repeated.",
+    )
+    group.add_argument(
+        "--hook-max-pending",
+        type=int,
+        default=None,
+        help="Maximum number of hook calls of a session waiting to start (default: unlimited).",
+    )
+    group.add_argument(
+        "--hook-drop-when-busy",
+        action="store_true",
+        help="Drop new hook calls once --hook-max-pending calls are waiting instead of waiting for room.",
+    )
+
+
+def _add_recording_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group(
+        "recording", "How frames are stored in the recordings."
+    )
+    group.add_argument(
+        "--log-encoded-images",
+        action="store_true",
+        help="Log JPEG and PNG color frames as they were received, leaving their decoding to the viewer. Hooks that read the images still decode them.",
+    )
+    group.add_argument(
+        "--decode-workers",
+        type=int,
+        default=None,
+        help="Threads decoding JPEG and PNG color frames, shared by all sessions. 0 decodes them on the thread saving the frames. With --workers, each worker starts this many (default: one per core).",
+    )
+    group.add_argument(
+        "--depth-codec",
+        type=DepthCodec,
+        choices=list(DepthCodec),
+        default=DepthCodec.NONE,
+        help="How depth images are stored. uint16_mm rounds float32 depth to millimeters, halving its size (default: %(default)s).",
+    )
+    group.add_argument(
+        "--point-cloud-budget",
+        type=int,
+        default=0,
+        help="Points of the point clouds each session remembers, so that updating a cloud logs only its changed points. 0 logs every cloud whole (default: %(default)s).",
+    )
+
+
+def _toggle_tracing(*_: Any) -> None:
+    if tracer.enabled:
+        tracer.disable()
+        logger.info("Paused tracing.")
+    else:
+        tracer.enable()
+        logger.info("Resumed tracing.")
+
+
+@contextmanager
+def _tracing(trace_file: str | None) -> Generator[None]:
+    """Record tracing spans while the server runs and write them to `trace_file`, if given.
+
+    SIGUSR1 pauses and resumes the recording.
+    """
+    if trace_file is None:
+        yield
+        return
+    tracer.enable()
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, _toggle_tracing)
+    try:
+        yield
+    finally:
+        tracer.disable()
+        tracer.write_chrome_trace(Path(trace_file))
+        logger.info("Wrote trace to %s", trace_file)
+
+
 def view(args: Any):
     """Run the ARFlow server and Rerun Viewer to view live data from the clients."""
-    run_server(
-        ARFlowServicer,
-        spawn_viewer=True,
-        save_dir=None,
-        application_id=args.application_id,
-        port=args.port,
-    )
+    with _tracing(args.trace_file):
+        if args.aio:
+            run_async_server(
+                AsyncARFlowServicer,
+                spawn_viewer=True,
+                save_dir=None,
+                application_id=args.application_id,
+                port=args.port,
+                idle_timeout=args.idle_timeout,
+                admission_controller=_admission_controller(args),
+                metrics_port=args.metrics_port,
+                log_encoded_images=args.log_encoded_images,
+                decode_workers=args.decode_workers,
+                depth_codec=args.depth_codec,
+                point_cloud_budget=args.point_cloud_budget,
+                max_message_length=args.max_message_length,
+            )
+            return
+        if args.workers > 1:
+            run_sharded_server(
+                ARFlowServicer,
+                num_workers=args.workers,
+                spawn_viewer=True,
+                save_dir=None,
+                application_id=args.application_id,
+                port=args.port,
+                ingest_queue_size=args.ingest_queue_size,
+                overflow_policy=args.overflow_policy,
+                idle_timeout=args.idle_timeout,
+                admission_controller=_admission_controller(args),
+                metrics_port=args.metrics_port,
+                hook_executor=_hook_executor(args),
+                log_encoded_images=args.log_encoded_images,
+                decode_workers=args.decode_workers,
+                depth_codec=args.depth_codec,
+                point_cloud_budget=args.point_cloud_budget,
+                max_message_length=args.max_message_length,
+            )
+            return
+        run_server(
+            ARFlowServicer,
+            spawn_viewer=True,
+            save_dir=None,
+            application_id=args.application_id,
+            port=args.port,
+            ingest_queue_size=args.ingest_queue_size,
+            overflow_policy=args.overflow_policy,
+            idle_timeout=args.idle_timeout,
+            admission_controller=_admission_controller(args),
+            metrics_port=args.metrics_port,
+            hook_executor=_hook_executor(args),
+            log_encoded_images=args.log_encoded_images,
+            decode_workers=args.decode_workers,
+            depth_codec=args.depth_codec,
+            point_cloud_budget=args.point_cloud_budget,
+            max_message_length=args.max_message_length,
+        )
 
 
 def save(args: Any):
     """Run the ARFlow server and save the data to disk."""
-    run_server(
-        ARFlowServicer,
-        spawn_viewer=False,
-        save_dir=Path(args.save_dir),
-        application_id=args.application_id,
-        port=args.port,
-    )
+    with _tracing(args.trace_file):
+        if args.aio:
+            run_async_server(
+                AsyncARFlowServicer,
+                spawn_viewer=False,
+                save_dir=Path(args.save_dir),
+                application_id=args.application_id,
+                port=args.port,
+                idle_timeout=args.idle_timeout,
+                admission_controller=_admission_controller(args),
+                metrics_port=args.metrics_port,
+                log_encoded_images=args.log_encoded_images,
+                decode_workers=args.decode_workers,
+                depth_codec=args.depth_codec,
+                point_cloud_budget=args.point_cloud_budget,
+                max_message_length=args.max_message_length,
+            )
+            return
+        if args.workers > 1:
+            run_sharded_server(
+                ARFlowServicer,
+                num_workers=args.workers,
+                spawn_viewer=False,
+                save_dir=Path(args.save_dir),
+                application_id=args.application_id,
+                port=args.port,
+                ingest_queue_size=args.ingest_queue_size,
+                overflow_policy=args.overflow_policy,
+                idle_timeout=args.idle_timeout,
+                admission_controller=_admission_controller(args),
+                metrics_port=args.metrics_port,
+                hook_executor=_hook_executor(args),
+                log_encoded_images=args.log_encoded_images,
+                decode_workers=args.decode_workers,
+                depth_codec=args.depth_codec,
+                point_cloud_budget=args.point_cloud_budget,
+                max_message_length=args.max_message_length,
+            )
+            return
+        run_server(
+            ARFlowServicer,
+            spawn_viewer=False,
+            save_dir=Path(args.save_dir),
+            application_id=args.application_id,
+            port=args.port,
+            ingest_queue_size=args.ingest_queue_size,
+            overflow_policy=args.overflow_policy,
+            idle_timeout=args.idle_timeout,
+            admission_controller=_admission_controller(args),
+            metrics_port=args.metrics_port,
+            hook_executor=_hook_executor(args),
+            log_encoded_images=args.log_encoded_images,
+            decode_workers=args.decode_workers,
+            depth_codec=args.depth_codec,
+            point_cloud_budget=args.point_cloud_budget,
+            max_message_length=args.max_message_length,
+        )
 
 
 def rerun(args: list[str]):
@@ -110,6 +393,59 @@ def parse_args(
         default="arflow",
         help=f"Application ID to use for the Rerun recording (default: %(default)s).",
     )
+    view_parser_mode = view_parser.add_mutually_exclusive_group()
+    view_parser_mode.add_argument(
+        "--aio",
+        action="store_true",
+        help="Serve requests on an asyncio event loop instead of a thread pool.",
+    )
+    view_parser_mode.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes to spread sessions across (default: %(default)s).",
+    )
+    view_parser.add_argument(
+        "--ingest-queue-size",
+        type=int,
+        default=0,
+        help="Number of frame batches each session may buffer so that RPCs return before frames are saved. 0 saves frames before replying. Ignored with --aio (default: %(default)s).",
+    )
+    view_parser.add_argument(
+        "--overflow-policy",
+        type=OverflowPolicy,
+        choices=list(OverflowPolicy),
+        default=OverflowPolicy.BLOCK,
+        help="What a full ingest queue does with a new batch (default: %(default)s).",
+    )
+    view_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Seconds without frames after which devices leave their sessions and empty sessions are deleted. (default: never).",
+    )
+    view_parser.add_argument(
+        "--max-message-length",
+        type=int,
+        default=DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+        help="Largest request in bytes that the server receives. Lowered to the smallest burst of the byte rate limits, since larger requests are never admitted (default: %(default)s).",
+    )
+    view_parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Local port to serve metrics on in the Prometheus text format at /metrics (default: disabled).",
+    )
+    view_parser.add_argument(
+        "--trace-file",
+        type=str,
+        default=None,
+        help="Record tracing spans of the stages of saving frames, and write them to this Chrome trace JSON file on exit. Send SIGUSR1 to pause and resume recording. With --workers, only the front process is traced (default: disabled).",
+    )
+    _add_rate_limit_arguments(view_parser)
+    _add_recording_arguments(view_parser)
+    _add_hook_arguments(view_parser)
     view_parser.set_defaults(func=view)
 
     # Save subcommand
@@ -137,6 +473,59 @@ def parse_args(
         default="arflow",
         help=f"Application ID to use for the Rerun recording (default: %(default)s).",
     )
+    save_parser_mode = save_parser.add_mutually_exclusive_group()
+    save_parser_mode.add_argument(
+        "--aio",
+        action="store_true",
+        help="Serve requests on an asyncio event loop instead of a thread pool.",
+    )
+    save_parser_mode.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes to spread sessions across (default: %(default)s).",
+    )
+    save_parser.add_argument(
+        "--ingest-queue-size",
+        type=int,
+        default=0,
+        help="Number of frame batches each session may buffer so that RPCs return before frames are saved. 0 saves frames before replying. Ignored with --aio (default: %(default)s).",
+    )
+    save_parser.add_argument(
+        "--overflow-policy",
+        type=OverflowPolicy,
+        choices=list(OverflowPolicy),
+        default=OverflowPolicy.BLOCK,
+        help="What a full ingest queue does with a new batch (default: %(default)s).",
+    )
+    save_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Seconds without frames after which devices leave their sessions and empty sessions are deleted. (default: never).",
+    )
+    save_parser.add_argument(
+        "--max-message-length",
+        type=int,
+        default=DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+        help="Largest request in bytes that the server receives. Lowered to the smallest burst of the byte rate limits, since larger requests are never admitted (default: %(default)s).",
+    )
+    save_parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Local port to serve metrics on in the Prometheus text format at /metrics (default: disabled).",
+    )
+    save_parser.add_argument(
+        "--trace-file",
+        type=str,
+        default=None,
+        help="Record tracing spans of the stages of saving frames, and write them to this Chrome trace JSON file on exit. Send SIGUSR1 to pause and resume recording. With --workers, only the front process is traced (default: disabled).",
+    )
+    _add_rate_limit_arguments(save_parser)
+    _add_recording_arguments(save_parser)
+    _add_hook_arguments(save_parser)
     save_parser.set_defaults(func=save)
 
     # Rerun subcommand
@@ -1,24 +1,50 @@
 """The ARFlow gRPC server implementation."""
 
 import logging
+import threading
+import time
 import uuid
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from concurrent import futures
+from functools import partial
 from pathlib import Path
 from signal import SIGINT, SIGTERM, signal
 from typing import Any, Type
 
 import grpc
 import rerun as rr
+from google.protobuf.message import Message
 from grpc_interceptor.exceptions import InvalidArgument, NotFound
 
+from arflow._admission import (
+    DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+    AdmissionController,
+    max_receive_message_length,
+)
+from arflow._batches import ColorBatch, DepthBatch, TransformBatch
+from arflow._decode_pool import DecodePool
+from arflow._decoded_frames import DEFAULT_DECODED_FRAME_BUDGET, DecodedFrameCache
 from arflow._error_interceptor import ErrorInterceptor
+from arflow._hook_executor import HookExecutor
+from arflow._ingest_queue import IngestQueue
+from arflow._metrics import ARFlowMetrics, start_metrics_server
+from arflow._metrics_interceptor import MetricsInterceptor
+from arflow._point_store import PointCloudStore
+from arflow._session_reaper import SessionReaper
 from arflow._session_stream import SessionStream
-from arflow._types import (
-    ARFrameType,
+from arflow._tracing import tracer
+from arflow._types import DepthCodec, OverflowPolicy
+from arflow._utils import (
+    ClassifiedARFrames,
+    ColorFrameGroupKey,
+    DepthFrameGroupKey,
+    check_frames,
+    classify_frames,
+    frames_byte_size,
 )
 from cakelab.arflow_grpc.v1 import arflow_service_pb2_grpc
 from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import AudioChunkFrame
 from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame
 from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
 from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
@@ -30,6 +56,7 @@ from cakelab.arflow_grpc.v1.device_pb2 import Device
 from cakelab.arflow_grpc.v1.get_session_request_pb2 import GetSessionRequest
 from cakelab.arflow_grpc.v1.get_session_response_pb2 import GetSessionResponse
 from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
 from cakelab.arflow_grpc.v1.join_session_request_pb2 import JoinSessionRequest
 from cakelab.arflow_grpc.v1.join_session_response_pb2 import JoinSessionResponse
 from cakelab.arflow_grpc.v1.leave_session_request_pb2 import LeaveSessionRequest
@@ -54,19 +81,60 @@ from cakelab.arflow_grpc.v1.save_synchronized_ar_frame_response_pb2 import (
     SaveSynchronizedARFrameResponse,
 )
 from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.stream_ar_frames_request_pb2 import (
+    StreamARFramesRequest,
+)
+from cakelab.arflow_grpc.v1.stream_ar_frames_response_pb2 import (
+    StreamARFramesResponse,
+)
+from cakelab.arflow_grpc.v1.synchronized_ar_frame_pb2 import SynchronizedARFrame
 from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
 
 logger = logging.getLogger(__name__)
 
 
-class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
-    """Provides methods that implement the functionality of the ARFlow gRPC server."""
+class _FrameStreamFlowControl:
+    """Acks and credit grants of the `StreamARFrames` RPC."""
+
+    stream_window: int = 16
+    """Number of request messages a client may send on `StreamARFrames` before it is acked."""
+    stream_ack_interval: int = 4
+    """Number of request messages after which `StreamARFrames` acks and grants the same number of credits back."""
+
+    def _stream_ack(self, acked_messages: int) -> StreamARFramesResponse | None:
+        """Return the ack owed after `acked_messages` processed messages, if any."""
+        if acked_messages % self.stream_ack_interval != 0:
+            return None
+        return StreamARFramesResponse(
+            acked_messages=acked_messages, credits=self.stream_ack_interval
+        )
+
+    def _final_stream_ack(self, acked_messages: int) -> StreamARFramesResponse | None:
+        """Return the ack for the messages left unacked when the client half-closes."""
+        pending = acked_messages % self.stream_ack_interval
+        if pending == 0:
+            return None
+        return StreamARFramesResponse(acked_messages=acked_messages, credits=pending)
+
+
+class _BaseARFlowServicer(
+    _FrameStreamFlowControl, arflow_service_pb2_grpc.ARFlowServiceServicer
+):
+    """Session bookkeeping shared by the threaded and the asyncio ARFlow servicers."""
 
     def __init__(
         self,
         spawn_viewer: bool = True,
         save_dir: Path | None = None,
         application_id: str = "arflow",
+        idle_timeout: float | None = None,
+        admission_controller: AdmissionController | None = None,
+        metrics: ARFlowMetrics | None = None,
+        decoded_frame_budget: int = DEFAULT_DECODED_FRAME_BUDGET,
+        log_encoded_images: bool = False,
+        decode_workers: int | None = None,
+        depth_codec: DepthCodec = DepthCodec.NONE,
+        point_cloud_budget: int = 0,
     ) -> None:
         """Initialize the ARFlowServicer.
 
@@ -74,10 +142,30 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
             spawn_viewer: Whether to spawn the Rerun Viewer in another process.
             save_dir: The path to save the data to. Assumed to be an existing directory.
             application_id: The application ID to store recordings under.
+            idle_timeout: Seconds without frames after which a device is removed from its session,
+                and a session whose devices are all gone is deleted. `None` keeps them forever.
+            admission_controller: Rate limits that calls carrying frames must stay within. `None` admits all frames.
+            metrics: Metrics to record the received frames and the server state into. `None` disables metrics.
+            decoded_frame_budget: Bytes of decoded color and depth frames each session keeps for its hooks.
+            log_encoded_images: Whether to log JPEG and PNG color frames as they were received.
+            decode_workers: Threads decoding JPEG and PNG color frames, shared by all sessions. `None` uses
+                one per available core, and 0 decodes them on the thread saving the frames.
+            depth_codec: How depth images are stored in the recordings.
+            point_cloud_budget: Points of the point clouds each session remembers to log only their changes.
+                0 logs every cloud whole.
 
         Raises:
-            ValueError: If neither or both operational modes are selected.
+            ValueError: If neither or both operational modes are selected, if `idle_timeout` is not positive,
+                or if `decoded_frame_budget`, `decode_workers`, or `point_cloud_budget` is negative.
         """
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("Idle timeout must be positive.")
+        if decoded_frame_budget < 0:
+            raise ValueError("Decoded frame budget cannot be negative.")
+        if decode_workers is not None and decode_workers < 0:
+            raise ValueError("Number of decode workers cannot be negative.")
+        if point_cloud_budget < 0:
+            raise ValueError("Point cloud budget cannot be negative.")
         if (spawn_viewer and save_dir is not None) or (
             not spawn_viewer and save_dir is None
         ):
@@ -87,8 +175,33 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         self.spawn_viewer = spawn_viewer
         self.save_dir = save_dir
         self.application_id = application_id
+        self.idle_timeout = idle_timeout
+        self.admission_controller = admission_controller
+        self.metrics = metrics
+        self.decoded_frame_budget = decoded_frame_budget
+        self.log_encoded_images = log_encoded_images
+        self.decode_pool = DecodePool(decode_workers) if decode_workers != 0 else None
+        """Threads decoding the JPEG and PNG color frames of all sessions. `None` decodes them inline."""
+        self.depth_codec = depth_codec
+        self.point_cloud_budget = point_cloud_budget
+        if metrics is not None:
+            if self.decode_pool is not None:
+                self.decode_pool.record_into(metrics)
+            metrics.add_gauge(
+                "arflow_sessions",
+                "Number of active sessions.",
+                lambda: [((), len(self.client_sessions))],
+            )
+            metrics.add_gauge(
+                "arflow_ingest_queue_depth",
+                "Number of frame batches waiting in the ingest queue of a session.",
+                self._collect_ingest_queue_depths,
+                label_names=("session",),
+            )
         self.client_sessions: dict[str, SessionStream] = {}
         """Active session streams, indexed by their ID."""
+        self._client_sessions_lock = threading.Lock()
+        """Serializes changes to `client_sessions`. Lookups by ID do not take it."""
         # Initializes SDK with an "empty" global recording. We don't want to log anything into the global recording.
         rr.init(application_id=self.application_id, spawn=self.spawn_viewer)
         # TODO: This here is right? https://rerun.io/docs/concepts/spaces-and-transforms#view-coordinates
@@ -101,9 +214,7 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         except KeyError:
             raise NotFound("Session not found")
 
-    def CreateSession(
-        self, request: CreateSessionRequest, context: grpc.ServicerContext | None = None
-    ) -> CreateSessionResponse:
+    def _create_session_stream(self, request: CreateSessionRequest) -> SessionStream:
         new_session_id = str(uuid.uuid4())
         new_rr_stream = rr.new_recording(
             application_id=self.application_id,
@@ -118,8 +229,15 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         new_session_stream = SessionStream(
             info=new_session,
             stream=new_rr_stream,
+            metrics=self.metrics,
+            decoded_frames=DecodedFrameCache(self.decoded_frame_budget),
+            log_encoded_images=self.log_encoded_images,
+            decode_pool=self.decode_pool,
+            depth_codec=self.depth_codec,
+            point_clouds=PointCloudStore(self.point_cloud_budget),
         )
-        self.client_sessions[new_session_id] = new_session_stream
+        with self._client_sessions_lock:
+            self.client_sessions[new_session_id] = new_session_stream
         logger.info("Created new session: %s", new_session_stream.info)
 
         if self.save_dir is not None:
@@ -135,12 +253,313 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
             )
             logger.info("Session data path: %s", save_path)
 
+        return new_session_stream
+
+    def _delete_session_stream(self, session_id: str) -> SessionStream:
+        with self._client_sessions_lock:
+            try:
+                session_stream = self.client_sessions.pop(session_id)
+            except KeyError:
+                raise NotFound("Session not found")
+
+        if self.admission_controller is not None:
+            self.admission_controller.forget_session(session_id)
+        if session_stream.ingest_queue is not None:
+            # Flushes the frames that were accepted before the session was deleted.
+            session_stream.ingest_queue.close()
+        rr.disconnect(session_stream.stream)
+        logger.info("Deleted session: %s", session_stream.info)
+
+        return session_stream
+
+    def _add_device_to_session(self, request: JoinSessionRequest) -> SessionStream:
+        session_stream = self._get_session_stream(request.session_id.value)
+
+        if not session_stream.add_device(request.device):
+            raise InvalidArgument("Device already in session")
+
+        logger.info("Client %s joined session %s", request.device, request.session_id)
+
+        return session_stream
+
+    def _remove_device_from_session(
+        self, request: LeaveSessionRequest
+    ) -> SessionStream:
+        session_stream = self._get_session_stream(request.session_id.value)
+
+        if not session_stream.remove_device(request.device):
+            raise NotFound("Device not in session")
+        if self.admission_controller is not None:
+            self.admission_controller.forget_device(
+                request.session_id.value, request.device.uid
+            )
+
+        logger.info(
+            "Client %s left session %s", request.device, request.session_id.value
+        )
+
+        return session_stream
+
+    def _get_session_stream_of_device(
+        self, session_id: str, device: Device
+    ) -> SessionStream:
+        session_stream = self._get_session_stream(session_id)
+
+        if not session_stream.has_device(device):
+            raise NotFound("Device not in session")
+
+        return session_stream
+
+    def _admit_frames(
+        self,
+        session_stream: SessionStream,
+        device: Device,
+        frames: Sequence[Message],
+    ) -> None:
+        """Check a call carrying `frames` against the rate limits, then record the activity of `device`.
+
+        Raises:
+            RateLimited: If the call exceeds a rate limit.
+        """
+        with tracer.span("admit_frames", frames=len(frames)):
+            num_bytes = frames_byte_size(frames)
+            if self.admission_controller is not None:
+                self.admission_controller.admit(
+                    session_stream.info.id.value, device.uid, len(frames), num_bytes
+                )
+            session_stream.record_activity(device, num_bytes)
+
+    def _check_frames(self, frames: Sequence[ARFrame | SynchronizedARFrame]) -> None:
+        """Check that `frames` can be saved, before any of them is saved or queued.
+
+        Raises:
+            InvalidArgument: If a frame has a pose or buffer of the wrong size, no sample rate,
+                or a point cloud with identifiers or confidence values for a different number of
+                points.
+        """
+        try:
+            check_frames(frames)
+        except ValueError as e:
+            raise InvalidArgument(str(e)) from e
+
+    def _bind_frame_stream(
+        self, request: StreamARFramesRequest
+    ) -> tuple[SessionStream, Device]:
+        session_stream = self._get_session_stream_of_device(
+            request.session_id.value, request.device
+        )
+        logger.debug(
+            "Bound frame stream of device %s to session %s",
+            request.device,
+            request.session_id.value,
+        )
+        return session_stream, request.device
+
+    def _list_session_streams(self) -> list[SessionStream]:
+        with self._client_sessions_lock:
+            return list(self.client_sessions.values())
+
+    def _collect_ingest_queue_depths(self) -> list[tuple[tuple[str], float]]:
+        return [
+            ((session_stream.info.id.value,), session_stream.ingest_queue.depth)
+            for session_stream in self._list_session_streams()
+            if session_stream.ingest_queue is not None
+        ]
+
+    def _record_received_frames(self, classified: ClassifiedARFrames) -> None:
+        if self.metrics is None:
+            return
+        for frame_type, frames in classified.items():
+            if len(frames) == 0:
+                continue
+            self.metrics.frames_received.inc(len(frames), (frame_type,))
+            self.metrics.frame_bytes_received.inc(
+                frames_byte_size(frames), (frame_type,)
+            )
+
+    def _reap_idle_session_streams(
+        self, now: float | None = None
+    ) -> tuple[list[SessionStream], list[tuple[SessionStream, Device]]]:
+        """Delete idle sessions and remove idle devices from the remaining ones.
+
+        Returns:
+            The deleted session streams, and the devices removed from sessions that live on.
+        """
+        if self.idle_timeout is None:
+            return [], []
+        deadline = (time.monotonic() if now is None else now) - self.idle_timeout
+        reaped_session_streams: list[SessionStream] = []
+        removed_devices: list[tuple[SessionStream, Device]] = []
+        for session_stream in self._list_session_streams():
+            if session_stream.last_active < deadline:
+                try:
+                    # Disconnecting flushes the recording and releases what it buffered.
+                    self._delete_session_stream(session_stream.info.id.value)
+                except NotFound:
+                    # Deleted by its devices in the meantime.
+                    continue
+                reaped_session_streams.append(session_stream)
+                continue
+            for device in session_stream.idle_devices(deadline):
+                if session_stream.remove_device(device):
+                    removed_devices.append((session_stream, device))
+                    if self.admission_controller is not None:
+                        self.admission_controller.forget_device(
+                            session_stream.info.id.value, device.uid
+                        )
+
+        for session_stream, device in removed_devices:
+            logger.info(
+                "Removed idle device %s from session %s",
+                device,
+                session_stream.info.id.value,
+            )
+        if len(reaped_session_streams) != 0:
+            # Their ingest queues were flushed when they were deleted, so what they still hold is
+            # their cache of decoded frames and their stored point clouds.
+            logger.info(
+                "Reaped %d idle sessions, releasing %d bytes of decoded frames and %d stored points",
+                len(reaped_session_streams),
+                sum(
+                    session_stream.decoded_frames.nbytes
+                    for session_stream in reaped_session_streams
+                ),
+                sum(
+                    session_stream.point_clouds.num_points
+                    for session_stream in reaped_session_streams
+                ),
+            )
+        return reaped_session_streams, removed_devices
+
+    def on_server_exit(self) -> None:
+        """Closes all TCP connections, servers, and files.
+
+        @private
+        """
+        logger.debug("Closing all TCP connections, servers, and files...")
+        # Disconnects the global recording. Without this, this function will hang indefinitely.
+        rr.disconnect()
+        for session in self._list_session_streams():
+            if session.ingest_queue is not None:
+                session.ingest_queue.close()
+            rr.disconnect(session.stream)
+            logger.debug("Disconnected session: %s", session.info.id.value)
+        if self.decode_pool is not None:
+            self.decode_pool.close()
+        logger.debug("All clients disconnected")
+
+
+class ARFlowServicer(_BaseARFlowServicer):
+    """Provides methods that implement the functionality of the ARFlow gRPC server."""
+
+    def __init__(
+        self,
+        spawn_viewer: bool = True,
+        save_dir: Path | None = None,
+        application_id: str = "arflow",
+        ingest_queue_size: int = 0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        idle_timeout: float | None = None,
+        admission_controller: AdmissionController | None = None,
+        metrics: ARFlowMetrics | None = None,
+        hook_executor: HookExecutor | None = None,
+        decoded_frame_budget: int = DEFAULT_DECODED_FRAME_BUDGET,
+        log_encoded_images: bool = False,
+        decode_workers: int | None = None,
+        depth_codec: DepthCodec = DepthCodec.NONE,
+        point_cloud_budget: int = 0,
+    ) -> None:
+        """Initialize the ARFlowServicer.
+
+        Args:
+            spawn_viewer: Whether to spawn the Rerun Viewer in another process.
+            save_dir: The path to save the data to. Assumed to be an existing directory.
+            application_id: The application ID to store recordings under.
+            ingest_queue_size: Number of `SaveARFrames` batches each session may buffer. When positive,
+                `SaveARFrames` and `StreamARFrames` only validate and enqueue frames, and a dedicated
+                thread per session saves them and runs the `on_save_*` hooks. When 0, frames are
+                saved on the RPC thread before it replies.
+            overflow_policy: What a full session ingest queue does with a new batch.
+            idle_timeout: Seconds without frames after which a device is removed from its session,
+                and a session whose devices are all gone is deleted. When set, a background thread
+                checks for idle sessions every `idle_timeout / 2` seconds. `None` keeps them forever.
+            admission_controller: Rate limits that `SaveARFrames`, `StreamARFrames`, and
+                `SaveSynchronizedARFrame` calls must stay within. Calls over a limit fail with
+                `RESOURCE_EXHAUSTED` before their frames are decoded or queued. `None` admits all frames.
+            metrics: Metrics to record the received frames, decoding and logging times, and the
+                session and queue state into. `None` disables metrics.
+            hook_executor: Runs the `on_save_*` hooks on its thread pool instead of the thread that
+                saved the frames, in order for each session. Frames are then saved without waiting
+                for the hooks. The servicer closes it on exit. `None` runs the hooks inline.
+            decoded_frame_budget: Bytes of decoded color and depth frames each session keeps, so that
+                logging and the hooks decode each frame once. Frames are released once their hooks have
+                run, and the least recently used ones are evicted beyond the budget.
+            log_encoded_images: Whether to log JPEG and PNG color frames as the compressed images they
+                were received as, leaving their decoding to the viewer. The server then decodes them
+                only for hooks that read `ColorBatch.buffers` or `ColorBatch.images`.
+            decode_workers: Threads decoding the JPEG and PNG color frames of a batch concurrently, shared
+                by all sessions. `None` uses one per available core, and 0 decodes them one by one on
+                the thread saving the frames.
+            depth_codec: How depth images are stored in the recordings. `DepthCodec.UINT16_MILLIMETERS`
+                halves the size of float32 depth, within the error bounds it documents.
+            point_cloud_budget: Points of the point clouds each session remembers, so that an update of
+                a cloud only logs its added, moved, and removed points. Beyond the budget, the least
+                recently updated clouds are forgotten and logged again on their next update. 0, the
+                default, logs every cloud whole, which suits clouds that change entirely between updates.
+
+        Raises:
+            ValueError: If neither or both operational modes are selected, if `ingest_queue_size` is negative,
+                if `idle_timeout` is not positive, or if `decoded_frame_budget`, `decode_workers`,
+                or `point_cloud_budget` is negative.
+        """
+        if ingest_queue_size < 0:
+            raise ValueError("Ingest queue size cannot be negative.")
+        self.ingest_queue_size = ingest_queue_size
+        self.overflow_policy = overflow_policy
+        super().__init__(
+            spawn_viewer=spawn_viewer,
+            save_dir=save_dir,
+            application_id=application_id,
+            idle_timeout=idle_timeout,
+            admission_controller=admission_controller,
+            metrics=metrics,
+            decoded_frame_budget=decoded_frame_budget,
+            log_encoded_images=log_encoded_images,
+            decode_workers=decode_workers,
+            depth_codec=depth_codec,
+            point_cloud_budget=point_cloud_budget,
+        )
+        self._session_reaper = (
+            SessionReaper(self.reap_idle_sessions, interval=idle_timeout / 2)
+            if idle_timeout is not None
+            else None
+        )
+        self.hook_executor = hook_executor
+        """Runs the `on_save_*` hooks off the thread that saved the frames, if set."""
+        if hook_executor is not None and metrics is not None:
+            hook_executor.record_into(metrics)
+
+    def _create_session_stream(self, request: CreateSessionRequest) -> SessionStream:
+        session_stream = super()._create_session_stream(request)
+        if self.ingest_queue_size > 0:
+            session_stream.ingest_queue = IngestQueue(
+                name=f"arflow-ingest-{session_stream.info.id.value}",
+                maxsize=self.ingest_queue_size,
+                overflow_policy=self.overflow_policy,
+            )
+        return session_stream
+
+    def CreateSession(
+        self, request: CreateSessionRequest, context: grpc.ServicerContext | None = None
+    ) -> CreateSessionResponse:
+        new_session_stream = self._create_session_stream(request)
+
         self.on_create_session(
             session_stream=new_session_stream,
             device=request.device,
         )
 
-        return CreateSessionResponse(session=new_session)
+        return CreateSessionResponse(session=new_session_stream.info)
 
     def on_create_session(self, session_stream: SessionStream, device: Device) -> None:
         """Hook for user-defined procedures when a session is created.
@@ -154,13 +573,7 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
     def DeleteSession(
         self, request: DeleteSessionRequest, context: grpc.ServicerContext | None = None
     ) -> DeleteSessionResponse:
-        try:
-            session_stream = self.client_sessions.pop(request.session_id.value)
-        except KeyError:
-            raise NotFound("Session not found")
-
-        rr.disconnect(session_stream.stream)
-        logger.info("Deleted session: %s", session_stream.info)
+        session_stream = self._delete_session_stream(request.session_id.value)
 
         self.on_delete_session(session_stream=session_stream)
 
@@ -190,7 +603,7 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         self, request: ListSessionsRequest, context: grpc.ServicerContext | None = None
     ) -> ListSessionsResponse:
         current_sessions = [
-            session_stream.info for session_stream in self.client_sessions.values()
+            session_stream.info for session_stream in self._list_session_streams()
         ]
 
         logger.info("Listed %s current sessions", len(current_sessions))
@@ -204,14 +617,7 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
 
         @private
         """
-        session_stream = self._get_session_stream(request.session_id.value)
-
-        if request.device in session_stream.info.devices:
-            raise InvalidArgument("Device already in session")
-
-        session_stream.info.devices.append(request.device)
-
-        logger.info("Client %s joined session %s", request.device, request.session_id)
+        session_stream = self._add_device_to_session(request)
 
         self.on_join_session(session_stream=session_stream, device=request.device)
 
@@ -237,16 +643,7 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
 
         @private
         """
-        session_stream = self._get_session_stream(request.session_id.value)
-
-        try:
-            session_stream.info.devices.remove(request.device)
-        except ValueError:
-            raise NotFound("Device not in session")
-
-        logger.info(
-            "Client %s left session %s", request.device, request.session_id.value
-        )
+        session_stream = self._remove_device_from_session(request)
 
         self.on_leave_session(
             session_stream=session_stream,
@@ -269,146 +666,302 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         request: SaveARFramesRequest,
         context: grpc.ServicerContext | None = None,
     ) -> SaveARFramesResponse:
-        """Save AR frames to a session. Frames can be of different types and chronologically unordered."""
+        """Save AR frames to a session. Frames can be of different types and chronologically unordered.
+
+        With an ingest queue, this only validates and enqueues the frames and returns before they are saved.
+        """
         if len(request.frames) == 0:
             raise InvalidArgument("No frames provided")
 
-        session_stream = self._get_session_stream(request.session_id.value)
+        session_stream = self._get_session_stream_of_device(
+            request.session_id.value, request.device
+        )
+        self._check_frames(request.frames)
+        self._admit_frames(session_stream, request.device, request.frames)
 
-        if request.device not in session_stream.info.devices:
-            raise NotFound("Device not in session")
+        self._submit_ar_frames(
+            frames=request.frames,
+            session_stream=session_stream,
+            device=request.device,
+        )
 
-        frames_grouped_by_type = {
-            type: [
-                frame for frame in request.frames if frame.WhichOneof("data") == type
-            ]
-            for type in ARFrameType
-        }
-        for frame_type, frames in frames_grouped_by_type.items():
-            if len(frames) == 0:
-                continue
+        return SaveARFramesResponse()
+
+    def StreamARFrames(
+        self,
+        request_iterator: Iterator[StreamARFramesRequest],
+        context: grpc.ServicerContext | None = None,
+    ) -> Iterator[StreamARFramesResponse]:
+        """Save AR frames to a session as they arrive on a stream.
+
+        The first request message binds the stream to its session and device, which are looked
+        up once instead of once per batch. The server grants `stream_window` credits when the
+        stream opens and acks every `stream_ack_interval` processed messages, granting as many
+        credits back, so a client that only sends while it holds credits never has more than
+        `stream_window` messages in flight. With an ingest queue, a message is acked once its
+        frames are enqueued.
+        """
+        yield StreamARFramesResponse(credits=self.stream_window)
+
+        session_stream: SessionStream | None = None
+        device = Device()
+        acked_messages = 0
+        for request in request_iterator:
+            if session_stream is None:
+                session_stream, device = self._bind_frame_stream(request)
+            self._check_frames(request.frames)
+            self._admit_frames(session_stream, device, request.frames)
+
+            if len(request.frames) != 0:
+                self._submit_ar_frames(
+                    frames=request.frames,
+                    session_stream=session_stream,
+                    device=device,
+                )
+
+            acked_messages += 1
+            ack = self._stream_ack(acked_messages)
+            if ack is not None:
+                yield ack
+
+        ack = self._final_stream_ack(acked_messages)
+        if ack is not None:
+            yield ack
+
+    def _submit_ar_frames(
+        self,
+        frames: Sequence[ARFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        self._submit(
+            partial(
+                self._save_ar_frames,
+                frames=frames,
+                session_stream=session_stream,
+                device=device,
+            ),
+            session_stream,
+        )
+
+    def _submit(self, save: Callable[[], None], session_stream: SessionStream) -> None:
+        """Call `save` inline, or hand it to the ingest queue of `session_stream` if it has one.
 
-            if frame_type == ARFrameType.TRANSFORM_FRAME and frames[0].transform_frame:
+        Every save of a session with an ingest queue goes through the queue, so that its frames
+        are saved by a single consumer in the order they were received.
+        """
+        if session_stream.ingest_queue is None:
+            save()
+            return
+
+        session_stream.ingest_queue.put(save)
+
+    def _save_ar_frames(
+        self,
+        frames: Sequence[ARFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        with tracer.span("save_ar_frames", frames=len(frames)):
+            with tracer.span("classify_frames"):
+                classified = classify_frames(frames)
+            self._record_received_frames(classified)
+            if len(classified.transform_frames) != 0:
                 self._process_transform_frames(
-                    frames=[f.transform_frame for f in frames],
+                    frames=classified.transform_frames,
                     session_stream=session_stream,
-                    device=request.device,
+                    device=device,
                 )
-            elif frame_type == ARFrameType.COLOR_FRAME and frames[0].color_frame:
+            if len(classified.color_frames) != 0:
                 self._process_color_frames(
-                    frames=[f.color_frame for f in frames],
+                    frames=classified.color_frames,
                     session_stream=session_stream,
-                    device=request.device,
+                    device=device,
+                    grouped_frames=classified.color_frame_groups,
                 )
-            elif frame_type == ARFrameType.DEPTH_FRAME and frames[0].depth_frame:
+            if len(classified.depth_frames) != 0:
                 self._process_depth_frames(
-                    frames=[f.depth_frame for f in frames],
+                    frames=classified.depth_frames,
                     session_stream=session_stream,
-                    device=request.device,
+                    device=device,
+                    grouped_frames=classified.depth_frame_groups,
                 )
-            elif (
-                frame_type == ARFrameType.GYROSCOPE_FRAME and frames[0].gyroscope_frame
-            ):
+            if len(classified.gyroscope_frames) != 0:
                 self._process_gyroscope_frames(
-                    frames=[f.gyroscope_frame for f in frames],
+                    frames=classified.gyroscope_frames,
                     session_stream=session_stream,
-                    device=request.device,
+                    device=device,
                 )
-            elif frame_type == ARFrameType.AUDIO_FRAME and frames[0].audio_frame:
+            if len(classified.audio_frames) != 0:
                 self._process_audio_frames(
-                    frames=[f.audio_frame for f in frames],
+                    frames=classified.audio_frames,
                     session_stream=session_stream,
-                    device=request.device,
+                    device=device,
                 )
-            elif (
-                frame_type == ARFrameType.PLANE_DETECTION_FRAME
-                and frames[0].plane_detection_frame
-            ):
+            if len(classified.plane_detection_frames) != 0:
                 self._process_plane_detection_frames(
-                    frames=[f.plane_detection_frame for f in frames],
+                    frames=classified.plane_detection_frames,
                     session_stream=session_stream,
-                    device=request.device,
+                    device=device,
                 )
-            elif (
-                frame_type == ARFrameType.POINT_CLOUD_DETECTION_FRAME
-                and frames[0].point_cloud_detection_frame
-            ):
+            if len(classified.point_cloud_detection_frames) != 0:
                 self._process_point_cloud_detection_frames(
-                    frames=[f.point_cloud_detection_frame for f in frames],
+                    frames=classified.point_cloud_detection_frames,
                     session_stream=session_stream,
-                    device=request.device,
+                    device=device,
                 )
-            elif (
-                frame_type == ARFrameType.MESH_DETECTION_FRAME
-                and frames[0].mesh_detection_frame
-            ):
+            if len(classified.mesh_detection_frames) != 0:
                 self._process_mesh_detection_frames(
-                    frames=[f.mesh_detection_frame for f in frames],
+                    frames=classified.mesh_detection_frames,
+                    session_stream=session_stream,
+                    device=device,
+                )
+            if len(classified.imu_batch_frames) != 0:
+                self._process_imu_batch_frames(
+                    frames=classified.imu_batch_frames,
                     session_stream=session_stream,
-                    device=request.device,
+                    device=device,
+                )
+            if len(classified.audio_chunk_frames) != 0:
+                self._process_audio_chunk_frames(
+                    frames=classified.audio_chunk_frames,
+                    session_stream=session_stream,
+                    device=device,
                 )
 
-        logger.debug(
-            "Saved AR frames of device %s to session %s",
-            request.device,
-            session_stream.info.id.value,
-        )
+            logger.debug(
+                "Saved AR frames of device %s to session %s",
+                device,
+                session_stream.info.id.value,
+            )
 
-        self.on_save_ar_frames(
-            frames=request.frames,
+            self._run_hook(
+                "on_save_ar_frames",
+                frames=frames,
+                session_stream=session_stream,
+                device=device,
+            )
+
+    def _run_hook(
+        self,
+        hook_name: str,
+        session_stream: SessionStream,
+        device: Device,
+        **kwargs: Any,
+    ) -> None:
+        """Call the `hook_name` hook inline, or hand it to the hook executor if there is one.
+
+        `kwargs` are the frames or batch the hook is called with.
+        """
+        hook = getattr(self, hook_name)
+        if self.hook_executor is None:
+            with tracer.span(hook_name):
+                hook(session_stream=session_stream, device=device, **kwargs)
+            return
+        self.hook_executor.submit(
+            session_stream.info.id.value,
+            hook_name,
+            tracer.traced(hook_name, hook),
             session_stream=session_stream,
-            device=request.device,
+            device=device,
+            **kwargs,
         )
 
-        return SaveARFramesResponse()
-
     def _process_transform_frames(
         self,
         frames: Sequence[TransformFrame],
         session_stream: SessionStream,
         device: Device,
     ) -> None:
-        session_stream.save_transform_frames(
-            frames=frames,
-            device=device,
-        )
-        self.on_save_transform_frames(
+        with tracer.span("save_transform_frames", frames=len(frames)):
+            batches = session_stream.save_transform_frames(
+                frames=frames,
+                device=device,
+            )
+        self._run_hook(
+            "on_save_transform_frames",
             frames=frames,
             session_stream=session_stream,
             device=device,
         )
+        for batch in batches:
+            self._run_hook(
+                "on_save_transform_batch",
+                batch=batch,
+                session_stream=session_stream,
+                device=device,
+            )
 
     def _process_color_frames(
         self,
         frames: Sequence[ColorFrame],
         session_stream: SessionStream,
         device: Device,
+        grouped_frames: Mapping[ColorFrameGroupKey, Sequence[ColorFrame]] | None = None,
     ) -> None:
-        session_stream.save_color_frames(
-            frames=frames,
-            device=device,
-        )
-        self.on_save_color_frames(
+        with tracer.span("save_color_frames", frames=len(frames)):
+            batches = session_stream.save_color_frames(
+                frames=frames,
+                device=device,
+                grouped_frames=grouped_frames,
+            )
+        self._run_hook(
+            "on_save_color_frames",
             frames=frames,
             session_stream=session_stream,
             device=device,
         )
+        for batch in batches:
+            self._run_hook(
+                "on_save_color_batch",
+                batch=batch,
+                session_stream=session_stream,
+                device=device,
+            )
+        self._release_decoded_frames(frames, session_stream)
 
     def _process_depth_frames(
         self,
         frames: Sequence[DepthFrame],
         session_stream: SessionStream,
         device: Device,
+        grouped_frames: Mapping[DepthFrameGroupKey, Sequence[DepthFrame]] | None = None,
     ) -> None:
-        session_stream.save_depth_frames(
-            frames=frames,
-            device=device,
-        )
-        self.on_save_depth_frames(
+        with tracer.span("save_depth_frames", frames=len(frames)):
+            batches = session_stream.save_depth_frames(
+                frames=frames,
+                device=device,
+                grouped_frames=grouped_frames,
+            )
+        self._run_hook(
+            "on_save_depth_frames",
             frames=frames,
             session_stream=session_stream,
             device=device,
         )
+        for batch in batches:
+            self._run_hook(
+                "on_save_depth_batch",
+                batch=batch,
+                session_stream=session_stream,
+                device=device,
+            )
+        self._release_decoded_frames(frames, session_stream)
+
+    def _release_decoded_frames(
+        self, frames: Sequence[ColorFrame | DepthFrame], session_stream: SessionStream
+    ) -> None:
+        if self.hook_executor is None:
+            session_stream.decoded_frames.release(frames)
+            return
+        # Runs after the hooks just submitted for `frames`, as the calls of a session run in order.
+        # If the hook executor drops the call, the frames are evicted once the cache is full instead.
+        self.hook_executor.submit(
+            session_stream.info.id.value,
+            "release_decoded_frames",
+            session_stream.decoded_frames.release,
+            frames,
+        )
 
     def _process_gyroscope_frames(
         self,
@@ -416,11 +969,13 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         session_stream: SessionStream,
         device: Device,
     ) -> None:
-        session_stream.save_gyroscope_frames(
-            frames=frames,
-            device=device,
-        )
-        self.on_save_gyroscope_frames(
+        with tracer.span("save_gyroscope_frames", frames=len(frames)):
+            session_stream.save_gyroscope_frames(
+                frames=frames,
+                device=device,
+            )
+        self._run_hook(
+            "on_save_gyroscope_frames",
             frames=frames,
             session_stream=session_stream,
             device=device,
@@ -432,27 +987,67 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         session_stream: SessionStream,
         device: Device,
     ) -> None:
-        session_stream.save_audio_frames(
+        with tracer.span("save_audio_frames", frames=len(frames)):
+            session_stream.save_audio_frames(
+                frames=frames,
+                device=device,
+            )
+        self._run_hook(
+            "on_save_audio_frames",
             frames=frames,
+            session_stream=session_stream,
             device=device,
         )
-        self.on_save_audio_frames(
+
+    def _process_imu_batch_frames(
+        self,
+        frames: Sequence[ImuBatchFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        with tracer.span("save_imu_batch_frames", frames=len(frames)):
+            session_stream.save_imu_batch_frames(
+                frames=frames,
+                device=device,
+            )
+        self._run_hook(
+            "on_save_imu_batch_frames",
             frames=frames,
             session_stream=session_stream,
             device=device,
         )
 
-    def _process_plane_detection_frames(
+    def _process_audio_chunk_frames(
         self,
-        frames: Sequence[PlaneDetectionFrame],
+        frames: Sequence[AudioChunkFrame],
         session_stream: SessionStream,
         device: Device,
     ) -> None:
-        session_stream.save_plane_detection_frames(
+        with tracer.span("save_audio_chunk_frames", frames=len(frames)):
+            session_stream.save_audio_chunk_frames(
+                frames=frames,
+                device=device,
+            )
+        self._run_hook(
+            "on_save_audio_chunk_frames",
             frames=frames,
+            session_stream=session_stream,
             device=device,
         )
-        self.on_save_plane_detection_frames(
+
+    def _process_plane_detection_frames(
+        self,
+        frames: Sequence[PlaneDetectionFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        with tracer.span("save_plane_detection_frames", frames=len(frames)):
+            session_stream.save_plane_detection_frames(
+                frames=frames,
+                device=device,
+            )
+        self._run_hook(
+            "on_save_plane_detection_frames",
             frames=frames,
             session_stream=session_stream,
             device=device,
@@ -464,11 +1059,13 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         session_stream: SessionStream,
         device: Device,
     ) -> None:
-        session_stream.save_point_cloud_detection_frames(
-            frames=frames,
-            device=device,
-        )
-        self.on_save_point_cloud_detection_frames(
+        with tracer.span("save_point_cloud_detection_frames", frames=len(frames)):
+            session_stream.save_point_cloud_detection_frames(
+                frames=frames,
+                device=device,
+            )
+        self._run_hook(
+            "on_save_point_cloud_detection_frames",
             frames=frames,
             session_stream=session_stream,
             device=device,
@@ -480,11 +1077,13 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         session_stream: SessionStream,
         device: Device,
     ) -> None:
-        session_stream.save_mesh_detection_frames(
-            frames=frames,
-            device=device,
-        )
-        self.on_save_mesh_detection_frames(
+        with tracer.span("save_mesh_detection_frames", frames=len(frames)):
+            session_stream.save_mesh_detection_frames(
+                frames=frames,
+                device=device,
+            )
+        self._run_hook(
+            "on_save_mesh_detection_frames",
             frames=frames,
             session_stream=session_stream,
             device=device,
@@ -550,6 +1149,57 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         """
         pass
 
+    def on_save_transform_batch(
+        self,
+        batch: TransformBatch,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when transform frames are saved to a recording stream, with their decoded poses.
+
+        Called after `on_save_transform_frames` with the same frames.
+
+        Args:
+            batch: The poses that were logged.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    def on_save_color_batch(
+        self,
+        batch: ColorBatch,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when color frames are saved to a recording stream, with their decoded images.
+
+        Called after `on_save_color_frames`, once for each group of frames with the same format and resolution.
+
+        Args:
+            batch: The images that were logged.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    def on_save_depth_batch(
+        self,
+        batch: DepthBatch,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when depth frames are saved to a recording stream, with their decoded depth images.
+
+        Called after `on_save_depth_frames`, once for each group of frames with the same format, resolution and smoothness.
+
+        Args:
+            batch: The depth images that were logged.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
     def on_save_gyroscope_frames(
         self,
         frames: Sequence[GyroscopeFrame],
@@ -580,6 +1230,36 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         """
         pass
 
+    def on_save_imu_batch_frames(
+        self,
+        frames: Sequence[ImuBatchFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when packed IMU batch frames are saved to a recording stream.
+
+        Args:
+            frames: The IMU batch frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
+    def on_save_audio_chunk_frames(
+        self,
+        frames: Sequence[AudioChunkFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        """Hook for user-defined procedures when packed audio chunk frames are saved to a recording stream.
+
+        Args:
+            frames: The audio chunk frames.
+            session_stream: The session stream.
+            device: The device that sent the AR frames.
+        """
+        pass
+
     def on_save_plane_detection_frames(
         self,
         frames: Sequence[PlaneDetectionFrame],
@@ -630,72 +1310,113 @@ class ARFlowServicer(arflow_service_pb2_grpc.ARFlowServiceServicer):
         request: SaveSynchronizedARFrameRequest,
         context: grpc.ServicerContext | None = None,
     ) -> SaveSynchronizedARFrameResponse:
-        session_stream = self._get_session_stream(request.session_id.value)
+        """Save a synchronized AR frame to a session.
 
-        if request.device not in session_stream.info.devices:
-            raise NotFound("Device not in session")
+        With an ingest queue, this only enqueues the frame, behind the frames of the session
+        that were received before it.
+        """
+        session_stream = self._get_session_stream_of_device(
+            request.session_id.value, request.device
+        )
+        self._check_frames([request.frame])
+        self._admit_frames(session_stream, request.device, [request.frame])
+
+        self._submit(
+            partial(
+                self._save_synchronized_ar_frame,
+                frame=request.frame,
+                session_stream=session_stream,
+                device=request.device,
+            ),
+            session_stream,
+        )
 
+        return SaveSynchronizedARFrameResponse()
+
+    def _save_synchronized_ar_frame(
+        self,
+        frame: SynchronizedARFrame,
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
         self._process_transform_frames(
-            frames=[request.frame.transform_frame],
+            frames=[frame.transform_frame],
             session_stream=session_stream,
-            device=request.device,
+            device=device,
         )
         self._process_depth_frames(
-            frames=[request.frame.depth_frame],
+            frames=[frame.depth_frame],
             session_stream=session_stream,
-            device=request.device,
+            device=device,
         )
         self._process_color_frames(
-            frames=[request.frame.color_frame],
+            frames=[frame.color_frame],
             session_stream=session_stream,
-            device=request.device,
+            device=device,
         )
         self._process_gyroscope_frames(
-            frames=[request.frame.gyroscope_frame],
+            frames=[frame.gyroscope_frame],
             session_stream=session_stream,
-            device=request.device,
+            device=device,
         )
         self._process_audio_frames(
-            frames=[request.frame.audio_frame],
+            frames=[frame.audio_frame],
             session_stream=session_stream,
-            device=request.device,
+            device=device,
         )
         self._process_plane_detection_frames(
-            frames=[request.frame.plane_detection_frame],
+            frames=[frame.plane_detection_frame],
             session_stream=session_stream,
-            device=request.device,
+            device=device,
         )
         self._process_point_cloud_detection_frames(
-            frames=[request.frame.point_cloud_detection_frame],
+            frames=[frame.point_cloud_detection_frame],
             session_stream=session_stream,
-            device=request.device,
+            device=device,
         )
         self._process_mesh_detection_frames(
-            frames=[request.frame.mesh_detection_frame],
+            frames=[frame.mesh_detection_frame],
             session_stream=session_stream,
-            device=request.device,
+            device=device,
         )
 
         logger.info(
             "Saved synchronized AR frame of device %s to session %s",
-            request.device,
+            device,
             session_stream.info.id.value,
         )
 
-        return SaveSynchronizedARFrameResponse()
+    def reap_idle_sessions(self, now: float | None = None) -> list[SessionStream]:
+        """Delete sessions and remove devices that have been idle for longer than `idle_timeout`.
+
+        Deleting a session disconnects its recording, which flushes it and releases what it
+        buffered. Fires `on_leave_session` for every removed device and `on_delete_session`
+        for every deleted session. Does nothing if `idle_timeout` is `None`.
+
+        Args:
+            now: Monotonic time to measure idleness against. Defaults to the current time.
+
+        Returns:
+            The deleted session streams.
+        """
+        reaped_session_streams, removed_devices = self._reap_idle_session_streams(now)
+        for session_stream, device in removed_devices:
+            self.on_leave_session(session_stream=session_stream, device=device)
+        for session_stream in reaped_session_streams:
+            self.on_delete_session(session_stream=session_stream)
+        return reaped_session_streams
 
     def on_server_exit(self) -> None:
-        """Closes all TCP connections, servers, and files.
+        """Stops reaping idle sessions, closes all TCP connections, servers, and files, then waits for the pending hooks.
 
         @private
         """
-        logger.debug("Closing all TCP connections, servers, and files...")
-        # Disconnects the global recording. Without this, this function will hang indefinitely.
-        rr.disconnect()
-        for id, session in self.client_sessions.items():
-            rr.disconnect(session.stream)
-            logger.debug("Disconnected session: %s", id)
-        logger.debug("All clients disconnected")
+        if self._session_reaper is not None:
+            self._session_reaper.close()
+        super().on_server_exit()
+        # After the ingest queues are closed, since their threads submit hooks.
+        if self.hook_executor is not None:
+            self.hook_executor.close()
 
 
 # TODO: Integration tests once more infrastructure work has been done (e.g., Docker). Remove pragma once implemented.
@@ -705,6 +1426,17 @@ def run_server(  # pragma: no cover
     save_dir: Path | None = None,
     application_id: str = "arflow",
     port: int = 8500,
+    ingest_queue_size: int = 0,
+    overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    idle_timeout: float | None = None,
+    admission_controller: AdmissionController | None = None,
+    metrics_port: int | None = None,
+    hook_executor: HookExecutor | None = None,
+    log_encoded_images: bool = False,
+    decode_workers: int | None = None,
+    depth_codec: DepthCodec = DepthCodec.NONE,
+    point_cloud_budget: int = 0,
+    max_message_length: int = DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
 ) -> None:
     """Run gRPC server.
 
@@ -713,26 +1445,57 @@ def run_server(  # pragma: no cover
         spawn_viewer: Whether to spawn the Rerun Viewer in another process.
         save_dir: The path to save the data to.
         port: The port to listen on.
+        ingest_queue_size: Number of frame batches each session may buffer before they are saved. 0 saves them inline.
+        overflow_policy: What a full session ingest queue does with a new batch.
+        idle_timeout: Seconds without frames after which devices and sessions are reaped. `None` keeps them forever.
+        admission_controller: Rate limits that calls carrying frames must stay within. `None` admits all frames.
+        metrics_port: Local port to serve metrics on in the Prometheus text format. `None` disables metrics.
+        hook_executor: Runs the `on_save_*` hooks off the threads that save frames. `None` runs them inline.
+        log_encoded_images: Whether to log JPEG and PNG color frames undecoded, leaving their decoding to the viewer.
+        decode_workers: Threads decoding JPEG and PNG color frames, shared by all sessions. `None` uses one per
+            available core, and 0 decodes them on the thread saving the frames.
+        depth_codec: How depth images are stored in the recordings. See `arflow.DepthCodec`.
+        point_cloud_budget: Points of the point clouds each session remembers to log only their changes. 0 logs every cloud whole.
+        max_message_length: Largest request in bytes that the server receives. Lowered to the smallest
+            byte burst of `admission_controller`, since larger requests are never admitted.
 
     Raises:
-        ValueError: If neither or both operational modes are selected.
+        ValueError: If neither or both operational modes are selected, or if `max_message_length` is not positive.
     """
+    receive_message_length = max_receive_message_length(
+        admission_controller, max_message_length
+    )
+    metrics = ARFlowMetrics() if metrics_port is not None else None
     try:
         servicer = service(
             spawn_viewer=spawn_viewer,
             save_dir=save_dir,
             application_id=application_id,
+            ingest_queue_size=ingest_queue_size,
+            overflow_policy=overflow_policy,
+            idle_timeout=idle_timeout,
+            admission_controller=admission_controller,
+            metrics=metrics,
+            hook_executor=hook_executor,
+            log_encoded_images=log_encoded_images,
+            decode_workers=decode_workers,
+            depth_codec=depth_codec,
+            point_cloud_budget=point_cloud_budget,
         )
     except ValueError as e:
         raise e
-    interceptors = [ErrorInterceptor()]  # pyright: ignore [reportUnknownVariableType]
+    interceptors: list[grpc.ServerInterceptor] = [ErrorInterceptor()]
+    metrics_server = None
+    if metrics is not None and metrics_port is not None:
+        interceptors.append(MetricsInterceptor(metrics))
+        metrics_server = start_metrics_server(metrics, metrics_port)
     server = grpc.server(  # pyright: ignore [reportUnknownMemberType]
         futures.ThreadPoolExecutor(max_workers=10),
         compression=grpc.Compression.Gzip,
         interceptors=interceptors,  # pyright: ignore [reportArgumentType]
         options=[
             # ("grpc.max_send_message_length", -1),
-            ("grpc.max_receive_message_length", -1),
+            ("grpc.max_receive_message_length", receive_message_length),
         ],
     )
     arflow_service_pb2_grpc.add_ARFlowServiceServicer_to_server(servicer, server)  # pyright: ignore [reportUnknownMemberType]
@@ -760,6 +1523,8 @@ def run_server(  # pragma: no cover
         all_rpcs_done_event.wait(30)
 
         servicer.on_server_exit()
+        if metrics_server is not None:
+            metrics_server.shutdown()
 
         # TODO: Discuss hook for user-defined cleanup procedures.
 
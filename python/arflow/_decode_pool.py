@@ -0,0 +1,133 @@
+"""Decodes the images of a color frame batch concurrently, on threads shared by all sessions."""
+
+import os
+import threading
+from collections.abc import Sequence
+from concurrent import futures
+
+import numpy as np
+import numpy.typing as npt
+
+from arflow._decoded_frames import DecodedFrame
+from arflow._metrics import ARFlowMetrics
+
+
+def available_cores() -> int:
+    """Number of cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class DecodePool:
+    """Decodes the frames of a batch on a pool of threads, into one preallocated array.
+
+    OpenCV releases the GIL while it decodes an image, so the JPEG and PNG frames of a batch
+    decode in parallel. Each frame is written to its own row, so the batch keeps the order
+    of its frames whichever thread finishes first.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers: Number of decoding threads. `None` uses one per available core.
+
+        Raises:
+            ValueError: If `max_workers` is not positive.
+        """
+        if max_workers is None:
+            max_workers = available_cores()
+        if max_workers <= 0:
+            raise ValueError("Decode pool needs at least one worker.")
+        self.max_workers = max_workers
+        """Number of decoding threads."""
+        self.queued = 0
+        """Number of frames waiting for a thread."""
+        self.running = 0
+        """Number of frames being decoded."""
+        self.decoded = 0
+        """Number of frames the pool decoded successfully."""
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="arflow-decode"
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of the threads decoding a frame."""
+        return self.running / self.max_workers
+
+    def record_into(self, metrics: ARFlowMetrics) -> None:
+        """Expose the frames waiting for and running on the pool, and its saturation, in `metrics`."""
+        metrics.add_gauge(
+            "arflow_decode_pool_frames",
+            "Number of frames waiting for or being decoded on the decode pool.",
+            lambda: [(("queued",), self.queued), (("running",), self.running)],
+            label_names=("state",),
+        )
+        metrics.add_gauge(
+            "arflow_decode_pool_saturation",
+            "Fraction of the decode pool threads decoding a frame.",
+            lambda: [((), self.saturation)],
+        )
+
+    def stack(
+        self, frames: Sequence[DecodedFrame], representation: str
+    ) -> npt.NDArray[np.uint8]:
+        """Decode `representation` of `frames` into one read-only array of shape `(N, H, W, 3)`.
+
+        Like `stack_decoded`, each frame then caches its row of the array. Frames that have
+        the representation decoded already are copied instead of being decoded again.
+
+        Args:
+            frames: Color frames of the same format and dimensions.
+            representation: `"rgb"` or `"bgr"`.
+
+        Raises:
+            ValueError: If a frame cannot be decoded.
+            RuntimeError: If the pool was closed.
+        """
+        stacked = np.empty(
+            (len(frames), frames[0].height, frames[0].width, 3), dtype=np.uint8
+        )
+        pending: list[futures.Future[None]] = []
+        for frame, row in zip(frames, stacked):
+            decoded = frame._representations.get(representation)  # pyright: ignore [reportPrivateUsage]
+            if decoded is not None:
+                row[:] = decoded
+                frame._adopt(representation, row)  # pyright: ignore [reportPrivateUsage]
+                frame._cache._hit(frame)  # pyright: ignore [reportPrivateUsage]
+                continue
+            with self._lock:
+                self.queued += 1
+            try:
+                pending.append(
+                    self._pool.submit(self._decode, frame, representation, row)
+                )
+            except RuntimeError:
+                with self._lock:
+                    self.queued -= 1
+                raise
+        for future in pending:
+            future.result()
+        stacked.flags.writeable = False
+        return stacked
+
+    def close(self) -> None:
+        """Finish the frames being decoded, then stop the threads."""
+        self._pool.shutdown(wait=True)
+
+    def _decode(
+        self, frame: DecodedFrame, representation: str, row: npt.NDArray[np.uint8]
+    ) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            frame._decode_into(representation, row)  # pyright: ignore [reportPrivateUsage]
+            with self._lock:
+                self.decoded += 1
+        finally:
+            with self._lock:
+                self.running -= 1
@@ -0,0 +1,468 @@
+"""Color and depth frames decoded on demand, sharing each decoding between the consumers of a frame."""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+
+from arflow._types import YuvLayout
+from arflow._yuv import (
+    FULL_RANGE_YUV_FORMATS,
+    YUV_FORMATS,
+    YuvBufferPool,
+    write_i420,
+    write_nv12,
+    yuv_layout,
+    yuv_size,
+)
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DECODED_FRAME_BUDGET = 256 * 1024 * 1024
+"""Bytes of decoded frames a session keeps by default."""
+
+MAX_DECODED_FRAMES = 10_000
+"""Number of frames a cache tracks before evicting the least recently used ones, whatever their size."""
+
+DEPTH_UINT16_UNITS_PER_METER = 1000.0
+"""`FORMAT_DEPTHUINT16` depth images hold millimeters."""
+
+
+def depth_to_millimeters(depth: npt.NDArray[np.float32]) -> npt.NDArray[np.uint16]:
+    """Round depth in meters to the nearest millimeter, saturating to the range of `uint16`.
+
+    Negative and non-finite depths become 0. See `DepthCodec.UINT16_MILLIMETERS` for the error bounds.
+    """
+    # OpenCV rounds and saturates in one pass, where NumPy takes one per step.
+    millimeters = cv2.multiply(  # pyright: ignore [reportCallIssue, reportUnknownVariableType]
+        depth.reshape((-1, depth.shape[-1])),
+        DEPTH_UINT16_UNITS_PER_METER,  # pyright: ignore [reportArgumentType]
+        dtype=cv2.CV_16U,
+    )
+    return np.asarray(millimeters, dtype=np.uint16).reshape(depth.shape)
+
+
+class DecodedFrame:
+    """Lazily decoded representations of a color or depth frame.
+
+    Each representation is decoded the first time it is asked for, then kept in the session's
+    `DecodedFrameCache` so that later consumers of the frame get the same read-only array.
+    Get instances from `DecodedFrameCache.get` rather than constructing them.
+    """
+
+    def __init__(self, frame: ColorFrame | DepthFrame, cache: "DecodedFrameCache"):
+        self.frame = frame
+        """The frame as received."""
+        self._cache = cache
+        self._representations: dict[str, npt.NDArray[Any]] = {}
+        self._charges: dict[str, int] = {}
+
+    @property
+    def format(self) -> XRCpuImage.Format.ValueType:
+        """Format the frame was sent in."""
+        return self.frame.image.format
+
+    @property
+    def width(self) -> int:
+        """Width of the image, in pixels."""
+        return self.frame.image.dimensions.x
+
+    @property
+    def height(self) -> int:
+        """Height of the image, in pixels."""
+        return self.frame.image.dimensions.y
+
+    def i420(self) -> npt.NDArray[np.uint8]:
+        """The Y, U and V planes of a YUV frame, flattened one after the other.
+
+        Raises:
+            ValueError: If the frame is not in a YUV format.
+        """
+        return self._get(YuvLayout.I420, self._decode_i420)
+
+    def nv12(self) -> npt.NDArray[np.uint8]:
+        """The Y plane, then the interleaved U and V samples of a YUV frame, flattened.
+
+        Raises:
+            ValueError: If the frame is not a YUV frame whose chroma planes interleave as NV12.
+        """
+        return self._get(YuvLayout.NV12, self._decode_nv12)
+
+    def rgb(self) -> npt.NDArray[np.uint8]:
+        """The image as RGB pixels. Shape `(H, W, 3)`.
+
+        Raises:
+            ValueError: If the frame is not in a supported color format.
+        """
+        return self._get("rgb", self._decode_rgb)
+
+    def bgr(self) -> npt.NDArray[np.uint8]:
+        """The image as BGR pixels, the channel order of OpenCV. Shape `(H, W, 3)`.
+
+        Raises:
+            ValueError: If the frame is not in a supported color format.
+        """
+        return self._get("bgr", self._decode_bgr)
+
+    def depth(self) -> npt.NDArray[np.float32]:
+        """The depth image in meters. Shape `(H, W)`.
+
+        Raises:
+            ValueError: If the frame is not in a supported depth format.
+        """
+        return self._get("depth", self._decode_depth)
+
+    def _get(
+        self, representation: str, decode: Callable[[], tuple[npt.NDArray[Any], bool]]
+    ) -> npt.NDArray[Any]:
+        array = self._representations.get(representation)
+        if array is not None:
+            self._cache._hit(self)  # pyright: ignore [reportPrivateUsage]
+            return array
+        # Decoded outside the cache lock, so two threads asking at once may both decode.
+        array, owned = decode()
+        self._adopt(representation, array, owned, miss=True)
+        return array
+
+    def _adopt(
+        self,
+        representation: str,
+        array: npt.NDArray[Any],
+        owned: bool = True,
+        miss: bool = False,
+    ) -> None:
+        """Cache `array` as `representation`. Views of the received frame are not charged."""
+        array.flags.writeable = False
+        self._cache._store(  # pyright: ignore [reportPrivateUsage]
+            self, representation, array, array.nbytes if owned else 0, miss
+        )
+
+    def _decode_into(self, representation: str, out: npt.NDArray[Any]) -> None:
+        """Write `representation` into `out`, which the frame then caches as it."""
+        decoded = self._representations.get(representation)
+        if decoded is not None:
+            out[...] = decoded
+            self._cache._hit(self)  # pyright: ignore [reportPrivateUsage]
+        else:
+            getattr(self, f"_decode_{representation}")(out)
+        self._adopt(representation, out, miss=decoded is None)
+
+    def _empty_stack(self, representation: str, num_frames: int) -> npt.NDArray[Any]:
+        """An uninitialized array to write `representation` of `num_frames` frames like this one into."""
+        if representation in (YuvLayout.I420, YuvLayout.NV12):
+            return np.empty(
+                (num_frames, yuv_size(self.width, self.height)), dtype=np.uint8
+            )
+        if representation == "depth":
+            return np.empty((num_frames, self.height, self.width), dtype=np.float32)
+        return np.empty((num_frames, self.height, self.width, 3), dtype=np.uint8)
+
+    def _decode_i420(
+        self, out: npt.NDArray[np.uint8] | None = None
+    ) -> tuple[npt.NDArray[np.uint8], bool]:
+        if self.format not in YUV_FORMATS:
+            raise ValueError(f"Frame in format {self.format} has no I420 planes.")
+        if out is None:
+            out = np.empty(yuv_size(self.width, self.height), dtype=np.uint8)
+        write_i420(self.frame.image, out)
+        return out, True
+
+    def _decode_nv12(
+        self, out: npt.NDArray[np.uint8] | None = None
+    ) -> tuple[npt.NDArray[np.uint8], bool]:
+        if (
+            self.format not in YUV_FORMATS
+            or yuv_layout(self.frame.image) != YuvLayout.NV12
+        ):
+            raise ValueError(f"Frame in format {self.format} has no NV12 planes.")
+        if out is None:
+            out = np.empty(yuv_size(self.width, self.height), dtype=np.uint8)
+        write_nv12(self.frame.image, out)
+        return out, True
+
+    def _decode_rgb(
+        self, out: npt.NDArray[np.uint8] | None = None
+    ) -> tuple[npt.NDArray[np.uint8], bool]:
+        if self.format == XRCpuImage.FORMAT_RGB24:
+            return _copy_into(
+                self._plane_view(np.uint8, (self.height, self.width, 3)), out
+            )
+        if self.format in YUV_FORMATS:
+            return self._convert_yuv(
+                cv2.COLOR_YUV2RGB_I420, cv2.COLOR_YUV2RGB_NV12, cv2.COLOR_YCrCb2RGB, out
+            ), True
+        if self.format in _ENCODED_FORMATS:
+            return _as_uint8(cv2.cvtColor(self.bgr(), cv2.COLOR_BGR2RGB, dst=out)), True
+        raise ValueError(f"Unsupported color frame format: {self.format}")
+
+    def _decode_bgr(
+        self, out: npt.NDArray[np.uint8] | None = None
+    ) -> tuple[npt.NDArray[np.uint8], bool]:
+        if self.format in _ENCODED_FORMATS:
+            bgr = cv2.imdecode(
+                np.frombuffer(self.frame.image.planes[0].data, dtype=np.uint8),
+                cv2.IMREAD_COLOR,
+            )
+            # OpenCV returns None for invalid data, whatever its stubs say.
+            if bgr is None:  # pyright: ignore [reportUnnecessaryComparison]
+                raise ValueError(f"Could not decode frame in format {self.format}.")
+            return _copy_into(_as_uint8(bgr), out)[0], True
+        if self.format in YUV_FORMATS:
+            return self._convert_yuv(
+                cv2.COLOR_YUV2BGR_I420, cv2.COLOR_YUV2BGR_NV12, cv2.COLOR_YCrCb2BGR, out
+            ), True
+        if self.format == XRCpuImage.FORMAT_RGB24:
+            return _as_uint8(cv2.cvtColor(self.rgb(), cv2.COLOR_RGB2BGR, dst=out)), True
+        raise ValueError(f"Unsupported color frame format: {self.format}")
+
+    def _decode_depth(
+        self, out: npt.NDArray[np.float32] | None = None
+    ) -> tuple[npt.NDArray[np.float32], bool]:
+        shape = (self.height, self.width)
+        if self.format == XRCpuImage.FORMAT_DEPTHFLOAT32:
+            return _copy_into(self._plane_view(np.float32, shape), out)
+        if self.format == XRCpuImage.FORMAT_DEPTHUINT16:
+            depth = np.divide(
+                self._plane_view(np.uint16, shape),
+                np.float32(DEPTH_UINT16_UNITS_PER_METER),
+                out=out,
+                dtype=np.float32,
+            )
+            return depth, True
+        raise ValueError(f"Unsupported depth frame format: {self.format}")
+
+    def _plane_view(
+        self, dtype: type[np.generic], shape: tuple[int, ...]
+    ) -> npt.NDArray[Any]:
+        return np.frombuffer(self.frame.image.planes[0].data, dtype=dtype).reshape(
+            shape
+        )
+
+    def _convert_yuv(
+        self,
+        i420_code: int,
+        nv12_code: int,
+        ycrcb_code: int,
+        out: npt.NDArray[np.uint8] | None = None,
+    ) -> npt.NDArray[np.uint8]:
+        """Convert whichever of the NV12 or I420 planes is decoded already, preferring NV12.
+
+        OpenCV converts 4:2:0 YUV in the limited range only. Full-range samples are those of
+        JPEG, so full-range frames are converted from YCrCb, with their chroma upsampled the
+        way OpenCV does for 4:2:0 images, by repeating each sample.
+        """
+        if self.format in FULL_RANGE_YUV_FORMATS:
+            i420 = self.i420()
+            luma_size = self.width * self.height
+            chroma_shape = (self.height // 2, self.width // 2)
+            chroma_size = chroma_shape[0] * chroma_shape[1]
+            cb, cr = (
+                cv2.resize(
+                    i420[start : start + chroma_size].reshape(chroma_shape),
+                    (self.width, self.height),
+                    interpolation=cv2.INTER_NEAREST,
+                )
+                for start in (luma_size, luma_size + chroma_size)
+            )
+            ycrcb = cv2.merge(
+                [i420[:luma_size].reshape((self.height, self.width)), cr, cb]
+            )
+            return _as_uint8(cv2.cvtColor(ycrcb, ycrcb_code, dst=out))
+        if YuvLayout.NV12 in self._representations:
+            planes, code = self.nv12(), nv12_code
+        else:
+            planes, code = self.i420(), i420_code
+        return _as_uint8(
+            cv2.cvtColor(
+                planes.reshape((self.height * 3 // 2, self.width)), code, dst=out
+            )
+        )
+
+
+class DecodedFrameCache:
+    """The decoded frames of a session, evicted least recently used first beyond a byte budget.
+
+    Logging, the `on_save_*` hooks and the batches they receive all get a frame's decoded
+    representations from here, so each is decoded once. The servicer releases the frames of
+    a request once their hooks have run. Frames are looked up by identity, so pass the
+    same message objects that the hooks received.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_DECODED_FRAME_BUDGET) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Bytes of decoded representations to keep. Representations that are views
+                of the received frames take no space and are not counted.
+
+        Raises:
+            ValueError: If `max_bytes` is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError("Decoded frame budget cannot be negative.")
+        self.max_bytes = max_bytes
+        """Bytes of decoded representations to keep."""
+        self.nbytes = 0
+        """Bytes of decoded representations kept."""
+        self.hits = 0
+        """Number of times a representation was found already decoded."""
+        self.misses = 0
+        """Number of times a representation had to be decoded."""
+        self.evictions = 0
+        """Number of frames whose representations were dropped to stay within the budget."""
+        self._frames: OrderedDict[int, DecodedFrame] = OrderedDict()
+        """Decoded frames by the identity of their message, least recently used first."""
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get(self, frame: ColorFrame | DepthFrame) -> DecodedFrame:
+        """The decoded frame of `frame`, sharing the representations decoded so far."""
+        with self._lock:
+            decoded = self._frames.get(id(frame))
+            if decoded is not None and decoded.frame is frame:
+                self._frames.move_to_end(id(frame))
+                return decoded
+            decoded = DecodedFrame(frame, self)
+            self._frames[id(frame)] = decoded
+            self._evict()
+            return decoded
+
+    def release(self, frames: Iterable[ColorFrame | DepthFrame]) -> None:
+        """Drop the decoded representations of `frames`, which no consumer needs anymore."""
+        with self._lock:
+            if len(self._frames) == 0:
+                return
+            for frame in frames:
+                decoded = self._frames.get(id(frame))
+                if decoded is not None and decoded.frame is frame:
+                    self._drop(id(frame))
+
+    def clear(self) -> None:
+        """Drop all decoded representations."""
+        with self._lock:
+            for key in list(self._frames):
+                self._drop(key)
+
+    def _hit(self, decoded: DecodedFrame) -> None:
+        with self._lock:
+            self.hits += 1
+            if self._frames.get(id(decoded.frame)) is decoded:
+                self._frames.move_to_end(id(decoded.frame))
+
+    def _store(
+        self,
+        decoded: DecodedFrame,
+        representation: str,
+        array: npt.NDArray[Any],
+        charge: int,
+        miss: bool,
+    ) -> None:
+        key = id(decoded.frame)
+        with self._lock:
+            if miss:
+                self.misses += 1
+            if self._frames.get(key) is not decoded:
+                # Released or evicted while its owner still held it: track it again.
+                self._frames[key] = decoded
+            self.nbytes += charge - decoded._charges.get(representation, 0)  # pyright: ignore [reportPrivateUsage]
+            decoded._representations[representation] = array  # pyright: ignore [reportPrivateUsage]
+            decoded._charges[representation] = charge  # pyright: ignore [reportPrivateUsage]
+            self._frames.move_to_end(key)
+            self._evict(keep=key)
+
+    def _evict(self, keep: int | None = None) -> None:
+        """Drop least recently used frames until the cache is within its limits. Must hold the lock."""
+        while len(self._frames) > 1 and (
+            self.nbytes > self.max_bytes or len(self._frames) > MAX_DECODED_FRAMES
+        ):
+            key = next(iter(self._frames))
+            if key == keep:
+                break
+            self._drop(key)
+            self.evictions += 1
+
+    def _drop(self, key: int) -> None:
+        """Must hold the lock."""
+        decoded = self._frames.pop(key)
+        self.nbytes -= sum(decoded._charges.values())  # pyright: ignore [reportPrivateUsage]
+        decoded._representations.clear()  # pyright: ignore [reportPrivateUsage]
+        decoded._charges.clear()  # pyright: ignore [reportPrivateUsage]
+
+
+def stack_decoded(
+    frames: Sequence[DecodedFrame], representation: str
+) -> npt.NDArray[Any]:
+    """Decode `representation` of `frames` into one read-only array, one frame per row.
+
+    Each frame is decoded straight into its row, or copied there if it has the representation
+    decoded already, and then caches its row instead of a copy of its own. The frames and the
+    stack so share one buffer.
+
+    Args:
+        frames: Frames of the same format and dimensions.
+        representation: Name of the `DecodedFrame` method that decodes the representation, e.g. `"rgb"`.
+    """
+    stacked = frames[0]._empty_stack(representation, len(frames))  # pyright: ignore [reportPrivateUsage]
+    for frame, row in zip(frames, stacked):
+        frame._decode_into(representation, row)  # pyright: ignore [reportPrivateUsage]
+    stacked.flags.writeable = False
+    return stacked
+
+
+def stack_yuv(
+    frames: Sequence[DecodedFrame], buffers: YuvBufferPool
+) -> tuple[YuvLayout, npt.NDArray[np.uint8]]:
+    """Write YUV `frames` into one read-only buffer from `buffers`, one frame per row.
+
+    The frames are written as NV12 when they all interleave their chroma that way, so that
+    they can be logged without de-interleaving them, and as I420 otherwise. Like
+    `stack_decoded`, each frame then caches its row as that representation.
+
+    Args:
+        frames: Frames of the same dimensions.
+        buffers: Pool to take the buffer from.
+    """
+    layout = (
+        YuvLayout.NV12
+        if all(yuv_layout(frame.frame.image) == YuvLayout.NV12 for frame in frames)
+        else YuvLayout.I420
+    )
+    write = write_nv12 if layout == YuvLayout.NV12 else write_i420
+    stacked = buffers.take(frames[0].width, frames[0].height, len(frames))
+    for frame, row in zip(frames, stacked):
+        decoded = frame._representations.get(layout)  # pyright: ignore [reportPrivateUsage]
+        if decoded is not None:
+            row[:] = decoded
+            frame._cache._hit(frame)  # pyright: ignore [reportPrivateUsage]
+        else:
+            write(frame.frame.image, row)
+        frame._adopt(layout, row, miss=decoded is None)  # pyright: ignore [reportPrivateUsage]
+    stacked.flags.writeable = False
+    return layout, stacked
+
+
+_ENCODED_FORMATS = (XRCpuImage.FORMAT_JPEG_RGB24, XRCpuImage.FORMAT_PNG_RGB24)
+
+
+def _as_uint8(image: Any) -> npt.NDArray[np.uint8]:
+    return np.asarray(image, dtype=np.uint8)
+
+
+def _copy_into(
+    array: npt.NDArray[Any], out: npt.NDArray[Any] | None
+) -> tuple[npt.NDArray[Any], bool]:
+    """`array` itself, not owned, or its copy in `out`."""
+    if out is None:
+        return array, False
+    out[...] = array
+    return out, True
@@ -1,12 +1,22 @@
 import logging
+import math
 from typing import Any, NoReturn
 
 import grpc
-from grpc_interceptor import ExceptionToStatusInterceptor
+from grpc_interceptor import (
+    AsyncExceptionToStatusInterceptor,
+    ExceptionToStatusInterceptor,
+)
+
+from arflow._admission import RETRY_PUSHBACK_METADATA_KEY, RateLimited
 
 logger = logging.getLogger(__name__)
 
 
+def _retry_pushback_metadata(ex: RateLimited) -> tuple[tuple[str, str]]:
+    return ((RETRY_PUSHBACK_METADATA_KEY, str(math.ceil(ex.retry_after * 1000))),)
+
+
 class ErrorInterceptor(ExceptionToStatusInterceptor):
     def handle_exception(
         self,
@@ -15,8 +25,33 @@ class ErrorInterceptor(ExceptionToStatusInterceptor):
         context: grpc.ServicerContext,
         method_name: str,
     ) -> NoReturn:
-        self.log_error(ex)
+        if isinstance(ex, RateLimited):
+            # Shedding load is expected under overload, so it is not logged as an error.
+            logger.debug("Rejected %s: %s", method_name, ex.details)
+            context.set_trailing_metadata(_retry_pushback_metadata(ex))
+        else:
+            self.log_error(ex)
         super().handle_exception(ex, request_or_iterator, context, method_name)
 
     def log_error(self, e: Exception) -> None:
         logger.exception(e)
+
+
+class AsyncErrorInterceptor(AsyncExceptionToStatusInterceptor):
+    async def handle_exception(
+        self,
+        ex: Exception,
+        request_or_iterator: Any,
+        context: grpc.aio.ServicerContext[Any, Any],
+        method_name: str,
+    ) -> NoReturn:
+        if isinstance(ex, RateLimited):
+            # Shedding load is expected under overload, so it is not logged as an error.
+            logger.debug("Rejected %s: %s", method_name, ex.details)
+            context.set_trailing_metadata(_retry_pushback_metadata(ex))
+        else:
+            self.log_error(ex)
+        await super().handle_exception(ex, request_or_iterator, context, method_name)  # pyright: ignore [reportUnknownMemberType]
+
+    def log_error(self, e: Exception) -> None:
+        logger.exception(e)
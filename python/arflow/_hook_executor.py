@@ -0,0 +1,306 @@
+"""Runs user hooks off the RPC threads, on a thread pool."""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent import futures
+from functools import partial
+from typing import Any
+
+from arflow._metrics import ARFlowMetrics
+
+logger = logging.getLogger(__name__)
+
+
+def _timed_call(
+    hook: Callable[..., object], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> float:
+    """Call `hook` and return how long it ran."""
+    start = time.perf_counter()
+    hook(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+class HookStats:
+    """Counts and latencies of the calls of one hook."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        """Number of calls accepted by `HookExecutor.submit`."""
+        self.completed = 0
+        """Number of calls that returned."""
+        self.failed = 0
+        """Number of calls that raised an exception."""
+        self.dropped = 0
+        """Number of calls discarded because their session's backlog was full."""
+        self.pending = 0
+        """Number of accepted calls waiting to start."""
+        self.running = 0
+        """Number of calls running."""
+        self.wait_time = 0.0
+        """Total seconds that finished calls waited between their submission and their start."""
+        self.run_time = 0.0
+        """Total seconds that finished calls ran."""
+        self.max_run_time = 0.0
+        """Longest run of a finished call, in seconds."""
+
+    @property
+    def backlog(self) -> int:
+        """Number of accepted calls that have not finished."""
+        return self.pending + self.running
+
+    def copy(self) -> "HookStats":
+        """A copy of the statistics that later calls do not change."""
+        stats = HookStats()
+        stats.__dict__.update(self.__dict__)
+        return stats
+
+
+class _HookCall:
+    __slots__ = ("hook_name", "hook", "args", "kwargs", "submitted_at")
+
+    def __init__(
+        self,
+        hook_name: str,
+        hook: Callable[..., object],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        self.hook_name = hook_name
+        self.hook = hook
+        self.args = args
+        self.kwargs = kwargs
+        self.submitted_at = time.perf_counter()
+
+
+class HookExecutor:
+    """Runs hooks on a thread pool so that they do not delay the RPCs that trigger them.
+
+    Calls submitted under the same key, such as a session ID, run one at a time in the order they
+    were submitted. Calls under different keys run concurrently, up to the size of the pool and
+    the concurrency limit of each hook. A call waiting for its hook's limit also holds back the
+    later calls under its key, so that their order is kept.
+
+    When the backlog of a key is full, new calls under it are dropped if `drop_when_busy` is set,
+    and otherwise wait for room, which slows down the caller.
+
+    Hooks receive the session stream and other objects that only live in the server process.
+    CPU-bound hooks that hold the GIL, such as model inference, can hand the frames they read
+    to a process pool of their own.
+
+    Pickling an executor, as `arflow.ShardedARFlowServicer` does to hand it to its workers,
+    gives a new executor with the same limits and none of the calls.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_concurrency: Mapping[str, int] | None = None,
+        max_pending: int | None = None,
+        drop_when_busy: bool = False,
+    ) -> None:
+        """Initialize the executor and its pool.
+
+        Args:
+            max_workers: Number of threads that run hooks.
+            max_concurrency: Maximum number of concurrent calls of each hook, by hook name. Hooks
+                not listed are only limited by `max_workers`.
+            max_pending: Maximum number of calls of a key waiting to start. `None` does not limit them.
+            drop_when_busy: Drop new calls of a key whose pending calls reached `max_pending`
+                instead of waiting for room.
+
+        Raises:
+            ValueError: If `max_workers`, a concurrency limit, or `max_pending` is not positive,
+                or if `drop_when_busy` is set without `max_pending`.
+        """
+        if max_workers <= 0:
+            raise ValueError("Hook executor needs at least one worker.")
+        if max_concurrency is not None and any(
+            limit <= 0 for limit in max_concurrency.values()
+        ):
+            raise ValueError("Hook concurrency limits must be positive.")
+        if max_pending is not None and max_pending <= 0:
+            raise ValueError("Maximum number of pending hook calls must be positive.")
+        if drop_when_busy and max_pending is None:
+            raise ValueError(
+                "Dropping hook calls when busy requires a maximum backlog."
+            )
+        self.max_workers = max_workers
+        """Number of threads that run hooks."""
+        self.max_concurrency = dict(max_concurrency or {})
+        """Maximum number of concurrent calls of each hook, by hook name."""
+        self.max_pending = max_pending
+        """Maximum number of calls of a key waiting to start."""
+        self.drop_when_busy = drop_when_busy
+        """Whether new calls of a key with a full backlog are dropped instead of waiting."""
+        self.metrics: ARFlowMetrics | None = None
+        """Metrics that hook latencies and dropped calls are recorded into. See `record_into`."""
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="arflow-hook"
+        )
+        self._pending: dict[str, deque[_HookCall]] = {}
+        """Calls waiting to start, by key. Keys without pending or running calls are removed."""
+        self._busy_keys: set[str] = set()
+        self._running: dict[str, int] = {}
+        self._stats: dict[str, HookStats] = {}
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            HookExecutor,
+            (
+                self.max_workers,
+                self.max_concurrency,
+                self.max_pending,
+                self.drop_when_busy,
+            ),
+        )
+
+    def record_into(self, metrics: ARFlowMetrics) -> None:
+        """Record hook latencies and dropped calls into `metrics`, and expose the backlog of each hook."""
+        self.metrics = metrics
+        metrics.add_gauge(
+            "arflow_hook_backlog",
+            "Number of hook calls waiting to start or running.",
+            lambda: [
+                ((hook_name,), stats.backlog)
+                for hook_name, stats in self.stats().items()
+            ],
+            label_names=("hook",),
+        )
+
+    @property
+    def backlog(self) -> int:
+        """Number of accepted calls of all hooks that have not finished."""
+        with self._cond:
+            return sum(stats.backlog for stats in self._stats.values())
+
+    def stats(self) -> dict[str, HookStats]:
+        """A snapshot of the counts and latencies of each hook, by hook name."""
+        with self._cond:
+            return {hook_name: stats.copy() for hook_name, stats in self._stats.items()}
+
+    def submit(
+        self,
+        key: str,
+        hook_name: str,
+        hook: Callable[..., object],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> bool:
+        """Schedule `hook(*args, **kwargs)` after the calls already submitted under `key`.
+
+        Args:
+            key: Calls with the same key run one at a time, in submission order.
+            hook_name: Name that the concurrency limits and statistics of the hook are kept under.
+            hook: The hook to call. Exceptions it raises are logged.
+            *args: Positional arguments of the hook.
+            **kwargs: Keyword arguments of the hook.
+
+        Returns:
+            Whether the call was accepted. It is dropped if the backlog of `key` is full and
+            `drop_when_busy` is set.
+
+        Raises:
+            RuntimeError: If the executor was closed.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Hook executor is closed.")
+            stats = self._stats.get(hook_name)
+            if stats is None:
+                stats = self._stats[hook_name] = HookStats()
+            while (
+                self.max_pending is not None
+                and len(self._pending.get(key, ())) >= self.max_pending
+            ):
+                if self.drop_when_busy:
+                    stats.dropped += 1
+                    if self.metrics is not None:
+                        self.metrics.hook_calls_dropped.inc(1, (hook_name,))
+                    logger.debug("Dropped %s call of busy key %s", hook_name, key)
+                    return False
+                self._cond.wait()
+                if self._closed:
+                    raise RuntimeError("Hook executor is closed.")
+            self._pending.setdefault(key, deque()).append(
+                _HookCall(hook_name, hook, args, kwargs)
+            )
+            stats.submitted += 1
+            stats.pending += 1
+            self._start_ready_calls()
+        return True
+
+    def join(self) -> None:
+        """Block until every accepted call has finished."""
+        with self._cond:
+            while len(self._pending) != 0:
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Run the accepted calls, then shut down the pool. Later calls of `submit` raise `RuntimeError`."""
+        with self._cond:
+            self._closed = True
+            # Wakes up callers waiting for room, which now raise.
+            self._cond.notify_all()
+        self.join()
+        self._pool.shutdown(wait=True)
+
+    def _start_ready_calls(self) -> None:
+        """Start the next call of each idle key whose hook is under its concurrency limit.
+
+        Must be called with the lock held.
+        """
+        for key, calls in list(self._pending.items()):
+            if key in self._busy_keys or len(calls) == 0:
+                continue
+            call = calls[0]
+            running = self._running.get(call.hook_name, 0)
+            limit = self.max_concurrency.get(call.hook_name)
+            if limit is not None and running >= limit:
+                continue
+            calls.popleft()
+            self._busy_keys.add(key)
+            self._running[call.hook_name] = running + 1
+            stats = self._stats[call.hook_name]
+            stats.pending -= 1
+            stats.running += 1
+            # Wakes up callers waiting for room in the backlog of `key`.
+            self._cond.notify_all()
+            future = self._pool.submit(_timed_call, call.hook, call.args, call.kwargs)
+            future.add_done_callback(partial(self._finish_call, key, call))
+
+    def _finish_call(
+        self, key: str, call: _HookCall, future: "futures.Future[float]"
+    ) -> None:
+        finished_at = time.perf_counter()
+        exception = future.exception()
+        with self._cond:
+            self._busy_keys.discard(key)
+            self._running[call.hook_name] -= 1
+            if len(self._pending.get(key, ())) == 0:
+                self._pending.pop(key, None)
+            stats = self._stats[call.hook_name]
+            stats.running -= 1
+            if exception is None:
+                run_time = future.result()
+                wait_time = finished_at - call.submitted_at - run_time
+                stats.completed += 1
+                stats.run_time += run_time
+                stats.wait_time += wait_time
+                stats.max_run_time = max(stats.max_run_time, run_time)
+                if self.metrics is not None:
+                    self.metrics.hook_duration.observe(run_time, (call.hook_name,))
+                    self.metrics.hook_wait_duration.observe(
+                        wait_time, (call.hook_name,)
+                    )
+            else:
+                stats.failed += 1
+            self._start_ready_calls()
+            self._cond.notify_all()
+        if exception is not None:
+            logger.error("Hook %s failed", call.hook_name, exc_info=exception)
@@ -0,0 +1,115 @@
+"""Bounded per-session work queue that decouples RPC handling from Rerun logging."""
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+
+from grpc_interceptor.exceptions import NotFound, ResourceExhausted
+
+from arflow._types import OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class IngestQueue:
+    """Runs the work items of a session in order on a dedicated consumer thread.
+
+    Producers only enqueue, so the time they spend is independent of how long the work
+    takes. When the queue is full, `overflow_policy` decides what happens to new items.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """Initialize the queue and start its consumer thread.
+
+        Args:
+            name: Name of the consumer thread, used in logs.
+            maxsize: Maximum number of queued items. Must be positive.
+            overflow_policy: What to do with new items when the queue is full.
+
+        Raises:
+            ValueError: If `maxsize` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("Ingest queue size must be positive.")
+        self.maxsize = maxsize
+        """Maximum number of queued items."""
+        self.overflow_policy = overflow_policy
+        """What to do with new items when the queue is full."""
+        self.dropped = 0
+        """Number of items discarded by the `OverflowPolicy.DROP_OLDEST` policy."""
+        self._items: deque[Callable[[], None]] = deque()
+        self._in_flight = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._consumer = threading.Thread(target=self._consume, name=name, daemon=True)
+        self._consumer.start()
+
+    @property
+    def depth(self) -> int:
+        """Number of items waiting to be processed."""
+        with self._cond:
+            return len(self._items)
+
+    def put(self, item: Callable[[], None]) -> None:
+        """Enqueue a work item.
+
+        Raises:
+            ResourceExhausted: If the queue is full and the policy is `OverflowPolicy.REJECT`.
+            NotFound: If the queue was closed because its session was deleted.
+        """
+        with self._cond:
+            while not self._closed and len(self._items) >= self.maxsize:
+                if self.overflow_policy == OverflowPolicy.REJECT:
+                    raise ResourceExhausted("Session ingest queue is full")
+                if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                    logger.warning(
+                        "Ingest queue %s is full, dropped its oldest item",
+                        self._consumer.name,
+                    )
+                    break
+                self._cond.wait()
+            if self._closed:
+                raise NotFound("Session not found")
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def join(self) -> None:
+        """Block until every enqueued item has been processed."""
+        with self._cond:
+            while self._items or self._in_flight:
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Process the remaining items, then stop the consumer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._consumer.join()
+
+    def _consume(self) -> None:
+        while True:
+            with self._cond:
+                while not self._items and not self._closed:
+                    self._cond.wait()
+                if not self._items:
+                    return
+                item = self._items.popleft()
+                self._in_flight += 1
+                # Wakes up producers blocked on a full queue.
+                self._cond.notify_all()
+            try:
+                item()
+            except Exception:
+                logger.exception("Failed to process item of %s", self._consumer.name)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
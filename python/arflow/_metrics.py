@@ -0,0 +1,294 @@
+"""Server metrics, exposed over HTTP in the Prometheus text format."""
+
+import bisect
+import logging
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+LabelValues = tuple[str, ...]
+
+DURATION_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds, in seconds, of the buckets of the duration histograms."""
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if len(names) == 0:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    type: str
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+            *self._render_samples(),
+        ]
+
+    def _render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """A value that only goes up, such as the number of frames received."""
+
+    type = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, label_values: LabelValues = ()) -> None:
+        """Add `amount` to the counter of `label_values`."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, label_values: LabelValues = ()) -> float:
+        """Current value of the counter of `label_values`."""
+        with self._lock:
+            return self._values.get(label_values, 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"
+            for label_values, value in values
+        ]
+
+
+class Gauge(_Metric):
+    """A value read when the metrics are collected, such as the depth of a queue."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[tuple[LabelValues, float]]],
+        label_names: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._collect = collect
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"
+            for label_values, value in self._collect()
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, such as RPC latencies, in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(buckets)
+        self._counts: dict[LabelValues, list[int]] = {}
+        """Per label values, the number of observations in each bucket, then above the last bucket."""
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, label_values: LabelValues = ()) -> None:
+        """Record an observation of `value` for `label_values`."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(label_values)
+            if counts is None:
+                counts = self._counts[label_values] = [0] * (len(self.buckets) + 1)
+                self._sums[label_values] = 0.0
+            counts[index] += 1
+            self._sums[label_values] += value
+
+    def count(self, label_values: LabelValues = ()) -> int:
+        """Number of observations for `label_values`."""
+        with self._lock:
+            return sum(self._counts.get(label_values, ()))
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            snapshot = [
+                (label_values, list(counts), self._sums[label_values])
+                for label_values, counts in self._counts.items()
+            ]
+        samples: list[str] = []
+        for label_values, counts, total in snapshot:
+            cumulative = 0
+            for upper_bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                labels = _format_labels(
+                    (*self.label_names, "le"),
+                    (*label_values, _format_value(upper_bound)),
+                )
+                samples.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            samples.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            samples.append(f"{self.name}_count{labels} {cumulative}")
+        return samples
+
+
+class ARFlowMetrics:
+    """The metrics an ARFlow server collects.
+
+    Servicers record into the metrics they were given, and `start_metrics_server` serves them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics, without any gauges of the server state."""
+        self.rpc_duration = Histogram(
+            "arflow_rpc_duration_seconds",
+            "Time to handle an RPC, until the last response message for streams.",
+            label_names=("method", "code"),
+        )
+        self.frames_received = Counter(
+            "arflow_frames_received_total",
+            "Number of AR frames received.",
+            label_names=("frame_type",),
+        )
+        self.frame_bytes_received = Counter(
+            "arflow_frame_bytes_received_total",
+            "Serialized size of the AR frames received.",
+            label_names=("frame_type",),
+        )
+        self.decode_duration = Histogram(
+            "arflow_decode_duration_seconds",
+            "Time to decode a batch of images of one format.",
+            label_names=("format",),
+        )
+        self.send_columns_duration = Histogram(
+            "arflow_send_columns_duration_seconds",
+            "Time spent in one rr.send_columns call.",
+        )
+        self.hook_duration = Histogram(
+            "arflow_hook_duration_seconds",
+            "Time a hook ran on the hook executor.",
+            label_names=("hook",),
+        )
+        self.hook_wait_duration = Histogram(
+            "arflow_hook_wait_duration_seconds",
+            "Time a hook call waited on the hook executor before it ran.",
+            label_names=("hook",),
+        )
+        self.hook_calls_dropped = Counter(
+            "arflow_hook_calls_dropped_total",
+            "Number of hook calls dropped because their session's hook backlog was full.",
+            label_names=("hook",),
+        )
+        self.gauges: list[Gauge] = []
+        """Gauges of the server state, read when the metrics are collected."""
+
+    def add_gauge(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[tuple[LabelValues, float]]],
+        label_names: Sequence[str] = (),
+    ) -> None:
+        """Add a gauge whose samples are read from `collect` when the metrics are collected."""
+        self.gauges.append(Gauge(name, documentation, collect, label_names))
+
+    def render(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in (
+            self.rpc_duration,
+            self.frames_received,
+            self.frame_bytes_received,
+            self.decode_duration,
+            self.send_columns_duration,
+            self.hook_duration,
+            self.hook_wait_duration,
+            self.hook_calls_dropped,
+            *self.gauges,
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(
+    metrics: ARFlowMetrics, port: int, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """Serve `metrics` at `/metrics` on a daemon thread.
+
+    Args:
+        metrics: The metrics to serve.
+        port: The port to listen on. 0 picks a free port.
+        host: The address to listen on. Defaults to local connections only.
+
+    Returns:
+        The HTTP server. Call `shutdown` on it to stop serving.
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            logger.debug(format, *args)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="arflow-metrics", daemon=True
+    ).start()
+    logger.info("Serving metrics on http://%s:%d/metrics", host, server.server_port)
+    return server
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Callable
+
+import grpc
+from grpc_interceptor import AsyncServerInterceptor, ServerInterceptor
+from grpc_interceptor.exceptions import GrpcException
+
+from arflow._metrics import ARFlowMetrics
+
+
+def _status_code(ex: BaseException) -> grpc.StatusCode:
+    if isinstance(ex, GrpcException):
+        return ex.status_code
+    if isinstance(ex, (GeneratorExit, asyncio.CancelledError)):
+        # The client went away before the response stream ended.
+        return grpc.StatusCode.CANCELLED
+    return grpc.StatusCode.UNKNOWN
+
+
+class _RpcTimer:
+    def __init__(self, metrics: ARFlowMetrics, method_name: str) -> None:
+        self.metrics = metrics
+        # "/cakelab.arflow_grpc.v1.ARFlowService/SaveARFrames" -> "SaveARFrames"
+        self.method = method_name.rsplit("/", 1)[-1]
+        self.start = time.perf_counter()
+
+    def stop(self, code: grpc.StatusCode) -> None:
+        self.metrics.rpc_duration.observe(
+            time.perf_counter() - self.start, (self.method, code.name)
+        )
+
+
+class MetricsInterceptor(ServerInterceptor):
+    """Records the latency and status code of every RPC.
+
+    Place it after `ErrorInterceptor` so that it sees the exceptions raised by the servicer.
+    """
+
+    def __init__(self, metrics: ARFlowMetrics) -> None:
+        self.metrics = metrics
+
+    def intercept(
+        self,
+        method: Callable[..., Any],
+        request_or_iterator: Any,
+        context: grpc.ServicerContext,
+        method_name: str,
+    ) -> Any:
+        timer = _RpcTimer(self.metrics, method_name)
+        try:
+            response_or_iterator = method(request_or_iterator, context)
+        except BaseException as ex:
+            timer.stop(_status_code(ex))
+            raise
+        if isinstance(response_or_iterator, Iterator):
+            return self._time_stream(
+                response_or_iterator,  # pyright: ignore [reportUnknownArgumentType]
+                timer,
+            )
+        timer.stop(grpc.StatusCode.OK)
+        return response_or_iterator
+
+    def _time_stream(self, responses: Iterator[Any], timer: _RpcTimer) -> Iterator[Any]:
+        try:
+            yield from responses
+        except BaseException as ex:
+            timer.stop(_status_code(ex))
+            raise
+        timer.stop(grpc.StatusCode.OK)
+
+
+class AsyncMetricsInterceptor(AsyncServerInterceptor):
+    """Records the latency and status code of every RPC on an asyncio server.
+
+    Place it after `AsyncErrorInterceptor` so that it sees the exceptions raised by the servicer.
+    """
+
+    def __init__(self, metrics: ARFlowMetrics) -> None:
+        self.metrics = metrics
+
+    async def intercept(
+        self,
+        method: Callable[..., Any],
+        request_or_iterator: Any,
+        context: grpc.aio.ServicerContext[Any, Any],
+        method_name: str,
+    ) -> Any:
+        timer = _RpcTimer(self.metrics, method_name)
+        response_or_iterator = method(request_or_iterator, context)
+        if hasattr(response_or_iterator, "__aiter__"):
+            return self._time_stream(response_or_iterator, timer)
+        try:
+            response = await response_or_iterator
+        except BaseException as ex:
+            timer.stop(_status_code(ex))
+            raise
+        timer.stop(grpc.StatusCode.OK)
+        return response
+
+    async def _time_stream(
+        self, responses: AsyncIterator[Any], timer: _RpcTimer
+    ) -> AsyncIterator[Any]:
+        try:
+            async for response in responses:
+                yield response
+        except BaseException as ex:
+            timer.stop(_status_code(ex))
+            raise
+        timer.stop(grpc.StatusCode.OK)
@@ -0,0 +1,354 @@
+"""Point clouds as they were last logged, so that each update only logs the points that changed."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_POINT_CLOUD_BUDGET = 2_000_000
+"""Points a store remembers by default, about 80 MB. Sessions remember none unless given a budget."""
+
+DEFAULT_POINT_EPSILON = 0.01
+"""Distance a point has to move before it is logged again by default, in meters."""
+
+DEFAULT_POINT_CHUNK_SIZE = 256
+"""Points logged together as one entity by default."""
+
+
+class PointChunk:
+    """Points of a cloud logged together as one entity, replaced whole when any of them change."""
+
+    __slots__ = ("index", "positions", "identifiers", "confidence")
+
+    def __init__(
+        self,
+        index: int,
+        positions: npt.NDArray[np.float32],
+        identifiers: npt.NDArray[np.uint64],
+        confidence: npt.NDArray[np.float32],
+    ) -> None:
+        self.index = index
+        """Index of the chunk in its cloud."""
+        self.positions = positions
+        """Positions of all points of the chunk, as last logged. Shape `(N, 3)`, where 0 empties the chunk."""
+        self.identifiers = identifiers
+        """Identifiers of the points. Shape `(N,)`, or `(0,)` when the cloud had none."""
+        self.confidence = confidence
+        """Confidence values of the points, NaN where none were sent. Shape `(N,)`, or `(0,)`."""
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+class PointCloudChanges:
+    """What to log for one update of a point cloud."""
+
+    __slots__ = ("cleared", "chunks", "added", "moved", "removed", "evicted")
+
+    def __init__(
+        self,
+        cleared: bool,
+        chunks: list[PointChunk],
+        added: int,
+        moved: int,
+        removed: int,
+        evicted: list[Hashable],
+    ) -> None:
+        self.cleared = cleared
+        """Whether the cloud was not remembered, so all of its logged points have to be cleared before logging `chunks`."""
+        self.chunks = chunks
+        """Chunks with added, moved or removed points, in index order."""
+        self.added = added
+        """Number of points that were not in the cloud before."""
+        self.moved = moved
+        """Number of points that moved farther than the store's epsilon since they were last logged."""
+        self.removed = removed
+        """Number of points that are no longer in the cloud."""
+        self.evicted = evicted
+        """Keys of the other clouds forgotten to stay within the budget, least recently updated first."""
+
+
+class _RememberedCloud:
+    """The points of a cloud, each in a slot. Slot `i` is in chunk `i // chunk_size`."""
+
+    __slots__ = (
+        "identifiers",
+        "slots",
+        "style",
+        "positions",
+        "confidence",
+        "slot_identifiers",
+        "live",
+    )
+
+    def __init__(self, style: Hashable) -> None:
+        self.identifiers = np.empty(0, dtype=np.uint64)
+        """Identifiers of the points, sorted."""
+        self.slots = np.empty(0, dtype=np.intp)
+        """Slot of each of `identifiers`."""
+        self.style = style
+        """Whatever else was logged with the points."""
+        self.positions = np.empty((0, 3), dtype=np.float32)
+        """Position of the point in each slot, as last logged."""
+        self.confidence = np.empty(0, dtype=np.float32)
+        """Confidence value of the point in each slot."""
+        self.slot_identifiers = np.empty(0, dtype=np.uint64)
+        """Identifier of the point in each slot."""
+        self.live = np.empty(0, dtype=np.bool_)
+        """Whether each slot holds a point."""
+
+    @property
+    def capacity(self) -> int:
+        return len(self.live)
+
+    def chunk(self, index: int, chunk_size: int) -> PointChunk:
+        """Copies of the points in chunk `index`, which later updates do not change."""
+        in_chunk = slice(index * chunk_size, (index + 1) * chunk_size)
+        live = self.live[in_chunk]
+        return PointChunk(
+            index,
+            self.positions[in_chunk][live],
+            self.slot_identifiers[in_chunk][live],
+            self.confidence[in_chunk][live],
+        )
+
+    def grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        self.positions = np.concatenate(
+            [self.positions, np.empty((extra, 3), dtype=np.float32)]
+        )
+        self.confidence = np.concatenate(
+            [self.confidence, np.empty(extra, dtype=np.float32)]
+        )
+        self.slot_identifiers = np.concatenate(
+            [self.slot_identifiers, np.empty(extra, dtype=np.uint64)]
+        )
+        self.live = np.concatenate([self.live, np.zeros(extra, dtype=np.bool_)])
+
+    def shrink(self, chunk_size: int) -> None:
+        """Drop the empty chunks at the end."""
+        live_slots = np.flatnonzero(self.live)
+        capacity = (
+            0
+            if len(live_slots) == 0
+            else (live_slots[-1] // chunk_size + 1) * chunk_size
+        )
+        if capacity < self.capacity:
+            self.positions = self.positions[:capacity].copy()
+            self.confidence = self.confidence[:capacity].copy()
+            self.slot_identifiers = self.slot_identifiers[:capacity].copy()
+            self.live = self.live[:capacity].copy()
+
+
+class PointCloudStore:
+    """The point clouds of a session as they were last logged, diffing each update against them.
+
+    Points are matched across updates by their identifiers, and kept in chunks of
+    `chunk_size` points that are each logged as one entity. An update returns only the
+    chunks with added, removed, or moved points, so that the points that did not change are
+    not logged again. Slots freed by removed points are reused by added ones, so a cloud
+    takes no more slots than the most points it had at once.
+
+    Beyond `max_points` remembered slots, the least recently updated clouds are forgotten.
+    Their points stay logged, and their next update clears them and logs the cloud again.
+    A store with no budget remembers nothing, and logs every cloud whole as one chunk.
+    """
+
+    def __init__(
+        self,
+        max_points: int = DEFAULT_POINT_CLOUD_BUDGET,
+        epsilon: float = DEFAULT_POINT_EPSILON,
+        chunk_size: int = DEFAULT_POINT_CHUNK_SIZE,
+    ) -> None:
+        """Initialize an empty store.
+
+        Args:
+            max_points: Points to remember across all clouds.
+            epsilon: Distance a point has to move before it is logged again, in meters. Points that
+                moved less keep the position they were last logged at.
+            chunk_size: Points logged together as one entity.
+
+        Raises:
+            ValueError: If `max_points` or `epsilon` is negative, or `chunk_size` is not positive.
+        """
+        if max_points < 0:
+            raise ValueError("Point cloud budget cannot be negative.")
+        if epsilon < 0:
+            raise ValueError("Point epsilon cannot be negative.")
+        if chunk_size <= 0:
+            raise ValueError("Point chunk size must be positive.")
+        self.max_points = max_points
+        """Points to remember across all clouds."""
+        self.epsilon = epsilon
+        """Distance a point has to move before it is logged again, in meters."""
+        self.chunk_size = chunk_size
+        """Points logged together as one entity."""
+        self.num_points = 0
+        """Slots of the remembered clouds."""
+        self.evictions = 0
+        """Number of clouds forgotten to stay within the budget."""
+        self._clouds: OrderedDict[Hashable, _RememberedCloud] = OrderedDict()
+        """Remembered clouds by key, least recently updated first."""
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clouds)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._clouds
+
+    def update(
+        self,
+        key: Hashable,
+        positions: npt.NDArray[np.float32],
+        identifiers: npt.NDArray[np.uint64],
+        confidence: npt.NDArray[np.float32],
+        style: Hashable = None,
+    ) -> PointCloudChanges:
+        """Replace the points of the cloud `key`, returning the chunks to log again.
+
+        Clouds without one distinct identifier per point, or larger than the whole budget,
+        cannot be diffed. They are logged whole, as one chunk, on every update and not remembered.
+
+        Args:
+            key: The cloud, such as the entity path of its trackable.
+            positions: Positions of all points of the cloud. Shape `(N, 3)`.
+            identifiers: Identifiers of the points. Shape `(N,)`, or `(0,)` when there are none.
+            confidence: Confidence values of the points. Shape `(N,)`, or `(0,)` when there are none.
+            style: Anything else logged with the points, such as their color. All chunks are logged
+                again when it changes.
+        """
+        num_points = len(positions)
+        if len(confidence) != num_points:
+            confidence = np.full(num_points, np.nan, dtype=np.float32)
+        order = np.argsort(identifiers, kind="stable")
+        identifiers = identifiers[order]
+        with self._lock:
+            cloud = self._clouds.pop(key, None)
+            if cloud is not None:
+                self.num_points -= cloud.capacity
+            if (
+                len(identifiers) != num_points
+                or num_points > self.max_points
+                or np.any(identifiers[1:] == identifiers[:-1])
+            ):
+                return self._whole(positions, identifiers, confidence, order)
+
+            cleared = cloud is None or cloud.style != style
+            if cloud is None or cloud.style != style:
+                cloud = _RememberedCloud(style)
+            changes = self._diff(
+                cloud, identifiers, positions[order], confidence[order]
+            )
+            changes.cleared = cleared
+            self._clouds[key] = cloud
+            self.num_points += cloud.capacity
+            changes.evicted = self._evict()
+            return changes
+
+    def remove(self, key: Hashable) -> None:
+        """Forget the cloud `key`, whose points were cleared."""
+        with self._lock:
+            cloud = self._clouds.pop(key, None)
+            if cloud is not None:
+                self.num_points -= cloud.capacity
+
+    def _evict(self) -> list[Hashable]:
+        """Forget the least recently updated clouds beyond the budget, keeping the latest one.
+
+        Returns:
+            The keys of the forgotten clouds.
+        """
+        evicted: list[Hashable] = []
+        while self.num_points > self.max_points and len(self._clouds) > 1:
+            key, cloud = self._clouds.popitem(last=False)
+            self.num_points -= cloud.capacity
+            self.evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _whole(
+        self,
+        positions: npt.NDArray[np.float32],
+        sorted_identifiers: npt.NDArray[np.uint64],
+        confidence: npt.NDArray[np.float32],
+        order: npt.NDArray[np.intp],
+    ) -> PointCloudChanges:
+        identifiers = np.empty_like(sorted_identifiers)
+        identifiers[order] = sorted_identifiers
+        if len(identifiers) != len(positions):
+            identifiers = np.empty(0, dtype=np.uint64)
+        return PointCloudChanges(
+            cleared=True,
+            chunks=[PointChunk(0, positions, identifiers, confidence)],
+            added=len(positions),
+            moved=0,
+            removed=0,
+            evicted=[],
+        )
+
+    def _diff(
+        self,
+        cloud: _RememberedCloud,
+        identifiers: npt.NDArray[np.uint64],
+        positions: npt.NDArray[np.float32],
+        confidence: npt.NDArray[np.float32],
+    ) -> PointCloudChanges:
+        """Update `cloud` to the points sorted by identifier."""
+        chunk_size = self.chunk_size
+        known = np.searchsorted(cloud.identifiers, identifiers)
+        found = np.zeros(len(identifiers), dtype=np.bool_)
+        in_range = known < len(cloud.identifiers)
+        found[in_range] = cloud.identifiers[known[in_range]] == identifiers[in_range]
+        kept_slots = cloud.slots[known[found]]
+
+        offsets = positions[found] - cloud.positions[kept_slots]
+        moved = np.sum(offsets * offsets, axis=1) > self.epsilon**2
+        moved_slots = kept_slots[moved]
+        cloud.positions[moved_slots] = positions[found][moved]
+        cloud.confidence[kept_slots] = confidence[found]
+
+        present = np.zeros(len(cloud.identifiers), dtype=np.bool_)
+        present[known[found]] = True
+        removed_slots = cloud.slots[~present]
+        cloud.live[removed_slots] = False
+
+        added = ~found
+        num_added = int(np.count_nonzero(added))
+        added_slots = np.flatnonzero(~cloud.live)[:num_added]
+        if len(added_slots) < num_added:
+            first_new_slot = cloud.capacity
+            num_new_slots = num_added - len(added_slots)
+            cloud.grow(-(-(first_new_slot + num_new_slots) // chunk_size) * chunk_size)
+            added_slots = np.concatenate(
+                [
+                    added_slots,
+                    np.arange(first_new_slot, first_new_slot + num_new_slots),
+                ]
+            )
+        cloud.positions[added_slots] = positions[added]
+        cloud.confidence[added_slots] = confidence[added]
+        cloud.slot_identifiers[added_slots] = identifiers[added]
+        cloud.live[added_slots] = True
+
+        slots = np.empty(len(identifiers), dtype=np.intp)
+        slots[found] = kept_slots
+        slots[added] = added_slots
+        cloud.identifiers = identifiers
+        cloud.slots = slots
+
+        changed_chunks = np.unique(
+            np.concatenate([moved_slots, removed_slots, added_slots]) // chunk_size
+        )
+        chunks = [cloud.chunk(int(index), chunk_size) for index in changed_chunks]
+        cloud.shrink(chunk_size)
+        return PointCloudChanges(
+            cleared=False,
+            chunks=chunks,
+            added=num_added,
+            moved=len(moved_slots),
+            removed=len(removed_slots),
+            evicted=[],
+        )
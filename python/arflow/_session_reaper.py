@@ -0,0 +1,45 @@
+"""Background thread that periodically reclaims idle sessions."""
+
+import logging
+import threading
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SessionReaper:
+    """Calls `reap` every `interval` seconds on a daemon thread until closed."""
+
+    def __init__(self, reap: Callable[[], object], interval: float) -> None:
+        """Initialize the reaper and start its thread.
+
+        Args:
+            reap: Reclaims idle sessions. Exceptions are logged and do not stop the reaper.
+            interval: Seconds between two calls of `reap`. Must be positive.
+
+        Raises:
+            ValueError: If `interval` is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("Reap interval must be positive.")
+        self.interval = interval
+        """Seconds between two calls of `reap`."""
+        self._reap = reap
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="arflow-session-reaper", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the reaper and wait for an ongoing `reap` to finish."""
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self._reap()
+            except Exception:
+                logger.exception("Failed to reap idle sessions")
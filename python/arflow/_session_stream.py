@@ -1,28 +1,57 @@
 """Session helps participating devices stream to the same Rerun recording."""
 
 import logging
-from collections.abc import Sequence
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, DefaultDict, Tuple
 
-import cv2
 import DracoPy
 import numpy as np
 import numpy.typing as npt
+import pyarrow as pa  # pyright: ignore [reportMissingTypeStubs]
 import rerun as rr
+from rerun.any_value import AnyBatchValue
 
+from arflow._batches import ColorBatch, DepthBatch, TransformBatch
+from arflow._decode_pool import DecodePool
+from arflow._decoded_frames import (
+    DEPTH_UINT16_UNITS_PER_METER,
+    DecodedFrameCache,
+    depth_to_millimeters,
+    stack_decoded,
+    stack_yuv,
+)
+from arflow._ingest_queue import IngestQueue
+from arflow._metrics import ARFlowMetrics
+from arflow._point_store import PointChunk, PointCloudStore
+from arflow._tracing import tracer
 from arflow._types import (
     ARFrameType,
+    DepthCodec,
     Timeline,
+    YuvLayout,
 )
 from arflow._utils import (
+    ColorFrameGroupKey,
+    DepthFrameGroupKey,
+    check_audio_chunk_frame,
+    check_imu_batch_frame,
+    check_point_cloud,
     group_color_frames_by_format_and_dims,
     group_depth_frames_by_format_dims_and_smoothness,
 )
+from arflow._yuv import FULL_RANGE_YUV_FORMATS, YUV_FORMATS, YuvBufferPool
+from cakelab.arflow_grpc.v1.ar_point_cloud_pb2 import ARPointCloud
 from cakelab.arflow_grpc.v1.ar_trackable_pb2 import ARTrackable
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import AudioChunkFrame
 from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame
 from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
 from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
 from cakelab.arflow_grpc.v1.device_pb2 import Device
 from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
 from cakelab.arflow_grpc.v1.mesh_detection_frame_pb2 import MeshDetectionFrame
 from cakelab.arflow_grpc.v1.plane_detection_frame_pb2 import PlaneDetectionFrame
 from cakelab.arflow_grpc.v1.point_cloud_detection_frame_pb2 import (
@@ -46,107 +75,336 @@ y_down_to_y_up = np.array(
 )
 
 
+_NOT_LOGGED = object()
+
+_MEDIA_TYPES = {
+    XRCpuImage.FORMAT_JPEG_RGB24: rr.components.MediaType.JPEG,
+    XRCpuImage.FORMAT_PNG_RGB24: rr.components.MediaType.PNG,
+}
+"""Media types of the color frame formats that can be logged without decoding them."""
+
+
+_DeviceKey = str | bytes
+"""UID of a device, or the serialized device if it has no UID."""
+
+
+def _device_key(device: Device) -> _DeviceKey:
+    """Key `device` is indexed by in a session: its UID, or the whole device if it has none."""
+    return device.uid if device.uid else device.SerializeToString(deterministic=True)
+
+
+class _DeviceEntities:
+    """Entity paths of a device in a session, so that they are escaped and joined only once."""
+
+    __slots__ = ("device_key", "_root", "_paths")
+
+    def __init__(self, session_part: str, device: Device) -> None:
+        self.device_key = (device.model, device.name)
+        self._root = [session_part, f"{device.model}_{device.name}_{device.uid}"]
+        self._paths: dict[tuple[str, ...], str] = {}
+
+    def path(self, parts: tuple[str, ...]) -> str:
+        entity_path = self._paths.get(parts)
+        if entity_path is None:
+            with tracer.span("new_entity_path"):
+                entity_path = rr.new_entity_path([*self._root, *parts])
+            self._paths[parts] = entity_path
+        return entity_path
+
+
 class SessionStream:
     """All devices in a session share a stream."""
 
-    def __init__(self, info: Session, stream: rr.RecordingStream):
-        self.info = info
-        """Session information."""
+    def __init__(
+        self,
+        info: Session,
+        stream: rr.RecordingStream,
+        ingest_queue: IngestQueue | None = None,
+        metrics: ARFlowMetrics | None = None,
+        decoded_frames: DecodedFrameCache | None = None,
+        log_encoded_images: bool = False,
+        decode_pool: DecodePool | None = None,
+        depth_codec: DepthCodec = DepthCodec.NONE,
+        point_clouds: PointCloudStore | None = None,
+    ):
+        self._info = info
+        self._devices: dict[_DeviceKey, Device] = {}
+        for device in info.devices:
+            key = _device_key(device)
+            self._devices[key] = Device()
+            self._devices[key].CopyFrom(device)
+        self._devices_lock = threading.Lock()
+        self._devices_dirty = False
+        self.last_active = time.monotonic()
+        """Monotonic time this session was created, or a device last joined it or sent frames to it."""
+        self._devices_last_active = dict.fromkeys(self._devices, self.last_active)
+        self.received_bytes = 0
+        """Size of all frame requests received for this session, in bytes."""
         self.stream = stream
         """Stream handle to the Rerun recording associated with this session."""
+        self.ingest_queue = ingest_queue
+        """Queue that saves the frames of this session off the RPC threads. `None` when frames are saved inline."""
+        self.metrics = metrics
+        """Metrics to record decoding and logging times into. `None` when metrics are disabled."""
+        self.decoded_frames = (
+            decoded_frames if decoded_frames is not None else DecodedFrameCache()
+        )
+        """Color and depth frames of this session decoded so far, shared by logging and the hooks."""
+        self.log_encoded_images = log_encoded_images
+        """Whether JPEG and PNG color frames are logged as the compressed images they arrived as, instead of decoded pixels."""
+        self._device_entities: dict[_DeviceKey, _DeviceEntities] = {}
+        """Entity paths of each device, by `_device_key`."""
+        self._static_keys: dict[str, Hashable] = {}
+        """Key of the static components last logged to each entity path."""
+        self.decode_pool = decode_pool
+        """Threads that decode the JPEG and PNG frames of a batch concurrently. `None` decodes them one by one."""
+        self.depth_codec = depth_codec
+        """How depth images are stored in the recording."""
+        self._yuv_buffers = YuvBufferPool()
+        """Buffers YUV color frames are converted into, reused once a batch is released."""
+        self.point_clouds = (
+            point_clouds if point_clouds is not None else PointCloudStore(0)
+        )
+        """Point clouds of this session as last logged, so that updates only log the points that changed. Remembers none by default."""
+        self._point_chunk_paths: DefaultDict[Hashable, set[str]] = defaultdict(set)
+        """Entity paths of the chunks logged for each point cloud, forgotten with the cloud."""
+
+    @property
+    def info(self) -> Session:
+        """Session information.
+
+        Treat it as a snapshot: devices join and leave through `add_device` and
+        `remove_device`, which keep it up to date.
+        """
+        with self._devices_lock:
+            if self._devices_dirty:
+                # Rebuilt into a new message rather than in place so readers holding the
+                # previous snapshot never see a half-updated device list.
+                info = Session(id=self._info.id, metadata=self._info.metadata)
+                info.devices.extend(self._devices.values())
+                self._info = info
+                self._devices_dirty = False
+            return self._info
+
+    def has_device(self, device: Device) -> bool:
+        """Whether `device` is in this session. Devices are looked up by UID, or as a whole if they have none."""
+        return self._devices.get(_device_key(device)) == device
+
+    def add_device(self, device: Device) -> bool:
+        """Add `device` to this session.
+
+        Returns:
+            `False` if a device with the same UID, or the same device if it has no UID, is
+            already in this session.
+        """
+        key = _device_key(device)
+        with self._devices_lock:
+            if key in self._devices:
+                return False
+            self._devices[key] = Device()
+            self._devices[key].CopyFrom(device)
+            self.last_active = time.monotonic()
+            self._devices_last_active[key] = self.last_active
+            if not self._devices_dirty:
+                self._info.devices.append(device)
+            return True
+
+    def remove_device(self, device: Device) -> bool:
+        """Remove `device` from this session.
+
+        The device list of `info` is only rebuilt when it is next read, so a fleet of
+        devices leaving costs O(1) per device.
+
+        Returns:
+            `False` if `device` is not in this session.
+        """
+        key = _device_key(device)
+        with self._devices_lock:
+            if self._devices.get(key) != device:
+                return False
+            del self._devices[key]
+            del self._devices_last_active[key]
+            self._device_entities.pop(key, None)
+            self._devices_dirty = True
+            return True
+
+    def record_activity(self, device: Device, num_bytes: int) -> None:
+        """Record that `num_bytes` of frames were just received from `device`."""
+        key = _device_key(device)
+        with self._devices_lock:
+            self.last_active = time.monotonic()
+            self.received_bytes += num_bytes
+            if key in self._devices_last_active:
+                self._devices_last_active[key] = self.last_active
+
+    def idle_devices(self, deadline: float) -> list[Device]:
+        """Devices that have not sent frames since the monotonic time `deadline`."""
+        with self._devices_lock:
+            return [
+                self._devices[key]
+                for key, last_active in self._devices_last_active.items()
+                if last_active < deadline
+            ]
+
+    def _entity_path(self, device: Device, *parts: str) -> str:
+        """The path of the entity `parts` of `device`, built once per device and entity."""
+        key = _device_key(device)
+        entities = self._device_entities.get(key)
+        if entities is None or entities.device_key != (device.model, device.name):
+            entities = self._device_entities[key] = _DeviceEntities(
+                session_part=f"{self.info.metadata.name}_{self.info.id.value}",
+                device=device,
+            )
+        return entities.path(parts)
+
+    def _log_static(
+        self, entity_path: str, *components: Any, key: Hashable = None
+    ) -> None:
+        """Log static `components` to `entity_path`, unless they were already logged there under the same `key`.
+
+        `key` must change whenever the components do, e.g. when the image format of an entity changes.
+        """
+        if self._static_keys.get(entity_path, _NOT_LOGGED) == key:
+            return
+        with tracer.span("log_static", entity_path=entity_path):
+            rr.log(entity_path, *components, static=True, recording=self.stream)
+        self._static_keys[entity_path] = key
+
+    def _send_columns(
+        self,
+        entity_path: str,
+        times: Iterable[Any],
+        components: Iterable[Any],
+        recording: Any,
+    ) -> None:
+        with tracer.span("send_columns", entity_path=entity_path):
+            if self.metrics is None:
+                rr.send_columns(
+                    entity_path, times=times, components=components, recording=recording
+                )
+                return
+            start = time.perf_counter()
+            rr.send_columns(
+                entity_path, times=times, components=components, recording=recording
+            )
+            self.metrics.send_columns_duration.observe(time.perf_counter() - start)
 
     def save_transform_frames(
         self,
         frames: Sequence[TransformFrame],
         device: Device,
-    ):
+    ) -> list[TransformBatch]:
+        """Returns the logged poses, as one batch, or no batch if there are no frames."""
         if len(frames) == 0:
             logger.warning("No transform frames to save.")
-            return
+            return []
 
-        entity_path = rr.new_entity_path(
-            [
-                f"{self.info.metadata.name}_{self.info.id.value}",
-                f"{device.model}_{device.name}_{device.uid}",
-                ARFrameType.TRANSFORM_FRAME,
-            ]
+        entity_path = self._entity_path(
+            device,
+            ARFrameType.TRANSFORM_FRAME,
         )
-        rr.log(
+        self._log_static(
             entity_path,
             [rr.Transform3D.indicator()],
-            static=True,
-            recording=self.stream,
         )
-        t = np.array([np.frombuffer(frame.data, dtype=np.float32) for frame in frames])
-        transforms = np.array([np.eye(4, dtype=np.float32) for _ in range(len(frames))])
-        transforms[:, :3, :] = t.reshape((len(frames), 3, 4))
-
-        # TODO: Do we need to flip Y?
-        transforms = y_down_to_y_up @ transforms
-        rr.send_columns(
+        with tracer.span("decode_transforms", frames=len(frames)):
+            # Each frame is the top 3x4 of a row-major pose, so the joined bytes view as
+            # (N, 3, 4) without touching the frames one by one.
+            data = np.frombuffer(
+                b"".join(frame.data for frame in frames), dtype=np.float32
+            )
+            if data.size != len(frames) * 12:
+                raise ValueError(
+                    f"Expected {len(frames) * 12} floats for {len(frames)} transform frames, got {data.size}."
+                )
+            poses = np.zeros((len(frames), 4, 4), dtype=np.float32)
+            poses[:, 3, 3] = 1
+            # TODO: Do we need to flip Y?
+            np.matmul(
+                y_down_to_y_up[:3, :3],
+                data.reshape((len(frames), 3, 4)),
+                out=poses[:, :3, :],
+            )
+        batch = TransformBatch(
+            timestamps=_device_timestamps_ns(frames),
+            poses=poses,
+        )
+        self._send_columns(
             entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
-                    times=[
-                        f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                        for f in frames
-                    ],
+                    times=batch.timestamps,
                 ),
             ],
             components=[
-                rr.components.TransformMat3x3Batch(
-                    data=[transform[:3, :3] for transform in transforms]
-                ),
+                _transform_mat3x3_batch(batch.poses[:, :3, :3]),
                 rr.components.Translation3DBatch(
-                    data=[transform[:3, 3] for transform in transforms]
+                    data=np.ascontiguousarray(batch.poses[:, :3, 3])
                 ),
             ],
             # TODO: Remove when this stabilizes. See https://github.com/rerun-io/rerun/issues/8167
             recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
         )
+        return [batch]
 
     def save_color_frames(
         self,
         frames: Sequence[ColorFrame],
         device: Device,
-    ):
+        grouped_frames: Mapping[ColorFrameGroupKey, Sequence[ColorFrame]] | None = None,
+    ) -> list[ColorBatch]:
         """Assumes that the device is in the session and all frames have the same format, width, height, and originating device.
 
+        `grouped_frames` are `frames` grouped by format and dimensions, when the caller has already grouped them.
+
+        Returns the logged images, one batch per group of supported format.
+
         @private
         """
         if len(frames) == 0:
             logger.warning("No color frames to save.")
-            return
-        grouped_frames = group_color_frames_by_format_and_dims(frames)
+            return []
+        if grouped_frames is None:
+            grouped_frames = group_color_frames_by_format_and_dims(frames)
+        batches: list[ColorBatch] = []
         for (format, width, height), homogenous_frames in grouped_frames.items():
             if len(homogenous_frames) == 0:
                 continue
 
-            entity_path = rr.new_entity_path(
-                [
-                    f"{self.info.metadata.name}_{self.info.id.value}",
-                    f"{device.model}_{device.name}_{device.uid}",
-                    ARFrameType.COLOR_FRAME,
-                    f"{width}x{height}",
-                ]
+            entity_path = self._entity_path(
+                device,
+                ARFrameType.COLOR_FRAME,
+                f"{width}x{height}",
             )
-            intrinsics_entity_path = rr.new_entity_path(
-                [
-                    f"{self.info.metadata.name}_{self.info.id.value}",
-                    f"{device.model}_{device.name}_{device.uid}",
-                    ARFrameType.COLOR_FRAME,
-                    f"{homogenous_frames[0].intrinsics.resolution.x}x{homogenous_frames[0].intrinsics.resolution.y}",
-                ]
+            intrinsics_entity_path = self._entity_path(
+                device,
+                ARFrameType.COLOR_FRAME,
+                f"{homogenous_frames[0].intrinsics.resolution.x}x{homogenous_frames[0].intrinsics.resolution.y}",
             )
 
-            if format == XRCpuImage.FORMAT_ANDROID_YUV_420_888:
+            decoded_frames = [self.decoded_frames.get(f) for f in homogenous_frames]
+            decode_start = time.perf_counter()
+            yuv_layout = None
+            data = None
+            encoded = None
+            if format in _MEDIA_TYPES and self.log_encoded_images:
+                # Logged as received. The viewer decodes them, and so do hooks that ask for pixels.
+                encoded = [f.image.planes[0].data for f in homogenous_frames]
+                image_static = [_MEDIA_TYPES[format], rr.EncodedImage.indicator()]
+            elif format in YUV_FORMATS:
+                with tracer.span("stack_yuv", frames=len(homogenous_frames)):
+                    yuv_layout, data = stack_yuv(decoded_frames, self._yuv_buffers)
                 format_static = rr.components.ImageFormat(
                     width=width,
                     height=height,
-                    pixel_format=rr.PixelFormat.Y_U_V12_LimitedRange,
+                    pixel_format=rr.PixelFormat.NV12
+                    if yuv_layout == YuvLayout.NV12
+                    else rr.PixelFormat.Y_U_V12_FullRange
+                    if format in FULL_RANGE_YUV_FORMATS
+                    else rr.PixelFormat.Y_U_V12_LimitedRange,
                 )
-                data = np.array([_to_i420_format(f.image) for f in homogenous_frames])
+                image_static = [format_static, rr.Image.indicator()]
             elif format == XRCpuImage.FORMAT_RGB24:
                 """
                 Decode a frame in RGB format and display it
@@ -157,179 +415,197 @@ class SessionStream:
                     pixel_format=None,
                     color_model=rr.ColorModel.RGB,
                 )
-                data = np.array([
-                    np.frombuffer(f.image.planes[0].data, dtype=np.uint8)
-                    for f in homogenous_frames
-                ])
-            elif format == XRCpuImage.FORMAT_JPEG_RGB24 or format == XRCpuImage.FORMAT_PNG_RGB24:
+                with tracer.span("np.frombuffer", frames=len(homogenous_frames)):
+                    data = stack_decoded(decoded_frames, "rgb").reshape(
+                        (len(decoded_frames), -1)
+                    )
+                image_static = [format_static, rr.Image.indicator()]
+            elif (
+                format == XRCpuImage.FORMAT_JPEG_RGB24
+                or format == XRCpuImage.FORMAT_PNG_RGB24
+            ):
                 format_static = rr.components.ImageFormat(
                     width=width,
                     height=height,
                     pixel_format=None,
                     color_model=rr.ColorModel.BGR,
                 )
-                data = np.array([
-                    cv2.imdecode(np.frombuffer(f.image.planes[0].data, dtype=np.uint8), cv2.IMREAD_COLOR).flatten()
-                    for f in homogenous_frames
-                ])
-            # elif format == XRCpuImage.FORMAT_IOS_YP_CBCR_420_8BI_PLANAR_FULL_RANGE:
-            #     format_static = rr.components.ImageFormat(
-            #         width=width,
-            #         height=height,
-            #         pixel_format=rr.PixelFormat.NV12,
-            #     )
+                with tracer.span("cv2.imdecode", frames=len(homogenous_frames)):
+                    if self.decode_pool is not None and len(decoded_frames) > 1:
+                        data = self.decode_pool.stack(decoded_frames, "bgr")
+                    else:
+                        data = stack_decoded(decoded_frames, "bgr")
+                    data = data.reshape((len(decoded_frames), -1))
+                image_static = [format_static, rr.Image.indicator()]
             else:
                 logger.warning(f"Unsupported color frame format: {format}")
                 continue
+            if self.metrics is not None and encoded is None:
+                self.metrics.decode_duration.observe(
+                    time.perf_counter() - decode_start,
+                    (XRCpuImage.Format.Name(format),),
+                )
 
-            rr.log(
+            batch = ColorBatch(
+                format=format,
+                width=width,
+                height=height,
+                timestamps=_device_timestamps_ns(homogenous_frames),
+                image_timestamps=_image_timestamps(homogenous_frames),
+                buffers=data,
+                intrinsics=_intrinsics_matrices(homogenous_frames),
+                decoded_frames=decoded_frames,
+                yuv_layout=yuv_layout,
+                encoded=encoded,
+            )
+            self._log_static(
                 intrinsics_entity_path,
                 [rr.Pinhole.indicator()],
-                static=True,
-                recording=self.stream,
             )
-            rr.send_columns(
+            self._send_columns(
                 intrinsics_entity_path,
                 times=[
-                    rr.TimeSecondsColumn(
+                    rr.TimeNanosColumn(
                         timeline=Timeline.DEVICE,
-                        times=[
-                            f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                            for f in homogenous_frames
-                        ],
+                        times=batch.timestamps,
                     ),
                 ],
                 components=[
-                    rr.components.PinholeProjectionBatch(
-                        data=[
-                            np.array(
-                                [
-                                    [
-                                        f.intrinsics.focal_length.x,
-                                        0,
-                                        f.intrinsics.principal_point.x,
-                                    ],
-                                    [
-                                        0,
-                                        f.intrinsics.focal_length.y,
-                                        f.intrinsics.principal_point.y,
-                                    ],
-                                    [0, 0, 1],
-                                ],
-                                dtype=np.float32,
-                            )
-                            for f in homogenous_frames
-                        ]
-                    )
+                    rr.components.PinholeProjectionBatch(data=batch.intrinsics)
                 ],
                 recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
             )
-            rr.log(
+            self._log_static(
                 entity_path,
-                [format_static, rr.Image.indicator()],
-                static=True,
-                recording=self.stream,
+                image_static,
+                key=(format, yuv_layout, encoded is None),
             )
-            rr.send_columns(
+            self._send_columns(
                 entity_path,
                 times=[
-                    rr.TimeSecondsColumn(
+                    rr.TimeNanosColumn(
                         timeline=Timeline.DEVICE,
-                        times=[
-                            f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                            for f in homogenous_frames
-                        ],
+                        times=batch.timestamps,
                     ),
                     rr.TimeSecondsColumn(
                         timeline=Timeline.IMAGE,
-                        times=[f.image.timestamp for f in homogenous_frames],
+                        times=batch.image_timestamps,
                     ),
                 ],
                 components=[
-                    rr.components.ImageBufferBatch(
-                        data=data,
-                        strict=True,
-                    ),
+                    rr.components.BlobBatch(batch.encoded)
+                    if batch.encoded is not None
+                    else _image_buffer_batch(batch.buffers),
                 ],
                 recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
             )
+            batches.append(batch)
+        return batches
 
     def save_depth_frames(
         self,
         frames: Sequence[DepthFrame],
         device: Device,
-    ):
-        """Assumes that the device is in the session and all frames have the same format, width, height, smoothness, and and originating device."""
+        grouped_frames: Mapping[DepthFrameGroupKey, Sequence[DepthFrame]] | None = None,
+    ) -> list[DepthBatch]:
+        """Assumes that the device is in the session and all frames have the same format, width, height, smoothness, and and originating device.
+
+        `grouped_frames` are `frames` grouped by format, dimensions, and smoothness, when the caller has already grouped them.
+
+        Returns the logged depth images, one batch per group of supported format.
+        """
         if len(frames) == 0:
             logger.warning("No depth frames to save.")
-            return
+            return []
 
-        grouped_frames = group_depth_frames_by_format_dims_and_smoothness(frames)
+        if grouped_frames is None:
+            grouped_frames = group_depth_frames_by_format_dims_and_smoothness(frames)
+        batches: list[DepthBatch] = []
         for (
             format,
             width,
             height,
             environment_depth_temporal_smoothing_enabled,
         ), homogenous_frames in grouped_frames.items():
-            entity_path = rr.new_entity_path(
-                [
-                    f"{self.info.metadata.name}_{self.info.id.value}",
-                    f"{device.model}_{device.name}_{device.uid}",
-                    ARFrameType.DEPTH_FRAME,
-                    f"{width}x{height}",
-                    "smoothed"
-                    if environment_depth_temporal_smoothing_enabled
-                    else "raw",
-                ]
+            entity_path = self._entity_path(
+                device,
+                ARFrameType.DEPTH_FRAME,
+                f"{width}x{height}",
+                "smoothed" if environment_depth_temporal_smoothing_enabled else "raw",
             )
 
-            if format == XRCpuImage.FORMAT_DEPTHFLOAT32:
+            quantized = (
+                format == XRCpuImage.FORMAT_DEPTHFLOAT32
+                and self.depth_codec == DepthCodec.UINT16_MILLIMETERS
+            )
+            if format == XRCpuImage.FORMAT_DEPTHFLOAT32 and not quantized:
                 format_static = rr.components.ImageFormat(
                     width=width,
                     height=height,
                     color_model=rr.ColorModel.L,
                     channel_datatype=rr.ChannelDatatype.F32,
                 )
-            elif format == XRCpuImage.FORMAT_DEPTHUINT16:
+                depth_meter = 1.0
+            elif format == XRCpuImage.FORMAT_DEPTHUINT16 or quantized:
                 format_static = rr.components.ImageFormat(
                     width=width,
                     height=height,
                     color_model=rr.ColorModel.L,
                     channel_datatype=rr.ChannelDatatype.U16,
                 )
+                # Sent `FORMAT_DEPTHUINT16` images keep the depth meter they have always been
+                # logged with. Only the millimeters this codec stores are scaled.
+                depth_meter = DEPTH_UINT16_UNITS_PER_METER if quantized else 1.0
             else:
                 logger.warning(f"Unsupported depth frame format: {format}")
                 continue
 
-            rr.log(
+            batch = DepthBatch(
+                format=format,
+                width=width,
+                height=height,
+                smoothed=environment_depth_temporal_smoothing_enabled,
+                timestamps=_device_timestamps_ns(homogenous_frames),
+                image_timestamps=_image_timestamps(homogenous_frames),
+                buffers=np.stack(
+                    [
+                        np.frombuffer(f.image.planes[0].data, dtype=np.uint8)
+                        for f in homogenous_frames
+                    ]
+                ),
+                decoded_frames=[self.decoded_frames.get(f) for f in homogenous_frames],
+            )
+            stored = batch.buffers
+            if quantized:
+                with tracer.span("depth_to_millimeters", frames=len(batch)):
+                    stored = (
+                        depth_to_millimeters(batch.depth)
+                        .reshape((len(batch), -1))
+                        .view(np.uint8)
+                    )
+            self._log_static(
                 entity_path,
                 [format_static, rr.DepthImage.indicator()],
-                [rr.components.DepthMeter(1.0)],
-                static=True,
-                recording=self.stream,
+                [rr.components.DepthMeter(depth_meter)],
+                key=(format, quantized),
             )
-            rr.send_columns(
+            self._send_columns(
                 entity_path,
                 times=[
-                    rr.TimeSecondsColumn(
+                    rr.TimeNanosColumn(
                         timeline=Timeline.DEVICE,
-                        times=[
-                            f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                            for f in homogenous_frames
-                        ],
+                        times=batch.timestamps,
                     ),
                     rr.TimeSecondsColumn(
                         timeline=Timeline.IMAGE,
-                        times=[f.image.timestamp for f in homogenous_frames],
-                    ),
-                ],
-                components=[
-                    rr.components.ImageBufferBatch(
-                        data=[f.image.planes[0].data for f in homogenous_frames],
+                        times=batch.image_timestamps,
                     ),
                 ],
+                components=[_image_buffer_batch(stored)],
                 recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
             )
+            batches.append(batch)
+        return batches
 
     def save_gyroscope_frames(
         self,
@@ -339,134 +615,111 @@ class SessionStream:
         if len(frames) == 0:
             return
 
-        entity_path = rr.new_entity_path(
-            [
-                f"{self.info.metadata.name}_{self.info.id.value}",
-                f"{device.model}_{device.name}_{device.uid}",
-                ARFrameType.GYROSCOPE_FRAME,
-            ]
+        device_timestamps = _device_timestamps_ns(frames)
+        with tracer.span("gyroscope_samples", frames=len(frames)):
+            samples = _gyroscope_samples(frames)
+        self._send_gyroscope_samples(device, device_timestamps, samples)
+
+    def save_imu_batch_frames(
+        self,
+        frames: Sequence[ImuBatchFrame],
+        device: Device,
+    ):
+        """Log the packed readings of `frames` to the same entities as gyroscope frames.
+
+        Raises:
+            ValueError: If the timestamps and readings of a frame do not match in number.
+        """
+        if len(frames) == 0:
+            return
+
+        with tracer.span("imu_batch_samples", frames=len(frames)):
+            device_timestamps, samples = _imu_batch_samples(frames)
+        self._send_gyroscope_samples(device, device_timestamps, samples)
+
+    def _send_gyroscope_samples(
+        self,
+        device: Device,
+        device_timestamps: npt.NDArray[np.int64],
+        samples: npt.NDArray[np.void],
+    ) -> None:
+        entity_path = self._entity_path(
+            device,
+            ARFrameType.GYROSCOPE_FRAME,
         )
-        device_timestamps = [
-            f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9 for f in frames
-        ]
         attitude_entity_path = f"{entity_path}/attitude"
-        rr.log(
+        self._log_static(
             attitude_entity_path,
             [rr.Boxes3D.indicator()],
             [rr.components.HalfSize3D([0.5, 0.5, 0.5])],
-            static=True,
-            recording=self.stream,
         )
-        rr.send_columns(
+        self._send_columns(
             attitude_entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
                     times=device_timestamps,
                 ),
             ],
             components=[
-                rr.components.RotationQuatBatch(
-                    data=[
-                        [
-                            frame.attitude.x,
-                            frame.attitude.y,
-                            frame.attitude.z,
-                            frame.attitude.w,
-                        ]
-                        for frame in frames
-                    ]
-                ),
+                rr.components.RotationQuatBatch(data=samples["attitude"]),
             ],
             recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
         )
         rotation_rate_entity_path = f"{entity_path}/rotation_rate"
-        rr.log(
+        self._log_static(
             rotation_rate_entity_path,
             [rr.Arrows3D.indicator()],
             [rr.components.Color([0, 255, 0])],
-            static=True,
-            recording=self.stream,
         )
-        rr.send_columns(
+        self._send_columns(
             rotation_rate_entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
                     times=device_timestamps,
                 ),
             ],
             components=[
-                rr.components.Vector3DBatch(
-                    data=[
-                        [
-                            frame.rotation_rate.x,
-                            frame.rotation_rate.y,
-                            frame.rotation_rate.z,
-                        ]
-                        for frame in frames
-                    ]
-                ),
+                rr.components.Vector3DBatch(data=samples["rotation_rate"]),
             ],
             recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
         )
         gravity_entity_path = f"{entity_path}/gravity"
-        rr.log(
+        self._log_static(
             gravity_entity_path,
             [rr.Arrows3D.indicator()],
             [rr.components.Color([0, 0, 255])],
-            static=True,
-            recording=self.stream,
         )
-        rr.send_columns(
+        self._send_columns(
             gravity_entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
                     times=device_timestamps,
                 ),
             ],
             components=[
-                rr.components.Vector3DBatch(
-                    data=[
-                        [
-                            frame.gravity.x,
-                            frame.gravity.y,
-                            frame.gravity.z,
-                        ]
-                        for frame in frames
-                    ]
-                ),
+                rr.components.Vector3DBatch(data=samples["gravity"]),
             ],
             recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
         )
         acceleration_entity_path = f"{entity_path}/acceleration"
-        rr.log(
+        self._log_static(
             acceleration_entity_path,
             [rr.Arrows3D.indicator()],
             [rr.components.Color([255, 255, 0])],
-            static=True,
-            recording=self.stream,
         )
-        rr.send_columns(
+        self._send_columns(
             acceleration_entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
                     times=device_timestamps,
                 ),
             ],
             components=[
-                rr.components.Vector3DBatch(
-                    data=[
-                        [
-                            frame.acceleration.x,
-                            frame.acceleration.y,
-                            frame.acceleration.z,
-                        ]
-                        for frame in frames
-                    ]
-                ),
+                rr.components.Vector3DBatch(data=samples["acceleration"]),
             ],
             recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
         )
@@ -480,28 +733,20 @@ class SessionStream:
             logger.warning("No audio frames to save.")
             return
 
-        entity_path = rr.new_entity_path(
-            [
-                f"{self.info.metadata.name}_{self.info.id.value}",
-                f"{device.model}_{device.name}_{device.uid}",
-                ARFrameType.AUDIO_FRAME,
-            ]
+        entity_path = self._entity_path(
+            device,
+            ARFrameType.AUDIO_FRAME,
         )
-        rr.log(
+        self._log_static(
             entity_path,
             [rr.Scalar.indicator()],
-            static=True,
-            recording=self.stream,
         )
-        rr.send_columns(
+        self._send_columns(
             entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
-                    times=[
-                        f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                        for f in frames
-                    ],
+                    times=_device_timestamps_ns(frames),
                 ),
             ],
             components=[
@@ -512,6 +757,50 @@ class SessionStream:
             recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
         )
 
+    def save_audio_chunk_frames(
+        self,
+        frames: Sequence[AudioChunkFrame],
+        device: Device,
+    ):
+        """Log every sample of `frames` at its own device timestamp, derived from the sample rate.
+
+        The chunks are logged to the same entity as audio frames.
+
+        Raises:
+            ValueError: If a frame has no sample rate or a partial sample.
+        """
+        if len(frames) == 0:
+            logger.warning("No audio chunk frames to save.")
+            return
+
+        entity_path = self._entity_path(
+            device,
+            ARFrameType.AUDIO_FRAME,
+        )
+        with tracer.span("audio_chunk_samples", frames=len(frames)):
+            device_timestamps, samples = _audio_chunk_samples(frames)
+        self._log_static(
+            entity_path,
+            [rr.Scalar.indicator()],
+        )
+        self._send_columns(
+            entity_path,
+            times=[
+                rr.TimeNanosColumn(
+                    timeline=Timeline.DEVICE,
+                    times=device_timestamps,
+                ),
+            ],
+            components=[
+                # One sample per row. Rerun partitions a plain batch with a list of ones,
+                # which costs a Python object per sample.
+                rr.components.ScalarBatch(data=samples).partition(
+                    np.ones(len(samples), dtype=np.int32)
+                )
+            ],
+            recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+        )
+
     def save_plane_detection_frames(
         self,
         frames: Sequence[PlaneDetectionFrame],
@@ -521,18 +810,13 @@ class SessionStream:
             logger.warning("No plane detection frames to save.")
             return
 
-        entity_path = rr.new_entity_path(
-            [
-                f"{self.info.metadata.name}_{self.info.id.value}",
-                f"{device.model}_{device.name}_{device.uid}",
-                ARFrameType.PLANE_DETECTION_FRAME,
-            ]
+        entity_path = self._entity_path(
+            device,
+            ARFrameType.PLANE_DETECTION_FRAME,
         )
-        rr.log(
+        self._log_static(
             entity_path,
             [rr.LineStrips3D.indicator()],
-            static=True,
-            recording=self.stream,
         )
         positively_changed_frames = list(
             filter(
@@ -543,15 +827,13 @@ class SessionStream:
                 frames,
             )
         )
-        rr.send_columns(
+        positively_changed_timestamps = _device_timestamps_ns(positively_changed_frames)
+        self._send_columns(
             entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
-                    times=[
-                        f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                        for f in positively_changed_frames
-                    ],
+                    times=positively_changed_timestamps,
                 ),
             ],
             components=[
@@ -599,15 +881,13 @@ class SessionStream:
         negatively_changed_frames = list(
             filter(lambda f: f.state == PlaneDetectionFrame.STATE_REMOVED, frames)
         )
-        rr.send_columns(
+        negatively_changed_timestamps = _device_timestamps_ns(negatively_changed_frames)
+        self._send_columns(
             entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
-                    times=[
-                        f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                        for f in negatively_changed_frames
-                    ],
+                    times=negatively_changed_timestamps,
                 ),
             ],
             components=[
@@ -629,146 +909,160 @@ class SessionStream:
         frames: Sequence[PointCloudDetectionFrame],
         device: Device,
     ):
+        """Log the points of each point cloud that changed since the cloud was last logged.
+
+        The points of a cloud are logged in chunks, each as one `Points3D` under the entity of
+        its trackable, and only the chunks with added, moved, or removed points are logged
+        again. See `PointCloudStore`. Unless `point_clouds` has a budget, every cloud is logged
+        whole as a single chunk. The identifiers and confidence values of the points are
+        logged alongside their positions, as the `identifier` and `confidence` components.
+
+        Raises:
+            ValueError: If a point cloud has identifiers or confidence values for a different
+                number of points than its positions.
+        """
         if len(frames) == 0:
             logger.warning("No point cloud detection frames to save.")
             return
 
-        entity_path = rr.new_entity_path(
-            [
-                f"{self.info.metadata.name}_{self.info.id.value}",
-                f"{device.model}_{device.name}_{device.uid}",
-                ARFrameType.POINT_CLOUD_DETECTION_FRAME,
-            ]
+        entity_path = self._entity_path(
+            device,
+            ARFrameType.POINT_CLOUD_DETECTION_FRAME,
         )
-        rr.log(
-            entity_path,
-            [rr.Points3D.indicator()],
-            static=True,
-            recording=self.stream,
+        trackable_frames_by_path: DefaultDict[str, list[PointCloudDetectionFrame]] = (
+            defaultdict(list)
         )
-        positively_changed_frames = list(
-            filter(
-                lambda f: f.state == PointCloudDetectionFrame.STATE_ADDED
-                or f.state == PointCloudDetectionFrame.STATE_UPDATED,
-                frames,
-            )
+        # Every cloud is read before any is diffed, so that a malformed one leaves the store
+        # as it was.
+        clouds_by_path: DefaultDict[str, list[_PointCloudArrays | None]] = defaultdict(
+            list
         )
-        # for each point cloud
-        rr.send_columns(
-            entity_path,
-            times=[
-                rr.TimeSecondsColumn(
-                    timeline=Timeline.DEVICE,
+        for f in frames:
+            trackable_id = f.point_cloud.trackable.trackable_id
+            trackable_entity_path = (
+                f"{entity_path}/{trackable_id.sub_id_1}_{trackable_id.sub_id_2}"
+            )
+            trackable_frames_by_path[trackable_entity_path].append(f)
+            clouds_by_path[trackable_entity_path].append(
+                _point_cloud_arrays(f.point_cloud)
+                if f.state == PointCloudDetectionFrame.STATE_ADDED
+                or f.state == PointCloudDetectionFrame.STATE_UPDATED
+                else None
+            )
+
+        for trackable_entity_path, trackable_frames in trackable_frames_by_path.items():
+            # Frames of a trackable are diffed in order, each against the one before.
+            cleared_timestamps: list[int] = []
+            chunk_rows: DefaultDict[int, list[tuple[int, PointChunk, bool]]] = (
+                defaultdict(list)
+            )
+            for f, cloud, device_timestamp in zip(
+                trackable_frames,
+                clouds_by_path[trackable_entity_path],
+                _device_timestamps_ns(trackable_frames).tolist(),
+            ):
+                if f.state == PointCloudDetectionFrame.STATE_REMOVED:
+                    self.point_clouds.remove(trackable_entity_path)
+                    self._forget_point_chunks(trackable_entity_path)
+                    cleared_timestamps.append(device_timestamp)
+                    continue
+                if cloud is None:
+                    continue
+                positions, identifiers, confidence = cloud
+                # TODO: notice ARTrackable.Pose
+                tracking = (
+                    f.point_cloud.trackable.tracking_state
+                    == ARTrackable.TRACKING_STATE_TRACKING
+                )
+                with tracer.span("point_cloud_changes", points=len(positions)):
+                    changes = self.point_clouds.update(
+                        trackable_entity_path,
+                        positions,
+                        identifiers,
+                        confidence,
+                        style=tracking,
+                    )
+                for key in changes.evicted:
+                    self._forget_point_chunks(key)
+                if changes.cleared:
+                    cleared_timestamps.append(device_timestamp)
+                for chunk in changes.chunks:
+                    chunk_rows[chunk.index].append((device_timestamp, chunk, tracking))
+
+            # Cleared before logging the chunks, so that chunks logged at the same time stay.
+            if len(cleared_timestamps) != 0:
+                self._send_columns(
+                    trackable_entity_path,
                     times=[
-                        f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                        for f in positively_changed_frames
+                        rr.TimeNanosColumn(
+                            timeline=Timeline.DEVICE,
+                            times=np.array(cleared_timestamps, dtype=np.int64),
+                        ),
                     ],
-                ),
-            ],
-            components=[
-                rr.components.EntityPathBatch(
-                    data=[
-                        f"{f.point_cloud.trackable.trackable_id.sub_id_1}_{f.point_cloud.trackable.trackable_id.sub_id_2}"
-                        for f in positively_changed_frames
-                    ]
-                ),
-                # TODO: notice ARTrackable.Pose
-                rr.components.ColorBatch(
-                    data=[
-                        [0, 255, 0]  # green
-                        if f.point_cloud.trackable.tracking_state
-                        == ARTrackable.TRACKING_STATE_TRACKING
-                        else [255, 0, 0]  # red
-                        for f in positively_changed_frames
+                    components=[
+                        rr.components.ClearIsRecursiveBatch(
+                            data=[True for _ in cleared_timestamps]
+                        ),
                     ],
-                ),
-                rr.components.TextBatch(
-                    data=[
-                        ARTrackable.TrackingState.Name(
-                            f.point_cloud.trackable.tracking_state
-                        )
-                        for f in positively_changed_frames
-                    ]
-                ),
-                # rr.components.TextBatch(
-                #     data=[
-                #         PointCloudDetectionFrame.State.Name(f.state)
-                #         for f in positively_changed_frames
-                #     ]
-                # ),
-            ],
-            recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+                    recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+                )
+            for index, rows in chunk_rows.items():
+                chunk_entity_path = f"{trackable_entity_path}/{index}"
+                self._point_chunk_paths[trackable_entity_path].add(chunk_entity_path)
+                self._send_point_chunks(chunk_entity_path, rows)
+
+    def _forget_point_chunks(self, key: Hashable) -> None:
+        """Forget the static components logged to the chunks of the point cloud `key`, which the store no longer remembers."""
+        for chunk_entity_path in self._point_chunk_paths.pop(key, ()):
+            self._static_keys.pop(chunk_entity_path, None)
+
+    def _send_point_chunks(
+        self,
+        entity_path: str,
+        rows: Sequence[tuple[int, PointChunk, bool]],
+    ) -> None:
+        """Log a chunk of points as one `Points3D` row per device timestamp, green while tracking."""
+        chunks = [chunk for _, chunk, _ in rows]
+        self._log_static(
+            entity_path,
+            [rr.Points3D.indicator()],
         )
-        # for each point in the cloud
-        rr.send_columns(
+        self._send_columns(
             entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
-                    times=[
-                        f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                        for f in positively_changed_frames
-                        for _ in f.point_cloud.identifiers
-                    ],
+                    times=np.array(
+                        [device_timestamp for device_timestamp, _, _ in rows],
+                        dtype=np.int64,
+                    ),
                 ),
             ],
             components=[
-                rr.components.EntityPathBatch(
-                    data=[
-                        rr.new_entity_path(
-                            [
-                                f"{f.point_cloud.trackable.trackable_id.sub_id_1}_{f.point_cloud.trackable.trackable_id.sub_id_2}",
-                                i,
-                            ]
-                        )
-                        for f in positively_changed_frames
-                        for i in f.point_cloud.identifiers
-                    ]
-                ),
-                rr.components.Position3DBatch(
-                    data=[
-                        [
-                            p.x,
-                            p.y,
-                            p.z,
-                        ]
-                        for f in positively_changed_frames
-                        for p in f.point_cloud.positions
-                    ]
+                _position3d_batch(
+                    np.concatenate([chunk.positions for chunk in chunks])
+                ).partition(np.array([len(chunk.positions) for chunk in chunks])),
+                rr.ComponentColumn(
+                    AnyBatchValue(
+                        "identifier",
+                        np.concatenate([chunk.identifiers for chunk in chunks]),
+                    ),
+                    np.array([len(chunk.identifiers) for chunk in chunks]),
                 ),
-                # TODO: Can use AnyBatchValue once this is released https://github.com/rerun-io/rerun/pull/8163.
-                # rr.components.TextBatch(
-                #     data=[
-                #         f.point_cloud.confidence_values
-                #         for f in positively_changed_frames
-                #     ],
-                # ),
-            ],
-            recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
-        )
-        negatively_changed_frames = list(
-            filter(lambda f: f.state == PointCloudDetectionFrame.STATE_REMOVED, frames)
-        )
-        rr.send_columns(
-            entity_path,
-            times=[
-                rr.TimeSecondsColumn(
-                    timeline=Timeline.DEVICE,
-                    times=[
-                        f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
-                        for f in negatively_changed_frames
-                    ],
+                rr.ComponentColumn(
+                    AnyBatchValue(
+                        "confidence",
+                        np.concatenate([chunk.confidence for chunk in chunks]),
+                    ),
+                    np.array([len(chunk.confidence) for chunk in chunks]),
                 ),
-            ],
-            components=[
-                rr.components.EntityPathBatch(
+                rr.components.ColorBatch(
                     data=[
-                        f"{f.point_cloud.trackable.trackable_id.sub_id_1}_{f.point_cloud.trackable.trackable_id.sub_id_2}"
-                        for f in negatively_changed_frames
-                    ]
-                ),
-                rr.components.ClearIsRecursiveBatch(
-                    data=[True for _ in negatively_changed_frames]
+                        [0, 255, 0]  # green
+                        if tracking
+                        else [255, 0, 0]  # red
+                        for _, _, tracking in rows
+                    ],
                 ),
             ],
             recording=self.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
@@ -783,18 +1077,13 @@ class SessionStream:
             logger.warning("No mesh detection frames to save.")
             return
 
-        entity_path = rr.new_entity_path(
-            [
-                f"{self.info.metadata.name}_{self.info.id.value}",
-                f"{device.model}_{device.name}_{device.uid}",
-                ARFrameType.MESH_DETECTION_FRAME,
-            ]
+        entity_path = self._entity_path(
+            device,
+            ARFrameType.MESH_DETECTION_FRAME,
         )
-        rr.log(
+        self._log_static(
             entity_path,
             [rr.Mesh3D.indicator()],
-            static=True,
-            recording=self.stream,
         )
         positively_changed_frames = list(
             filter(
@@ -804,14 +1093,15 @@ class SessionStream:
             )
         )
         for f in positively_changed_frames:
-            rr.set_time_seconds(
+            rr.set_time_nanos(
                 Timeline.DEVICE,
-                seconds=f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9,
+                nanos=f.device_timestamp.ToNanoseconds(),
                 recording=self.stream,
             )
             for sub_mesh in f.mesh_filter.mesh.sub_meshes:
                 # We are ignoring type because DracoPy is written with Cython, and Pyright cannot infer types from a native module.
-                decoded_mesh = DracoPy.decode(sub_mesh.data)  # pyright: ignore [reportUnknownMemberType, reportUnknownVariableType]
+                with tracer.span("DracoPy.decode", num_bytes=len(sub_mesh.data)):
+                    decoded_mesh = DracoPy.decode(sub_mesh.data)  # pyright: ignore [reportUnknownMemberType, reportUnknownVariableType]
                 rr.log(
                     f"{entity_path}/{rr.escape_entity_path_part(str(f.mesh_filter.instance_id))}",
                     rr.Mesh3D(
@@ -823,17 +1113,15 @@ class SessionStream:
                     ),
                     recording=self.stream,
                 )
-        negatively_changed_frames = filter(
-            lambda f: f.state == PointCloudDetectionFrame.STATE_REMOVED, frames
+        negatively_changed_frames = list(
+            filter(lambda f: f.state == MeshDetectionFrame.STATE_REMOVED, frames)
         )
-        rr.send_columns(
+        self._send_columns(
             entity_path,
             times=[
-                rr.TimeSecondsColumn(
+                rr.TimeNanosColumn(
                     timeline=Timeline.DEVICE,
-                    times=[
-                        f.device_timestamp.seconds for f in negatively_changed_frames
-                    ],
+                    times=_device_timestamps_ns(negatively_changed_frames),
                 ),
             ],
             components=[
@@ -851,48 +1139,217 @@ class SessionStream:
         )
 
 
-# TODO: Performance opportunity for hot path. Can operate on a batch of images at once instead of one at a time.
-def _to_i420_format(image: XRCpuImage) -> npt.NDArray[np.uint8]:
-    if len(image.planes) != 3:
-        logger.warning(
-            f"Skipping bad image. Expected 3 planes, got {len(image.planes)}."
+def _transform_mat3x3_batch(
+    matrices: npt.NDArray[np.float32],
+) -> rr.components.TransformMat3x3Batch:
+    """Builds the column of `(N, 3, 3)` row-major matrices directly as Arrow.
+
+    Rerun converts an array of matrices one `Mat3x3` at a time, which dominates logging
+    large batches of poses.
+    """
+    flat_columns = np.ascontiguousarray(matrices.transpose((0, 2, 1))).reshape(-1)
+    return rr.components.TransformMat3x3Batch(
+        pa.FixedSizeListArray.from_arrays(  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+            flat_columns,
+            type=rr.components.TransformMat3x3Type().storage_type,  # pyright: ignore [reportUnknownMemberType]
         )
-        return np.array([], dtype=np.uint8)
+    )
 
-    height = image.dimensions.y
-    width = image.dimensions.x
-    uv_height = height // 2
-    uv_width = width // 2
-    y_plane, u_plane, v_plane = (
-        image.planes[0],
-        image.planes[1],
-        image.planes[2],
+
+def _position3d_batch(
+    positions: npt.NDArray[np.float32],
+) -> rr.components.Position3DBatch:
+    """Builds the column of `(N, 3)` positions directly as Arrow, without converting them."""
+    return rr.components.Position3DBatch(
+        pa.FixedSizeListArray.from_arrays(  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+            np.ascontiguousarray(positions, dtype=np.float32).reshape(-1),
+            type=rr.components.Position3DType().storage_type,  # pyright: ignore [reportUnknownMemberType]
+        )
     )
-    y_data = (
-        np.frombuffer(y_plane.data, dtype=np.uint8)
-        .reshape((height, y_plane.row_stride))[:, :width]
-        .flatten()
+
+
+_PointCloudArrays = Tuple[
+    npt.NDArray[np.float32], npt.NDArray[np.uint64], npt.NDArray[np.float32]
+]
+"""Positions, identifiers, and confidence values of the points of a point cloud."""
+
+
+def _point_cloud_arrays(point_cloud: ARPointCloud) -> _PointCloudArrays:
+    """Positions, identifiers, and confidence values of the points of `point_cloud`.
+
+    Packed fields are viewed from their bytes. Otherwise the repeated fields are read point by
+    point. Shapes `(N, 3)`, `(N,)` or `(0,)`, and `(N,)` or `(0,)`.
+
+    Raises:
+        ValueError: If the identifiers or confidence values are not one per point.
+    """
+    check_point_cloud(point_cloud)
+    if len(point_cloud.packed_positions) != 0:
+        positions = np.frombuffer(point_cloud.packed_positions, dtype="<f4")
+        identifiers = np.frombuffer(point_cloud.packed_identifiers, dtype="<u8")
+        confidence = np.frombuffer(point_cloud.packed_confidence_values, dtype="<f4")
+    else:
+        positions = np.fromiter(
+            (c for p in point_cloud.positions for c in (p.x, p.y, p.z)),
+            dtype=np.float32,
+            count=3 * len(point_cloud.positions),
+        )
+        identifiers = np.array(point_cloud.identifiers, dtype=np.uint64)
+        confidence = np.array(point_cloud.confidence_values, dtype=np.float32)
+    positions = positions.astype(np.float32, copy=False).reshape((-1, 3))
+    return (
+        positions,
+        identifiers.astype(np.uint64, copy=False),
+        confidence.astype(np.float32, copy=False),
     )
-    # Downsample and pack U and V planes
-    u_data = (
-        # Have to pad an extra byte due to how the Android image format was captured. Check:
-        # https://stackoverflow.com/questions/51399908/yuv-420-888-byte-format/62090742
-        np.frombuffer(u_plane.data + b"\x00", dtype=np.uint8)
-        # pad an extra byte
-        .reshape((uv_height, u_plane.row_stride))[
-            :,
-            : uv_width * u_plane.pixel_stride : u_plane.pixel_stride,
-        ]
-        .flatten()
+
+
+_GYROSCOPE_SAMPLE = np.dtype(
+    [
+        ("attitude", np.float32, (4,)),
+        ("rotation_rate", np.float32, (3,)),
+        ("gravity", np.float32, (3,)),
+        ("acceleration", np.float32, (3,)),
+    ]
+)
+"""The 13 floats of a gyroscope frame, with the attitude quaternion in XYZW order."""
+
+
+def _gyroscope_samples(frames: Sequence[GyroscopeFrame]) -> npt.NDArray[np.void]:
+    """The readings of `frames` as one `_GYROSCOPE_SAMPLE` array, read in a single pass. Shape `(N,)`.
+
+    Each field is an `(N, 3)` or `(N, 4)` view, ready to be sent as a column without building
+    lists of readings first.
+    """
+
+    def readings() -> Iterator[float]:
+        for frame in frames:
+            attitude = frame.attitude
+            rotation_rate = frame.rotation_rate
+            gravity = frame.gravity
+            acceleration = frame.acceleration
+            yield attitude.x
+            yield attitude.y
+            yield attitude.z
+            yield attitude.w
+            yield rotation_rate.x
+            yield rotation_rate.y
+            yield rotation_rate.z
+            yield gravity.x
+            yield gravity.y
+            yield gravity.z
+            yield acceleration.x
+            yield acceleration.y
+            yield acceleration.z
+
+    values = np.fromiter(readings(), dtype=np.float32, count=13 * len(frames))
+    return values.view(_GYROSCOPE_SAMPLE)
+
+
+def _imu_batch_samples(
+    frames: Sequence[ImuBatchFrame],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.void]]:
+    """Device timestamps and `_GYROSCOPE_SAMPLE` readings of `frames`, viewed from their bytes.
+
+    Only the frames are visited, never their readings, so the cost does not grow with the
+    number of readings beyond joining the bytes of the frames.
+    """
+    for frame in frames:
+        check_imu_batch_frame(frame)
+    device_timestamps = np.frombuffer(
+        b"".join(frame.device_timestamps for frame in frames), dtype="<i8"
+    ).astype(np.int64, copy=False)
+    values = np.frombuffer(
+        b"".join(frame.samples for frame in frames), dtype="<f4"
+    ).astype(np.float32, copy=False)
+    return device_timestamps, values.view(_GYROSCOPE_SAMPLE)
+
+
+def _audio_chunk_samples(
+    frames: Sequence[AudioChunkFrame],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float32]]:
+    """Device timestamp of every sample of `frames`, and the samples viewed from their bytes."""
+    counts = np.empty(len(frames), dtype=np.int64)
+    sample_rates = np.empty(len(frames), dtype=np.int64)
+    for i, frame in enumerate(frames):
+        check_audio_chunk_frame(frame)
+        counts[i] = len(frame.samples) // 4
+        sample_rates[i] = frame.sample_rate
+    samples = np.frombuffer(
+        b"".join(frame.samples for frame in frames), dtype="<f4"
+    ).astype(np.float32, copy=False)
+    chunk = np.repeat(np.arange(len(frames)), counts)
+    first_sample = np.cumsum(counts) - counts
+    index_in_chunk = np.arange(len(samples)) - np.repeat(first_sample, counts)
+    device_timestamps = (
+        _device_timestamps_ns(frames)[chunk]
+        + index_in_chunk * 1_000_000_000 // sample_rates[chunk]
     )
-    v_data = (
-        np.frombuffer(v_plane.data + b"\x00", dtype=np.uint8)
-        .reshape((uv_height, v_plane.row_stride))[
-            :, : uv_width * v_plane.pixel_stride : v_plane.pixel_stride
-        ]
-        .flatten()
+    return device_timestamps, samples
+
+
+def _image_buffer_batch(
+    buffers: npt.NDArray[np.uint8],
+) -> rr.components.ImageBufferBatch:
+    """Builds the column of `(N, num_bytes)` images directly as Arrow, without copying them.
+
+    Rerun copies an array of images twice before wrapping it.
+    """
+    offsets = np.arange(len(buffers) + 1, dtype=np.int64) * buffers.shape[1]
+    flat = np.ascontiguousarray(buffers).reshape(-1)
+    return rr.components.ImageBufferBatch(
+        pa.ListArray.from_arrays(  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+            # Raises rather than wrapping around past the 2 GiB of 32-bit offsets.
+            pa.array(offsets, type=pa.int32()),  # pyright: ignore [reportUnknownMemberType]
+            pa.array(flat),  # pyright: ignore [reportUnknownMemberType]
+            type=rr.components.ImageBufferType().storage_type,  # pyright: ignore [reportUnknownMemberType]
+        )
     )
-    return np.concatenate([y_data, u_data, v_data])
+
+
+def _device_timestamps_ns(
+    frames: Sequence[
+        TransformFrame
+        | ColorFrame
+        | DepthFrame
+        | GyroscopeFrame
+        | AudioFrame
+        | AudioChunkFrame
+        | PlaneDetectionFrame
+        | PointCloudDetectionFrame
+        | MeshDetectionFrame
+    ],
+) -> npt.NDArray[np.int64]:
+    """Device timestamps of `frames` as one array of nanoseconds, exact for any timestamp.
+
+    Build it once per batch and reuse it for every column sent from the batch.
+    """
+    return np.fromiter(
+        (
+            f.device_timestamp.seconds * 1_000_000_000 + f.device_timestamp.nanos
+            for f in frames
+        ),
+        dtype=np.int64,
+        count=len(frames),
+    )
+
+
+def _image_timestamps(
+    frames: Sequence[ColorFrame | DepthFrame],
+) -> npt.NDArray[np.float64]:
+    return np.fromiter(
+        (f.image.timestamp for f in frames), dtype=np.float64, count=len(frames)
+    )
+
+
+def _intrinsics_matrices(frames: Sequence[ColorFrame]) -> npt.NDArray[np.float32]:
+    matrices = np.zeros((len(frames), 3, 3), dtype=np.float32)
+    matrices[:, 0, 0] = [f.intrinsics.focal_length.x for f in frames]
+    matrices[:, 1, 1] = [f.intrinsics.focal_length.y for f in frames]
+    matrices[:, 0, 2] = [f.intrinsics.principal_point.x for f in frames]
+    matrices[:, 1, 2] = [f.intrinsics.principal_point.y for f in frames]
+    matrices[:, 2, 2] = 1
+    return matrices
 
 
 def _convert_2d_to_3d_boundary_points(
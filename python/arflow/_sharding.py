@@ -0,0 +1,582 @@
+"""The ARFlow gRPC server spread across worker processes."""
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent import futures
+from pathlib import Path
+from signal import SIGINT, SIGTERM, signal
+from typing import Any, Type, TypeVar
+
+import grpc
+from google.protobuf.message import Message
+from grpc_interceptor.exceptions import InvalidArgument, NotFound
+
+from arflow._admission import (
+    DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+    AdmissionController,
+    max_receive_message_length,
+)
+from arflow._core import (
+    ARFlowServicer,
+    _FrameStreamFlowControl,  # pyright: ignore [reportPrivateUsage]
+)
+from arflow._error_interceptor import ErrorInterceptor
+from arflow._hook_executor import HookExecutor
+from arflow._metrics import ARFlowMetrics, start_metrics_server
+from arflow._metrics_interceptor import MetricsInterceptor
+from arflow._session_reaper import SessionReaper
+from arflow._types import DepthCodec, OverflowPolicy
+from arflow._utils import check_frames, frames_byte_size
+from cakelab.arflow_grpc.v1 import arflow_service_pb2_grpc
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.create_session_response_pb2 import CreateSessionResponse
+from cakelab.arflow_grpc.v1.delete_session_request_pb2 import DeleteSessionRequest
+from cakelab.arflow_grpc.v1.delete_session_response_pb2 import DeleteSessionResponse
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.get_session_request_pb2 import GetSessionRequest
+from cakelab.arflow_grpc.v1.get_session_response_pb2 import GetSessionResponse
+from cakelab.arflow_grpc.v1.join_session_request_pb2 import JoinSessionRequest
+from cakelab.arflow_grpc.v1.join_session_response_pb2 import JoinSessionResponse
+from cakelab.arflow_grpc.v1.leave_session_request_pb2 import LeaveSessionRequest
+from cakelab.arflow_grpc.v1.leave_session_response_pb2 import LeaveSessionResponse
+from cakelab.arflow_grpc.v1.list_sessions_request_pb2 import ListSessionsRequest
+from cakelab.arflow_grpc.v1.list_sessions_response_pb2 import ListSessionsResponse
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import (
+    SaveARFramesRequest,
+)
+from cakelab.arflow_grpc.v1.save_ar_frames_response_pb2 import (
+    SaveARFramesResponse,
+)
+from cakelab.arflow_grpc.v1.save_synchronized_ar_frame_request_pb2 import (
+    SaveSynchronizedARFrameRequest,
+)
+from cakelab.arflow_grpc.v1.save_synchronized_ar_frame_response_pb2 import (
+    SaveSynchronizedARFrameResponse,
+)
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.stream_ar_frames_request_pb2 import (
+    StreamARFramesRequest,
+)
+from cakelab.arflow_grpc.v1.stream_ar_frames_response_pb2 import (
+    StreamARFramesResponse,
+)
+from cakelab.arflow_grpc.v1.synchronized_ar_frame_pb2 import SynchronizedARFrame
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=Message)
+
+_worker_servicer: ARFlowServicer | None = None
+"""The servicer owned by the current worker process."""
+
+
+def _start_worker(service: Type[ARFlowServicer], service_kwargs: dict[str, Any]) -> int:
+    global _worker_servicer
+    _worker_servicer = service(**service_kwargs)
+    return os.getpid()
+
+
+def _call_worker(method: str, request: bytes, request_type: Type[Message]) -> bytes:
+    # Messages cross the process boundary in their wire format, which is far cheaper to
+    # pickle than the message objects.
+    assert _worker_servicer is not None
+    response: Message = getattr(_worker_servicer, method)(
+        request_type.FromString(request)
+    )
+    return response.SerializeToString()
+
+
+def _stop_worker() -> None:
+    if _worker_servicer is not None:
+        _worker_servicer.on_server_exit()
+
+
+class _Shard:
+    """A worker process and the number of sessions it owns."""
+
+    def __init__(self, executor: futures.ProcessPoolExecutor) -> None:
+        self.executor = executor
+        self.pid = 0
+        self.num_sessions = 0
+
+    def call(self, method: str, request: Message, response_type: Type[M]) -> M:
+        payload = self.executor.submit(
+            _call_worker, method, request.SerializeToString(), type(request)
+        ).result()
+        return response_type.FromString(payload)
+
+
+class ShardedARFlowServicer(
+    _FrameStreamFlowControl, arflow_service_pb2_grpc.ARFlowServiceServicer
+):
+    """Spreads sessions across worker processes that each run their own `service`.
+
+    Decoding frames and logging them to Rerun hold the GIL, so a single process is bound to
+    one core. Here, every session is pinned to one worker process for its whole life: the
+    worker owns the session's `rr.RecordingStream` and saves its frames in order, while
+    sessions on other workers are saved in parallel. New sessions go to the worker that owns
+    the fewest sessions.
+
+    Session information is mirrored in this process, which serves `GetSession` and
+    `ListSessions` without a round trip to the workers. Sessions and devices that the workers
+    reap for being idle are forgotten here periodically. The `on_*` hooks of `service` run in
+    the worker processes, so `service` must be importable from them.
+    """
+
+    def __init__(
+        self,
+        service: Type[ARFlowServicer] = ARFlowServicer,
+        num_workers: int | None = None,
+        spawn_viewer: bool = True,
+        save_dir: Path | None = None,
+        application_id: str = "arflow",
+        ingest_queue_size: int = 0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        idle_timeout: float | None = None,
+        admission_controller: AdmissionController | None = None,
+        hook_executor: HookExecutor | None = None,
+        log_encoded_images: bool = False,
+        decode_workers: int | None = None,
+        depth_codec: DepthCodec = DepthCodec.NONE,
+        point_cloud_budget: int = 0,
+    ) -> None:
+        """Start the worker processes.
+
+        Args:
+            service: The service class each worker runs. Custom servers should subclass `arflow.ARFlowServicer`.
+            num_workers: Number of worker processes. Defaults to the number of cores.
+            spawn_viewer: Whether to spawn the Rerun Viewer in another process.
+            save_dir: The path to save the data to. Assumed to be an existing directory.
+            application_id: The application ID to store recordings under.
+            ingest_queue_size: See `arflow.ARFlowServicer`.
+            overflow_policy: See `arflow.ARFlowServicer`.
+            idle_timeout: See `arflow.ARFlowServicer`. Each worker reaps its own sessions, and this
+                process forgets them every `idle_timeout / 2` seconds.
+            admission_controller: See `arflow.ARFlowServicer`. Calls are admitted in this process,
+                so the per-session and total limits hold across all workers.
+            hook_executor: See `arflow.ARFlowServicer`. Each worker runs its hooks on an executor
+                of its own with the same limits, so the concurrency limits hold per worker.
+            log_encoded_images: See `arflow.ARFlowServicer`.
+            decode_workers: See `arflow.ARFlowServicer`. Each worker starts threads of its own.
+            depth_codec: See `arflow.ARFlowServicer`.
+            point_cloud_budget: See `arflow.ARFlowServicer`.
+
+        Raises:
+            ValueError: If `num_workers` or `idle_timeout` is not positive, or if `service` rejects
+                the other arguments.
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if num_workers < 1:
+            raise ValueError("Number of workers must be positive.")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("Idle timeout must be positive.")
+
+        # Workers are spawned rather than forked because the threads of gRPC and Rerun do not
+        # survive a fork.
+        context = multiprocessing.get_context("spawn")
+        self.shards = [
+            _Shard(futures.ProcessPoolExecutor(max_workers=1, mp_context=context))
+            for _ in range(num_workers)
+        ]
+        service_kwargs: dict[str, Any] = {
+            "spawn_viewer": spawn_viewer,
+            "save_dir": save_dir,
+            "application_id": application_id,
+            "ingest_queue_size": ingest_queue_size,
+            "overflow_policy": overflow_policy,
+            "idle_timeout": idle_timeout,
+            "hook_executor": hook_executor,
+            "log_encoded_images": log_encoded_images,
+            "decode_workers": decode_workers,
+            "depth_codec": depth_codec,
+            "point_cloud_budget": point_cloud_budget,
+        }
+        try:
+            # Starts the workers eagerly so that invalid arguments surface here.
+            started = [
+                shard.executor.submit(_start_worker, service, service_kwargs)
+                for shard in self.shards
+            ]
+            for shard, pid in zip(self.shards, started):
+                shard.pid = pid.result()
+        except BaseException:
+            for shard in self.shards:
+                shard.executor.shutdown(cancel_futures=True)
+            raise
+
+        self.sessions: dict[str, Session] = {}
+        """Information of the active sessions, indexed by their ID."""
+        self._session_shards: dict[str, _Shard] = {}
+        self._lock = threading.Lock()
+        self.admission_controller = admission_controller
+        """Rate limits that calls carrying frames must stay within."""
+        logger.info(
+            "Started %d workers: %s", num_workers, [shard.pid for shard in self.shards]
+        )
+        self._session_reaper = (
+            SessionReaper(self.forget_reaped_sessions, interval=idle_timeout / 2)
+            if idle_timeout is not None
+            else None
+        )
+        super().__init__()
+
+    def _get_shard(self, session_id: str) -> _Shard:
+        with self._lock:
+            try:
+                return self._session_shards[session_id]
+            except KeyError:
+                raise NotFound("Session not found")
+
+    def CreateSession(
+        self, request: CreateSessionRequest, context: grpc.ServicerContext | None = None
+    ) -> CreateSessionResponse:
+        with self._lock:
+            shard = min(self.shards, key=lambda shard: shard.num_sessions)
+            # Reserves the slot so that concurrent calls spread across workers.
+            shard.num_sessions += 1
+
+        try:
+            response = shard.call("CreateSession", request, CreateSessionResponse)
+        except BaseException:
+            with self._lock:
+                shard.num_sessions -= 1
+            raise
+
+        with self._lock:
+            self.sessions[response.session.id.value] = response.session
+            self._session_shards[response.session.id.value] = shard
+        logger.debug(
+            "Placed session %s on worker %d", response.session.id.value, shard.pid
+        )
+
+        return response
+
+    def DeleteSession(
+        self, request: DeleteSessionRequest, context: grpc.ServicerContext | None = None
+    ) -> DeleteSessionResponse:
+        shard = self._get_shard(request.session_id.value)
+        response = shard.call("DeleteSession", request, DeleteSessionResponse)
+
+        with self._lock:
+            if self._session_shards.pop(request.session_id.value, None) is not None:
+                del self.sessions[request.session_id.value]
+                shard.num_sessions -= 1
+        if self.admission_controller is not None:
+            self.admission_controller.forget_session(request.session_id.value)
+
+        return response
+
+    def GetSession(
+        self, request: GetSessionRequest, context: grpc.ServicerContext | None = None
+    ) -> GetSessionResponse:
+        with self._lock:
+            try:
+                session = self.sessions[request.session_id.value]
+            except KeyError:
+                raise NotFound("Session not found")
+            return GetSessionResponse(session=session)
+
+    def ListSessions(
+        self,
+        request: ListSessionsRequest,
+        context: grpc.ServicerContext | None = None,
+    ) -> ListSessionsResponse:
+        with self._lock:
+            return ListSessionsResponse(sessions=self.sessions.values())
+
+    def JoinSession(
+        self, request: JoinSessionRequest, context: grpc.ServicerContext | None = None
+    ) -> JoinSessionResponse:
+        shard = self._get_shard(request.session_id.value)
+        response = shard.call("JoinSession", request, JoinSessionResponse)
+
+        with self._lock:
+            if request.session_id.value in self.sessions:
+                self.sessions[request.session_id.value] = response.session
+
+        return response
+
+    def LeaveSession(
+        self, request: LeaveSessionRequest, context: grpc.ServicerContext | None = None
+    ) -> LeaveSessionResponse:
+        shard = self._get_shard(request.session_id.value)
+        response = shard.call("LeaveSession", request, LeaveSessionResponse)
+
+        with self._lock:
+            session = self.sessions.get(request.session_id.value)
+            if session is not None and request.device in session.devices:
+                session.devices.remove(request.device)
+        if self.admission_controller is not None:
+            self.admission_controller.forget_device(
+                request.session_id.value, request.device.uid
+            )
+
+        return response
+
+    def _check_frames(self, frames: Sequence[ARFrame | SynchronizedARFrame]) -> None:
+        """Reject malformed frames before they are admitted and forwarded to a worker.
+
+        Raises:
+            InvalidArgument: If a frame has a pose or buffer of the wrong size, no sample rate,
+                or a point cloud with identifiers or confidence values for a different number of
+                points.
+        """
+        try:
+            check_frames(frames)
+        except ValueError as e:
+            raise InvalidArgument(str(e)) from e
+
+    def _admit_frames(
+        self, session_id: str, device: Device, frames: Sequence[Message]
+    ) -> None:
+        if self.admission_controller is not None:
+            self.admission_controller.admit(
+                session_id, device.uid, len(frames), frames_byte_size(frames)
+            )
+
+    def SaveARFrames(
+        self,
+        request: SaveARFramesRequest,
+        context: grpc.ServicerContext | None = None,
+    ) -> SaveARFramesResponse:
+        """Save AR frames to a session on the worker that owns it."""
+        shard = self._get_shard(request.session_id.value)
+        self._check_frames(request.frames)
+        self._admit_frames(request.session_id.value, request.device, request.frames)
+        return shard.call("SaveARFrames", request, SaveARFramesResponse)
+
+    def StreamARFrames(
+        self,
+        request_iterator: Iterator[StreamARFramesRequest],
+        context: grpc.ServicerContext | None = None,
+    ) -> Iterator[StreamARFramesResponse]:
+        """Save AR frames to a session on the worker that owns it as they arrive on a stream.
+
+        See `arflow.ARFlowServicer.StreamARFrames` for the binding and flow-control semantics.
+        """
+        yield StreamARFramesResponse(credits=self.stream_window)
+
+        shard: _Shard | None = None
+        session_id = SessionUuid()
+        device = Device()
+        acked_messages = 0
+        for request in request_iterator:
+            if shard is None:
+                session_id = request.session_id
+                device = request.device
+                shard = self._get_shard(session_id.value)
+                with self._lock:
+                    session = self.sessions.get(session_id.value)
+                    if session is None or device not in session.devices:
+                        raise NotFound("Device not in session")
+
+            self._check_frames(request.frames)
+            self._admit_frames(session_id.value, device, request.frames)
+            if len(request.frames) != 0:
+                shard.call(
+                    "SaveARFrames",
+                    SaveARFramesRequest(
+                        session_id=session_id, device=device, frames=request.frames
+                    ),
+                    SaveARFramesResponse,
+                )
+
+            acked_messages += 1
+            ack = self._stream_ack(acked_messages)
+            if ack is not None:
+                yield ack
+
+        ack = self._final_stream_ack(acked_messages)
+        if ack is not None:
+            yield ack
+
+    def SaveSynchronizedARFrame(
+        self,
+        request: SaveSynchronizedARFrameRequest,
+        context: grpc.ServicerContext | None = None,
+    ) -> SaveSynchronizedARFrameResponse:
+        shard = self._get_shard(request.session_id.value)
+        self._check_frames([request.frame])
+        self._admit_frames(request.session_id.value, request.device, [request.frame])
+        return shard.call(
+            "SaveSynchronizedARFrame", request, SaveSynchronizedARFrameResponse
+        )
+
+    def forget_reaped_sessions(self) -> list[str]:
+        """Forget the sessions and devices that the workers reaped for being idle.
+
+        Sessions and devices added while the workers are asked for their sessions are kept.
+
+        Returns:
+            The IDs of the forgotten sessions.
+        """
+        forgotten_sessions: list[str] = []
+        removed_devices: list[tuple[str, Device]] = []
+        for shard in self.shards:
+            with self._lock:
+                known_devices = {
+                    session_id: list(self.sessions[session_id].devices)
+                    for session_id, session_shard in self._session_shards.items()
+                    if session_shard is shard
+                }
+            if len(known_devices) == 0:
+                continue
+            live_sessions = {
+                session.id.value: session
+                for session in shard.call(
+                    "ListSessions", ListSessionsRequest(), ListSessionsResponse
+                ).sessions
+            }
+
+            with self._lock:
+                for session_id, devices in known_devices.items():
+                    live_session = live_sessions.get(session_id)
+                    if live_session is None:
+                        if self._session_shards.pop(session_id, None) is not None:
+                            del self.sessions[session_id]
+                            shard.num_sessions -= 1
+                            forgotten_sessions.append(session_id)
+                        continue
+                    session = self.sessions.get(session_id)
+                    for device in devices:
+                        if (
+                            session is not None
+                            and device not in live_session.devices
+                            and device in session.devices
+                        ):
+                            session.devices.remove(device)
+                            removed_devices.append((session_id, device))
+
+        if self.admission_controller is not None:
+            for session_id in forgotten_sessions:
+                self.admission_controller.forget_session(session_id)
+            for session_id, device in removed_devices:
+                self.admission_controller.forget_device(session_id, device.uid)
+        if len(forgotten_sessions) != 0:
+            logger.info("Forgot %d sessions reaped by workers", len(forgotten_sessions))
+        return forgotten_sessions
+
+    def on_server_exit(self) -> None:
+        """Stops forgetting reaped sessions, closes the connections, servers, and files of every worker, then stops them.
+
+        @private
+        """
+        if self._session_reaper is not None:
+            self._session_reaper.close()
+        for shard in self.shards:
+            shard.executor.submit(_stop_worker).result()
+            shard.executor.shutdown()
+        logger.debug("All workers stopped")
+
+
+def run_sharded_server(  # pragma: no cover
+    service: Type[ARFlowServicer],
+    num_workers: int | None = None,
+    spawn_viewer: bool = True,
+    save_dir: Path | None = None,
+    application_id: str = "arflow",
+    port: int = 8500,
+    ingest_queue_size: int = 0,
+    overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    idle_timeout: float | None = None,
+    admission_controller: AdmissionController | None = None,
+    metrics_port: int | None = None,
+    hook_executor: HookExecutor | None = None,
+    log_encoded_images: bool = False,
+    decode_workers: int | None = None,
+    depth_codec: DepthCodec = DepthCodec.NONE,
+    point_cloud_budget: int = 0,
+    max_message_length: int = DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+) -> None:
+    """Run gRPC server that spreads sessions across worker processes.
+
+    Args:
+        service: The service class each worker runs. Custom servers should subclass `arflow.ARFlowServicer`.
+        num_workers: Number of worker processes. Defaults to the number of cores.
+        spawn_viewer: Whether to spawn the Rerun Viewer in another process.
+        save_dir: The path to save the data to.
+        port: The port to listen on.
+        ingest_queue_size: Number of frame batches each session may buffer before they are saved. 0 saves them inline.
+        overflow_policy: What a full session ingest queue does with a new batch.
+        idle_timeout: Seconds without frames after which devices and sessions are reaped. `None` keeps them forever.
+        admission_controller: Rate limits that calls carrying frames must stay within. `None` admits all frames.
+        metrics_port: Local port to serve RPC metrics on in the Prometheus text format. Frame and
+            decoding metrics are not collected from the workers. `None` disables metrics.
+        hook_executor: Runs the `on_save_*` hooks off the threads that save frames, with its limits
+            applied in each worker. `None` runs them inline.
+        log_encoded_images: Whether to log JPEG and PNG color frames undecoded, leaving their decoding to the viewer.
+        decode_workers: Threads decoding JPEG and PNG color frames, shared by all sessions. `None` uses one per
+            available core, and 0 decodes them on the thread saving the frames.
+        depth_codec: How depth images are stored in the recordings. See `arflow.DepthCodec`.
+        point_cloud_budget: Points of the point clouds each session remembers to log only their changes. 0 logs every cloud whole.
+        max_message_length: Largest request in bytes that the server receives. Lowered to the smallest
+            byte burst of `admission_controller`, since larger requests are never admitted.
+
+    Raises:
+        ValueError: If neither or both operational modes are selected, or if `num_workers` or
+            `max_message_length` is not positive.
+    """
+    receive_message_length = max_receive_message_length(
+        admission_controller, max_message_length
+    )
+    servicer = ShardedARFlowServicer(
+        service,
+        num_workers=num_workers,
+        spawn_viewer=spawn_viewer,
+        save_dir=save_dir,
+        application_id=application_id,
+        ingest_queue_size=ingest_queue_size,
+        overflow_policy=overflow_policy,
+        idle_timeout=idle_timeout,
+        admission_controller=admission_controller,
+        hook_executor=hook_executor,
+        log_encoded_images=log_encoded_images,
+        decode_workers=decode_workers,
+        depth_codec=depth_codec,
+        point_cloud_budget=point_cloud_budget,
+    )
+    interceptors: list[grpc.ServerInterceptor] = [ErrorInterceptor()]
+    metrics_server = None
+    if metrics_port is not None:
+        metrics = ARFlowMetrics()
+        metrics.add_gauge(
+            "arflow_sessions",
+            "Number of active sessions.",
+            lambda: [((), len(servicer.sessions))],
+        )
+        interceptors.append(MetricsInterceptor(metrics))
+        metrics_server = start_metrics_server(metrics, metrics_port)
+    server = grpc.server(  # pyright: ignore [reportUnknownMemberType]
+        # Each worker serves one call at a time, so a few threads per worker keep them busy.
+        futures.ThreadPoolExecutor(max_workers=4 * len(servicer.shards)),
+        compression=grpc.Compression.Gzip,
+        interceptors=interceptors,  # pyright: ignore [reportArgumentType]
+        options=[
+            ("grpc.max_receive_message_length", receive_message_length),
+        ],
+    )
+    arflow_service_pb2_grpc.add_ARFlowServiceServicer_to_server(servicer, server)  # pyright: ignore [reportUnknownMemberType]
+    server.add_insecure_port("[::]:%s" % port)
+    server.start()
+    logger.info("Server started, listening on %s", port)
+
+    def handle_shutdown(*_: Any) -> None:
+        # See `arflow.run_server` for the shutdown procedure.
+        logger.debug("Shutting down gracefully")
+        all_rpcs_done_event = server.stop(30)
+        all_rpcs_done_event.wait(30)
+
+        servicer.on_server_exit()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+
+        logger.info("Server shut down gracefully")
+
+    signal(SIGTERM, handle_shutdown)
+    signal(SIGINT, handle_shutdown)
+    server.wait_for_termination()
@@ -0,0 +1,160 @@
+"""Tracing spans of the stages of saving frames, in the Chrome trace event format."""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from types import TracebackType
+from typing import Any, ParamSpec, TypeVar
+
+DEFAULT_CAPACITY = 100_000
+"""Number of spans a tracer keeps before dropping the oldest ones."""
+
+_NULL_SPAN = nullcontext()
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer._record(self._name, self._start, end, self._args)  # pyright: ignore [reportPrivateUsage]
+
+
+class Tracer:
+    """Records nested spans of named stages into a ring buffer.
+
+    A disabled tracer records nothing: `span` returns a shared no-op context manager, so
+    instrumented code only pays for one attribute check. Tracing can be enabled and disabled
+    at any time, from any thread.
+
+    Spans are timed with the monotonic performance counter and exported in the
+    [Chrome trace event format](https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU),
+    which the Perfetto UI and `chrome://tracing` open. Spans recorded on the same thread
+    while another span is open are nested under it. Spans around an `await` may overlap the
+    spans of other tasks on the same event loop.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize a disabled tracer.
+
+        Args:
+            capacity: Number of spans to keep. Once full, the oldest spans are dropped.
+
+        Raises:
+            ValueError: If `capacity` is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("Tracer capacity must be positive.")
+        self.enabled = False
+        """Whether spans are recorded."""
+        self._events: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._thread_names: dict[int, str] = {}
+
+    def enable(self) -> None:
+        """Start recording spans."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans. The recorded spans are kept."""
+        self.enabled = False
+
+    def span(self, name: str, **args: Any) -> AbstractContextManager[None]:
+        """Time the enclosed block as a span called `name`, annotated with `args`.
+
+        Keep `args` cheap to compute: they are evaluated even when tracing is disabled.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def traced(self, name: str, function: Callable[P, R]) -> Callable[P, R]:
+        """Wrap `function` so that each call is timed as a span called `name`.
+
+        Returns `function` itself while tracing is disabled, e.g. to hand it to another thread.
+        """
+        if not self.enabled:
+            return function
+
+        def traced_function(*args: P.args, **kwargs: P.kwargs) -> R:
+            with self.span(name):
+                return function(*args, **kwargs)
+
+        return traced_function
+
+    def events(self) -> list[dict[str, Any]]:
+        """The recorded spans as Chrome trace events, oldest first."""
+        events = list(self._events)
+        pid = os.getpid()
+        return [
+            *(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in list(self._thread_names.items())
+            ),
+            *events,
+        ]
+
+    def clear(self) -> None:
+        """Drop the recorded spans."""
+        self._events.clear()
+        self._thread_names.clear()
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the recorded spans to `path` as a Chrome trace JSON file."""
+        with open(path, "w") as f:
+            json.dump(
+                {"traceEvents": self.events(), "displayTimeUnit": "ms"},
+                f,
+            )
+
+    def _record(
+        self, name: str, start_ns: int, end_ns: int, args: dict[str, Any]
+    ) -> None:
+        tid = threading.get_native_id()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        event: dict[str, Any] = {
+            "name": name,
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": tid,
+        }
+        if len(args) != 0:
+            event["args"] = args
+        # Appending to a bounded deque is atomic, so concurrent spans need no lock.
+        self._events.append(event)
+
+
+tracer = Tracer()
+"""The tracer of the ARFlow server. Disabled until `enable` is called."""
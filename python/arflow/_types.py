@@ -16,8 +16,50 @@ class ARFrameType(StrEnum):
     PLANE_DETECTION_FRAME = "plane_detection_frame"
     POINT_CLOUD_DETECTION_FRAME = "point_cloud_detection_frame"
     MESH_DETECTION_FRAME = "mesh_detection_frame"
+    IMU_BATCH_FRAME = "imu_batch_frame"
+    AUDIO_CHUNK_FRAME = "audio_chunk_frame"
 
 
 class Timeline(StrEnum):
     DEVICE = "device_timestamp"
     IMAGE = "image_timestamp"
+
+
+class OverflowPolicy(StrEnum):
+    """What a full session ingest queue does with a new batch of frames."""
+
+    BLOCK = "block"
+    """Wait until the consumer makes room. Backpressure reaches the client through the RPC latency."""
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest queued batch to make room."""
+    REJECT = "reject"
+    """Fail the RPC with `RESOURCE_EXHAUSTED` so the client can back off and retry."""
+
+
+class DepthCodec(StrEnum):
+    """How depth images are stored in the recording.
+
+    There is no lossless codec beyond storing depth as sent. Rerun 0.20 cannot display
+    compressed depth images, and the LZ4 compression it applies to every recording barely
+    shrinks noisy sensor depth. `UINT16_MILLIMETERS` is lossy and at most halves the size of
+    depth images.
+    """
+
+    NONE = "none"
+    """As they were sent, without loss."""
+    UINT16_MILLIMETERS = "uint16_mm"
+    """`FORMAT_DEPTHFLOAT32` images are rounded to the nearest millimeter and stored as 16-bit
+    integers, half their size. Depths in [0, 65.535] m are stored within 0.5 mm of the sent value.
+    Larger depths are stored as 65.535 m, and negative and non-finite depths as 0, which means no
+    depth. `FORMAT_DEPTHUINT16` images are stored as sent."""
+
+
+class YuvLayout(StrEnum):
+    """How the samples of a 4:2:0 YUV image follow each other in memory."""
+
+    I420 = "i420"
+    """The Y plane, then the U plane, then the V plane."""
+    NV12 = "nv12"
+    """The Y plane, then the U and V samples interleaved, U first."""
+    NV21 = "nv21"
+    """The Y plane, then the V and U samples interleaved, V first."""
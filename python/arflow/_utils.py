@@ -1,44 +1,260 @@
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import DefaultDict, Tuple
 
+from google.protobuf.message import Message
+
+from arflow._types import ARFrameType
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.ar_point_cloud_pb2 import ARPointCloud
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import AudioChunkFrame
+from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame
 from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
 from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
+from cakelab.arflow_grpc.v1.mesh_detection_frame_pb2 import MeshDetectionFrame
+from cakelab.arflow_grpc.v1.plane_detection_frame_pb2 import PlaneDetectionFrame
+from cakelab.arflow_grpc.v1.point_cloud_detection_frame_pb2 import (
+    PointCloudDetectionFrame,
+)
+from cakelab.arflow_grpc.v1.synchronized_ar_frame_pb2 import SynchronizedARFrame
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
 from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
 
+ColorFrameGroupKey = Tuple[XRCpuImage.Format, int, int]
+"""Format, width, and height shared by a group of color frames."""
+DepthFrameGroupKey = Tuple[XRCpuImage.Format, int, int, bool]
+"""Format, width, height, and temporal smoothing shared by a group of depth frames."""
+
+
+class ClassifiedARFrames:
+    """AR frames unwrapped from `ARFrame` and bucketed by the type set in its `data` oneof.
+
+    Every bucket keeps the order of the frames in the request. Color and depth frames are
+    also grouped by the image properties they are logged under.
+    """
+
+    def __init__(self) -> None:
+        self.transform_frames: list[TransformFrame] = []
+        self.color_frames: list[ColorFrame] = []
+        self.color_frame_groups: DefaultDict[ColorFrameGroupKey, list[ColorFrame]] = (
+            defaultdict(list)
+        )
+        self.depth_frames: list[DepthFrame] = []
+        self.depth_frame_groups: DefaultDict[DepthFrameGroupKey, list[DepthFrame]] = (
+            defaultdict(list)
+        )
+        self.gyroscope_frames: list[GyroscopeFrame] = []
+        self.audio_frames: list[AudioFrame] = []
+        self.plane_detection_frames: list[PlaneDetectionFrame] = []
+        self.point_cloud_detection_frames: list[PointCloudDetectionFrame] = []
+        self.mesh_detection_frames: list[MeshDetectionFrame] = []
+        self.imu_batch_frames: list[ImuBatchFrame] = []
+        self.audio_chunk_frames: list[AudioChunkFrame] = []
+
+    def items(self) -> list[tuple[ARFrameType, Sequence[Message]]]:
+        """The frames of every type, paired with their type."""
+        return [
+            (ARFrameType.TRANSFORM_FRAME, self.transform_frames),
+            (ARFrameType.COLOR_FRAME, self.color_frames),
+            (ARFrameType.DEPTH_FRAME, self.depth_frames),
+            (ARFrameType.GYROSCOPE_FRAME, self.gyroscope_frames),
+            (ARFrameType.AUDIO_FRAME, self.audio_frames),
+            (ARFrameType.PLANE_DETECTION_FRAME, self.plane_detection_frames),
+            (
+                ARFrameType.POINT_CLOUD_DETECTION_FRAME,
+                self.point_cloud_detection_frames,
+            ),
+            (ARFrameType.MESH_DETECTION_FRAME, self.mesh_detection_frames),
+            (ARFrameType.IMU_BATCH_FRAME, self.imu_batch_frames),
+            (ARFrameType.AUDIO_CHUNK_FRAME, self.audio_chunk_frames),
+        ]
+
+
+def frames_byte_size(frames: Iterable[Message]) -> int:
+    """Serialized size of `frames`, without the request that carries them.
+
+    The upb protobuf backend computes the size of a message by serializing it, and serializing
+    a request of large frames at once is several times slower than serializing its frames one
+    by one.
+    """
+    return sum(frame.ByteSize() for frame in frames)
+
+
+def classify_frames(frames: Sequence[ARFrame]) -> ClassifiedARFrames:
+    """Bucket AR frames by type, and color and depth frames by their group keys, in one pass."""
+    classified = ClassifiedARFrames()
+    for frame in frames:
+        frame_type = frame.WhichOneof("data")
+        if frame_type == ARFrameType.TRANSFORM_FRAME:
+            classified.transform_frames.append(frame.transform_frame)
+        elif frame_type == ARFrameType.COLOR_FRAME:
+            color_frame = frame.color_frame
+            classified.color_frames.append(color_frame)
+            classified.color_frame_groups[color_frame_group_key(color_frame)].append(
+                color_frame
+            )
+        elif frame_type == ARFrameType.DEPTH_FRAME:
+            depth_frame = frame.depth_frame
+            classified.depth_frames.append(depth_frame)
+            classified.depth_frame_groups[depth_frame_group_key(depth_frame)].append(
+                depth_frame
+            )
+        elif frame_type == ARFrameType.GYROSCOPE_FRAME:
+            classified.gyroscope_frames.append(frame.gyroscope_frame)
+        elif frame_type == ARFrameType.AUDIO_FRAME:
+            classified.audio_frames.append(frame.audio_frame)
+        elif frame_type == ARFrameType.PLANE_DETECTION_FRAME:
+            classified.plane_detection_frames.append(frame.plane_detection_frame)
+        elif frame_type == ARFrameType.POINT_CLOUD_DETECTION_FRAME:
+            classified.point_cloud_detection_frames.append(
+                frame.point_cloud_detection_frame
+            )
+        elif frame_type == ARFrameType.MESH_DETECTION_FRAME:
+            classified.mesh_detection_frames.append(frame.mesh_detection_frame)
+        elif frame_type == ARFrameType.IMU_BATCH_FRAME:
+            classified.imu_batch_frames.append(frame.imu_batch_frame)
+        elif frame_type == ARFrameType.AUDIO_CHUNK_FRAME:
+            classified.audio_chunk_frames.append(frame.audio_chunk_frame)
+    return classified
+
+
+def check_frames(frames: Iterable[ARFrame | SynchronizedARFrame]) -> None:
+    """Check that the packed buffers of `frames` can be read, before any of them is saved.
+
+    A synchronized frame is checked by every frame it carries.
+
+    Raises:
+        ValueError: If a frame has a pose or buffer of the wrong size, no sample rate, or a
+            point cloud with identifiers or confidence values for a different number of points.
+    """
+    for frame in frames:
+        if isinstance(frame, SynchronizedARFrame):
+            check_transform_frame(frame.transform_frame)
+            check_point_cloud(frame.point_cloud_detection_frame.point_cloud)
+            continue
+        frame_type = frame.WhichOneof("data")
+        if frame_type == ARFrameType.TRANSFORM_FRAME:
+            check_transform_frame(frame.transform_frame)
+        elif frame_type == ARFrameType.IMU_BATCH_FRAME:
+            check_imu_batch_frame(frame.imu_batch_frame)
+        elif frame_type == ARFrameType.AUDIO_CHUNK_FRAME:
+            check_audio_chunk_frame(frame.audio_chunk_frame)
+        elif frame_type == ARFrameType.POINT_CLOUD_DETECTION_FRAME:
+            check_point_cloud(frame.point_cloud_detection_frame.point_cloud)
+
+
+def check_transform_frame(frame: TransformFrame) -> None:
+    """Check that `frame` holds the top 3x4 of a pose, as 12 float32 values.
+
+    Raises:
+        ValueError: If the pose is not 48 bytes.
+    """
+    if len(frame.data) != 48:
+        raise ValueError(
+            f"Expected a 48-byte pose of 12 floats, got {len(frame.data)} bytes."
+        )
+
+
+def check_imu_batch_frame(frame: ImuBatchFrame) -> None:
+    """Check that `frame` has a 52-byte reading, 13 floats, for each 8-byte timestamp.
+
+    Raises:
+        ValueError: If the timestamps and readings do not match in number.
+    """
+    num_readings, partial_timestamp = divmod(len(frame.device_timestamps), 8)
+    if partial_timestamp != 0 or len(frame.samples) != num_readings * 52:
+        raise ValueError(
+            "Expected 52 bytes of readings for each 8-byte timestamp, "
+            f"got {len(frame.samples)} bytes for {len(frame.device_timestamps)} bytes of timestamps."
+        )
+
+
+def check_audio_chunk_frame(frame: AudioChunkFrame) -> None:
+    """Check that `frame` has a sample rate and whole 4-byte samples.
+
+    Raises:
+        ValueError: If the sample rate is 0 or the last sample is partial.
+    """
+    if frame.sample_rate == 0 or len(frame.samples) % 4 != 0:
+        raise ValueError(
+            f"Expected a sample rate and whole 4-byte samples, got {frame.sample_rate} Hz "
+            f"and {len(frame.samples)} bytes."
+        )
+
+
+def check_point_cloud(point_cloud: ARPointCloud) -> None:
+    """Check that the fields of `point_cloud` agree on its number of points.
+
+    The packed fields are checked by their sizes, or the repeated fields if there are no
+    packed positions. Identifiers and confidence values may be left out.
+
+    Raises:
+        ValueError: If a packed field is of the wrong size, or the identifiers or confidence
+            values are not one per point.
+    """
+    if len(point_cloud.packed_positions) != 0:
+        num_points, partial_position = divmod(len(point_cloud.packed_positions), 12)
+        if partial_position != 0:
+            raise ValueError(
+                f"Expected whole 12-byte positions, got {len(point_cloud.packed_positions)} bytes."
+            )
+        fields = (
+            ("identifiers", len(point_cloud.packed_identifiers), 8),
+            ("confidence values", len(point_cloud.packed_confidence_values), 4),
+        )
+    else:
+        num_points = len(point_cloud.positions)
+        fields = (
+            ("identifiers", len(point_cloud.identifiers), 1),
+            ("confidence values", len(point_cloud.confidence_values), 1),
+        )
+    for name, size, item_size in fields:
+        if size not in (0, num_points * item_size):
+            raise ValueError(
+                f"Expected {num_points} {name} for {num_points} points, got {size / item_size:g}."
+            )
+
+
+def color_frame_group_key(frame: ColorFrame) -> ColorFrameGroupKey:
+    image = frame.image
+    return (image.format, image.dimensions.x, image.dimensions.y)
+
+
+def depth_frame_group_key(frame: DepthFrame) -> DepthFrameGroupKey:
+    image = frame.image
+    return (
+        image.format,
+        image.dimensions.x,
+        image.dimensions.y,
+        frame.environment_depth_temporal_smoothing_enabled,
+    )
+
 
 def group_color_frames_by_format_and_dims(
     frames: Sequence[ColorFrame],
-) -> DefaultDict[Tuple[XRCpuImage.Format, int, int], list[ColorFrame]]:
+) -> DefaultDict[ColorFrameGroupKey, list[ColorFrame]]:
     """Group color frames by format and dimensions (width x height)."""
     color_frames_grouped_by_format_and_dims: DefaultDict[
-        Tuple[XRCpuImage.Format, int, int], list[ColorFrame]
+        ColorFrameGroupKey, list[ColorFrame]
     ] = defaultdict(list)
     for frame in frames:
-        color_frames_grouped_by_format_and_dims[
-            (
-                frame.image.format,
-                frame.image.dimensions.x,
-                frame.image.dimensions.y,
-            )
-        ].append(frame)
+        color_frames_grouped_by_format_and_dims[color_frame_group_key(frame)].append(
+            frame
+        )
     return color_frames_grouped_by_format_and_dims
 
 
 def group_depth_frames_by_format_dims_and_smoothness(
     frames: Sequence[DepthFrame],
-) -> DefaultDict[Tuple[XRCpuImage.Format, int, int, bool], list[DepthFrame]]:
+) -> DefaultDict[DepthFrameGroupKey, list[DepthFrame]]:
     """Group depth frames by format, dimensions (width x height), and smoothness."""
     depth_frames_grouped_by_format_dims_and_smoothness: DefaultDict[
-        Tuple[XRCpuImage.Format, int, int, bool], list[DepthFrame]
+        DepthFrameGroupKey, list[DepthFrame]
     ] = defaultdict(list)
     for frame in frames:
         depth_frames_grouped_by_format_dims_and_smoothness[
-            (
-                frame.image.format,
-                frame.image.dimensions.x,
-                frame.image.dimensions.y,
-                frame.environment_depth_temporal_smoothing_enabled,
-            )
+            depth_frame_group_key(frame)
         ].append(frame)
     return depth_frames_grouped_by_format_dims_and_smoothness
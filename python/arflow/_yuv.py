@@ -0,0 +1,219 @@
+"""YUV 4:2:0 color frames written straight into batches of the layouts Rerun displays.
+
+Android sends `YUV_420_888` frames as separate Y, U and V planes. iOS sends
+`YpCbCr 420 8-bit bi-planar` frames as a Y plane and an interleaved CbCr plane, which is NV12.
+iOS samples span the full 8-bit range, while Android samples span the limited range. Rerun
+only reads NV12 in the limited range, so iOS frames are written as I420, which Rerun reads in
+either range.
+"""
+
+import logging
+import sys
+import threading
+
+import numpy as np
+import numpy.typing as npt
+
+from arflow._types import YuvLayout
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+logger = logging.getLogger(__name__)
+
+YUV_FORMATS = (
+    XRCpuImage.FORMAT_ANDROID_YUV_420_888,
+    XRCpuImage.FORMAT_IOS_YP_CBCR_420_8BI_PLANAR_FULL_RANGE,
+)
+"""Color frame formats of YUV 4:2:0 images."""
+
+FULL_RANGE_YUV_FORMATS = (XRCpuImage.FORMAT_IOS_YP_CBCR_420_8BI_PLANAR_FULL_RANGE,)
+"""YUV formats whose samples span the full 8-bit range rather than the limited range."""
+
+
+def yuv_size(width: int, height: int) -> int:
+    """Bytes of a `width` x `height` image in a 4:2:0 layout, whether I420 or NV12."""
+    return width * height + 2 * (height // 2) * (width // 2)
+
+
+def yuv_layout(image: XRCpuImage) -> YuvLayout:
+    """How the chroma planes of a YUV image are laid out.
+
+    Android cameras usually hand out U and V planes that are views of one interleaved buffer,
+    one byte apart. Their samples then alternate in both planes, which is NV12 when the U plane
+    starts first and NV21 when the V plane does. Otherwise the planes are treated as separate,
+    I420 once their samples are gathered. Bi-planar iOS images are gathered into I420 too, since
+    Rerun has no full-range NV12.
+    """
+    if image.dimensions.x % 2 or image.dimensions.y % 2:
+        return YuvLayout.I420
+    if image.format in FULL_RANGE_YUV_FORMATS or len(image.planes) != 3:
+        return YuvLayout.I420
+    _, u_plane, v_plane = image.planes
+    if (
+        u_plane.pixel_stride != 2
+        or v_plane.pixel_stride != 2
+        or u_plane.row_stride != v_plane.row_stride
+    ):
+        return YuvLayout.I420
+    u_data = np.frombuffer(u_plane.data, dtype=np.uint8)
+    v_data = np.frombuffer(v_plane.data, dtype=np.uint8)
+    overlap = min(len(u_data), len(v_data)) - 1
+    if overlap < 1:
+        return YuvLayout.I420
+    if np.array_equal(u_data[1 : overlap + 1], v_data[:overlap]):
+        return YuvLayout.NV12
+    if np.array_equal(v_data[1 : overlap + 1], u_data[:overlap]):
+        return YuvLayout.NV21
+    return YuvLayout.I420
+
+
+def write_i420(image: XRCpuImage, out: npt.NDArray[np.uint8]) -> None:
+    """Write the Y, then U, then V samples of a YUV image into `out`, of `yuv_size` bytes.
+
+    The samples are gathered with the strides of each plane, whatever its layout, and keep
+    their range.
+    """
+    width = image.dimensions.x
+    height = image.dimensions.y
+    if not _has_yuv_planes(image, out):
+        return
+    uv_width = width // 2
+    uv_height = height // 2
+    u_start = width * height
+    v_start = u_start + uv_width * uv_height
+    u_out = out[u_start:v_start].reshape((uv_height, uv_width))
+    v_out = out[v_start:].reshape((uv_height, uv_width))
+    _gather(image.planes[0], height, width, out[:u_start].reshape((height, width)))
+    if len(image.planes) == 2:
+        cbcr_plane = image.planes[1]
+        _gather(cbcr_plane, uv_height, uv_width, u_out, pixel_stride=2)
+        _gather(cbcr_plane, uv_height, uv_width, v_out, pixel_stride=2, offset=1)
+    else:
+        _gather(image.planes[1], uv_height, uv_width, u_out)
+        _gather(image.planes[2], uv_height, uv_width, v_out)
+
+
+def write_nv12(image: XRCpuImage, out: npt.NDArray[np.uint8]) -> None:
+    """Write the Y samples, then the interleaved U and V samples of an NV12 image into `out`.
+
+    The chroma rows are copied without de-interleaving them. Only valid for images whose
+    `yuv_layout` is `YuvLayout.NV12`.
+    """
+    width = image.dimensions.x
+    height = image.dimensions.y
+    if not _has_yuv_planes(image, out):
+        return
+    uv_start = width * height
+    uv_rows = out[uv_start:].reshape((height // 2, width))
+    _gather(image.planes[0], height, width, out[:uv_start].reshape((height, width)))
+    _, u_plane, v_plane = image.planes
+    # The U plane holds every interleaved byte but the last V sample, which only the V plane has.
+    _gather(u_plane, height // 2, width, uv_rows, pixel_stride=1)
+    v_data = np.frombuffer(v_plane.data, dtype=np.uint8)
+    last_v = (height // 2 - 1) * v_plane.row_stride + width - 2
+    if last_v < len(v_data):
+        uv_rows[-1, -1] = v_data[last_v]
+
+
+class YuvBufferPool:
+    """Reusable buffers for batches of YUV images, keyed by the dimensions of the images.
+
+    A buffer is handed out again only once nothing references it anymore, that is once the
+    batch logged from it, the decoded frames sharing its rows and every view of them are gone.
+    Consumers can therefore keep a batch as long as they like, at the cost of a new buffer.
+    """
+
+    def __init__(self, buffers_per_size: int = 2) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            buffers_per_size: Buffers kept for each image size. Batches taken while they are all in
+                use get a buffer of their own.
+        """
+        self.buffers_per_size = buffers_per_size
+        """Buffers kept for each image size."""
+        self.allocations = 0
+        """Number of buffers allocated."""
+        self.reuses = 0
+        """Number of times a kept buffer was handed out again."""
+        self._buffers: dict[tuple[int, int], list[npt.NDArray[np.uint8]]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, width: int, height: int, num_images: int) -> npt.NDArray[np.uint8]:
+        """A writable buffer of `num_images` rows of `yuv_size(width, height)` bytes."""
+        with self._lock:
+            buffers = self._buffers.setdefault((width, height), [])
+            for i in range(len(buffers)):
+                buffer = buffers[i]
+                # Unused when referenced only by `buffers`, `buffer` and the argument of
+                # `getrefcount`. Views of a buffer, and views of those, all reference it.
+                if sys.getrefcount(buffer) > 3:
+                    continue
+                if len(buffer) >= num_images:
+                    self.reuses += 1
+                else:
+                    buffer = buffers[i] = self._allocate(width, height, num_images)
+                # A view, so that consumers making it read-only leave the buffer writable.
+                return buffer[:num_images]
+            buffer = self._allocate(width, height, num_images)
+            if len(buffers) < self.buffers_per_size:
+                buffers.append(buffer)
+            return buffer[:num_images]
+
+    def clear(self) -> None:
+        """Forget all buffers."""
+        with self._lock:
+            self._buffers.clear()
+
+    def _allocate(
+        self, width: int, height: int, num_images: int
+    ) -> npt.NDArray[np.uint8]:
+        """Must hold the lock."""
+        self.allocations += 1
+        return np.empty((num_images, yuv_size(width, height)), dtype=np.uint8)
+
+
+def _has_yuv_planes(image: XRCpuImage, out: npt.NDArray[np.uint8]) -> bool:
+    expected = (
+        2
+        if image.format == XRCpuImage.FORMAT_IOS_YP_CBCR_420_8BI_PLANAR_FULL_RANGE
+        else 3
+    )
+    if len(image.planes) == expected:
+        return True
+    logger.warning(
+        f"Skipping bad image. Expected {expected} planes, got {len(image.planes)}."
+    )
+    out[:] = 0
+    return False
+
+
+def _gather(
+    plane: XRCpuImage.Plane,
+    rows: int,
+    columns: int,
+    out: npt.NDArray[np.uint8],
+    pixel_stride: int | None = None,
+    offset: int = 0,
+) -> None:
+    """Copy a `rows` x `columns` grid of samples of `plane`, starting `offset` bytes in, into `out`.
+
+    The last row of a plane usually ends at its last sample rather than at the row stride,
+    and some clients trim it further. Samples missing from the plane are zero.
+    """
+    data = np.frombuffer(plane.data, dtype=np.uint8)[offset:]
+    if pixel_stride is None:
+        pixel_stride = plane.pixel_stride or 1
+    row_stride = plane.row_stride or columns * pixel_stride
+    row_span = (columns - 1) * pixel_stride + 1
+    complete_rows = min(rows, max(0, (len(data) - row_span) // row_stride + 1))
+    if complete_rows > 0:
+        out[:complete_rows] = np.lib.stride_tricks.as_strided(
+            data,
+            shape=(complete_rows, columns),
+            strides=(row_stride, pixel_stride),
+            writeable=False,
+        )
+    for row in range(complete_rows, rows):
+        samples = data[row * row_stride : row * row_stride + row_span : pixel_stride]
+        out[row, : len(samples)] = samples
+        out[row, len(samples) :] = 0
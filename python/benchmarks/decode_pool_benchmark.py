@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark of decoding the JPEG frames of a color batch one by one and on a `DecodePool`.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/decode_pool_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import timeit
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+
+from arflow import DecodedFrameCache, DecodePool
+from arflow._decoded_frames import stack_decoded
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+
+def camera_image(width: int, height: int, seed: int) -> npt.NDArray[np.uint8]:
+    """A smooth BGR test image, so that JPEG compresses it like a camera image."""
+    small = (
+        np.arange((height // 32) * (width // 32) * 3, dtype=np.uint32) * (seed + 7919)
+    ) % 251
+    small = small.astype(np.uint8).reshape((height // 32, width // 32, 3))
+    return np.asarray(
+        cv2.resize(small, (width, height), interpolation=cv2.INTER_CUBIC),
+        dtype=np.uint8,
+    )
+
+
+def jpeg_frames(width: int, height: int, num_frames: int) -> list[ColorFrame]:
+    encoded = [
+        cv2.imencode(".jpg", camera_image(width, height, seed))[1].tobytes()
+        for seed in range(min(num_frames, 8))
+    ]
+    return [
+        ColorFrame(
+            image=XRCpuImage(
+                dimensions=Vector2Int(x=width, y=height),
+                format=XRCpuImage.FORMAT_JPEG_RGB24,
+                planes=[XRCpuImage.Plane(data=encoded[i % len(encoded)])],
+            )
+        )
+        for i in range(num_frames)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark sequential and pooled JPEG batch decoding."
+    )
+    parser.add_argument("--frames", type=int, nargs="+", default=[15, 50, 200])
+    parser.add_argument("--resolutions", nargs="+", default=["640x480", "1920x1080"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pool = DecodePool(args.workers)
+    print(f"decode pool of {pool.max_workers} threads")
+    print(
+        f"{'resolution':>10} {'frames':>7} {'sequential (ms)':>16} {'pool (ms)':>10} {'speedup':>8}"
+    )
+    for resolution in args.resolutions:
+        width, height = (int(n) for n in resolution.split("x"))
+        for num_frames in args.frames:
+            frames = jpeg_frames(width, height, num_frames)
+
+            def sequential() -> None:
+                cache = DecodedFrameCache()
+                stack_decoded([cache.get(frame) for frame in frames], "bgr")
+
+            def pooled() -> None:
+                cache = DecodedFrameCache()
+                pool.stack([cache.get(frame) for frame in frames], "bgr")
+
+            sequential_time = min(
+                timeit.repeat(sequential, number=1, repeat=args.repeat)
+            )
+            pool_time = min(timeit.repeat(pooled, number=1, repeat=args.repeat))
+            print(
+                f"{resolution:>10} {num_frames:>7} {sequential_time * 1e3:>16.1f} {pool_time * 1e3:>10.1f} {sequential_time / pool_time:>7.1f}x"
+            )
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark of storing a long float32 depth capture with each `DepthCodec`.
+
+Also saves the capture the way depth batches were logged before, letting Rerun convert the
+stacked images itself. Reports the server CPU time per frame and the size of each recording.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/depth_codec_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import numpy.typing as npt
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import DepthCodec, SessionStream
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+DEVICE = Device(model="iPhone", name="bench", uid="bench-device")
+
+
+def depth_image(width: int, height: int, index: int) -> npt.NDArray[np.float32]:
+    """A sloped surface with a moving wave and millimeter noise, like LiDAR depth of a room."""
+    y, x = np.mgrid[0:height, 0:width]
+    noise = np.random.default_rng(index).normal(0, 0.004, (height, width))
+    depth = 1.0 + 0.004 * x + 0.003 * y + 0.5 * np.sin((x + index) / 40.0) + noise
+    return depth.astype(np.float32)
+
+
+def depth_frames(width: int, height: int, num_frames: int) -> list[DepthFrame]:
+    return [
+        DepthFrame(
+            device_timestamp=Timestamp(seconds=i // 60, nanos=i % 60 * 16_666_666),
+            image=XRCpuImage(
+                dimensions=Vector2Int(x=width, y=height),
+                format=XRCpuImage.FORMAT_DEPTHFLOAT32,
+                planes=[XRCpuImage.Plane(data=depth_image(width, height, i).tobytes())],
+            ),
+        )
+        for i in range(num_frames)
+    ]
+
+
+def run(
+    path: Path, frames: list[DepthFrame], batch_size: int, depth_codec: DepthCodec
+) -> float:
+    """Save `frames` into a recording at `path` and return the CPU seconds per frame."""
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    stream = SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+        depth_codec=depth_codec,
+    )
+    start = time.process_time()
+    for i in range(0, len(frames), batch_size):
+        batch = frames[i : i + batch_size]
+        stream.save_depth_frames(batch, DEVICE)
+        stream.decoded_frames.release(batch)
+    elapsed = time.process_time() - start
+    rr.disconnect(recording)
+    return elapsed / len(frames)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the recording size and CPU time of each depth codec."
+    )
+    parser.add_argument("--width", type=int, default=256)
+    parser.add_argument("--height", type=int, default=192)
+    parser.add_argument("--frames", type=int, default=1800)
+    parser.add_argument("--batch-size", type=int, default=10)
+    args = parser.parse_args()
+
+    frames = depth_frames(args.width, args.height, args.frames)
+    print(f"{'':>10} {'CPU/frame (ms)':>15} {'recording (MB)':>15}")
+    with tempfile.TemporaryDirectory() as save_dir:
+        runs = [
+            ("previous", DepthCodec.NONE, True),
+            ("none", DepthCodec.NONE, False),
+            ("uint16_mm", DepthCodec.UINT16_MILLIMETERS, False),
+        ]
+        for name, depth_codec, rerun_conversion in runs:
+            path = Path(save_dir) / f"{name}.rrd"
+            if rerun_conversion:
+                with patch(
+                    "arflow._session_stream._image_buffer_batch",
+                    rr.components.ImageBufferBatch,
+                ):
+                    per_frame = run(path, frames, args.batch_size, depth_codec)
+            else:
+                per_frame = run(path, frames, args.batch_size, depth_codec)
+            size = path.stat().st_size / 1e6
+            print(f"{name:>10} {per_frame * 1e3:>15.3f} {size:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark of logging JPEG color frames as they were received against decoding them.
+
+Saves the same JPEG camera images with and without `log_encoded_images` and reports the
+server CPU time per frame and the size of each recording.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/encoded_color_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import SessionStream
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+DEVICE = Device(model="Pixel", name="bench", uid="bench-device")
+
+
+def camera_image(width: int, height: int, seed: int) -> npt.NDArray[np.uint8]:
+    """A smooth BGR test image, so that JPEG compresses it like a camera image."""
+    small = (
+        np.arange((height // 32) * (width // 32) * 3, dtype=np.uint32) * (seed + 7919)
+    ) % 251
+    small = small.astype(np.uint8).reshape((height // 32, width // 32, 3))
+    return np.asarray(
+        cv2.resize(small, (width, height), interpolation=cv2.INTER_CUBIC),
+        dtype=np.uint8,
+    )
+
+
+def jpeg_frame(
+    bgr: npt.NDArray[np.uint8], timestamp: Timestamp, quality: int
+) -> ColorFrame:
+    height, width = bgr.shape[:2]
+    _, encoded = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return ColorFrame(
+        device_timestamp=timestamp,
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=width, y=height),
+            format=XRCpuImage.FORMAT_JPEG_RGB24,
+            planes=[XRCpuImage.Plane(data=encoded.tobytes())],
+        ),
+    )
+
+
+def run(path: Path, batches: list[list[ColorFrame]], log_encoded_images: bool) -> float:
+    """Save `batches` into a recording at `path` and return the CPU seconds per frame."""
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    stream = SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+        log_encoded_images=log_encoded_images,
+    )
+    start = time.process_time()
+    for frames in batches:
+        stream.save_color_frames(frames, DEVICE)
+        stream.decoded_frames.release(frames)
+    elapsed = time.process_time() - start
+    rr.disconnect(recording)
+    return elapsed / sum(len(frames) for frames in batches)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark logging JPEG color frames decoded and as received."
+    )
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1440)
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--frames-per-batch", type=int, default=4)
+    parser.add_argument("--jpeg-quality", type=int, default=90)
+    args = parser.parse_args()
+
+    images = [
+        camera_image(args.width, args.height, seed)
+        for seed in range(args.frames_per_batch)
+    ]
+    batches = [
+        [
+            jpeg_frame(
+                image, Timestamp(seconds=batch, nanos=i * 1000), args.jpeg_quality
+            )
+            for i, image in enumerate(images)
+        ]
+        for batch in range(args.batches)
+    ]
+
+    print(f"{'':>8} {'CPU/frame (ms)':>15} {'recording (MB)':>15}")
+    with tempfile.TemporaryDirectory() as save_dir:
+        for name, log_encoded_images in (("decoded", False), ("encoded", True)):
+            path = Path(save_dir) / f"{name}.rrd"
+            per_frame = run(path, batches, log_encoded_images)
+            size = path.stat().st_size / 1e6
+            print(f"{name:>8} {per_frame * 1e3:>15.2f} {size:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Microbenchmark of how SaveARFrames buckets the frames of a request.
+
+Compares the previous approach, which scanned the request once per frame type and then
+regrouped color and depth frames, with the single-pass `classify_frames`.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/frame_grouping_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import timeit
+from collections.abc import Sequence
+from typing import Any
+
+from arflow._types import ARFrameType
+from arflow._utils import (
+    classify_frames,
+    group_color_frames_by_format_and_dims,
+    group_depth_frames_by_format_dims_and_smoothness,
+)
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+
+def make_request(num_frames: int) -> SaveARFramesRequest:
+    """A request mixing the frame types a phone sends in one batch."""
+    frames: list[ARFrame] = []
+    for i in range(num_frames):
+        kind = i % 4
+        if kind == 0:
+            frames.append(ARFrame(transform_frame=TransformFrame(data=bytes(48))))
+        elif kind == 1:
+            frames.append(
+                ARFrame(
+                    color_frame=ColorFrame(
+                        image=XRCpuImage(
+                            format=XRCpuImage.FORMAT_ANDROID_YUV_420_888,
+                            dimensions=Vector2Int(x=640, y=480),
+                        )
+                    )
+                )
+            )
+        elif kind == 2:
+            frames.append(
+                ARFrame(
+                    depth_frame=DepthFrame(
+                        image=XRCpuImage(
+                            format=XRCpuImage.FORMAT_DEPTHFLOAT32,
+                            dimensions=Vector2Int(x=256, y=192),
+                        ),
+                        environment_depth_temporal_smoothing_enabled=i % 8 == 2,
+                    )
+                )
+            )
+        else:
+            frames.append(ARFrame(gyroscope_frame=GyroscopeFrame()))
+    return SaveARFramesRequest(frames=frames)
+
+
+def multi_pass(frames: Sequence[ARFrame]) -> Any:
+    grouped = {
+        type: [frame for frame in frames if frame.WhichOneof("data") == type]
+        for type in ARFrameType
+    }
+    unwrapped = {
+        type: [getattr(f, type) for f in frames_of_type]
+        for type, frames_of_type in grouped.items()
+    }
+    return (
+        unwrapped,
+        group_color_frames_by_format_and_dims(unwrapped[ARFrameType.COLOR_FRAME]),
+        group_depth_frames_by_format_dims_and_smoothness(
+            unwrapped[ARFrameType.DEPTH_FRAME]
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark SaveARFrames frame grouping."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'frames':>8} {'multi-pass (us)':>16} {'single-pass (us)':>17} {'speedup':>8}"
+    )
+    for size in args.sizes:
+        frames = make_request(size).frames
+        number = max(1, 20_000 // size)
+        before = min(
+            timeit.repeat(lambda: multi_pass(frames), number=number, repeat=args.repeat)
+        )
+        after = min(
+            timeit.repeat(
+                lambda: classify_frames(frames), number=number, repeat=args.repeat
+            )
+        )
+        print(
+            f"{size:>8} {before / number * 1e6:>16.1f} {after / number * 1e6:>17.1f} {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark of saving a call's gyroscope frames into a recording.
+
+Compares the previous logging, which built a list of readings per column and let Rerun
+convert each list, with `save_gyroscope_frames` reading every frame once into one array.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/gyroscope_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import tempfile
+import timeit
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import SessionStream
+from arflow._session_stream import (
+    _device_timestamps_ns,  # pyright: ignore [reportPrivateUsage]
+)
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.quaternion_pb2 import Quaternion
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.vector3_pb2 import Vector3
+
+DEVICE = Device(model="Pixel", name="bench", uid="bench-device")
+
+
+def make_frames(num_frames: int) -> list[GyroscopeFrame]:
+    readings = np.random.default_rng(0).random((num_frames, 13), dtype=np.float32)
+    return [
+        GyroscopeFrame(
+            device_timestamp=Timestamp(seconds=i // 200, nanos=i % 200 * 5_000_000),
+            attitude=Quaternion(x=r[0], y=r[1], z=r[2], w=r[3]),
+            rotation_rate=Vector3(x=r[4], y=r[5], z=r[6]),
+            gravity=Vector3(x=r[7], y=r[8], z=r[9]),
+            acceleration=Vector3(x=r[10], y=r[11], z=r[12]),
+        )
+        for i, r in enumerate(readings)
+    ]
+
+
+def save_per_column(stream: SessionStream, frames: Sequence[GyroscopeFrame]) -> None:
+    times = [rr.TimeNanosColumn(timeline="device", times=_device_timestamps_ns(frames))]
+    recording = stream.stream.to_native()  # pyright: ignore [reportUnknownMemberType, reportUnknownVariableType]
+    rr.send_columns(
+        "gyroscope/attitude",
+        times=times,
+        components=[
+            rr.components.RotationQuatBatch(
+                data=[
+                    [f.attitude.x, f.attitude.y, f.attitude.z, f.attitude.w]
+                    for f in frames
+                ]
+            )
+        ],
+        recording=recording,  # pyright: ignore [reportUnknownArgumentType]
+    )
+    for name in ("rotation_rate", "gravity", "acceleration"):
+        rr.send_columns(
+            f"gyroscope/{name}",
+            times=times,
+            components=[
+                rr.components.Vector3DBatch(
+                    data=[
+                        [
+                            getattr(f, name).x,
+                            getattr(f, name).y,
+                            getattr(f, name).z,
+                        ]
+                        for f in frames
+                    ]
+                )
+            ],
+            recording=recording,  # pyright: ignore [reportUnknownArgumentType]
+        )
+
+
+def new_stream(path: Path) -> SessionStream:
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    return SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-column and single-pass gyroscope logging."
+    )
+    parser.add_argument("--frames", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'frames':>8} {'per-column (ms)':>16} {'single pass (ms)':>17} {'speedup':>8}"
+    )
+    with tempfile.TemporaryDirectory() as save_dir:
+        for num_frames in args.frames:
+            frames = make_frames(num_frames)
+            per_column_stream = new_stream(
+                Path(save_dir) / f"per_column_{num_frames}.rrd"
+            )
+            single_pass_stream = new_stream(
+                Path(save_dir) / f"single_pass_{num_frames}.rrd"
+            )
+            per_column = min(
+                timeit.repeat(
+                    lambda: save_per_column(per_column_stream, frames),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            single_pass = min(
+                timeit.repeat(
+                    lambda: single_pass_stream.save_gyroscope_frames(frames, DEVICE),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            print(
+                f"{num_frames:>8} {per_column * 1e3:>16.2f} {single_pass * 1e3:>17.2f} {per_column / single_pass:>7.1f}x"
+            )
+            rr.disconnect(per_column_stream.stream)
+            rr.disconnect(single_pass_stream.stream)
+
+
+if __name__ == "__main__":
+    main()
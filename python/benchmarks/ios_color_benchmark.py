@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark of saving iPhone camera frames as NV12 against saving them as JPEG.
+
+Before bi-planar YpCbCr frames were supported, iOS clients had to encode their camera
+images to JPEG for the server to decode. Saves the same camera images both ways and
+reports the server CPU time and the bytes sent per frame.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/ios_color_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import SessionStream
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+DEVICE = Device(model="iPhone", name="bench", uid="bench-device")
+ROW_ALIGNMENT = 64
+"""iOS pads the rows of camera planes to a multiple of this many bytes."""
+
+
+def camera_image(width: int, height: int, seed: int) -> npt.NDArray[np.uint8]:
+    """A smooth BGR test image, so that JPEG compresses it like a camera image."""
+    small = (
+        np.arange((height // 32) * (width // 32) * 3, dtype=np.uint32) * (seed + 7919)
+    ) % 251
+    small = small.astype(np.uint8).reshape((height // 32, width // 32, 3))
+    return np.asarray(
+        cv2.resize(small, (width, height), interpolation=cv2.INTER_CUBIC),
+        dtype=np.uint8,
+    )
+
+
+def nv12_frame(bgr: npt.NDArray[np.uint8], timestamp: Timestamp) -> ColorFrame:
+    height, width = bgr.shape[:2]
+    i420 = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV_I420).reshape(-1)
+    y = i420[: width * height].reshape((height, width))
+    u = i420[width * height : width * height * 5 // 4].reshape(
+        (height // 2, width // 2)
+    )
+    v = i420[width * height * 5 // 4 :].reshape((height // 2, width // 2))
+    row_stride = -(-width // ROW_ALIGNMENT) * ROW_ALIGNMENT
+    y_rows = np.zeros((height, row_stride), dtype=np.uint8)
+    y_rows[:, :width] = y
+    cbcr_rows = np.zeros((height // 2, row_stride), dtype=np.uint8)
+    cbcr_rows[:, 0:width:2] = u
+    cbcr_rows[:, 1:width:2] = v
+    return ColorFrame(
+        device_timestamp=timestamp,
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=width, y=height),
+            format=XRCpuImage.FORMAT_IOS_YP_CBCR_420_8BI_PLANAR_FULL_RANGE,
+            planes=[
+                XRCpuImage.Plane(
+                    data=y_rows.tobytes(), row_stride=row_stride, pixel_stride=1
+                ),
+                XRCpuImage.Plane(
+                    data=cbcr_rows.tobytes(), row_stride=row_stride, pixel_stride=2
+                ),
+            ],
+        ),
+    )
+
+
+def jpeg_frame(
+    bgr: npt.NDArray[np.uint8], timestamp: Timestamp, quality: int
+) -> ColorFrame:
+    height, width = bgr.shape[:2]
+    _, encoded = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return ColorFrame(
+        device_timestamp=timestamp,
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=width, y=height),
+            format=XRCpuImage.FORMAT_JPEG_RGB24,
+            planes=[XRCpuImage.Plane(data=encoded.tobytes())],
+        ),
+    )
+
+
+def run(path: Path, batches: list[list[ColorFrame]]) -> float:
+    """Save `batches` into a recording at `path` and return the CPU seconds per frame."""
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    stream = SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+    )
+    start = time.process_time()
+    for frames in batches:
+        stream.save_color_frames(frames, DEVICE)
+        stream.decoded_frames.release(frames)
+    elapsed = time.process_time() - start
+    rr.disconnect(recording)
+    return elapsed / sum(len(frames) for frames in batches)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark saving iOS camera frames as NV12 and as JPEG."
+    )
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1440)
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--frames-per-batch", type=int, default=4)
+    parser.add_argument("--jpeg-quality", type=int, default=90)
+    args = parser.parse_args()
+
+    images = [
+        camera_image(args.width, args.height, seed)
+        for seed in range(args.frames_per_batch)
+    ]
+    nv12_batches: list[list[ColorFrame]] = []
+    jpeg_batches: list[list[ColorFrame]] = []
+    for batch in range(args.batches):
+        timestamps = [
+            Timestamp(seconds=batch, nanos=i * 1000) for i in range(len(images))
+        ]
+        nv12_batches.append([nv12_frame(b, t) for b, t in zip(images, timestamps)])
+        jpeg_batches.append(
+            [jpeg_frame(b, t, args.jpeg_quality) for b, t in zip(images, timestamps)]
+        )
+
+    print(f"{'':>6} {'CPU/frame (ms)':>15} {'bytes/frame':>12}")
+    with tempfile.TemporaryDirectory() as save_dir:
+        for name, batches in (("jpeg", jpeg_batches), ("nv12", nv12_batches)):
+            per_frame = run(Path(save_dir) / f"{name}.rrd", batches)
+            frame_bytes = np.mean(
+                [frame.image.ByteSize() for frame in batches[0]], dtype=np.float64
+            )
+            print(f"{name:>6} {per_frame * 1e3:>15.2f} {frame_bytes:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Benchmark of receiving gyroscope readings and audio samples per message and packed.
+
+Times parsing a serialized `SaveARFramesRequest` and saving its frames into a recording, for
+one `GyroscopeFrame` per reading against `ImuBatchFrame`s, and `AudioFrame`s against
+`AudioChunkFrame`s of the same samples.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/packed_sensor_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import tempfile
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import SessionStream
+from arflow._utils import classify_frames
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import AudioChunkFrame
+from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
+from cakelab.arflow_grpc.v1.quaternion_pb2 import Quaternion
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.vector3_pb2 import Vector3
+
+DEVICE = Device(model="Pixel", name="bench", uid="bench-device")
+SAMPLE_RATE = 48_000
+SAMPLES_PER_FRAME = 1_024
+
+
+def gyroscope_request(
+    readings: npt.NDArray[np.float32], timestamps: npt.NDArray[np.int64]
+) -> bytes:
+    return SaveARFramesRequest(
+        frames=[
+            ARFrame(
+                gyroscope_frame=GyroscopeFrame(
+                    device_timestamp=Timestamp(
+                        seconds=int(t) // 1_000_000_000, nanos=int(t) % 1_000_000_000
+                    ),
+                    attitude=Quaternion(x=r[0], y=r[1], z=r[2], w=r[3]),
+                    rotation_rate=Vector3(x=r[4], y=r[5], z=r[6]),
+                    gravity=Vector3(x=r[7], y=r[8], z=r[9]),
+                    acceleration=Vector3(x=r[10], y=r[11], z=r[12]),
+                )
+            )
+            for r, t in zip(readings, timestamps)
+        ]
+    ).SerializeToString()
+
+
+def imu_batch_request(
+    readings: npt.NDArray[np.float32], timestamps: npt.NDArray[np.int64]
+) -> bytes:
+    return SaveARFramesRequest(
+        frames=[
+            ARFrame(
+                imu_batch_frame=ImuBatchFrame(
+                    device_timestamps=timestamps.astype("<i8").tobytes(),
+                    samples=readings.astype("<f4").tobytes(),
+                )
+            )
+        ]
+    ).SerializeToString()
+
+
+def audio_request(samples: npt.NDArray[np.float32]) -> bytes:
+    return SaveARFramesRequest(
+        frames=[
+            ARFrame(
+                audio_frame=AudioFrame(
+                    device_timestamp=Timestamp(nanos=i * 1_000), data=chunk.tolist()
+                )
+            )
+            for i, chunk in enumerate(samples)
+        ]
+    ).SerializeToString()
+
+
+def audio_chunk_request(samples: npt.NDArray[np.float32]) -> bytes:
+    return SaveARFramesRequest(
+        frames=[
+            ARFrame(
+                audio_chunk_frame=AudioChunkFrame(
+                    device_timestamp=Timestamp(nanos=i * 1_000),
+                    sample_rate=SAMPLE_RATE,
+                    samples=chunk.astype("<f4").tobytes(),
+                )
+            )
+            for i, chunk in enumerate(samples)
+        ]
+    ).SerializeToString()
+
+
+def receive(stream: SessionStream, serialized: bytes) -> None:
+    request = SaveARFramesRequest()
+    request.ParseFromString(serialized)
+    classified = classify_frames(request.frames)
+    stream.save_gyroscope_frames(classified.gyroscope_frames, DEVICE)
+    stream.save_imu_batch_frames(classified.imu_batch_frames, DEVICE)
+    if len(classified.audio_frames) != 0:
+        stream.save_audio_frames(classified.audio_frames, DEVICE)
+    if len(classified.audio_chunk_frames) != 0:
+        stream.save_audio_chunk_frames(classified.audio_chunk_frames, DEVICE)
+
+
+def new_stream(path: Path) -> SessionStream:
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    return SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+    )
+
+
+def best_of(
+    save_dir: str, name: str, run: Callable[[SessionStream], None], repeat: int
+) -> float:
+    stream = new_stream(Path(save_dir) / f"{name}.rrd")
+    elapsed = min(timeit.repeat(lambda: run(stream), number=1, repeat=repeat))
+    rr.disconnect(stream.stream)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-message and packed gyroscope and audio ingest."
+    )
+    parser.add_argument("--readings", type=int, default=10_000)
+    parser.add_argument("--audio-frames", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    readings = rng.random((args.readings, 13), dtype=np.float32)
+    timestamps = np.arange(args.readings, dtype=np.int64) * 5_000_000
+    samples = rng.random((args.audio_frames, SAMPLES_PER_FRAME), dtype=np.float32)
+    requests = {
+        "gyroscope": gyroscope_request(readings, timestamps),
+        "imu_batch": imu_batch_request(readings, timestamps),
+        "audio": audio_request(samples),
+        "audio_chunk": audio_chunk_request(samples),
+    }
+
+    print(f"{'':>12} {'request (KB)':>13} {'parse + save (ms)':>18}")
+    with tempfile.TemporaryDirectory() as save_dir:
+        for name, serialized in requests.items():
+            elapsed = best_of(
+                save_dir,
+                name,
+                lambda stream, serialized=serialized: receive(stream, serialized),
+                args.repeat,
+            )
+            print(f"{name:>12} {len(serialized) / 1e3:>13.1f} {elapsed * 1e3:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
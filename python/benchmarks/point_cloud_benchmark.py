@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Benchmark of saving point cloud detection frames into a recording.
+
+Compares the previous logging, which sent one entity path and one position per point, with
+`save_point_cloud_detection_frames` from repeated and from packed point clouds. Every point of
+every cloud is new, so all chunks of each cloud are logged. See `point_cloud_scan_benchmark.py`
+for clouds that change little between updates. Reports the server CPU time per cloud and the
+size of each recording.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/point_cloud_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import numpy as np
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import SessionStream
+from arflow._session_stream import (
+    _device_timestamps_ns,  # pyright: ignore [reportPrivateUsage]
+)
+from cakelab.arflow_grpc.v1.ar_point_cloud_pb2 import ARPointCloud
+from cakelab.arflow_grpc.v1.ar_trackable_pb2 import ARTrackable
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.point_cloud_detection_frame_pb2 import (
+    PointCloudDetectionFrame,
+)
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.vector3_pb2 import Vector3
+
+DEVICE = Device(model="iPhone", name="bench", uid="bench-device")
+TRACKABLE = ARTrackable(
+    trackable_id=ARTrackable.TrackableId(sub_id_1=1, sub_id_2=2),
+    tracking_state=ARTrackable.TRACKING_STATE_TRACKING,
+)
+
+
+def point_cloud_frames(
+    num_frames: int, num_points: int, packed: bool
+) -> list[PointCloudDetectionFrame]:
+    rng = np.random.default_rng(0)
+    frames: list[PointCloudDetectionFrame] = []
+    for i in range(num_frames):
+        positions = rng.random((num_points, 3), dtype=np.float32)
+        identifiers = np.arange(i, i + num_points, dtype=np.uint64)
+        confidence = rng.random(num_points, dtype=np.float32)
+        if packed:
+            point_cloud = ARPointCloud(
+                trackable=TRACKABLE,
+                packed_positions=positions.astype("<f4").tobytes(),
+                packed_identifiers=identifiers.astype("<u8").tobytes(),
+                packed_confidence_values=confidence.astype("<f4").tobytes(),
+            )
+        else:
+            point_cloud = ARPointCloud(
+                trackable=TRACKABLE,
+                positions=[Vector3(x=p[0], y=p[1], z=p[2]) for p in positions],
+                identifiers=identifiers.tolist(),
+                confidence_values=confidence.tolist(),
+            )
+        frames.append(
+            PointCloudDetectionFrame(
+                state=PointCloudDetectionFrame.STATE_UPDATED,
+                device_timestamp=Timestamp(seconds=i),
+                point_cloud=point_cloud,
+            )
+        )
+    return frames
+
+
+def save_per_point(
+    stream: SessionStream, frames: Sequence[PointCloudDetectionFrame]
+) -> None:
+    entity_path = stream._entity_path(  # pyright: ignore [reportPrivateUsage]
+        DEVICE, "point_cloud_detection_frame"
+    )
+    rr.send_columns(
+        entity_path,
+        times=[
+            rr.TimeNanosColumn(
+                timeline="device_timestamp",
+                times=np.repeat(
+                    _device_timestamps_ns(frames),
+                    [len(f.point_cloud.identifiers) for f in frames],
+                ),
+            ),
+        ],
+        components=[
+            rr.components.EntityPathBatch(
+                data=[
+                    rr.new_entity_path(
+                        [
+                            f"{f.point_cloud.trackable.trackable_id.sub_id_1}_{f.point_cloud.trackable.trackable_id.sub_id_2}",
+                            i,
+                        ]
+                    )
+                    for f in frames
+                    for i in f.point_cloud.identifiers
+                ]
+            ),
+            rr.components.Position3DBatch(
+                data=[[p.x, p.y, p.z] for f in frames for p in f.point_cloud.positions]
+            ),
+        ],
+        recording=stream.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+    )
+
+
+def save_point_clouds(
+    stream: SessionStream, frames: Sequence[PointCloudDetectionFrame]
+) -> None:
+    stream.save_point_cloud_detection_frames(frames, DEVICE)
+
+
+def run(
+    path: Path,
+    frames: list[PointCloudDetectionFrame],
+    save: Callable[[SessionStream, Sequence[PointCloudDetectionFrame]], None],
+) -> float:
+    """Save `frames` one by one into a recording at `path` and return the CPU seconds per frame."""
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    stream = SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+    )
+    start = time.process_time()
+    for frame in frames:
+        save(stream, [frame])
+    elapsed = time.process_time() - start
+    rr.disconnect(recording)
+    return elapsed / len(frames)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the CPU time and recording size of point cloud logging."
+    )
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--points", type=int, default=5_000)
+    args = parser.parse_args()
+
+    repeated = point_cloud_frames(args.frames, args.points, packed=False)
+    packed = point_cloud_frames(args.frames, args.points, packed=True)
+    runs = [
+        ("previous", repeated, save_per_point),
+        ("repeated", repeated, save_point_clouds),
+        ("packed", packed, save_point_clouds),
+    ]
+    print(f"{'':>10} {'CPU/cloud (ms)':>15} {'recording (MB)':>15}")
+    with tempfile.TemporaryDirectory() as save_dir:
+        for name, frames, save in runs:
+            path = Path(save_dir) / f"{name}.rrd"
+            per_frame = run(path, frames, save)
+            size = path.stat().st_size / 1e6
+            print(f"{name:>10} {per_frame * 1e3:>15.3f} {size:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
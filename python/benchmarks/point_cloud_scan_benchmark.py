@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Benchmark of recording a long point cloud scan, with every update resending the whole cloud.
+
+Each update adds newly detected points and drops as many of the oldest ones, like ARFoundation
+feature points while scanning a room. Points are refined by a couple of centimeters, often in
+their first second and rarely after, and all of them jitter by a millimeter. Compares logging
+every update whole, as the previous logging did, with `save_point_cloud_detection_frames`
+logging only the chunks that changed. Reports the server CPU time per update, the size of
+each recording, and the points the store remembers at the end.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/point_cloud_scan_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+import argparse
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import numpy as np
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+from rerun.any_value import AnyBatchValue
+
+from arflow import PointCloudStore, SessionStream
+from arflow._point_store import DEFAULT_POINT_CHUNK_SIZE
+from arflow._session_stream import (
+    _device_timestamps_ns,  # pyright: ignore [reportPrivateUsage]
+    _point_cloud_arrays,  # pyright: ignore [reportPrivateUsage]
+    _position3d_batch,  # pyright: ignore [reportPrivateUsage]
+)
+from cakelab.arflow_grpc.v1.ar_point_cloud_pb2 import ARPointCloud
+from cakelab.arflow_grpc.v1.ar_trackable_pb2 import ARTrackable
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.point_cloud_detection_frame_pb2 import (
+    PointCloudDetectionFrame,
+)
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+
+DEVICE = Device(model="iPhone", name="bench", uid="bench-device")
+TRACKABLE = ARTrackable(
+    trackable_id=ARTrackable.TrackableId(sub_id_1=1, sub_id_2=2),
+    tracking_state=ARTrackable.TRACKING_STATE_TRACKING,
+)
+
+
+def scan_frames(
+    num_updates: int,
+    num_points: int,
+    added: int,
+    young_refined: float,
+    refined: float,
+) -> list[PointCloudDetectionFrame]:
+    rng = np.random.default_rng(0)
+    identifiers = np.arange(num_points, dtype=np.uint64)
+    positions = rng.random((num_points, 3)) * 5
+    ages = np.full(num_points, 30)
+    frames: list[PointCloudDetectionFrame] = []
+    for i in range(num_updates):
+        if i > 0:
+            next_identifier = int(identifiers[-1]) + 1
+            identifiers = np.concatenate(
+                [
+                    identifiers[added:],
+                    np.arange(
+                        next_identifier, next_identifier + added, dtype=np.uint64
+                    ),
+                ]
+            )
+            positions = np.concatenate([positions[added:], rng.random((added, 3)) * 5])
+            ages = np.concatenate([ages[added:] + 1, np.zeros(added, dtype=np.int64)])
+            moved = rng.random(num_points) < np.where(ages < 30, young_refined, refined)
+            positions[moved] += rng.normal(0, 0.02, (int(moved.sum()), 3))
+        jittered = positions + rng.normal(0, 0.001, positions.shape)
+        frames.append(
+            PointCloudDetectionFrame(
+                state=PointCloudDetectionFrame.STATE_ADDED
+                if i == 0
+                else PointCloudDetectionFrame.STATE_UPDATED,
+                device_timestamp=Timestamp(seconds=i // 30, nanos=i % 30 * 33_333_333),
+                point_cloud=ARPointCloud(
+                    trackable=TRACKABLE,
+                    packed_positions=jittered.astype("<f4").tobytes(),
+                    packed_identifiers=identifiers.astype("<u8").tobytes(),
+                    packed_confidence_values=rng.random(
+                        num_points, dtype=np.float32
+                    ).tobytes(),
+                ),
+            )
+        )
+    return frames
+
+
+def save_whole(
+    stream: SessionStream, frames: Sequence[PointCloudDetectionFrame]
+) -> None:
+    entity_path = stream._entity_path(  # pyright: ignore [reportPrivateUsage]
+        DEVICE, "point_cloud_detection_frame"
+    )
+    clouds = [_point_cloud_arrays(f.point_cloud) for f in frames]
+    rr.send_columns(
+        f"{entity_path}/1_2",
+        times=[
+            rr.TimeNanosColumn(
+                timeline="device_timestamp", times=_device_timestamps_ns(frames)
+            )
+        ],
+        components=[
+            _position3d_batch(
+                np.concatenate([positions for positions, _, _ in clouds])
+            ).partition(np.array([len(positions) for positions, _, _ in clouds])),
+            rr.ComponentColumn(
+                AnyBatchValue(
+                    "identifier",
+                    np.concatenate([identifiers for _, identifiers, _ in clouds]),
+                ),
+                np.array([len(identifiers) for _, identifiers, _ in clouds]),
+            ),
+            rr.ComponentColumn(
+                AnyBatchValue(
+                    "confidence",
+                    np.concatenate([confidence for _, _, confidence in clouds]),
+                ),
+                np.array([len(confidence) for _, _, confidence in clouds]),
+            ),
+        ],
+        recording=stream.stream.to_native(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+    )
+
+
+def save_changes(
+    stream: SessionStream, frames: Sequence[PointCloudDetectionFrame]
+) -> None:
+    stream.save_point_cloud_detection_frames(frames, DEVICE)
+
+
+def run(
+    path: Path,
+    frames: list[PointCloudDetectionFrame],
+    save: Callable[[SessionStream, Sequence[PointCloudDetectionFrame]], None],
+    chunk_size: int,
+) -> tuple[float, SessionStream]:
+    """Save `frames` one by one into a recording at `path` and return the CPU seconds per frame."""
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    stream = SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+        point_clouds=PointCloudStore(chunk_size=chunk_size),
+    )
+    start = time.process_time()
+    for frame in frames:
+        save(stream, [frame])
+    elapsed = time.process_time() - start
+    rr.disconnect(recording)
+    return elapsed / len(frames), stream
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the CPU time and recording size of logging a point cloud scan."
+    )
+    parser.add_argument("--updates", type=int, default=600)
+    parser.add_argument("--points", type=int, default=5_000)
+    parser.add_argument("--added", type=int, default=20)
+    parser.add_argument("--young-refined", type=float, default=0.05)
+    parser.add_argument("--refined", type=float, default=0.0005)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_POINT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    frames = scan_frames(
+        args.updates, args.points, args.added, args.young_refined, args.refined
+    )
+    print(
+        f"{'':>8} {'CPU/update (ms)':>16} {'recording (MB)':>15} {'remembered points':>18}"
+    )
+    with tempfile.TemporaryDirectory() as save_dir:
+        for name, save in (("whole", save_whole), ("changes", save_changes)):
+            path = Path(save_dir) / f"{name}.rrd"
+            per_frame, stream = run(path, frames, save, args.chunk_size)
+            size = path.stat().st_size / 1e6
+            print(
+                f"{name:>8} {per_frame * 1e3:>16.3f} {size:>15.2f} {stream.point_clouds.num_points:>18}"
+            )
+
+
+if __name__ == "__main__":
+    main()
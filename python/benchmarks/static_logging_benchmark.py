@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark of caching entity paths and static components per device.
+
+Saves the same batches into two recordings: one where `SessionStream` forgets its cached
+entity paths and logged static components before every batch, as it used to, and one where
+it keeps them. Reports the CPU time per batch and the size of each .rrd file.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/static_logging_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+# pyright: reportPrivateUsage=false
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import SessionStream
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+DEVICE = Device(model="Pixel", name="bench", uid="bench-device")
+
+
+def make_batch(
+    index: int, frames_per_batch: int
+) -> tuple[
+    list[TransformFrame], list[ColorFrame], list[DepthFrame], list[GyroscopeFrame]
+]:
+    timestamps = [
+        Timestamp(seconds=index, nanos=i * 1000) for i in range(frames_per_batch)
+    ]
+    transforms = [
+        TransformFrame(device_timestamp=t, data=bytes(48)) for t in timestamps
+    ]
+    colors = [
+        ColorFrame(
+            device_timestamp=t,
+            image=XRCpuImage(
+                dimensions=Vector2Int(x=64, y=48),
+                format=XRCpuImage.FORMAT_RGB24,
+                planes=[XRCpuImage.Plane(data=bytes(64 * 48 * 3))],
+            ),
+        )
+        for t in timestamps
+    ]
+    depths = [
+        DepthFrame(
+            device_timestamp=t,
+            image=XRCpuImage(
+                dimensions=Vector2Int(x=32, y=24),
+                format=XRCpuImage.FORMAT_DEPTHFLOAT32,
+                planes=[
+                    XRCpuImage.Plane(data=np.ones(32 * 24, dtype=np.float32).tobytes())
+                ],
+            ),
+        )
+        for t in timestamps
+    ]
+    gyroscopes = [GyroscopeFrame(device_timestamp=t) for t in timestamps]
+    return transforms, colors, depths, gyroscopes
+
+
+def run(path: Path, num_batches: int, frames_per_batch: int, cached: bool) -> float:
+    """Save `num_batches` batches into a recording at `path` and return the CPU seconds per batch."""
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    stream = SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+    )
+    batches = [make_batch(i, frames_per_batch) for i in range(num_batches)]
+    start = time.process_time()
+    for transforms, colors, depths, gyroscopes in batches:
+        if not cached:
+            stream._device_entities.clear()
+            stream._static_keys.clear()
+        stream.save_transform_frames(transforms, DEVICE)
+        stream.save_color_frames(colors, DEVICE)
+        stream.save_depth_frames(depths, DEVICE)
+        stream.save_gyroscope_frames(gyroscopes, DEVICE)
+        stream.decoded_frames.release(colors)
+        stream.decoded_frames.release(depths)
+    elapsed = time.process_time() - start
+    rr.disconnect(recording)
+    return elapsed / num_batches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-device entity path and static component caching."
+    )
+    parser.add_argument("--batches", type=int, default=500)
+    parser.add_argument("--frames-per-batch", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        results: dict[bool, tuple[float, int]] = {}
+        for cached in (False, True):
+            path = Path(save_dir) / f"{'cached' if cached else 'uncached'}.rrd"
+            per_batch = run(path, args.batches, args.frames_per_batch, cached)
+            results[cached] = (per_batch, path.stat().st_size)
+
+    print(f"{'':>10} {'CPU/batch (us)':>15} {'rrd size (KiB)':>15}")
+    for cached, (per_batch, size) in results.items():
+        print(
+            f"{'cached' if cached else 'uncached':>10} {per_batch * 1e6:>15.1f} {size / 1024:>15.1f}"
+        )
+    (before, before_size), (after, after_size) = results[False], results[True]
+    print(
+        f"CPU per batch -{(1 - after / before) * 100:.0f}%, rrd size -{(1 - after_size / before_size) * 100:.0f}%"
+    )
+
+
+if __name__ == "__main__":
+    main()
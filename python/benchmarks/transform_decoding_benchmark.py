@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark of saving a call's transform frames into a recording.
+
+Compares the previous per-frame decoding, which built a pose per frame and let Rerun
+convert the rotations one matrix at a time, with the batched `save_transform_frames`.
+
+Usage (from the `python` directory): PYTHONPATH=. python benchmarks/transform_decoding_benchmark.py
+"""
+
+# ruff:noqa: D103, T201
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false
+import argparse
+import tempfile
+import timeit
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import SessionStream
+from arflow._session_stream import y_down_to_y_up
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+
+DEVICE = Device(model="Pixel", name="bench", uid="bench-device")
+
+
+def make_frames(num_frames: int) -> list[TransformFrame]:
+    data = np.random.default_rng(0).random((num_frames, 12), dtype=np.float32)
+    return [
+        TransformFrame(
+            device_timestamp=Timestamp(seconds=i // 60, nanos=i % 60 * 16_666_666),
+            data=data[i].tobytes(),
+        )
+        for i in range(num_frames)
+    ]
+
+
+def save_per_frame(
+    stream: SessionStream, entity_path: str, frames: Sequence[TransformFrame]
+) -> None:
+    t = np.array([np.frombuffer(frame.data, dtype=np.float32) for frame in frames])
+    transforms = np.array([np.eye(4, dtype=np.float32) for _ in range(len(frames))])
+    transforms[:, :3, :] = t.reshape((len(frames), 3, 4))
+    transforms = y_down_to_y_up @ transforms
+    rr.send_columns(
+        entity_path,
+        times=[
+            rr.TimeSecondsColumn(
+                timeline="device",
+                times=[
+                    f.device_timestamp.seconds + f.device_timestamp.nanos / 1e9
+                    for f in frames
+                ],
+            )
+        ],
+        components=[
+            rr.components.TransformMat3x3Batch(
+                data=[transform[:3, :3] for transform in transforms]
+            ),
+            rr.components.Translation3DBatch(
+                data=[transform[:3, 3] for transform in transforms]
+            ),
+        ],
+        recording=stream.stream.to_native(),
+    )
+
+
+def new_stream(path: Path) -> SessionStream:
+    recording = rr.new_recording(application_id="arflow-bench", recording_id=path.stem)
+    rr.save(path, recording=recording)
+    return SessionStream(
+        info=Session(id=SessionUuid(value=path.stem), devices=[DEVICE]),
+        stream=recording,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-frame and batched transform frame decoding."
+    )
+    parser.add_argument(
+        "--frames", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'frames':>8} {'per-frame (ms)':>15} {'batched (ms)':>13} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as save_dir:
+        for num_frames in args.frames:
+            frames = make_frames(num_frames)
+            per_frame_stream = new_stream(
+                Path(save_dir) / f"per_frame_{num_frames}.rrd"
+            )
+            batched_stream = new_stream(Path(save_dir) / f"batched_{num_frames}.rrd")
+            per_frame = min(
+                timeit.repeat(
+                    lambda: save_per_frame(per_frame_stream, "transform", frames),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            batched = min(
+                timeit.repeat(
+                    lambda: batched_stream.save_transform_frames(frames, DEVICE),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            print(
+                f"{num_frames:>8} {per_frame * 1e3:>15.2f} {batched * 1e3:>13.2f} {per_frame / batched:>7.1f}x"
+            )
+            rr.disconnect(per_frame_stream.stream)
+            rr.disconnect(batched_stream.stream)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,17 +22,19 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from cakelab.arflow_grpc.v1 import audio_chunk_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_audio__chunk__frame__pb2
 from cakelab.arflow_grpc.v1 import audio_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_audio__frame__pb2
 from cakelab.arflow_grpc.v1 import color_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_color__frame__pb2
 from cakelab.arflow_grpc.v1 import depth_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_depth__frame__pb2
 from cakelab.arflow_grpc.v1 import gyroscope_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_gyroscope__frame__pb2
+from cakelab.arflow_grpc.v1 import imu_batch_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_imu__batch__frame__pb2
 from cakelab.arflow_grpc.v1 import mesh_detection_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_mesh__detection__frame__pb2
 from cakelab.arflow_grpc.v1 import plane_detection_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_plane__detection__frame__pb2
 from cakelab.arflow_grpc.v1 import point_cloud_detection_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_point__cloud__detection__frame__pb2
 from cakelab.arflow_grpc.v1 import transform_frame_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_transform__frame__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%cakelab/arflow_grpc/v1/ar_frame.proto\x12\x16\x63\x61kelab.arflow_grpc.v1\x1a(cakelab/arflow_grpc/v1/audio_frame.proto\x1a(cakelab/arflow_grpc/v1/color_frame.proto\x1a(cakelab/arflow_grpc/v1/depth_frame.proto\x1a,cakelab/arflow_grpc/v1/gyroscope_frame.proto\x1a\x31\x63\x61kelab/arflow_grpc/v1/mesh_detection_frame.proto\x1a\x32\x63\x61kelab/arflow_grpc/v1/plane_detection_frame.proto\x1a\x38\x63\x61kelab/arflow_grpc/v1/point_cloud_detection_frame.proto\x1a,cakelab/arflow_grpc/v1/transform_frame.proto\"\xc2\x05\n\x07\x41RFrame\x12Q\n\x0ftransform_frame\x18\x01 \x01(\x0b\x32&.cakelab.arflow_grpc.v1.TransformFrameH\x00R\x0etransformFrame\x12\x45\n\x0b\x63olor_frame\x18\x02 \x01(\x0b\x32\".cakelab.arflow_grpc.v1.ColorFrameH\x00R\ncolorFrame\x12\x45\n\x0b\x64\x65pth_frame\x18\x03 \x01(\x0b\x32\".cakelab.arflow_grpc.v1.DepthFrameH\x00R\ndepthFrame\x12Q\n\x0fgyroscope_frame\x18\x04 \x01(\x0b\x32&.cakelab.arflow_grpc.v1.GyroscopeFrameH\x00R\x0egyroscopeFrame\x12\x45\n\x0b\x61udio_frame\x18\x05 \x01(\x0b\x32\".cakelab.arflow_grpc.v1.AudioFrameH\x00R\naudioFrame\x12\x61\n\x15plane_detection_frame\x18\x06 \x01(\x0b\x32+.cakelab.arflow_grpc.v1.PlaneDetectionFrameH\x00R\x13planeDetectionFrame\x12q\n\x1bpoint_cloud_detection_frame\x18\x07 \x01(\x0b\x32\x30.cakelab.arflow_grpc.v1.PointCloudDetectionFrameH\x00R\x18pointCloudDetectionFrame\x12^\n\x14mesh_detection_frame\x18\x08 \x01(\x0b\x32*.cakelab.arflow_grpc.v1.MeshDetectionFrameH\x00R\x12meshDetectionFrameB\x06\n\x04\x64\x61taB\xa1\x01\n\x1a\x63om.cakelab.arflow_grpc.v1B\x0c\x41rFrameProtoP\x01\xa2\x02\x03\x43\x41X\xaa\x02\x16\x43\x61keLab.ARFlow.Grpc.V1\xca\x02\x15\x43\x61kelab\\ArflowGrpc\\V1\xe2\x02!Cakelab\\ArflowGrpc\\V1\\GPBMetadata\xea\x02\x17\x43\x61kelab::ArflowGrpc::V1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%cakelab/arflow_grpc/v1/ar_frame.proto\x12\x16\x63\x61kelab.arflow_grpc.v1\x1a.cakelab/arflow_grpc/v1/audio_chunk_frame.proto\x1a(cakelab/arflow_grpc/v1/audio_frame.proto\x1a(cakelab/arflow_grpc/v1/color_frame.proto\x1a(cakelab/arflow_grpc/v1/depth_frame.proto\x1a,cakelab/arflow_grpc/v1/gyroscope_frame.proto\x1a,cakelab/arflow_grpc/v1/imu_batch_frame.proto\x1a\x31\x63\x61kelab/arflow_grpc/v1/mesh_detection_frame.proto\x1a\x32\x63\x61kelab/arflow_grpc/v1/plane_detection_frame.proto\x1a\x38\x63\x61kelab/arflow_grpc/v1/point_cloud_detection_frame.proto\x1a,cakelab/arflow_grpc/v1/transform_frame.proto\"\xea\x06\n\x07\x41RFrame\x12Q\n\x0ftransform_frame\x18\x01 \x01(\x0b\x32&.cakelab.arflow_grpc.v1.TransformFrameH\x00R\x0etransformFrame\x12\x45\n\x0b\x63olor_frame\x18\x02 \x01(\x0b\x32\".cakelab.arflow_grpc.v1.ColorFrameH\x00R\ncolorFrame\x12\x45\n\x0b\x64\x65pth_frame\x18\x03 \x01(\x0b\x32\".cakelab.arflow_grpc.v1.DepthFrameH\x00R\ndepthFrame\x12Q\n\x0fgyroscope_frame\x18\x04 \x01(\x0b\x32&.cakelab.arflow_grpc.v1.GyroscopeFrameH\x00R\x0egyroscopeFrame\x12\x45\n\x0b\x61udio_frame\x18\x05 \x01(\x0b\x32\".cakelab.arflow_grpc.v1.AudioFrameH\x00R\naudioFrame\x12\x61\n\x15plane_detection_frame\x18\x06 \x01(\x0b\x32+.cakelab.arflow_grpc.v1.PlaneDetectionFrameH\x00R\x13planeDetectionFrame\x12q\n\x1bpoint_cloud_detection_frame\x18\x07 \x01(\x0b\x32\x30.cakelab.arflow_grpc.v1.PointCloudDetectionFrameH\x00R\x18pointCloudDetectionFrame\x12^\n\x14mesh_detection_frame\x18\x08 \x01(\x0b\x32*.cakelab.arflow_grpc.v1.MeshDetectionFrameH\x00R\x12meshDetectionFrame\x12O\n\x0fimu_batch_frame\x18\t \x01(\x0b\x32%.cakelab.arflow_grpc.v1.ImuBatchFrameH\x00R\rimuBatchFrame\x12U\n\x11\x61udio_chunk_frame\x18\n \x01(\x0b\x32\'.cakelab.arflow_grpc.v1.AudioChunkFrameH\x00R\x0f\x61udioChunkFrameB\x06\n\x04\x64\x61taB\xa1\x01\n\x1a\x63om.cakelab.arflow_grpc.v1B\x0c\x41rFrameProtoP\x01\xa2\x02\x03\x43\x41X\xaa\x02\x16\x43\x61keLab.ARFlow.Grpc.V1\xca\x02\x15\x43\x61kelab\\ArflowGrpc\\V1\xe2\x02!Cakelab\\ArflowGrpc\\V1\\GPBMetadata\xea\x02\x17\x43\x61kelab::ArflowGrpc::V1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -40,6 +42,6 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'cakelab.arflow_grpc.v1.ar_f
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\n\032com.cakelab.arflow_grpc.v1B\014ArFrameProtoP\001\242\002\003CAX\252\002\026CakeLab.ARFlow.Grpc.V1\312\002\025Cakelab\\ArflowGrpc\\V1\342\002!Cakelab\\ArflowGrpc\\V1\\GPBMetadata\352\002\027Cakelab::ArflowGrpc::V1'
-  _globals['_ARFRAME']._serialized_start=445
-  _globals['_ARFRAME']._serialized_end=1151
+  _globals['_ARFRAME']._serialized_start=539
+  _globals['_ARFRAME']._serialized_end=1413
 # @@protoc_insertion_point(module_scope)
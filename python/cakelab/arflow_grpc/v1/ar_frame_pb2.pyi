@@ -1,7 +1,9 @@
+from cakelab.arflow_grpc.v1 import audio_chunk_frame_pb2 as _audio_chunk_frame_pb2
 from cakelab.arflow_grpc.v1 import audio_frame_pb2 as _audio_frame_pb2
 from cakelab.arflow_grpc.v1 import color_frame_pb2 as _color_frame_pb2
 from cakelab.arflow_grpc.v1 import depth_frame_pb2 as _depth_frame_pb2
 from cakelab.arflow_grpc.v1 import gyroscope_frame_pb2 as _gyroscope_frame_pb2
+from cakelab.arflow_grpc.v1 import imu_batch_frame_pb2 as _imu_batch_frame_pb2
 from cakelab.arflow_grpc.v1 import mesh_detection_frame_pb2 as _mesh_detection_frame_pb2
 from cakelab.arflow_grpc.v1 import plane_detection_frame_pb2 as _plane_detection_frame_pb2
 from cakelab.arflow_grpc.v1 import point_cloud_detection_frame_pb2 as _point_cloud_detection_frame_pb2
@@ -13,7 +15,7 @@ from typing import ClassVar as _ClassVar, Mapping as _Mapping, Optional as _Opti
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class ARFrame(_message.Message):
-    __slots__ = ("transform_frame", "color_frame", "depth_frame", "gyroscope_frame", "audio_frame", "plane_detection_frame", "point_cloud_detection_frame", "mesh_detection_frame")
+    __slots__ = ("transform_frame", "color_frame", "depth_frame", "gyroscope_frame", "audio_frame", "plane_detection_frame", "point_cloud_detection_frame", "mesh_detection_frame", "imu_batch_frame", "audio_chunk_frame")
     TRANSFORM_FRAME_FIELD_NUMBER: _ClassVar[int]
     COLOR_FRAME_FIELD_NUMBER: _ClassVar[int]
     DEPTH_FRAME_FIELD_NUMBER: _ClassVar[int]
@@ -22,6 +24,8 @@ class ARFrame(_message.Message):
     PLANE_DETECTION_FRAME_FIELD_NUMBER: _ClassVar[int]
     POINT_CLOUD_DETECTION_FRAME_FIELD_NUMBER: _ClassVar[int]
     MESH_DETECTION_FRAME_FIELD_NUMBER: _ClassVar[int]
+    IMU_BATCH_FRAME_FIELD_NUMBER: _ClassVar[int]
+    AUDIO_CHUNK_FRAME_FIELD_NUMBER: _ClassVar[int]
     transform_frame: _transform_frame_pb2.TransformFrame
     color_frame: _color_frame_pb2.ColorFrame
     depth_frame: _depth_frame_pb2.DepthFrame
@@ -30,4 +34,6 @@ class ARFrame(_message.Message):
     plane_detection_frame: _plane_detection_frame_pb2.PlaneDetectionFrame
     point_cloud_detection_frame: _point_cloud_detection_frame_pb2.PointCloudDetectionFrame
     mesh_detection_frame: _mesh_detection_frame_pb2.MeshDetectionFrame
-    def __init__(self, transform_frame: _Optional[_Union[_transform_frame_pb2.TransformFrame, _Mapping]] = ..., color_frame: _Optional[_Union[_color_frame_pb2.ColorFrame, _Mapping]] = ..., depth_frame: _Optional[_Union[_depth_frame_pb2.DepthFrame, _Mapping]] = ..., gyroscope_frame: _Optional[_Union[_gyroscope_frame_pb2.GyroscopeFrame, _Mapping]] = ..., audio_frame: _Optional[_Union[_audio_frame_pb2.AudioFrame, _Mapping]] = ..., plane_detection_frame: _Optional[_Union[_plane_detection_frame_pb2.PlaneDetectionFrame, _Mapping]] = ..., point_cloud_detection_frame: _Optional[_Union[_point_cloud_detection_frame_pb2.PointCloudDetectionFrame, _Mapping]] = ..., mesh_detection_frame: _Optional[_Union[_mesh_detection_frame_pb2.MeshDetectionFrame, _Mapping]] = ...) -> None: ...
+    imu_batch_frame: _imu_batch_frame_pb2.ImuBatchFrame
+    audio_chunk_frame: _audio_chunk_frame_pb2.AudioChunkFrame
+    def __init__(self, transform_frame: _Optional[_Union[_transform_frame_pb2.TransformFrame, _Mapping]] = ..., color_frame: _Optional[_Union[_color_frame_pb2.ColorFrame, _Mapping]] = ..., depth_frame: _Optional[_Union[_depth_frame_pb2.DepthFrame, _Mapping]] = ..., gyroscope_frame: _Optional[_Union[_gyroscope_frame_pb2.GyroscopeFrame, _Mapping]] = ..., audio_frame: _Optional[_Union[_audio_frame_pb2.AudioFrame, _Mapping]] = ..., plane_detection_frame: _Optional[_Union[_plane_detection_frame_pb2.PlaneDetectionFrame, _Mapping]] = ..., point_cloud_detection_frame: _Optional[_Union[_point_cloud_detection_frame_pb2.PointCloudDetectionFrame, _Mapping]] = ..., mesh_detection_frame: _Optional[_Union[_mesh_detection_frame_pb2.MeshDetectionFrame, _Mapping]] = ..., imu_batch_frame: _Optional[_Union[_imu_batch_frame_pb2.ImuBatchFrame, _Mapping]] = ..., audio_chunk_frame: _Optional[_Union[_audio_chunk_frame_pb2.AudioChunkFrame, _Mapping]] = ...) -> None: ...
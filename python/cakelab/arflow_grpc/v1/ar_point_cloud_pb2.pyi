@@ -8,13 +8,19 @@ from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Map
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class ARPointCloud(_message.Message):
-    __slots__ = ("trackable", "confidence_values", "identifiers", "positions")
+    __slots__ = ("trackable", "confidence_values", "identifiers", "positions", "packed_positions", "packed_identifiers", "packed_confidence_values")
     TRACKABLE_FIELD_NUMBER: _ClassVar[int]
     CONFIDENCE_VALUES_FIELD_NUMBER: _ClassVar[int]
     IDENTIFIERS_FIELD_NUMBER: _ClassVar[int]
     POSITIONS_FIELD_NUMBER: _ClassVar[int]
+    PACKED_POSITIONS_FIELD_NUMBER: _ClassVar[int]
+    PACKED_IDENTIFIERS_FIELD_NUMBER: _ClassVar[int]
+    PACKED_CONFIDENCE_VALUES_FIELD_NUMBER: _ClassVar[int]
     trackable: _ar_trackable_pb2.ARTrackable
     confidence_values: _containers.RepeatedScalarFieldContainer[float]
     identifiers: _containers.RepeatedScalarFieldContainer[int]
     positions: _containers.RepeatedCompositeFieldContainer[_vector3_pb2.Vector3]
-    def __init__(self, trackable: _Optional[_Union[_ar_trackable_pb2.ARTrackable, _Mapping]] = ..., confidence_values: _Optional[_Iterable[float]] = ..., identifiers: _Optional[_Iterable[int]] = ..., positions: _Optional[_Iterable[_Union[_vector3_pb2.Vector3, _Mapping]]] = ...) -> None: ...
+    packed_positions: bytes
+    packed_identifiers: bytes
+    packed_confidence_values: bytes
+    def __init__(self, trackable: _Optional[_Union[_ar_trackable_pb2.ARTrackable, _Mapping]] = ..., confidence_values: _Optional[_Iterable[float]] = ..., identifiers: _Optional[_Iterable[int]] = ..., positions: _Optional[_Iterable[_Union[_vector3_pb2.Vector3, _Mapping]]] = ..., packed_positions: _Optional[bytes] = ..., packed_identifiers: _Optional[bytes] = ..., packed_confidence_values: _Optional[bytes] = ...) -> None: ...
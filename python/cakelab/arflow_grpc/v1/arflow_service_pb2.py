@@ -38,9 +38,11 @@ from cakelab.arflow_grpc.v1 import save_ar_frames_request_pb2 as cakelab_dot_arf
 from cakelab.arflow_grpc.v1 import save_ar_frames_response_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_save__ar__frames__response__pb2
 from cakelab.arflow_grpc.v1 import save_synchronized_ar_frame_request_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_save__synchronized__ar__frame__request__pb2
 from cakelab.arflow_grpc.v1 import save_synchronized_ar_frame_response_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_save__synchronized__ar__frame__response__pb2
+from cakelab.arflow_grpc.v1 import stream_ar_frames_request_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__request__pb2
+from cakelab.arflow_grpc.v1 import stream_ar_frames_response_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__response__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+cakelab/arflow_grpc/v1/arflow_service.proto\x12\x16\x63\x61kelab.arflow_grpc.v1\x1a\x33\x63\x61kelab/arflow_grpc/v1/create_session_request.proto\x1a\x34\x63\x61kelab/arflow_grpc/v1/create_session_response.proto\x1a\x33\x63\x61kelab/arflow_grpc/v1/delete_session_request.proto\x1a\x34\x63\x61kelab/arflow_grpc/v1/delete_session_response.proto\x1a\x30\x63\x61kelab/arflow_grpc/v1/get_session_request.proto\x1a\x31\x63\x61kelab/arflow_grpc/v1/get_session_response.proto\x1a\x31\x63\x61kelab/arflow_grpc/v1/join_session_request.proto\x1a\x32\x63\x61kelab/arflow_grpc/v1/join_session_response.proto\x1a\x32\x63\x61kelab/arflow_grpc/v1/leave_session_request.proto\x1a\x33\x63\x61kelab/arflow_grpc/v1/leave_session_response.proto\x1a\x32\x63\x61kelab/arflow_grpc/v1/list_sessions_request.proto\x1a\x33\x63\x61kelab/arflow_grpc/v1/list_sessions_response.proto\x1a\x33\x63\x61kelab/arflow_grpc/v1/save_ar_frames_request.proto\x1a\x34\x63\x61kelab/arflow_grpc/v1/save_ar_frames_response.proto\x1a?cakelab/arflow_grpc/v1/save_synchronized_ar_frame_request.proto\x1a@cakelab/arflow_grpc/v1/save_synchronized_ar_frame_response.proto2\x86\x07\n\rARFlowService\x12l\n\rCreateSession\x12,.cakelab.arflow_grpc.v1.CreateSessionRequest\x1a-.cakelab.arflow_grpc.v1.CreateSessionResponse\x12l\n\rDeleteSession\x12,.cakelab.arflow_grpc.v1.DeleteSessionRequest\x1a-.cakelab.arflow_grpc.v1.DeleteSessionResponse\x12\x63\n\nGetSession\x12).cakelab.arflow_grpc.v1.GetSessionRequest\x1a*.cakelab.arflow_grpc.v1.GetSessionResponse\x12i\n\x0cListSessions\x12+.cakelab.arflow_grpc.v1.ListSessionsRequest\x1a,.cakelab.arflow_grpc.v1.ListSessionsResponse\x12\x66\n\x0bJoinSession\x12*.cakelab.arflow_grpc.v1.JoinSessionRequest\x1a+.cakelab.arflow_grpc.v1.JoinSessionResponse\x12i\n\x0cLeaveSession\x12+.cakelab.arflow_grpc.v1.LeaveSessionRequest\x1a,.cakelab.arflow_grpc.v1.LeaveSessionResponse\x12i\n\x0cSaveARFrames\x12+.cakelab.arflow_grpc.v1.SaveARFramesRequest\x1a,.cakelab.arflow_grpc.v1.SaveARFramesResponse\x12\x8a\x01\n\x17SaveSynchronizedARFrame\x12\x36.cakelab.arflow_grpc.v1.SaveSynchronizedARFrameRequest\x1a\x37.cakelab.arflow_grpc.v1.SaveSynchronizedARFrameResponseB\xa7\x01\n\x1a\x63om.cakelab.arflow_grpc.v1B\x12\x41rflowServiceProtoP\x01\xa2\x02\x03\x43\x41X\xaa\x02\x16\x43\x61keLab.ARFlow.Grpc.V1\xca\x02\x15\x43\x61kelab\\ArflowGrpc\\V1\xe2\x02!Cakelab\\ArflowGrpc\\V1\\GPBMetadata\xea\x02\x17\x43\x61kelab::ArflowGrpc::V1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n+cakelab/arflow_grpc/v1/arflow_service.proto\x12\x16\x63\x61kelab.arflow_grpc.v1\x1a\x33\x63\x61kelab/arflow_grpc/v1/create_session_request.proto\x1a\x34\x63\x61kelab/arflow_grpc/v1/create_session_response.proto\x1a\x33\x63\x61kelab/arflow_grpc/v1/delete_session_request.proto\x1a\x34\x63\x61kelab/arflow_grpc/v1/delete_session_response.proto\x1a\x30\x63\x61kelab/arflow_grpc/v1/get_session_request.proto\x1a\x31\x63\x61kelab/arflow_grpc/v1/get_session_response.proto\x1a\x31\x63\x61kelab/arflow_grpc/v1/join_session_request.proto\x1a\x32\x63\x61kelab/arflow_grpc/v1/join_session_response.proto\x1a\x32\x63\x61kelab/arflow_grpc/v1/leave_session_request.proto\x1a\x33\x63\x61kelab/arflow_grpc/v1/leave_session_response.proto\x1a\x32\x63\x61kelab/arflow_grpc/v1/list_sessions_request.proto\x1a\x33\x63\x61kelab/arflow_grpc/v1/list_sessions_response.proto\x1a\x33\x63\x61kelab/arflow_grpc/v1/save_ar_frames_request.proto\x1a\x34\x63\x61kelab/arflow_grpc/v1/save_ar_frames_response.proto\x1a?cakelab/arflow_grpc/v1/save_synchronized_ar_frame_request.proto\x1a@cakelab/arflow_grpc/v1/save_synchronized_ar_frame_response.proto\x1a\x35\x63\x61kelab/arflow_grpc/v1/stream_ar_frames_request.proto\x1a\x36\x63\x61kelab/arflow_grpc/v1/stream_ar_frames_response.proto2\xfb\x07\n\rARFlowService\x12l\n\rCreateSession\x12,.cakelab.arflow_grpc.v1.CreateSessionRequest\x1a-.cakelab.arflow_grpc.v1.CreateSessionResponse\x12l\n\rDeleteSession\x12,.cakelab.arflow_grpc.v1.DeleteSessionRequest\x1a-.cakelab.arflow_grpc.v1.DeleteSessionResponse\x12\x63\n\nGetSession\x12).cakelab.arflow_grpc.v1.GetSessionRequest\x1a*.cakelab.arflow_grpc.v1.GetSessionResponse\x12i\n\x0cListSessions\x12+.cakelab.arflow_grpc.v1.ListSessionsRequest\x1a,.cakelab.arflow_grpc.v1.ListSessionsResponse\x12\x66\n\x0bJoinSession\x12*.cakelab.arflow_grpc.v1.JoinSessionRequest\x1a+.cakelab.arflow_grpc.v1.JoinSessionResponse\x12i\n\x0cLeaveSession\x12+.cakelab.arflow_grpc.v1.LeaveSessionRequest\x1a,.cakelab.arflow_grpc.v1.LeaveSessionResponse\x12i\n\x0cSaveARFrames\x12+.cakelab.arflow_grpc.v1.SaveARFramesRequest\x1a,.cakelab.arflow_grpc.v1.SaveARFramesResponse\x12s\n\x0eStreamARFrames\x12-.cakelab.arflow_grpc.v1.StreamARFramesRequest\x1a..cakelab.arflow_grpc.v1.StreamARFramesResponse(\x01\x30\x01\x12\x8a\x01\n\x17SaveSynchronizedARFrame\x12\x36.cakelab.arflow_grpc.v1.SaveSynchronizedARFrameRequest\x1a\x37.cakelab.arflow_grpc.v1.SaveSynchronizedARFrameResponseB\xa7\x01\n\x1a\x63om.cakelab.arflow_grpc.v1B\x12\x41rflowServiceProtoP\x01\xa2\x02\x03\x43\x41X\xaa\x02\x16\x43\x61keLab.ARFlow.Grpc.V1\xca\x02\x15\x43\x61kelab\\ArflowGrpc\\V1\xe2\x02!Cakelab\\ArflowGrpc\\V1\\GPBMetadata\xea\x02\x17\x43\x61kelab::ArflowGrpc::V1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -48,6 +50,6 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'cakelab.arflow_grpc.v1.arfl
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\n\032com.cakelab.arflow_grpc.v1B\022ArflowServiceProtoP\001\242\002\003CAX\252\002\026CakeLab.ARFlow.Grpc.V1\312\002\025Cakelab\\ArflowGrpc\\V1\342\002!Cakelab\\ArflowGrpc\\V1\\GPBMetadata\352\002\027Cakelab::ArflowGrpc::V1'
-  _globals['_ARFLOWSERVICE']._serialized_start=938
-  _globals['_ARFLOWSERVICE']._serialized_end=1840
+  _globals['_ARFLOWSERVICE']._serialized_start=1049
+  _globals['_ARFLOWSERVICE']._serialized_end=2068
 # @@protoc_insertion_point(module_scope)
@@ -18,6 +18,8 @@ from cakelab.arflow_grpc.v1 import save_ar_frames_request_pb2 as cakelab_dot_arf
 from cakelab.arflow_grpc.v1 import save_ar_frames_response_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_save__ar__frames__response__pb2
 from cakelab.arflow_grpc.v1 import save_synchronized_ar_frame_request_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_save__synchronized__ar__frame__request__pb2
 from cakelab.arflow_grpc.v1 import save_synchronized_ar_frame_response_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_save__synchronized__ar__frame__response__pb2
+from cakelab.arflow_grpc.v1 import stream_ar_frames_request_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__request__pb2
+from cakelab.arflow_grpc.v1 import stream_ar_frames_response_pb2 as cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__response__pb2
 
 
 class ARFlowServiceStub(object):
@@ -66,6 +68,11 @@ class ARFlowServiceStub(object):
                 request_serializer=cakelab_dot_arflow__grpc_dot_v1_dot_save__ar__frames__request__pb2.SaveARFramesRequest.SerializeToString,
                 response_deserializer=cakelab_dot_arflow__grpc_dot_v1_dot_save__ar__frames__response__pb2.SaveARFramesResponse.FromString,
                 _registered_method=True)
+        self.StreamARFrames = channel.stream_stream(
+                '/cakelab.arflow_grpc.v1.ARFlowService/StreamARFrames',
+                request_serializer=cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__request__pb2.StreamARFramesRequest.SerializeToString,
+                response_deserializer=cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__response__pb2.StreamARFramesResponse.FromString,
+                _registered_method=True)
         self.SaveSynchronizedARFrame = channel.unary_unary(
                 '/cakelab.arflow_grpc.v1.ARFlowService/SaveSynchronizedARFrame',
                 request_serializer=cakelab_dot_arflow__grpc_dot_v1_dot_save__synchronized__ar__frame__request__pb2.SaveSynchronizedARFrameRequest.SerializeToString,
@@ -127,6 +134,15 @@ class ARFlowServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamARFrames(self, request_iterator, context):
+        """/ Stream AR frames from a device to its session's recording stream. The session and
+        / device are bound once by the first request message. The server replies with an
+        / initial credit grant and then with periodic acks that replenish the credits.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SaveSynchronizedARFrame(self, request, context):
         """/ Save an synchronized AR frame from a device to its session's recording stream.
         / This is our old approach and we're keeping this for benchmarking purposes.
@@ -173,6 +189,11 @@ def add_ARFlowServiceServicer_to_server(servicer, server):
                     request_deserializer=cakelab_dot_arflow__grpc_dot_v1_dot_save__ar__frames__request__pb2.SaveARFramesRequest.FromString,
                     response_serializer=cakelab_dot_arflow__grpc_dot_v1_dot_save__ar__frames__response__pb2.SaveARFramesResponse.SerializeToString,
             ),
+            'StreamARFrames': grpc.stream_stream_rpc_method_handler(
+                    servicer.StreamARFrames,
+                    request_deserializer=cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__request__pb2.StreamARFramesRequest.FromString,
+                    response_serializer=cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__response__pb2.StreamARFramesResponse.SerializeToString,
+            ),
             'SaveSynchronizedARFrame': grpc.unary_unary_rpc_method_handler(
                     servicer.SaveSynchronizedARFrame,
                     request_deserializer=cakelab_dot_arflow__grpc_dot_v1_dot_save__synchronized__ar__frame__request__pb2.SaveSynchronizedARFrameRequest.FromString,
@@ -380,6 +401,33 @@ class ARFlowService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamARFrames(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/cakelab.arflow_grpc.v1.ARFlowService/StreamARFrames',
+            cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__request__pb2.StreamARFramesRequest.SerializeToString,
+            cakelab_dot_arflow__grpc_dot_v1_dot_stream__ar__frames__response__pb2.StreamARFramesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SaveSynchronizedARFrame(request,
             target,
@@ -0,0 +1,16 @@
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Mapping as _Mapping, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class AudioChunkFrame(_message.Message):
+    __slots__ = ("device_timestamp", "sample_rate", "samples")
+    DEVICE_TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    SAMPLE_RATE_FIELD_NUMBER: _ClassVar[int]
+    SAMPLES_FIELD_NUMBER: _ClassVar[int]
+    device_timestamp: _timestamp_pb2.Timestamp
+    sample_rate: int
+    samples: bytes
+    def __init__(self, device_timestamp: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., sample_rate: _Optional[int] = ..., samples: _Optional[bytes] = ...) -> None: ...
@@ -0,0 +1,13 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ImuBatchFrame(_message.Message):
+    __slots__ = ("device_timestamps", "samples")
+    DEVICE_TIMESTAMPS_FIELD_NUMBER: _ClassVar[int]
+    SAMPLES_FIELD_NUMBER: _ClassVar[int]
+    device_timestamps: bytes
+    samples: bytes
+    def __init__(self, device_timestamps: _Optional[bytes] = ..., samples: _Optional[bytes] = ...) -> None: ...
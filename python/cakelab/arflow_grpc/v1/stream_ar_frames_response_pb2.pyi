@@ -0,0 +1,13 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class StreamARFramesResponse(_message.Message):
+    __slots__ = ("acked_messages", "credits")
+    ACKED_MESSAGES_FIELD_NUMBER: _ClassVar[int]
+    CREDITS_FIELD_NUMBER: _ClassVar[int]
+    acked_messages: int
+    credits: int
+    def __init__(self, acked_messages: _Optional[int] = ..., credits: _Optional[int] = ...) -> None: ...
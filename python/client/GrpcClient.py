@@ -4,7 +4,7 @@
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
 # We have to do the above because the grpc stub has no type hints
 
-from typing import Awaitable, Iterable
+from typing import Awaitable, Iterable, Iterator
 
 import grpc
 
@@ -26,6 +26,10 @@ from cakelab.arflow_grpc.v1.list_sessions_response_pb2 import ListSessionsRespon
 from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
 from cakelab.arflow_grpc.v1.save_ar_frames_response_pb2 import SaveARFramesResponse
 from cakelab.arflow_grpc.v1.session_pb2 import SessionMetadata, SessionUuid
+from cakelab.arflow_grpc.v1.stream_ar_frames_request_pb2 import StreamARFramesRequest
+from cakelab.arflow_grpc.v1.stream_ar_frames_response_pb2 import (
+    StreamARFramesResponse,
+)
 
 
 class GrpcClient:
@@ -151,6 +155,39 @@ class GrpcClient:
         response: Awaitable[SaveARFramesResponse] = self.stub.SaveARFrames(request)
         return response
 
+    def stream_ar_frames(
+        self,
+        session_id: str,
+        ar_frame_batches: Iterable[Iterable[ARFrame]],
+        device: Device,
+    ) -> Iterator[StreamARFramesResponse]:
+        """Stream batches of AR frames to the session over a single call.
+
+        Args:
+            session_id: The session ID.
+            ar_frame_batches: The batches of AR frames to save, one request message per batch.
+            device: The device that captured the AR frames.
+
+        Returns:
+            The acks and credit grants sent back by the server.
+        """
+
+        def requests() -> Iterator[StreamARFramesRequest]:
+            for i, ar_frames in enumerate(ar_frame_batches):
+                if i == 0:
+                    yield StreamARFramesRequest(
+                        session_id=SessionUuid(value=session_id),
+                        device=device,
+                        frames=ar_frames,
+                    )
+                else:
+                    yield StreamARFramesRequest(frames=ar_frames)
+
+        response: Iterator[StreamARFramesResponse] = self.stub.StreamARFrames(
+            requests()
+        )
+        return response
+
     def close(self):
         """Close the channel."""
         self.channel.close()
@@ -0,0 +1,114 @@
+"""Admission control tests."""
+
+# ruff:noqa: D103
+import pytest
+from grpc_interceptor.exceptions import ResourceExhausted
+
+from arflow._admission import (
+    DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+    AdmissionController,
+    RateLimit,
+    RateLimited,
+    max_receive_message_length,
+)
+
+
+@pytest.mark.parametrize(
+    "frames_per_second, bytes_per_second, burst_seconds",
+    [(0, None, 1), (None, -1, 1), (1, 1, 0)],
+)
+def test_invalid_rate_limit(
+    frames_per_second: float | None,
+    bytes_per_second: float | None,
+    burst_seconds: float,
+):
+    with pytest.raises(ValueError):
+        RateLimit(frames_per_second, bytes_per_second, burst_seconds)
+
+
+def test_admits_burst_then_refills():
+    controller = AdmissionController(
+        per_device=RateLimit(frames_per_second=10, burst_seconds=0.5)
+    )
+    controller.admit("session", "device", num_frames=5, num_bytes=0, now=0)
+
+    with pytest.raises(RateLimited) as excinfo:
+        controller.admit("session", "device", num_frames=2, num_bytes=0, now=0)
+    assert excinfo.value.retry_after == pytest.approx(0.2)
+
+    controller.admit("session", "device", num_frames=2, num_bytes=0, now=0.2)
+
+
+def test_device_limits_are_independent():
+    controller = AdmissionController(per_device=RateLimit(frames_per_second=1))
+    controller.admit("session", "device1", num_frames=1, num_bytes=0, now=0)
+    controller.admit("session", "device2", num_frames=1, num_bytes=0, now=0)
+    controller.admit("other session", "device1", num_frames=1, num_bytes=0, now=0)
+    with pytest.raises(RateLimited):
+        controller.admit("session", "device1", num_frames=1, num_bytes=0, now=0)
+
+
+def test_rejected_calls_take_no_tokens():
+    controller = AdmissionController(
+        per_device=RateLimit(frames_per_second=10),
+        per_session=RateLimit(bytes_per_second=100),
+    )
+    controller.admit("session", "device1", num_frames=1, num_bytes=100, now=0)
+    # Over the session byte limit, so the device frame bucket must stay untouched.
+    with pytest.raises(RateLimited) as excinfo:
+        controller.admit("session", "device1", num_frames=9, num_bytes=50, now=0)
+    assert excinfo.value.retry_after == pytest.approx(0.5)
+
+    controller.admit("session", "device1", num_frames=9, num_bytes=50, now=0.5)
+
+
+def test_total_limit_is_shared():
+    controller = AdmissionController(total=RateLimit(bytes_per_second=100))
+    controller.admit("session1", "device1", num_frames=1, num_bytes=60, now=0)
+    with pytest.raises(RateLimited) as excinfo:
+        controller.admit("session2", "device2", num_frames=1, num_bytes=60, now=0)
+    assert excinfo.value.retry_after == pytest.approx(0.2)
+
+
+def test_call_larger_than_burst_is_never_admitted():
+    controller = AdmissionController(per_session=RateLimit(bytes_per_second=100))
+    with pytest.raises(ResourceExhausted) as excinfo:
+        controller.admit("session", "device", num_frames=1, num_bytes=101, now=100)
+    assert not isinstance(excinfo.value, RateLimited)
+
+
+def test_forget_resets_buckets():
+    controller = AdmissionController(
+        per_device=RateLimit(frames_per_second=1),
+        per_session=RateLimit(frames_per_second=2),
+    )
+    controller.admit("session", "device1", num_frames=1, num_bytes=0, now=0)
+    controller.forget_device("session", "device1")
+    controller.admit("session", "device1", num_frames=1, num_bytes=0, now=0)
+    with pytest.raises(RateLimited):
+        controller.admit("session", "device2", num_frames=1, num_bytes=0, now=0)
+
+    controller.forget_session("session")
+    controller.admit("session", "device1", num_frames=1, num_bytes=0, now=0)
+
+
+def test_receive_limit_follows_the_smallest_byte_burst():
+    assert max_receive_message_length(None) == DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH
+    assert (
+        max_receive_message_length(
+            AdmissionController(per_device=RateLimit(frames_per_second=10))
+        )
+        == DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH
+    )
+
+    controller = AdmissionController(
+        per_device=RateLimit(bytes_per_second=4e6, burst_seconds=0.5),
+        total=RateLimit(bytes_per_second=10e6),
+    )
+    assert controller.max_call_bytes == 2e6
+    limit = max_receive_message_length(controller)
+    assert 2_000_000 < limit < 3_000_000
+    assert max_receive_message_length(controller, max_length=1_000) == 1_000
+
+    with pytest.raises(ValueError):
+        max_receive_message_length(None, max_length=0)
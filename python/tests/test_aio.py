@@ -0,0 +1,567 @@
+"""End-to-end asyncio gRPC server tests."""
+
+# ruff:noqa: D101,D102,D103,D107
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+# We have to do the above because the grpc stub has no type hints
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from unittest.mock import patch
+
+import grpc
+import numpy as np
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import AsyncARFlowServicer, SessionStream, TransformBatch
+from arflow._error_interceptor import AsyncErrorInterceptor
+from cakelab.arflow_grpc.v1 import arflow_service_pb2_grpc
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.ar_plane_pb2 import ARPlane
+from cakelab.arflow_grpc.v1.ar_point_cloud_pb2 import ARPointCloud
+from cakelab.arflow_grpc.v1.arflow_service_pb2_grpc import ARFlowServiceStub
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import AudioChunkFrame
+from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.delete_session_request_pb2 import DeleteSessionRequest
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.get_session_request_pb2 import GetSessionRequest
+from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
+from cakelab.arflow_grpc.v1.join_session_request_pb2 import JoinSessionRequest
+from cakelab.arflow_grpc.v1.leave_session_request_pb2 import LeaveSessionRequest
+from cakelab.arflow_grpc.v1.list_sessions_request_pb2 import ListSessionsRequest
+from cakelab.arflow_grpc.v1.mesh_detection_frame_pb2 import MeshDetectionFrame
+from cakelab.arflow_grpc.v1.plane_detection_frame_pb2 import PlaneDetectionFrame
+from cakelab.arflow_grpc.v1.point_cloud_detection_frame_pb2 import (
+    PointCloudDetectionFrame,
+)
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.save_synchronized_ar_frame_request_pb2 import (
+    SaveSynchronizedARFrameRequest,
+)
+from cakelab.arflow_grpc.v1.session_pb2 import SessionUuid
+from cakelab.arflow_grpc.v1.stream_ar_frames_request_pb2 import StreamARFramesRequest
+from cakelab.arflow_grpc.v1.stream_ar_frames_response_pb2 import (
+    StreamARFramesResponse,
+)
+from cakelab.arflow_grpc.v1.synchronized_ar_frame_pb2 import SynchronizedARFrame
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.vector2_pb2 import Vector2
+from cakelab.arflow_grpc.v1.vector3_pb2 import Vector3
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+from tests.conftest import TEST_APP_ID
+
+
+class UserExtendedAsyncService(AsyncARFlowServicer):
+    def __init__(self, save_dir: Path, idle_timeout: float | None = None):
+        super().__init__(
+            spawn_viewer=False,
+            save_dir=save_dir,
+            application_id=TEST_APP_ID,
+            idle_timeout=idle_timeout,
+        )
+        self.num_sessions = 0
+        self.num_clients = 0
+        self.saved_transform_frames: list[TransformFrame] = []
+        self.saved_transform_batches: list[TransformBatch] = []
+        self.saved_ar_frames: list[ARFrame] = []
+
+    async def on_create_session(
+        self, session_stream: SessionStream, device: Device
+    ) -> None:
+        self.num_sessions += 1
+
+    async def on_delete_session(self, session_stream: SessionStream) -> None:
+        self.num_sessions -= 1
+
+    async def on_join_session(
+        self, session_stream: SessionStream, device: Device
+    ) -> None:
+        self.num_clients += 1
+
+    async def on_leave_session(
+        self, session_stream: SessionStream, device: Device
+    ) -> None:
+        self.num_clients -= 1
+
+    async def on_save_transform_frames(
+        self,
+        frames: Sequence[TransformFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        self.saved_transform_frames.extend(frames)
+
+    async def on_save_transform_batch(
+        self, batch: TransformBatch, session_stream: SessionStream, device: Device
+    ) -> None:
+        self.saved_transform_batches.append(batch)
+
+    async def on_save_ar_frames(
+        self, frames: Sequence[ARFrame], session_stream: SessionStream, device: Device
+    ) -> None:
+        self.saved_ar_frames.extend(frames)
+
+
+def run_with_stub(
+    servicer: AsyncARFlowServicer,
+    test: Callable[[ARFlowServiceStub], Awaitable[None]],
+) -> None:
+    async def main() -> None:
+        server = grpc.aio.server(
+            interceptors=[AsyncErrorInterceptor()],
+            options=[
+                ("grpc.max_receive_message_length", -1),
+            ],
+        )
+        arflow_service_pb2_grpc.add_ARFlowServiceServicer_to_server(servicer, server)
+        port = server.add_insecure_port("[::]:0")
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+                await test(ARFlowServiceStub(channel))
+        finally:
+            await server.stop(None)
+
+    asyncio.run(main())
+
+
+def test_session_lifecycle(tmp_path: Path):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path)
+
+    async def test(stub: ARFlowServiceStub) -> None:
+        response = await stub.CreateSession(
+            CreateSessionRequest(device=Device(uid="1"))
+        )
+        assert servicer.num_sessions == 1
+        await stub.JoinSession(
+            JoinSessionRequest(session_id=response.session.id, device=Device(uid="2"))
+        )
+        assert servicer.num_clients == 1
+        assert (
+            len((await stub.ListSessions(ListSessionsRequest())).sessions[0].devices)
+            == 2
+        )
+        await stub.LeaveSession(
+            LeaveSessionRequest(session_id=response.session.id, device=Device(uid="2"))
+        )
+        assert servicer.num_clients == 0
+        await stub.DeleteSession(DeleteSessionRequest(session_id=response.session.id))
+        assert servicer.num_sessions == 0
+        assert len((await stub.ListSessions(ListSessionsRequest())).sessions) == 0
+
+    run_with_stub(servicer, test)
+
+
+def test_save_ar_frames(tmp_path: Path, device_fixture: Device):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path)
+
+    async def test(stub: ARFlowServiceStub) -> None:
+        response = await stub.CreateSession(CreateSessionRequest(device=device_fixture))
+        transform_frames = [
+            TransformFrame(
+                device_timestamp=Timestamp(seconds=i, nanos=0),
+                data=np.random.rand(12).astype(np.float32).tobytes(),
+            )
+            for i in range(3)
+        ]
+        ar_frames = [ARFrame(transform_frame=f) for f in transform_frames] + [
+            ARFrame(
+                audio_frame=AudioFrame(
+                    device_timestamp=Timestamp(seconds=0, nanos=0), data=[1, 2, 3]
+                )
+            )
+        ]
+        await stub.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=response.session.id,
+                device=device_fixture,
+                frames=ar_frames,
+            )
+        )
+        assert servicer.saved_transform_frames == transform_frames
+        (batch,) = servicer.saved_transform_batches
+        np.testing.assert_array_equal(
+            batch.timestamps, [0, 1_000_000_000, 2_000_000_000]
+        )
+        assert batch.poses.shape == (3, 4, 4)
+        assert servicer.saved_ar_frames == ar_frames
+
+    run_with_stub(servicer, test)
+
+
+def test_default_hooks_accept_every_frame_type(tmp_path: Path, device_fixture: Device):
+    servicer = AsyncARFlowServicer(
+        spawn_viewer=False, save_dir=tmp_path, application_id=TEST_APP_ID
+    )
+    timestamp = Timestamp(seconds=0, nanos=0)
+    frames = [
+        ARFrame(
+            transform_frame=TransformFrame(
+                device_timestamp=timestamp,
+                data=np.random.rand(12).astype(np.float32).tobytes(),
+            )
+        ),
+        ARFrame(
+            color_frame=ColorFrame(
+                device_timestamp=timestamp,
+                image=XRCpuImage(
+                    dimensions=Vector2Int(x=4, y=2),
+                    format=XRCpuImage.FORMAT_RGB24,
+                    planes=[XRCpuImage.Plane(data=bytes(4 * 2 * 3))],
+                ),
+            )
+        ),
+        ARFrame(
+            depth_frame=DepthFrame(
+                device_timestamp=timestamp,
+                image=XRCpuImage(
+                    dimensions=Vector2Int(x=4, y=2),
+                    format=XRCpuImage.FORMAT_DEPTHUINT16,
+                    planes=[XRCpuImage.Plane(data=bytes(4 * 2 * 2))],
+                ),
+            )
+        ),
+        ARFrame(gyroscope_frame=GyroscopeFrame(device_timestamp=timestamp)),
+        ARFrame(audio_frame=AudioFrame(device_timestamp=timestamp, data=[1, 2, 3])),
+        ARFrame(
+            plane_detection_frame=PlaneDetectionFrame(
+                state=PlaneDetectionFrame.STATE_ADDED,
+                device_timestamp=timestamp,
+                plane=ARPlane(
+                    center=Vector3(x=1.0, y=2.0, z=3.0),
+                    normal=Vector3(x=0.0, y=1.0, z=0.0),
+                    size=Vector2(x=1.0, y=2.0),
+                    boundary=[
+                        Vector2(x=1.0, y=2.0),
+                        Vector2(x=2.0, y=3.0),
+                        Vector2(x=1.0, y=3.0),
+                    ],
+                ),
+            )
+        ),
+        ARFrame(
+            point_cloud_detection_frame=PointCloudDetectionFrame(
+                state=PointCloudDetectionFrame.STATE_ADDED,
+                device_timestamp=timestamp,
+                point_cloud=ARPointCloud(
+                    packed_positions=np.random.rand(4, 3).astype("<f4").tobytes()
+                ),
+            )
+        ),
+        ARFrame(
+            mesh_detection_frame=MeshDetectionFrame(
+                state=MeshDetectionFrame.STATE_REMOVED, device_timestamp=timestamp
+            )
+        ),
+        ARFrame(
+            imu_batch_frame=ImuBatchFrame(
+                device_timestamps=np.arange(2, dtype="<i8").tobytes(),
+                samples=np.random.rand(2, 13).astype("<f4").tobytes(),
+            )
+        ),
+        ARFrame(
+            audio_chunk_frame=AudioChunkFrame(
+                device_timestamp=timestamp,
+                sample_rate=48_000,
+                samples=np.random.rand(480).astype("<f4").tobytes(),
+            )
+        ),
+    ]
+    other_device = Device(uid="other-device")
+
+    async def main() -> None:
+        session = (
+            await servicer.CreateSession(CreateSessionRequest(device=device_fixture))
+        ).session
+        await servicer.JoinSession(
+            JoinSessionRequest(session_id=session.id, device=other_device)
+        )
+        await servicer.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=session.id, device=device_fixture, frames=frames
+            )
+        )
+        assert (
+            await servicer.GetSession(GetSessionRequest(session_id=session.id))
+        ).session.id == session.id
+        await servicer.LeaveSession(
+            LeaveSessionRequest(session_id=session.id, device=other_device)
+        )
+        await servicer.DeleteSession(DeleteSessionRequest(session_id=session.id))
+
+    asyncio.run(main())
+    servicer.on_server_exit()
+
+
+@pytest.mark.parametrize(
+    "request_, code",
+    [
+        (SaveARFramesRequest(), grpc.StatusCode.INVALID_ARGUMENT),
+        (
+            SaveARFramesRequest(
+                session_id=SessionUuid(value="nonexistent"),
+                frames=[ARFrame(transform_frame=TransformFrame())],
+            ),
+            grpc.StatusCode.NOT_FOUND,
+        ),
+    ],
+)
+def test_save_ar_frames_invalid_request(
+    tmp_path: Path, request_: SaveARFramesRequest, code: grpc.StatusCode
+):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path)
+
+    async def test(stub: ARFlowServiceStub) -> None:
+        with pytest.raises(grpc.aio.AioRpcError) as excinfo:
+            await stub.SaveARFrames(request_)
+        assert excinfo.value.code() == code
+
+    run_with_stub(servicer, test)
+
+
+def test_save_ar_frames_with_malformed_frames(tmp_path: Path, device_fixture: Device):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path)
+
+    async def test(stub: ARFlowServiceStub) -> None:
+        response = await stub.CreateSession(CreateSessionRequest(device=device_fixture))
+        with pytest.raises(grpc.aio.AioRpcError) as excinfo:
+            await stub.SaveARFrames(
+                SaveARFramesRequest(
+                    session_id=response.session.id,
+                    device=device_fixture,
+                    frames=[
+                        ARFrame(
+                            audio_chunk_frame=AudioChunkFrame(
+                                sample_rate=48_000, samples=bytes(6)
+                            )
+                        )
+                    ],
+                )
+            )
+        assert excinfo.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+        assert servicer.saved_ar_frames == []
+
+    run_with_stub(servicer, test)
+
+
+def test_save_synchronized_ar_frame_with_malformed_frames(
+    tmp_path: Path, device_fixture: Device
+):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path)
+
+    async def test(stub: ARFlowServiceStub) -> None:
+        response = await stub.CreateSession(CreateSessionRequest(device=device_fixture))
+        with pytest.raises(grpc.aio.AioRpcError) as excinfo:
+            await stub.SaveSynchronizedARFrame(
+                SaveSynchronizedARFrameRequest(
+                    session_id=response.session.id,
+                    device=device_fixture,
+                    frame=SynchronizedARFrame(
+                        transform_frame=TransformFrame(data=bytes(48)),
+                        point_cloud_detection_frame=PointCloudDetectionFrame(
+                            point_cloud=ARPointCloud(packed_positions=bytes(26))
+                        ),
+                    ),
+                )
+            )
+        assert excinfo.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+        assert servicer.saved_transform_frames == []
+
+    run_with_stub(servicer, test)
+
+
+def test_save_synchronized_ar_frame(tmp_path: Path, device_fixture: Device):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path)
+
+    async def test(stub: ARFlowServiceStub) -> None:
+        response = await stub.CreateSession(CreateSessionRequest(device=device_fixture))
+        transform_frame = TransformFrame(
+            device_timestamp=Timestamp(seconds=2, nanos=0),
+            data=np.arange(12, dtype=np.float32).tobytes(),
+        )
+        await stub.SaveSynchronizedARFrame(
+            SaveSynchronizedARFrameRequest(
+                session_id=response.session.id,
+                device=device_fixture,
+                frame=SynchronizedARFrame(
+                    transform_frame=transform_frame,
+                    audio_frame=AudioFrame(
+                        device_timestamp=Timestamp(seconds=2, nanos=0), data=[1, 2, 3]
+                    ),
+                ),
+            )
+        )
+
+        assert servicer.saved_transform_frames == [transform_frame]
+        (batch,) = servicer.saved_transform_batches
+        np.testing.assert_array_equal(batch.timestamps, [2_000_000_000])
+        np.testing.assert_array_equal(
+            batch.poses[0, :3],
+            # Y points down on the device and up in the recording.
+            np.arange(12, dtype=np.float32).reshape(3, 4) * [[1], [-1], [1]],
+        )
+        np.testing.assert_array_equal(batch.poses[0, 3], [0, 0, 0, 1])
+
+    run_with_stub(servicer, test)
+
+
+class OneSaveAtATimeService(UserExtendedAsyncService):
+    def __init__(self, save_dir: Path):
+        super().__init__(save_dir=save_dir)
+        self.saving = 0
+        self.most_saving = 0
+
+    async def on_save_transform_frames(
+        self,
+        frames: Sequence[TransformFrame],
+        session_stream: SessionStream,
+        device: Device,
+    ) -> None:
+        self.saving += 1
+        self.most_saving = max(self.most_saving, self.saving)
+        await asyncio.sleep(0.05)
+        self.saving -= 1
+        await super().on_save_transform_frames(frames, session_stream, device)
+
+
+def test_frames_of_a_session_are_saved_one_call_at_a_time(
+    tmp_path: Path, device_fixture: Device
+):
+    servicer = OneSaveAtATimeService(save_dir=tmp_path)
+
+    async def test(stub: ARFlowServiceStub) -> None:
+        response = await stub.CreateSession(CreateSessionRequest(device=device_fixture))
+        transform_frame = TransformFrame(
+            device_timestamp=Timestamp(seconds=1),
+            data=np.arange(12, dtype=np.float32).tobytes(),
+        )
+        await asyncio.gather(
+            *[
+                stub.SaveARFrames(
+                    SaveARFramesRequest(
+                        session_id=response.session.id,
+                        device=device_fixture,
+                        frames=[ARFrame(transform_frame=transform_frame)],
+                    )
+                )
+                for _ in range(3)
+            ],
+            stub.SaveSynchronizedARFrame(
+                SaveSynchronizedARFrameRequest(
+                    session_id=response.session.id,
+                    device=device_fixture,
+                    frame=SynchronizedARFrame(transform_frame=transform_frame),
+                )
+            ),
+        )
+
+        assert servicer.saved_transform_frames == [transform_frame] * 4
+        assert servicer.most_saving == 1
+
+    run_with_stub(servicer, test)
+
+
+def test_stream_ar_frames(tmp_path: Path, device_fixture: Device):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path)
+
+    async def test(stub: ARFlowServiceStub) -> None:
+        response = await stub.CreateSession(CreateSessionRequest(device=device_fixture))
+        transform_frames = [
+            TransformFrame(
+                device_timestamp=Timestamp(seconds=i, nanos=0),
+                data=np.random.rand(12).astype(np.float32).tobytes(),
+            )
+            for i in range(4)
+        ]
+        call = stub.StreamARFrames()
+        grant = await call.read()
+        assert grant == StreamARFramesResponse(credits=servicer.stream_window)
+        await call.write(
+            StreamARFramesRequest(
+                session_id=response.session.id,
+                device=device_fixture,
+                frames=[ARFrame(transform_frame=transform_frames[0])],
+            )
+        )
+        for frame in transform_frames[1:]:
+            await call.write(
+                StreamARFramesRequest(frames=[ARFrame(transform_frame=frame)])
+            )
+        ack = await call.read()
+        assert ack == StreamARFramesResponse(
+            acked_messages=4, credits=servicer.stream_ack_interval
+        )
+        assert servicer.saved_transform_frames == transform_frames
+        # The messages left unacked when the client half-closes are acked at the end.
+        await call.write(StreamARFramesRequest())
+        await call.done_writing()
+        assert await call.read() == StreamARFramesResponse(acked_messages=5, credits=1)
+        assert await call.read() == grpc.aio.EOF  # pyright: ignore [reportAttributeAccessIssue]
+
+        # Nothing is left to ack when the client half-closes without sending anything.
+        call = stub.StreamARFrames()
+        await call.done_writing()
+        assert await call.read() == StreamARFramesResponse(
+            credits=servicer.stream_window
+        )
+        assert await call.read() == grpc.aio.EOF  # pyright: ignore [reportAttributeAccessIssue]
+
+    run_with_stub(servicer, test)
+
+
+def test_reap_idle_sessions(tmp_path: Path, device_fixture: Device):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path, idle_timeout=60)
+    other_device = Device(uid="other-device")
+
+    async def main() -> None:
+        with patch("arflow._session_stream.time.monotonic", return_value=100.0):
+            session = (
+                await servicer.CreateSession(
+                    CreateSessionRequest(device=device_fixture)
+                )
+            ).session
+            await servicer.JoinSession(
+                JoinSessionRequest(session_id=session.id, device=other_device)
+            )
+        with patch("arflow._session_stream.time.monotonic", return_value=150.0):
+            await servicer.SaveARFrames(
+                SaveARFramesRequest(
+                    session_id=session.id,
+                    device=other_device,
+                    frames=[
+                        ARFrame(
+                            transform_frame=TransformFrame(
+                                device_timestamp=Timestamp(seconds=0, nanos=0),
+                                data=np.random.rand(12).astype(np.float32).tobytes(),
+                            )
+                        )
+                    ],
+                )
+            )
+        session_stream = servicer.client_sessions[session.id.value]
+        assert servicer.num_clients == 1
+
+        # Only the device that never sent frames is idle.
+        assert await servicer.reap_idle_sessions(now=180.0) == []
+        assert list(session_stream.info.devices) == [other_device]
+        assert servicer.num_clients == 0
+        assert servicer.num_sessions == 1
+
+        assert await servicer.reap_idle_sessions(now=211.0) == [session_stream]
+        assert servicer.client_sessions == {}
+        assert servicer.num_sessions == 0
+
+    asyncio.run(main())
+    servicer.on_server_exit()
+
+
+def test_on_server_exit_shuts_down_executor(tmp_path: Path):
+    servicer = UserExtendedAsyncService(save_dir=tmp_path)
+    servicer.on_server_exit()
+    with pytest.raises(RuntimeError):
+        servicer.executor.submit(lambda: None)
@@ -0,0 +1,230 @@
+"""Decoded frame batch tests."""
+
+# ruff:noqa: D101,D102,D103,D107
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import (
+    ARFlowServicer,
+    ColorBatch,
+    DepthBatch,
+    SessionStream,
+    TransformBatch,
+)
+from arflow._session_stream import y_down_to_y_up
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.intrinsics_pb2 import Intrinsics
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.vector2_pb2 import Vector2
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+from tests.conftest import TEST_APP_ID
+
+WIDTH = 4
+HEIGHT = 2
+
+
+class BatchRecordingServicer(ARFlowServicer):
+    def __init__(self, save_dir: Path):
+        super().__init__(
+            spawn_viewer=False, save_dir=save_dir, application_id=TEST_APP_ID
+        )
+        self.transform_batches: list[TransformBatch] = []
+        self.color_batches: list[ColorBatch] = []
+        self.depth_batches: list[DepthBatch] = []
+
+    def on_save_transform_batch(
+        self, batch: TransformBatch, session_stream: SessionStream, device: Device
+    ) -> None:
+        self.transform_batches.append(batch)
+
+    def on_save_color_batch(
+        self, batch: ColorBatch, session_stream: SessionStream, device: Device
+    ) -> None:
+        self.color_batches.append(batch)
+
+    def on_save_depth_batch(
+        self, batch: DepthBatch, session_stream: SessionStream, device: Device
+    ) -> None:
+        self.depth_batches.append(batch)
+
+
+@pytest.fixture
+def servicer(tmp_path: Path) -> Iterator[BatchRecordingServicer]:
+    servicer = BatchRecordingServicer(tmp_path)
+    yield servicer
+    servicer.on_server_exit()
+
+
+def save(
+    servicer: BatchRecordingServicer, device: Device, frames: list[ARFrame]
+) -> None:
+    session = servicer.CreateSession(CreateSessionRequest(device=device)).session
+    servicer.SaveARFrames(
+        SaveARFramesRequest(
+            session_id=session.id,
+            device=device,
+            frames=frames,
+        )
+    )
+
+
+def test_transform_batch(servicer: BatchRecordingServicer, device_fixture: Device):
+    data = np.random.rand(3, 12).astype(np.float32)
+    save(
+        servicer,
+        device_fixture,
+        [
+            ARFrame(
+                transform_frame=TransformFrame(
+                    device_timestamp=Timestamp(seconds=i, nanos=5),
+                    data=data[i].tobytes(),
+                )
+            )
+            for i in range(3)
+        ],
+    )
+
+    (batch,) = servicer.transform_batches
+    assert len(batch) == 3
+    assert batch.timestamps.dtype == np.int64
+    np.testing.assert_array_equal(batch.timestamps, [5, 1_000_000_005, 2_000_000_005])
+    expected = np.tile(np.eye(4, dtype=np.float32), (3, 1, 1))
+    expected[:, :3, :] = data.reshape((3, 3, 4))
+    np.testing.assert_allclose(batch.poses, y_down_to_y_up @ expected)
+    assert not batch.poses.flags.writeable
+
+
+def test_color_batches(servicer: BatchRecordingServicer, device_fixture: Device):
+    rgb = np.arange(2 * HEIGHT * WIDTH * 3, dtype=np.uint8).reshape(
+        (2, HEIGHT, WIDTH, 3)
+    )
+    y_plane = np.arange(WIDTH * HEIGHT, dtype=np.uint8)
+    # Android interleaves the U and V planes and omits the last byte of each.
+    uv_plane = np.arange(WIDTH * HEIGHT // 2 - 1, dtype=np.uint8)
+    save(
+        servicer,
+        device_fixture,
+        [
+            ARFrame(
+                color_frame=ColorFrame(
+                    device_timestamp=Timestamp(seconds=i),
+                    image=XRCpuImage(
+                        dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+                        format=XRCpuImage.FORMAT_RGB24,
+                        timestamp=i + 0.5,
+                        planes=[XRCpuImage.Plane(data=rgb[i].tobytes())],
+                    ),
+                    intrinsics=Intrinsics(
+                        focal_length=Vector2(x=1, y=2),
+                        principal_point=Vector2(x=3, y=4),
+                        resolution=Vector2Int(x=WIDTH, y=HEIGHT),
+                    ),
+                )
+            )
+            for i in range(2)
+        ]
+        + [
+            ARFrame(
+                color_frame=ColorFrame(
+                    device_timestamp=Timestamp(seconds=0),
+                    image=XRCpuImage(
+                        dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+                        format=XRCpuImage.FORMAT_ANDROID_YUV_420_888,
+                        planes=[
+                            XRCpuImage.Plane(
+                                data=y_plane.tobytes(), row_stride=WIDTH, pixel_stride=1
+                            ),
+                            XRCpuImage.Plane(
+                                data=uv_plane.tobytes(),
+                                row_stride=WIDTH,
+                                pixel_stride=2,
+                            ),
+                            XRCpuImage.Plane(
+                                data=uv_plane.tobytes(),
+                                row_stride=WIDTH,
+                                pixel_stride=2,
+                            ),
+                        ],
+                    ),
+                )
+            )
+        ],
+    )
+
+    rgb_batch, yuv_batch = sorted(
+        servicer.color_batches, key=lambda batch: len(batch), reverse=True
+    )
+    assert rgb_batch.format == XRCpuImage.FORMAT_RGB24
+    np.testing.assert_array_equal(rgb_batch.images, rgb)
+    np.testing.assert_array_equal(rgb_batch.image_timestamps, [0.5, 1.5])
+    np.testing.assert_array_equal(
+        rgb_batch.intrinsics,
+        np.tile(np.array([[1, 0, 3], [0, 2, 4], [0, 0, 1]]), (2, 1, 1)),
+    )
+    assert not rgb_batch.images.flags.writeable
+
+    assert yuv_batch.format == XRCpuImage.FORMAT_ANDROID_YUV_420_888
+    assert yuv_batch.images.shape == (1, HEIGHT * 3 // 2, WIDTH)
+    np.testing.assert_array_equal(
+        yuv_batch.images[0, :HEIGHT], y_plane.reshape((HEIGHT, WIDTH))
+    )
+
+
+@pytest.mark.parametrize(
+    "format,depth,expected",
+    [
+        (
+            XRCpuImage.FORMAT_DEPTHFLOAT32,
+            np.full((HEIGHT, WIDTH), 1.5, dtype=np.float32),
+            1.5,
+        ),
+        (
+            XRCpuImage.FORMAT_DEPTHUINT16,
+            np.full((HEIGHT, WIDTH), 1500, dtype=np.uint16),
+            1.5,
+        ),
+    ],
+)
+def test_depth_batch(
+    servicer: BatchRecordingServicer,
+    device_fixture: Device,
+    format: XRCpuImage.Format,
+    depth: npt.NDArray[np.float32 | np.uint16],
+    expected: float,
+):
+    save(
+        servicer,
+        device_fixture,
+        [
+            ARFrame(
+                depth_frame=DepthFrame(
+                    device_timestamp=Timestamp(seconds=1),
+                    environment_depth_temporal_smoothing_enabled=True,
+                    image=XRCpuImage(
+                        dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+                        format=format,
+                        planes=[XRCpuImage.Plane(data=depth.tobytes())],
+                    ),
+                )
+            )
+        ],
+    )
+
+    (batch,) = servicer.depth_batches
+    assert batch.format == format
+    assert batch.smoothed
+    np.testing.assert_array_equal(batch.timestamps, [1_000_000_000])
+    assert batch.depth.dtype == np.float32
+    np.testing.assert_allclose(batch.depth, np.full((1, HEIGHT, WIDTH), expected))
+    assert not batch.depth.flags.writeable
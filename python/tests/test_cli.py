@@ -3,22 +3,48 @@
 # ruff:noqa: D103
 # pyright: reportPrivateUsage=false
 
+import json
 import logging
 import os
 import shlex
+import signal
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from arflow._admission import DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH
 from arflow._cli import (
+    _admission_controller,
+    _hook_executor,
     _prompt_until_valid_dir,
+    _toggle_tracing,
     parse_args,
     rerun,
     save,
     view,
 )
+from arflow._tracing import tracer
+from arflow._types import DepthCodec, OverflowPolicy
+
+
+def disable_optional_features(args: MagicMock) -> None:
+    for scope in ("device", "session", "total"):
+        setattr(args, f"{scope}_frame_rate", None)
+        setattr(args, f"{scope}_byte_rate", None)
+    args.rate_limit_burst = 1.0
+    args.metrics_port = None
+    args.trace_file = None
+    args.max_message_length = DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH
+    args.hook_workers = None
+    args.hook_concurrency = None
+    args.hook_max_pending = None
+    args.hook_drop_when_busy = False
+    args.point_cloud_budget = 0
+    args.depth_codec = DepthCodec.NONE
+    args.decode_workers = None
+    args.log_encoded_images = False
 
 
 # https://docs.pytest.org/en/stable/how-to/tmp_path.html#the-tmp-path-fixture
@@ -58,8 +84,14 @@ def test_view():
         patch("arflow._cli.ARFlowServicer") as mock_servicer,
     ):
         args = MagicMock()
+        disable_optional_features(args)
         args.port = 1234
         args.application_id = "test-id"
+        args.aio = False
+        args.workers = 1
+        args.ingest_queue_size = 8
+        args.overflow_policy = OverflowPolicy.REJECT
+        args.idle_timeout = 30.0
 
         view(args)
 
@@ -69,6 +101,17 @@ def test_view():
             save_dir=None,
             port=1234,
             application_id="test-id",
+            ingest_queue_size=8,
+            overflow_policy=OverflowPolicy.REJECT,
+            idle_timeout=30.0,
+            admission_controller=None,
+            metrics_port=None,
+            hook_executor=None,
+            log_encoded_images=False,
+            decode_workers=None,
+            depth_codec=DepthCodec.NONE,
+            point_cloud_budget=0,
+            max_message_length=DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
         )
 
 
@@ -78,9 +121,15 @@ def test_save():
         patch("arflow._cli.ARFlowServicer") as mock_servicer,
     ):
         args = MagicMock()
+        disable_optional_features(args)
         args.port = 1234
         args.save_dir = "/tmp/save_path"
         args.application_id = "test-id"
+        args.aio = False
+        args.workers = 1
+        args.ingest_queue_size = 8
+        args.overflow_policy = OverflowPolicy.REJECT
+        args.idle_timeout = 30.0
 
         save(args)
 
@@ -90,6 +139,157 @@ def test_save():
             save_dir=Path("/tmp/save_path"),
             port=1234,
             application_id="test-id",
+            ingest_queue_size=8,
+            overflow_policy=OverflowPolicy.REJECT,
+            idle_timeout=30.0,
+            admission_controller=None,
+            metrics_port=None,
+            hook_executor=None,
+            log_encoded_images=False,
+            decode_workers=None,
+            depth_codec=DepthCodec.NONE,
+            point_cloud_budget=0,
+            max_message_length=DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+        )
+
+
+def test_view_aio():
+    with (
+        patch("arflow._cli.run_async_server") as mock_run_async_server,
+        patch("arflow._cli.AsyncARFlowServicer") as mock_servicer,
+    ):
+        args = MagicMock()
+        disable_optional_features(args)
+        args.port = 1234
+        args.application_id = "test-id"
+        args.aio = True
+        args.idle_timeout = None
+
+        view(args)
+
+        mock_run_async_server.assert_called_once_with(
+            mock_servicer,
+            spawn_viewer=True,
+            save_dir=None,
+            port=1234,
+            application_id="test-id",
+            idle_timeout=None,
+            admission_controller=None,
+            metrics_port=None,
+            log_encoded_images=False,
+            decode_workers=None,
+            depth_codec=DepthCodec.NONE,
+            point_cloud_budget=0,
+            max_message_length=DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+        )
+
+
+def test_save_aio():
+    with (
+        patch("arflow._cli.run_async_server") as mock_run_async_server,
+        patch("arflow._cli.AsyncARFlowServicer") as mock_servicer,
+    ):
+        args = MagicMock()
+        disable_optional_features(args)
+        args.port = 1234
+        args.save_dir = "/tmp/save_path"
+        args.application_id = "test-id"
+        args.aio = True
+        args.idle_timeout = None
+
+        save(args)
+
+        mock_run_async_server.assert_called_once_with(
+            mock_servicer,
+            spawn_viewer=False,
+            save_dir=Path("/tmp/save_path"),
+            port=1234,
+            application_id="test-id",
+            idle_timeout=None,
+            admission_controller=None,
+            metrics_port=None,
+            log_encoded_images=False,
+            decode_workers=None,
+            depth_codec=DepthCodec.NONE,
+            point_cloud_budget=0,
+            max_message_length=DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+        )
+
+
+def test_view_sharded():
+    with (
+        patch("arflow._cli.run_sharded_server") as mock_run_sharded_server,
+        patch("arflow._cli.ARFlowServicer") as mock_servicer,
+    ):
+        args = MagicMock()
+        disable_optional_features(args)
+        args.port = 1234
+        args.application_id = "test-id"
+        args.aio = False
+        args.workers = 4
+        args.ingest_queue_size = 0
+        args.overflow_policy = OverflowPolicy.BLOCK
+        args.idle_timeout = 30.0
+
+        view(args)
+
+        mock_run_sharded_server.assert_called_once_with(
+            mock_servicer,
+            num_workers=4,
+            spawn_viewer=True,
+            save_dir=None,
+            port=1234,
+            application_id="test-id",
+            ingest_queue_size=0,
+            overflow_policy=OverflowPolicy.BLOCK,
+            idle_timeout=30.0,
+            admission_controller=None,
+            metrics_port=None,
+            hook_executor=None,
+            log_encoded_images=False,
+            decode_workers=None,
+            depth_codec=DepthCodec.NONE,
+            point_cloud_budget=0,
+            max_message_length=DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+        )
+
+
+def test_save_sharded():
+    with (
+        patch("arflow._cli.run_sharded_server") as mock_run_sharded_server,
+        patch("arflow._cli.ARFlowServicer") as mock_servicer,
+    ):
+        args = MagicMock()
+        disable_optional_features(args)
+        args.port = 1234
+        args.save_dir = "/tmp/save_path"
+        args.application_id = "test-id"
+        args.aio = False
+        args.workers = 4
+        args.ingest_queue_size = 0
+        args.overflow_policy = OverflowPolicy.BLOCK
+        args.idle_timeout = 30.0
+
+        save(args)
+
+        mock_run_sharded_server.assert_called_once_with(
+            mock_servicer,
+            num_workers=4,
+            spawn_viewer=False,
+            save_dir=Path("/tmp/save_path"),
+            port=1234,
+            application_id="test-id",
+            ingest_queue_size=0,
+            overflow_policy=OverflowPolicy.BLOCK,
+            idle_timeout=30.0,
+            admission_controller=None,
+            metrics_port=None,
+            hook_executor=None,
+            log_encoded_images=False,
+            decode_workers=None,
+            depth_codec=DepthCodec.NONE,
+            point_cloud_budget=0,
+            max_message_length=DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
         )
 
 
@@ -234,3 +434,292 @@ def test_parse_args(
         assert not hasattr(args, "port")
         assert not hasattr(args, "save_dir")
         assert not hasattr(args, "application_id")
+
+
+@pytest.mark.parametrize(
+    "command, aio",
+    [
+        ("view", False),
+        ("view --aio", True),
+        ("save", False),
+        ("save --aio", True),
+    ],
+)
+def test_parse_args_aio(command: str, aio: bool, tmp_path: Path):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.aio == aio
+
+
+@pytest.mark.parametrize(
+    "command, ingest_queue_size, overflow_policy",
+    [
+        ("view", 0, OverflowPolicy.BLOCK),
+        ("view --ingest-queue-size 8", 8, OverflowPolicy.BLOCK),
+        (
+            "save --ingest-queue-size 8 --overflow-policy drop_oldest",
+            8,
+            OverflowPolicy.DROP_OLDEST,
+        ),
+        ("save --overflow-policy reject", 0, OverflowPolicy.REJECT),
+    ],
+)
+def test_parse_args_ingest_queue(
+    command: str,
+    ingest_queue_size: int,
+    overflow_policy: OverflowPolicy,
+    tmp_path: Path,
+):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.ingest_queue_size == ingest_queue_size
+    assert args.overflow_policy == overflow_policy
+
+
+@pytest.mark.parametrize(
+    "command, metrics_port",
+    [("view", None), ("save --metrics-port 9090", 9090)],
+)
+def test_parse_args_metrics_port(
+    command: str, metrics_port: int | None, tmp_path: Path
+):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.metrics_port == metrics_port
+
+
+@pytest.mark.parametrize(
+    "command, trace_file",
+    [("view", None), ("save --trace-file trace.json", "trace.json")],
+)
+def test_parse_args_trace_file(command: str, trace_file: str | None, tmp_path: Path):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.trace_file == trace_file
+
+
+def test_view_with_trace_file(tmp_path: Path):
+    trace_file = tmp_path / "trace.json"
+
+    def run_server(*_: Any, **__: Any) -> None:
+        assert tracer.enabled
+        with tracer.span("stage"):
+            pass
+
+    with (
+        patch("arflow._cli.run_server", side_effect=run_server),
+        patch("arflow._cli.signal.signal") as mock_signal,
+    ):
+        args = MagicMock()
+        disable_optional_features(args)
+        args.aio = False
+        args.workers = 1
+        args.trace_file = str(trace_file)
+
+        try:
+            view(args)
+        finally:
+            tracer.clear()
+
+    assert not tracer.enabled
+    mock_signal.assert_called_once_with(signal.SIGUSR1, _toggle_tracing)
+    with trace_file.open() as f:
+        events = json.load(f)["traceEvents"]
+    assert [event["name"] for event in events if event["ph"] == "X"] == ["stage"]
+
+    _toggle_tracing()
+    assert tracer.enabled
+    _toggle_tracing()
+    assert not tracer.enabled
+
+
+@pytest.mark.parametrize(
+    "command, idle_timeout",
+    [
+        ("view", None),
+        ("view --idle-timeout 30", 30.0),
+        ("save --idle-timeout 0.5", 0.5),
+    ],
+)
+def test_parse_args_idle_timeout(
+    command: str, idle_timeout: float | None, tmp_path: Path
+):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.idle_timeout == idle_timeout
+
+
+@pytest.mark.parametrize(
+    "command, max_message_length",
+    [
+        ("view", DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH),
+        ("save --max-message-length 4194304", 4_194_304),
+    ],
+)
+def test_parse_args_max_message_length(
+    command: str, max_message_length: int, tmp_path: Path
+):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.max_message_length == max_message_length
+
+
+@pytest.mark.parametrize(
+    "command, workers",
+    [
+        ("view", 1),
+        ("view -w 4", 4),
+        ("save --workers 2", 2),
+    ],
+)
+def test_parse_args_workers(command: str, workers: int, tmp_path: Path):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.workers == workers
+
+
+def test_parse_args_aio_and_workers_are_exclusive(tmp_path: Path):
+    with (
+        patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)),
+        pytest.raises(SystemExit),
+    ):
+        parse_args(shlex.split("save --aio --workers 2"))
+
+
+def test_parse_args_rate_limits(tmp_path: Path):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(
+            shlex.split(
+                "save --device-frame-rate 30 --total-byte-rate 1e6 --rate-limit-burst 2"
+            )
+        )
+
+    admission_controller = _admission_controller(args)
+
+    assert admission_controller is not None
+    assert admission_controller.per_device is not None
+    assert admission_controller.per_device.frames_per_second == 30
+    assert admission_controller.per_device.bytes_per_second is None
+    assert admission_controller.per_device.burst_seconds == 2
+    assert admission_controller.per_session is None
+    assert admission_controller.total is not None
+    assert admission_controller.total.frames_per_second is None
+    assert admission_controller.total.bytes_per_second == 1e6
+
+
+def test_parse_args_without_rate_limits(tmp_path: Path):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split("view"))
+
+    assert _admission_controller(args) is None
+
+
+def test_parse_args_hooks(tmp_path: Path):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(
+            shlex.split(
+                "save --hook-workers 2 --hook-concurrency on_save_ar_frames=1 "
+                "--hook-concurrency on_save_synchronized_ar_frame=2 "
+                "--hook-max-pending 8 --hook-drop-when-busy"
+            )
+        )
+
+    hook_executor = _hook_executor(args)
+
+    assert hook_executor is not None
+    assert hook_executor.max_workers == 2
+    assert hook_executor.max_concurrency == {
+        "on_save_ar_frames": 1,
+        "on_save_synchronized_ar_frame": 2,
+    }
+    assert hook_executor.max_pending == 8
+    assert hook_executor.drop_when_busy
+    hook_executor.close()
+
+
+def test_parse_args_without_hooks(tmp_path: Path):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split("view"))
+
+    assert _hook_executor(args) is None
+
+
+@pytest.mark.parametrize(
+    "value", ["on_save_ar_frames", "=1", "on_save_ar_frames=", "on_save_ar_frames=x"]
+)
+def test_parse_args_rejects_malformed_hook_concurrency(value: str, tmp_path: Path):
+    with (
+        patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)),
+        pytest.raises(SystemExit),
+    ):
+        parse_args(["view", "--hook-concurrency", value])
+
+
+@pytest.mark.parametrize(
+    "command, log_encoded_images",
+    [
+        ("view", False),
+        ("save --log-encoded-images", True),
+    ],
+)
+def test_parse_args_log_encoded_images(
+    command: str, log_encoded_images: bool, tmp_path: Path
+):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.log_encoded_images == log_encoded_images
+
+
+@pytest.mark.parametrize(
+    "command, decode_workers",
+    [
+        ("view", None),
+        ("save --decode-workers 0", 0),
+        ("view --decode-workers 2", 2),
+    ],
+)
+def test_parse_args_decode_workers(
+    command: str, decode_workers: int | None, tmp_path: Path
+):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.decode_workers == decode_workers
+
+
+@pytest.mark.parametrize(
+    "command, depth_codec",
+    [
+        ("view", DepthCodec.NONE),
+        ("save --depth-codec uint16_mm", DepthCodec.UINT16_MILLIMETERS),
+    ],
+)
+def test_parse_args_depth_codec(command: str, depth_codec: DepthCodec, tmp_path: Path):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.depth_codec == depth_codec
+
+
+@pytest.mark.parametrize(
+    "command, point_cloud_budget",
+    [
+        ("view", 0),
+        ("save --point-cloud-budget 1000000", 1_000_000),
+    ],
+)
+def test_parse_args_point_cloud_budget(
+    command: str, point_cloud_budget: int, tmp_path: Path
+):
+    with patch("arflow._cli._prompt_until_valid_dir", return_value=str(tmp_path)):
+        _, args, _ = parse_args(shlex.split(command))
+
+    assert args.point_cloud_budget == point_cloud_budget
@@ -0,0 +1,123 @@
+"""Decode pool tests."""
+
+# ruff:noqa: D103
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from arflow import ARFlowMetrics, ARFlowServicer, DecodedFrameCache, DecodePool
+from arflow._decoded_frames import DecodedFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+from tests.conftest import TEST_APP_ID
+
+WIDTH = 4
+HEIGHT = 2
+
+
+def png_frame(value: int = 0) -> ColorFrame:
+    _, encoded = cv2.imencode(
+        ".png", np.full((HEIGHT, WIDTH, 3), value, dtype=np.uint8)
+    )
+    return ColorFrame(
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+            format=XRCpuImage.FORMAT_PNG_RGB24,
+            planes=[XRCpuImage.Plane(data=encoded.tobytes())],
+        ),
+    )
+
+
+def test_invalid_workers(tmp_path: Path):
+    with pytest.raises(ValueError):
+        DecodePool(max_workers=0)
+    with pytest.raises(ValueError):
+        ARFlowServicer(
+            spawn_viewer=False,
+            save_dir=tmp_path,
+            application_id=TEST_APP_ID,
+            decode_workers=-1,
+        )
+
+
+def test_frames_keep_their_order():
+    pool = DecodePool(max_workers=4)
+    cache = DecodedFrameCache()
+    decoded = [cache.get(png_frame(i)) for i in range(16)]
+    decoded[3].bgr()
+
+    stacked = pool.stack(decoded, "bgr")
+    pool.close()
+
+    assert stacked.shape == (16, HEIGHT, WIDTH, 3)
+    assert not stacked.flags.writeable
+    np.testing.assert_array_equal(stacked[:, 0, 0, 0], np.arange(16))
+    assert np.shares_memory(decoded[3].bgr(), stacked)
+    assert cache.misses == 16
+    assert cache.nbytes == stacked.nbytes
+    assert pool.decoded == 15
+    assert (pool.queued, pool.running) == (0, 0)
+
+
+def test_frames_are_decoded_concurrently():
+    pool = DecodePool(max_workers=2)
+    cache = DecodedFrameCache()
+    both_decoding = threading.Barrier(2, timeout=5)
+    both_checked = threading.Barrier(2, timeout=5)
+    saturations: list[float] = []
+    decode_bgr = DecodedFrame._decode_bgr  # pyright: ignore [reportPrivateUsage]
+
+    def wait_for_the_other(
+        frame: DecodedFrame, out: npt.NDArray[np.uint8] | None = None
+    ) -> tuple[npt.NDArray[np.uint8], bool]:
+        both_decoding.wait()
+        saturations.append(pool.saturation)
+        both_checked.wait()
+        return decode_bgr(frame, out)
+
+    with patch.object(DecodedFrame, "_decode_bgr", wait_for_the_other):
+        stacked = pool.stack([cache.get(png_frame(i)) for i in range(2)], "bgr")
+    pool.close()
+
+    np.testing.assert_array_equal(stacked[:, 0, 0, 0], [0, 1])
+    assert saturations == [1.0, 1.0]
+    assert pool.saturation == 0.0
+
+
+def test_invalid_frames_raise():
+    pool = DecodePool(max_workers=2)
+    cache = DecodedFrameCache()
+    frame = png_frame()
+    frame.image.format = XRCpuImage.FORMAT_JPEG_RGB24
+    frame.image.planes[0].data = b"not a jpeg"
+
+    with pytest.raises(ValueError):
+        pool.stack([cache.get(png_frame()), cache.get(frame)], "bgr")
+    pool.close()
+
+    assert (pool.queued, pool.running, pool.decoded) == (0, 0, 1)
+    with pytest.raises(RuntimeError):
+        pool.stack([cache.get(png_frame())], "bgr")
+
+
+def test_saturation_metrics(tmp_path: Path):
+    metrics = ARFlowMetrics()
+    servicer = ARFlowServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        metrics=metrics,
+        decode_workers=2,
+    )
+    servicer.on_server_exit()
+
+    rendered = metrics.render()
+    assert 'arflow_decode_pool_frames{state="queued"} 0' in rendered
+    assert 'arflow_decode_pool_frames{state="running"} 0' in rendered
+    assert "arflow_decode_pool_saturation 0" in rendered
@@ -0,0 +1,297 @@
+"""Decoded frame cache tests."""
+
+# ruff:noqa: D101,D102,D103,D107
+from pathlib import Path
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import (
+    ARFlowServicer,
+    ColorBatch,
+    DecodedFrameCache,
+    SessionStream,
+    YuvLayout,
+)
+from arflow._decoded_frames import DecodedFrame, stack_decoded, stack_yuv
+from arflow._yuv import YuvBufferPool
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+from tests.conftest import TEST_APP_ID
+
+WIDTH = 4
+HEIGHT = 2
+
+
+def rgb_frame(value: int = 0) -> ColorFrame:
+    return ColorFrame(
+        device_timestamp=Timestamp(seconds=0),
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+            format=XRCpuImage.FORMAT_RGB24,
+            planes=[XRCpuImage.Plane(data=bytes([value]) * (WIDTH * HEIGHT * 3))],
+        ),
+    )
+
+
+def png_frame(value: int = 0) -> ColorFrame:
+    _, encoded = cv2.imencode(
+        ".png", np.full((HEIGHT, WIDTH, 3), value, dtype=np.uint8)
+    )
+    return ColorFrame(
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+            format=XRCpuImage.FORMAT_PNG_RGB24,
+            planes=[XRCpuImage.Plane(data=encoded.tobytes())],
+        ),
+    )
+
+
+def nv12_frame() -> ColorFrame:
+    """A frame whose chroma planes view one interleaved buffer, the way Android cameras send them."""
+    chroma = bytes([100, 200, 101, 201])
+    return ColorFrame(
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+            format=XRCpuImage.FORMAT_ANDROID_YUV_420_888,
+            planes=[
+                XRCpuImage.Plane(
+                    data=bytes(range(WIDTH * HEIGHT)), row_stride=WIDTH, pixel_stride=1
+                ),
+                XRCpuImage.Plane(data=chroma[:-1], row_stride=WIDTH, pixel_stride=2),
+                XRCpuImage.Plane(data=chroma[1:], row_stride=WIDTH, pixel_stride=2),
+            ],
+        ),
+    )
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        DecodedFrameCache(max_bytes=-1)
+
+
+def test_representations_are_decoded_once():
+    cache = DecodedFrameCache()
+    frame = png_frame()
+
+    decoded = cache.get(frame)
+    assert cache.get(frame) is decoded
+    bgr = decoded.bgr()
+    rgb = decoded.rgb()
+
+    assert bgr.shape == rgb.shape == (HEIGHT, WIDTH, 3)
+    assert not rgb.flags.writeable
+    assert cache.get(frame).bgr() is bgr
+    assert cache.get(frame).rgb() is rgb
+    assert cache.misses == 2
+    # RGB is converted from the cached BGR.
+    assert cache.hits == 3
+    assert cache.nbytes == bgr.nbytes + rgb.nbytes
+
+
+def test_views_of_the_frame_are_not_charged():
+    cache = DecodedFrameCache()
+    frame = DepthFrame(
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+            format=XRCpuImage.FORMAT_DEPTHFLOAT32,
+            planes=[
+                XRCpuImage.Plane(
+                    data=np.full((HEIGHT, WIDTH), 2.0, dtype=np.float32).tobytes()
+                )
+            ],
+        )
+    )
+
+    np.testing.assert_array_equal(cache.get(frame).depth(), 2.0)
+    assert cache.nbytes == 0
+
+
+def test_unsupported_representation():
+    decoded = DecodedFrameCache().get(rgb_frame())
+
+    with pytest.raises(ValueError):
+        decoded.i420()
+    with pytest.raises(ValueError):
+        decoded.depth()
+
+
+def test_unsupported_color_format():
+    frame = rgb_frame()
+    frame.image.format = XRCpuImage.FORMAT_DEPTHUINT16
+    decoded = DecodedFrameCache().get(frame)
+
+    with pytest.raises(ValueError):
+        decoded.nv12()
+    with pytest.raises(ValueError):
+        decoded.rgb()
+    with pytest.raises(ValueError):
+        decoded.bgr()
+
+
+def test_rgb_frames_convert_to_bgr():
+    decoded = DecodedFrameCache().get(rgb_frame(7))
+    rgb = np.arange(WIDTH * HEIGHT * 3, dtype=np.uint8)
+    decoded.frame.image.planes[0].data = rgb.tobytes()
+
+    np.testing.assert_array_equal(
+        decoded.bgr(), rgb.reshape((HEIGHT, WIDTH, 3))[..., ::-1]
+    )
+
+
+def test_nv12_frames():
+    cache = DecodedFrameCache()
+    decoded = cache.get(nv12_frame())
+
+    nv12 = decoded.nv12()
+    rgb = decoded.rgb()
+
+    np.testing.assert_array_equal(
+        nv12, list(range(WIDTH * HEIGHT)) + [100, 200, 101, 201]
+    )
+    # RGB is converted from the cached NV12 planes.
+    np.testing.assert_array_equal(
+        rgb,
+        cv2.cvtColor(
+            np.array(
+                list(range(WIDTH * HEIGHT)) + [100, 101, 200, 201], dtype=np.uint8
+            ).reshape((HEIGHT * 3 // 2, WIDTH)),
+            cv2.COLOR_YUV2RGB_I420,
+        ),
+    )
+    assert cache.misses == 2
+    assert cache.hits == 1
+    with pytest.raises(ValueError):
+        DecodedFrameCache().get(rgb_frame()).nv12()
+
+
+def test_least_recently_used_frames_are_evicted():
+    frame_bytes = WIDTH * HEIGHT * 3
+    cache = DecodedFrameCache(max_bytes=2 * frame_bytes)
+    frames = [png_frame(i) for i in range(3)]
+
+    cache.get(frames[0]).bgr()
+    cache.get(frames[1]).bgr()
+    cache.get(frames[0]).bgr()
+    cache.get(frames[2]).bgr()
+
+    assert cache.evictions == 1
+    assert cache.nbytes == 2 * frame_bytes
+    assert len(cache) == 2
+    cache.get(frames[0]).bgr()
+    assert cache.misses == 3
+
+
+def test_release():
+    cache = DecodedFrameCache()
+    frames = [png_frame(i) for i in range(2)]
+    for frame in frames:
+        cache.get(frame).bgr()
+
+    cache.release(frames[:1])
+
+    assert len(cache) == 1
+    assert cache.nbytes == WIDTH * HEIGHT * 3
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_stacked_representation_is_shared():
+    cache = DecodedFrameCache()
+    decoded = [cache.get(png_frame(i)) for i in range(2)]
+    decoded[0].bgr()
+
+    stacked = stack_decoded(decoded, "bgr")
+
+    assert stacked.shape == (2, HEIGHT, WIDTH, 3)
+    assert cache.misses == 2
+    assert np.shares_memory(decoded[0].bgr(), stacked)
+    assert cache.nbytes == stacked.nbytes
+
+
+def test_stacked_yuv_frames_share_their_rows():
+    cache = DecodedFrameCache()
+    decoded = [cache.get(nv12_frame()) for _ in range(2)]
+    nv12 = decoded[0].nv12()
+    i420 = stack_decoded(decoded, "i420")
+
+    layout, stacked = stack_yuv(decoded, YuvBufferPool())
+
+    assert layout == YuvLayout.NV12
+    np.testing.assert_array_equal(stacked, [nv12, nv12])
+    # The frame that had NV12 decoded already is copied into its row.
+    assert cache.misses == 4
+    assert all(np.shares_memory(frame.nv12(), stacked) for frame in decoded)
+    assert all(np.shares_memory(frame.i420(), i420) for frame in decoded)
+
+
+def test_stacked_frames_are_decoded_into_their_rows():
+    cache = DecodedFrameCache()
+    frames = [
+        DepthFrame(
+            image=XRCpuImage(
+                dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+                format=XRCpuImage.FORMAT_DEPTHUINT16,
+                planes=[
+                    XRCpuImage.Plane(
+                        data=np.full((HEIGHT, WIDTH), i, dtype=np.uint16).tobytes()
+                    )
+                ],
+            )
+        )
+        for i in (1500, 250)
+    ]
+    decoded = [cache.get(frame) for frame in frames]
+
+    # No frame is decoded into an array of its own first.
+    with patch.object(DecodedFrame, "_get", side_effect=AssertionError):
+        stacked = stack_decoded(decoded, "depth")
+
+    np.testing.assert_array_equal(
+        stacked[:, 0, 0], np.array([1.5, 0.25], dtype=np.float32)
+    )
+    assert cache.misses == 2
+    assert cache.nbytes == stacked.nbytes
+    assert all(np.shares_memory(frame.depth(), stacked) for frame in decoded)
+
+
+def test_hooks_share_decoded_frames_until_released(
+    tmp_path: Path, device_fixture: Device
+):
+    seen: list[bool] = []
+
+    class SharingServicer(ARFlowServicer):
+        def on_save_color_batch(
+            self, batch: ColorBatch, session_stream: SessionStream, device: Device
+        ) -> None:
+            (decoded,) = batch.decoded_frames
+            assert session_stream.decoded_frames.get(decoded.frame) is decoded
+            seen.append(np.shares_memory(decoded.rgb(), batch.images))
+
+    servicer = SharingServicer(
+        spawn_viewer=False, save_dir=tmp_path, application_id=TEST_APP_ID
+    )
+    session = servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+    servicer.SaveARFrames(
+        SaveARFramesRequest(
+            session_id=session.id,
+            device=device_fixture,
+            frames=[ARFrame(color_frame=rgb_frame())],
+        )
+    )
+    servicer.on_server_exit()
+
+    assert seen == [True]
+    assert len(servicer.client_sessions[session.id.value].decoded_frames) == 0
@@ -0,0 +1,237 @@
+"""Hook executor tests."""
+
+# ruff:noqa: D103
+import pickle
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import ARFlowMetrics, ARFlowServicer, HookExecutor, SessionStream
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from tests.conftest import TEST_APP_ID
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_workers": 0},
+        {"max_concurrency": {"hook": 0}},
+        {"max_pending": 0},
+        {"drop_when_busy": True},
+    ],
+)
+def test_invalid_arguments(kwargs: dict[str, Any]):
+    with pytest.raises(ValueError):
+        HookExecutor(**kwargs)
+
+
+def test_calls_of_a_key_run_in_order():
+    executor = HookExecutor(max_workers=4)
+    calls: list[tuple[str, int]] = []
+    running: set[str] = set()
+    overlapped = False
+
+    def hook(key: str, index: int) -> None:
+        nonlocal overlapped
+        if key in running:
+            overlapped = True
+        running.add(key)
+        time.sleep(0.001)
+        calls.append((key, index))
+        running.discard(key)
+
+    for index in range(20):
+        for key in ("a", "b"):
+            assert executor.submit(key, "hook", hook, key, index)
+    executor.close()
+
+    assert not overlapped
+    for key in ("a", "b"):
+        assert [index for k, index in calls if k == key] == list(range(20))
+    stats = executor.stats()["hook"]
+    assert stats.submitted == stats.completed == 40
+    assert stats.backlog == 0
+    assert stats.run_time >= 40 * 0.001
+    assert stats.max_run_time >= 0.001
+
+
+def test_keys_run_concurrently():
+    executor = HookExecutor(max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+
+    executor.submit("a", "hook", barrier.wait)
+    executor.submit("b", "hook", barrier.wait)
+    executor.close()
+
+    assert executor.stats()["hook"].completed == 2
+
+
+def test_concurrency_limit():
+    executor = HookExecutor(max_workers=4, max_concurrency={"slow": 1})
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def slow() -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.005)
+        with lock:
+            running -= 1
+
+    for key in ("a", "b", "c", "d"):
+        executor.submit(key, "slow", slow)
+    executor.close()
+
+    assert max_running == 1
+    assert executor.stats()["slow"].completed == 4
+
+
+def test_drop_when_busy():
+    executor = HookExecutor(max_workers=1, max_pending=1, drop_when_busy=True)
+    release = threading.Event()
+
+    assert executor.submit("a", "hook", release.wait, 5)
+    # Wait for the first call to start so that the second one is pending.
+    while executor.stats()["hook"].running == 0:
+        time.sleep(0.001)
+    assert executor.submit("a", "hook", release.wait, 5)
+    assert not executor.submit("a", "hook", release.wait, 5)
+    assert executor.submit("b", "hook", release.wait, 5)
+    assert executor.backlog == 3
+    release.set()
+    executor.close()
+
+    stats = executor.stats()["hook"]
+    assert stats.submitted == 3
+    assert stats.completed == 3
+    assert stats.dropped == 1
+
+
+def test_full_backlog_blocks_without_drop():
+    executor = HookExecutor(max_workers=1, max_pending=1)
+    release = threading.Event()
+    executor.submit("a", "hook", release.wait, 5)
+    while executor.stats()["hook"].running == 0:
+        time.sleep(0.001)
+    executor.submit("a", "hook", release.wait, 5)
+
+    blocked = threading.Thread(
+        target=executor.submit, args=("a", "hook", release.wait, 5)
+    )
+    blocked.start()
+    blocked.join(timeout=0.05)
+    assert blocked.is_alive()
+    release.set()
+    blocked.join(timeout=5)
+    assert not blocked.is_alive()
+    executor.close()
+
+    assert executor.stats()["hook"].completed == 3
+
+
+def test_failed_calls_are_counted_and_logged(caplog: pytest.LogCaptureFixture):
+    executor = HookExecutor(max_workers=1)
+
+    def fail() -> None:
+        raise RuntimeError("Hook failed")
+
+    executor.submit("a", "fail", fail)
+    executor.submit("a", "ok", lambda: None)
+    executor.close()
+
+    assert executor.stats()["fail"].failed == 1
+    assert executor.stats()["ok"].completed == 1
+    assert "Hook fail failed" in caplog.text
+
+
+def test_submit_after_close():
+    executor = HookExecutor(max_workers=1)
+    executor.close()
+
+    with pytest.raises(RuntimeError):
+        executor.submit("a", "hook", lambda: None)
+
+
+def test_pickled_executor_keeps_its_limits():
+    executor = HookExecutor(
+        max_workers=2, max_concurrency={"hook": 1}, max_pending=3, drop_when_busy=True
+    )
+    executor.submit("a", "hook", lambda: None)
+
+    copy = pickle.loads(pickle.dumps(executor))
+
+    assert copy is not executor
+    assert copy.max_workers == 2
+    assert copy.max_concurrency == {"hook": 1}
+    assert copy.max_pending == 3
+    assert copy.drop_when_busy
+    assert copy.stats() == {}
+    copy.close()
+    executor.close()
+
+
+def test_servicer_runs_hooks_on_executor(tmp_path: Path, device_fixture: Device):
+    release = threading.Event()
+    hook_threads: list[str] = []
+
+    class SlowHookServicer(ARFlowServicer):
+        def on_save_transform_frames(
+            self,
+            frames: Sequence[TransformFrame],
+            session_stream: SessionStream,
+            device: Device,
+        ) -> None:
+            hook_threads.append(threading.current_thread().name)
+            release.wait(5)
+
+    metrics = ARFlowMetrics()
+    servicer = SlowHookServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        metrics=metrics,
+        hook_executor=HookExecutor(max_workers=2),
+    )
+    assert servicer.hook_executor is not None
+    session = servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+    request = SaveARFramesRequest(
+        session_id=session.id,
+        device=device_fixture,
+        frames=[
+            ARFrame(
+                transform_frame=TransformFrame(
+                    device_timestamp=Timestamp(seconds=0, nanos=0),
+                    data=np.random.rand(12).astype(np.float32).tobytes(),
+                )
+            )
+        ],
+    )
+
+    # Returns while the hook is still running.
+    servicer.SaveARFrames(request)
+    servicer.SaveARFrames(request)
+    assert servicer.hook_executor.backlog >= 2
+    assert 'arflow_hook_backlog{hook="on_save_transform_frames"}' in metrics.render()
+    release.set()
+    servicer.on_server_exit()
+
+    stats = servicer.hook_executor.stats()
+    assert stats["on_save_transform_frames"].completed == 2
+    assert stats["on_save_ar_frames"].completed == 2
+    assert all(name.startswith("arflow-hook") for name in hook_threads)
+    assert metrics.hook_duration.count(("on_save_transform_frames",)) == 2
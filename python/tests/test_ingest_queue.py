@@ -0,0 +1,114 @@
+"""Session ingest queue tests."""
+
+# ruff:noqa: D103
+import threading
+
+import pytest
+from grpc_interceptor.exceptions import NotFound, ResourceExhausted
+
+from arflow._ingest_queue import IngestQueue
+from arflow._types import OverflowPolicy
+
+
+def blocked_queue(
+    maxsize: int, overflow_policy: OverflowPolicy
+) -> tuple[IngestQueue, threading.Event]:
+    """Return a queue whose consumer is stuck on its first item until the event is set."""
+    release = threading.Event()
+    started = threading.Event()
+    queue = IngestQueue(
+        name="test-ingest", maxsize=maxsize, overflow_policy=overflow_policy
+    )
+
+    def wait_for_release() -> None:
+        started.set()
+        release.wait()
+
+    queue.put(wait_for_release)
+    started.wait()
+    return queue, release
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        IngestQueue(name="test-ingest", maxsize=0)
+
+
+def test_items_run_in_order():
+    queue = IngestQueue(name="test-ingest", maxsize=4)
+    processed: list[int] = []
+    for i in range(10):
+        queue.put(lambda i=i: processed.append(i))
+    queue.join()
+    assert processed == list(range(10))
+    assert queue.depth == 0
+    queue.close()
+
+
+def test_depth():
+    queue, release = blocked_queue(4, OverflowPolicy.BLOCK)
+    queue.put(lambda: None)
+    queue.put(lambda: None)
+    assert queue.depth == 2
+    release.set()
+    queue.join()
+    assert queue.depth == 0
+    queue.close()
+
+
+def test_reject_when_full():
+    queue, release = blocked_queue(1, OverflowPolicy.REJECT)
+    queue.put(lambda: None)
+    with pytest.raises(ResourceExhausted):
+        queue.put(lambda: None)
+    release.set()
+    queue.close()
+
+
+def test_drop_oldest_when_full():
+    queue, release = blocked_queue(2, OverflowPolicy.DROP_OLDEST)
+    processed: list[int] = []
+    for i in range(4):
+        queue.put(lambda i=i: processed.append(i))
+    assert queue.dropped == 2
+    release.set()
+    queue.close()
+    assert processed == [2, 3]
+
+
+def test_block_when_full():
+    queue, release = blocked_queue(1, OverflowPolicy.BLOCK)
+    processed: list[int] = []
+    queue.put(lambda: processed.append(0))
+    producer = threading.Thread(target=queue.put, args=(lambda: processed.append(1),))
+    producer.start()
+    producer.join(timeout=0.1)
+    assert producer.is_alive()
+    release.set()
+    producer.join()
+    queue.close()
+    assert processed == [0, 1]
+
+
+def test_failing_item_does_not_stop_consumer():
+    queue = IngestQueue(name="test-ingest", maxsize=2)
+    processed: list[int] = []
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    queue.put(fail)
+    queue.put(lambda: processed.append(1))
+    queue.close()
+    assert processed == [1]
+
+
+def test_close_flushes_and_rejects_new_items():
+    queue, release = blocked_queue(4, OverflowPolicy.BLOCK)
+    processed: list[int] = []
+    queue.put(lambda: processed.append(1))
+    release.set()
+    queue.close()
+    assert processed == [1]
+    with pytest.raises(NotFound):
+        queue.put(lambda: None)
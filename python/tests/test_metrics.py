@@ -0,0 +1,290 @@
+"""Metrics tests."""
+
+# ruff:noqa: D103
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+import asyncio
+import urllib.error
+import urllib.request
+from collections.abc import AsyncIterator, Iterator
+from concurrent import futures
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import grpc
+import numpy as np
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+from grpc_interceptor.exceptions import NotFound
+
+from arflow import ARFlowMetrics, ARFlowServicer
+from arflow._error_interceptor import ErrorInterceptor
+from arflow._metrics import Counter, Histogram, start_metrics_server
+from arflow._metrics_interceptor import AsyncMetricsInterceptor, MetricsInterceptor
+from cakelab.arflow_grpc.v1 import arflow_service_pb2_grpc
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.arflow_service_pb2_grpc import ARFlowServiceStub
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.get_session_request_pb2 import GetSessionRequest
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.session_pb2 import SessionUuid
+from cakelab.arflow_grpc.v1.stream_ar_frames_request_pb2 import StreamARFramesRequest
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+from tests.conftest import TEST_APP_ID
+
+
+def test_counter_render():
+    counter = Counter("frames_total", "Frames.", label_names=("type",))
+    counter.inc(2, ("color",))
+    counter.inc(1, ("color",))
+    counter.inc(1, ('de"pth',))
+
+    assert counter.render() == [
+        "# HELP frames_total Frames.",
+        "# TYPE frames_total counter",
+        'frames_total{type="color"} 3.0',
+        'frames_total{type="de\\"pth"} 1.0',
+    ]
+
+
+def test_histogram_render():
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.count() == 4
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1.0"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 2.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_metrics_server():
+    metrics = ARFlowMetrics()
+    metrics.add_gauge("answer", "The answer.", lambda: [((), 42)])
+    server = start_metrics_server(metrics, port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            body = response.read().decode()
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"{url}/other")
+        assert excinfo.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "# TYPE arflow_rpc_duration_seconds histogram" in body
+    assert "answer 42.0" in body
+
+
+def test_servicer_metrics(tmp_path: Path, device_fixture: Device):
+    metrics = ARFlowMetrics()
+    servicer = ARFlowServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        ingest_queue_size=4,
+        metrics=metrics,
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=2),
+        interceptors=[ErrorInterceptor(), MetricsInterceptor(metrics)],  # pyright: ignore [reportArgumentType]
+    )
+    arflow_service_pb2_grpc.add_ARFlowServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("[::]:0")
+    server.start()
+
+    transform_frame = ARFrame(
+        transform_frame=TransformFrame(
+            device_timestamp=Timestamp(seconds=0, nanos=0),
+            data=np.random.rand(12).astype(np.float32).tobytes(),
+        )
+    )
+    color_frame = ARFrame(
+        color_frame=ColorFrame(
+            device_timestamp=Timestamp(seconds=0, nanos=0),
+            image=XRCpuImage(
+                dimensions=Vector2Int(x=4, y=2),
+                format=XRCpuImage.FORMAT_RGB24,
+                planes=[XRCpuImage.Plane(data=bytes(4 * 2 * 3))],
+            ),
+        )
+    )
+    try:
+        with grpc.insecure_channel(f"localhost:{port}") as channel:
+            stub = ARFlowServiceStub(channel)
+            session = stub.CreateSession(
+                CreateSessionRequest(device=device_fixture)
+            ).session
+            stub.SaveARFrames(
+                SaveARFramesRequest(
+                    session_id=session.id,
+                    device=device_fixture,
+                    frames=[transform_frame, color_frame, transform_frame],
+                )
+            )
+            list(
+                stub.StreamARFrames(
+                    iter(
+                        [
+                            StreamARFramesRequest(
+                                session_id=session.id,
+                                device=device_fixture,
+                                frames=[transform_frame],
+                            )
+                        ]
+                    )
+                )
+            )
+            with pytest.raises(grpc.RpcError):
+                stub.GetSession(
+                    GetSessionRequest(session_id=SessionUuid(value="nonexistent"))
+                )
+            ingest_queue = servicer.client_sessions[session.id.value].ingest_queue
+            assert ingest_queue is not None
+            ingest_queue.join()
+            rendered = metrics.render()
+    finally:
+        server.stop(None)
+        servicer.on_server_exit()
+
+    assert metrics.rpc_duration.count(("CreateSession", "OK")) == 1
+    assert metrics.rpc_duration.count(("SaveARFrames", "OK")) == 1
+    assert metrics.rpc_duration.count(("StreamARFrames", "OK")) == 1
+    assert metrics.rpc_duration.count(("GetSession", "NOT_FOUND")) == 1
+    assert metrics.frames_received.value(("transform_frame",)) == 3
+    assert metrics.frames_received.value(("color_frame",)) == 1
+    assert (
+        metrics.frame_bytes_received.value(("color_frame",))
+        == color_frame.color_frame.ByteSize()
+    )
+    assert metrics.decode_duration.count(("FORMAT_RGB24",)) == 1
+    assert metrics.send_columns_duration.count() > 0
+    assert "arflow_sessions 1.0" in rendered
+    assert f'arflow_ingest_queue_depth{{session="{session.id.value}"}} 0.0' in rendered
+
+
+METHOD_NAME = "/cakelab.arflow_grpc.v1.ARFlowService/Method"
+
+
+def test_interceptor_records_failed_rpcs():
+    metrics = ARFlowMetrics()
+    interceptor = MetricsInterceptor(metrics)
+
+    def not_found(request: Any, context: Any) -> Any:
+        raise NotFound("nope")
+
+    def broken(request: Any, context: Any) -> Any:
+        raise RuntimeError("boom")
+
+    with pytest.raises(NotFound):
+        interceptor.intercept(not_found, None, MagicMock(), METHOD_NAME)
+    with pytest.raises(RuntimeError):
+        interceptor.intercept(broken, None, MagicMock(), METHOD_NAME)
+
+    assert metrics.rpc_duration.count(("Method", "NOT_FOUND")) == 1
+    assert metrics.rpc_duration.count(("Method", "UNKNOWN")) == 1
+
+
+def test_interceptor_times_response_streams_until_they_end():
+    metrics = ARFlowMetrics()
+    interceptor = MetricsInterceptor(metrics)
+
+    def stream(request: Any, context: Any) -> Iterator[int]:
+        yield 1
+        yield 2
+
+    def failing_stream(request: Any, context: Any) -> Iterator[int]:
+        yield 1
+        raise NotFound("nope")
+
+    responses = interceptor.intercept(stream, None, MagicMock(), METHOD_NAME)
+    assert next(responses) == 1
+    assert metrics.rpc_duration.count() == 0
+    assert list(responses) == [2]
+    assert metrics.rpc_duration.count(("Method", "OK")) == 1
+
+    with pytest.raises(NotFound):
+        list(interceptor.intercept(failing_stream, None, MagicMock(), METHOD_NAME))
+    assert metrics.rpc_duration.count(("Method", "NOT_FOUND")) == 1
+
+    # The client goes away before the stream ends.
+    responses = interceptor.intercept(stream, None, MagicMock(), METHOD_NAME)
+    next(responses)
+    responses.close()
+    assert metrics.rpc_duration.count(("Method", "CANCELLED")) == 1
+
+
+def test_async_interceptor_records_unary_rpcs():
+    metrics = ARFlowMetrics()
+    interceptor = AsyncMetricsInterceptor(metrics)
+
+    async def ok(request: Any, context: Any) -> str:
+        return "response"
+
+    async def not_found(request: Any, context: Any) -> str:
+        raise NotFound("nope")
+
+    async def main() -> None:
+        assert (
+            await interceptor.intercept(ok, None, MagicMock(), METHOD_NAME)
+            == "response"
+        )
+        with pytest.raises(NotFound):
+            await interceptor.intercept(not_found, None, MagicMock(), METHOD_NAME)
+
+    asyncio.run(main())
+
+    assert metrics.rpc_duration.count(("Method", "OK")) == 1
+    assert metrics.rpc_duration.count(("Method", "NOT_FOUND")) == 1
+
+
+def test_async_interceptor_times_response_streams_until_they_end():
+    metrics = ARFlowMetrics()
+    interceptor = AsyncMetricsInterceptor(metrics)
+
+    async def stream(request: Any, context: Any) -> AsyncIterator[int]:
+        yield 1
+        yield 2
+
+    async def failing_stream(request: Any, context: Any) -> AsyncIterator[int]:
+        yield 1
+        raise NotFound("nope")
+
+    async def endless_stream(request: Any, context: Any) -> AsyncIterator[int]:
+        while True:
+            yield 1
+            await asyncio.sleep(0)
+
+    async def consume(method: Any) -> list[int]:
+        responses = await interceptor.intercept(method, None, MagicMock(), METHOD_NAME)
+        return [response async for response in responses]
+
+    async def main() -> None:
+        assert await consume(stream) == [1, 2]
+        assert metrics.rpc_duration.count(("Method", "OK")) == 1
+
+        with pytest.raises(NotFound):
+            await consume(failing_stream)
+        assert metrics.rpc_duration.count(("Method", "NOT_FOUND")) == 1
+
+        # The client goes away before the stream ends.
+        task = asyncio.create_task(consume(endless_stream))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert metrics.rpc_duration.count(("Method", "CANCELLED")) == 1
+
+    asyncio.run(main())
@@ -0,0 +1,187 @@
+"""Point cloud store tests."""
+
+# ruff:noqa: D103
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from arflow import ARFlowServicer, PointCloudStore
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from tests.conftest import TEST_APP_ID
+
+NO_CONFIDENCE = np.empty(0, dtype=np.float32)
+
+
+def cloud(
+    identifiers: list[int], offset: float = 0.0
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.uint64]]:
+    positions = np.repeat(
+        np.array(identifiers, dtype=np.float32)[:, np.newaxis], 3, axis=1
+    )
+    return positions + offset, np.array(identifiers, dtype=np.uint64)
+
+
+def test_invalid_store(tmp_path: Path):
+    with pytest.raises(ValueError):
+        PointCloudStore(max_points=-1)
+    with pytest.raises(ValueError):
+        PointCloudStore(epsilon=-1.0)
+    with pytest.raises(ValueError):
+        PointCloudStore(chunk_size=0)
+    with pytest.raises(ValueError):
+        ARFlowServicer(
+            spawn_viewer=False,
+            save_dir=tmp_path,
+            application_id=TEST_APP_ID,
+            point_cloud_budget=-1,
+        )
+
+
+def test_unchanged_points_are_not_logged_again():
+    store = PointCloudStore(epsilon=0.01, chunk_size=4)
+    positions, identifiers = cloud(list(range(10)))
+
+    first = store.update("cloud", positions, identifiers, NO_CONFIDENCE)
+    assert first.cleared
+    assert [chunk.index for chunk in first.chunks] == [0, 1, 2]
+    assert first.added == 10
+
+    order = np.arange(10)[::-1]
+    again = store.update(
+        "cloud", positions[order] + 0.001, identifiers[order], NO_CONFIDENCE
+    )
+    assert not again.cleared
+    assert again.chunks == []
+    assert (again.added, again.moved, again.removed) == (0, 0, 0)
+
+
+def test_changed_points_log_their_chunks():
+    store = PointCloudStore(epsilon=0.01, chunk_size=4)
+    store.update("cloud", *cloud(list(range(10))), NO_CONFIDENCE)
+
+    positions, identifiers = cloud([0, 2, 3, 4, 5, 6, 7, 8, 9, 100])
+    positions[4] += 1.0
+    changes = store.update("cloud", positions, identifiers, NO_CONFIDENCE)
+
+    assert (changes.added, changes.moved, changes.removed) == (1, 1, 1)
+    assert [chunk.index for chunk in changes.chunks] == [0, 1]
+    # The added point takes the slot of the removed one.
+    assert changes.chunks[0].identifiers.tolist() == [0, 100, 2, 3]
+    assert changes.chunks[1].positions[1].tolist() == [6.0, 6.0, 6.0]
+    assert store.num_points == 12
+
+
+def test_points_moved_within_epsilon_keep_their_logged_position():
+    store = PointCloudStore(epsilon=0.01, chunk_size=4)
+    store.update("cloud", *cloud([1, 2]), NO_CONFIDENCE)
+    store.update("cloud", *cloud([1, 2], offset=0.006), NO_CONFIDENCE)
+
+    changes = store.update("cloud", *cloud([1, 2], offset=0.012), NO_CONFIDENCE)
+
+    (chunk,) = changes.chunks
+    np.testing.assert_allclose(chunk.positions, cloud([1, 2], offset=0.012)[0])
+
+
+def test_removed_chunks_are_emptied_and_released():
+    store = PointCloudStore(chunk_size=2)
+    store.update("cloud", *cloud([1, 2, 3, 4]), np.ones(4, dtype=np.float32))
+
+    changes = store.update("cloud", *cloud([1, 2]), np.ones(2, dtype=np.float32))
+
+    (chunk,) = changes.chunks
+    assert chunk.index == 1
+    assert len(chunk) == 0
+    assert store.num_points == 2
+
+
+def test_changed_style_logs_the_cloud_again():
+    store = PointCloudStore(chunk_size=2)
+    store.update("cloud", *cloud([1, 2, 3]), NO_CONFIDENCE, style=True)
+
+    changes = store.update("cloud", *cloud([1, 2, 3]), NO_CONFIDENCE, style=False)
+
+    assert changes.cleared
+    assert [chunk.index for chunk in changes.chunks] == [0, 1]
+
+
+def test_clouds_without_distinct_identifiers_are_not_remembered():
+    store = PointCloudStore(chunk_size=2)
+    positions, _ = cloud([1, 2, 3])
+
+    without = store.update(
+        "cloud", positions, np.empty(0, dtype=np.uint64), NO_CONFIDENCE
+    )
+    duplicated = store.update(
+        "cloud", positions, np.array([5, 4, 5], dtype=np.uint64), NO_CONFIDENCE
+    )
+
+    assert without.cleared and duplicated.cleared
+    # Logged whole, as one chunk.
+    assert [len(chunk) for chunk in without.chunks] == [3]
+    assert len(without.chunks[0].identifiers) == 0
+    assert duplicated.chunks[0].identifiers.tolist() == [5, 4, 5]
+    assert "cloud" not in store
+
+
+def test_stores_without_a_budget_remember_nothing():
+    store = PointCloudStore(max_points=0, chunk_size=2)
+
+    first = store.update("cloud", *cloud([1, 2, 3]), NO_CONFIDENCE)
+    again = store.update("cloud", *cloud([1, 2, 3]), NO_CONFIDENCE)
+
+    assert first.cleared and again.cleared
+    assert [(chunk.index, len(chunk)) for chunk in again.chunks] == [(0, 3)]
+    assert len(store) == 0
+
+
+def test_least_recently_updated_clouds_are_forgotten():
+    store = PointCloudStore(max_points=8, chunk_size=4)
+    store.update("first", *cloud([1, 2, 3, 4]), NO_CONFIDENCE)
+    store.update("second", *cloud([1, 2, 3, 4]), NO_CONFIDENCE)
+    store.update("first", *cloud([1, 2, 3, 4]), NO_CONFIDENCE)
+
+    changes = store.update("third", *cloud([1]), NO_CONFIDENCE)
+
+    assert changes.evicted == ["second"]
+    assert "second" not in store
+    assert store.evictions == 1
+    assert store.num_points == 8
+    assert store.update("second", *cloud([1, 2, 3, 4]), NO_CONFIDENCE).cleared
+
+
+def test_removed_clouds_are_forgotten():
+    store = PointCloudStore()
+    store.update("cloud", *cloud([1, 2]), NO_CONFIDENCE)
+
+    store.remove("cloud")
+
+    assert len(store) == 0
+    assert store.num_points == 0
+    assert store.update("cloud", *cloud([1, 2]), NO_CONFIDENCE).cleared
+
+
+def test_sessions_remember_points_within_the_budget(tmp_path: Path):
+    servicer = ARFlowServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        point_cloud_budget=1_000,
+    )
+    response = servicer.CreateSession(CreateSessionRequest())
+    session_stream = servicer.client_sessions[response.session.id.value]
+    servicer.on_server_exit()
+
+    assert session_stream.point_clouds.max_points == 1_000
+
+
+def test_sessions_remember_no_points_by_default(tmp_path: Path):
+    servicer = ARFlowServicer(
+        spawn_viewer=False, save_dir=tmp_path, application_id=TEST_APP_ID
+    )
+    response = servicer.CreateSession(CreateSessionRequest())
+    session_stream = servicer.client_sessions[response.session.id.value]
+    servicer.on_server_exit()
+
+    assert session_stream.point_clouds.max_points == 0
@@ -14,7 +14,8 @@ import numpy as np
 import pytest
 from google.protobuf.timestamp_pb2 import Timestamp
 
-from arflow import ARFlowServicer
+from arflow import AdmissionController, ARFlowServicer, RateLimit
+from arflow._admission import RETRY_PUSHBACK_METADATA_KEY
 from arflow._error_interceptor import ErrorInterceptor
 from cakelab.arflow_grpc.v1 import arflow_service_pb2_grpc
 from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
@@ -41,6 +42,10 @@ from cakelab.arflow_grpc.v1.plane_detection_frame_pb2 import PlaneDetectionFrame
 from cakelab.arflow_grpc.v1.quaternion_pb2 import Quaternion
 from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
 from cakelab.arflow_grpc.v1.session_pb2 import SessionUuid
+from cakelab.arflow_grpc.v1.stream_ar_frames_request_pb2 import StreamARFramesRequest
+from cakelab.arflow_grpc.v1.stream_ar_frames_response_pb2 import (
+    StreamARFramesResponse,
+)
 from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
 from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
 from cakelab.arflow_grpc.v1.vector2_pb2 import Vector2
@@ -514,3 +519,115 @@ def test_save_ar_frames_with_nonexistent_device_in_existing_session(
     with pytest.raises(grpc.RpcError) as excinfo:
         stub.SaveARFrames(SaveARFramesRequest(device=device_fixture))
     assert excinfo.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_stream_ar_frames(stub: ARFlowServiceStub, device_fixture: Device):
+    response: CreateSessionResponse = stub.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    )
+    transform_frames = [
+        TransformFrame(
+            device_timestamp=Timestamp(seconds=i, nanos=0),
+            data=np.random.rand(12).astype(np.float32).tobytes(),
+        )
+        for i in range(5)
+    ]
+    requests = [
+        StreamARFramesRequest(
+            session_id=response.session.id,
+            device=device_fixture,
+            frames=[ARFrame(transform_frame=transform_frames[0])],
+        )
+    ] + [
+        StreamARFramesRequest(frames=[ARFrame(transform_frame=f)])
+        for f in transform_frames[1:]
+    ]
+    with patch.object(
+        ARFlowServicer, "on_save_transform_frames"
+    ) as mock_on_save_transform_frames:
+        responses = list(stub.StreamARFrames(iter(requests)))
+
+    assert responses == [
+        StreamARFramesResponse(credits=ARFlowServicer.stream_window),
+        StreamARFramesResponse(
+            acked_messages=4, credits=ARFlowServicer.stream_ack_interval
+        ),
+        StreamARFramesResponse(acked_messages=5, credits=1),
+    ]
+    assert mock_on_save_transform_frames.call_count == 5
+    mock_on_save_transform_frames.assert_called_with(
+        frames=[transform_frames[4]],
+        session_stream=ANY,
+        device=device_fixture,
+    )
+
+
+def test_stream_ar_frames_with_nonexistent_session(
+    stub: ARFlowServiceStub, device_fixture: Device
+):
+    with pytest.raises(grpc.RpcError) as excinfo:
+        list(
+            stub.StreamARFrames(
+                iter(
+                    [
+                        StreamARFramesRequest(
+                            session_id=SessionUuid(value="invalid_id"),
+                            device=device_fixture,
+                        )
+                    ]
+                )
+            )
+        )
+    assert excinfo.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_save_ar_frames_over_rate_limit(tmp_path: Path, device_fixture: Device):
+    servicer = ARFlowServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        admission_controller=AdmissionController(
+            per_device=RateLimit(frames_per_second=0.1, burst_seconds=10)
+        ),
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=2),
+        interceptors=[ErrorInterceptor()],  # pyright: ignore [reportArgumentType]
+    )
+    arflow_service_pb2_grpc.add_ARFlowServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("[::]:0")
+    server.start()
+
+    try:
+        with grpc.insecure_channel(f"localhost:{port}") as channel:
+            stub = ARFlowServiceStub(channel)
+            response: CreateSessionResponse = stub.CreateSession(
+                CreateSessionRequest(device=device_fixture)
+            )
+            request = SaveARFramesRequest(
+                session_id=response.session.id,
+                device=device_fixture,
+                frames=[
+                    ARFrame(
+                        transform_frame=TransformFrame(
+                            device_timestamp=Timestamp(seconds=0, nanos=0),
+                            data=np.random.rand(12).astype(np.float32).tobytes(),
+                        )
+                    )
+                ],
+            )
+            stub.SaveARFrames(request)
+
+            with pytest.raises(grpc.RpcError) as excinfo:
+                stub.SaveARFrames(request)
+    finally:
+        server.stop(None)
+        servicer.on_server_exit()
+
+    assert excinfo.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    retry_after_ms = next(
+        metadatum.value
+        for metadatum in excinfo.value.trailing_metadata()
+        if metadatum.key == RETRY_PUSHBACK_METADATA_KEY
+    )
+    assert 0 < int(retry_after_ms) <= 10_000
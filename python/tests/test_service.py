@@ -3,6 +3,8 @@
 # ruff:noqa: D103
 # pyright: reportPrivateUsage=false
 
+import logging
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,10 +17,14 @@ import pytest
 import rerun as rr
 from google.protobuf.timestamp_pb2 import Timestamp
 
-from arflow import ARFlowServicer
+from arflow import AdmissionController, ARFlowServicer
 from arflow._session_stream import SessionStream
+from arflow._types import OverflowPolicy
 from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
 from cakelab.arflow_grpc.v1.ar_plane_pb2 import ARPlane
+from cakelab.arflow_grpc.v1.ar_point_cloud_pb2 import ARPointCloud
+from cakelab.arflow_grpc.v1.ar_trackable_pb2 import ARTrackable
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import AudioChunkFrame
 from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame
 from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
 from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
@@ -27,6 +33,7 @@ from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
 from cakelab.arflow_grpc.v1.device_pb2 import Device
 from cakelab.arflow_grpc.v1.get_session_request_pb2 import GetSessionRequest
 from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
 from cakelab.arflow_grpc.v1.intrinsics_pb2 import Intrinsics
 from cakelab.arflow_grpc.v1.join_session_request_pb2 import JoinSessionRequest
 from cakelab.arflow_grpc.v1.leave_session_request_pb2 import LeaveSessionRequest
@@ -34,9 +41,16 @@ from cakelab.arflow_grpc.v1.list_sessions_request_pb2 import ListSessionsRequest
 from cakelab.arflow_grpc.v1.mesh_detection_frame_pb2 import MeshDetectionFrame
 from cakelab.arflow_grpc.v1.mesh_filter_pb2 import MeshFilter
 from cakelab.arflow_grpc.v1.plane_detection_frame_pb2 import PlaneDetectionFrame
+from cakelab.arflow_grpc.v1.point_cloud_detection_frame_pb2 import (
+    PointCloudDetectionFrame,
+)
 from cakelab.arflow_grpc.v1.quaternion_pb2 import Quaternion
 from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.save_synchronized_ar_frame_request_pb2 import (
+    SaveSynchronizedARFrameRequest,
+)
 from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.synchronized_ar_frame_pb2 import SynchronizedARFrame
 from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
 from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
 from cakelab.arflow_grpc.v1.vector2_pb2 import Vector2
@@ -54,6 +68,16 @@ def test_invalid_servicer_init(spawn_viewer: bool, save_dir: Path | None):
         ARFlowServicer(spawn_viewer=spawn_viewer, save_dir=save_dir)
 
 
+def test_invalid_ingest_queue_size():
+    with pytest.raises(ValueError):
+        ARFlowServicer(spawn_viewer=True, ingest_queue_size=-1)
+
+
+def test_invalid_idle_timeout():
+    with pytest.raises(ValueError):
+        ARFlowServicer(spawn_viewer=True, idle_timeout=0)
+
+
 def test_create_session(default_service_fixture: ARFlowServicer):
     request = CreateSessionRequest()
     response = default_service_fixture.CreateSession(request)
@@ -213,6 +237,116 @@ def test_leave_session_multiple_devices(
         )
 
 
+def test_join_session_with_device_already_in_session(
+    default_service_fixture: ARFlowServicer, device_fixture: Device
+):
+    default_service_fixture.client_sessions = {
+        "session1": SessionStream(
+            info=Session(id=SessionUuid(value="session1"), devices=[device_fixture]),
+            stream=MagicMock(),
+        ),
+    }
+    request = JoinSessionRequest(
+        session_id=SessionUuid(value="session1"),
+        device=Device(uid=device_fixture.uid, name="another name"),
+    )
+    with pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo:
+        default_service_fixture.JoinSession(request)
+    assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_devices_without_uid_are_compared_as_a_whole(
+    default_service_fixture: ARFlowServicer,
+):
+    default_service_fixture.client_sessions = {
+        "session1": SessionStream(
+            info=Session(id=SessionUuid(value="session1")), stream=MagicMock()
+        ),
+    }
+    session_id = SessionUuid(value="session1")
+    default_service_fixture.JoinSession(
+        JoinSessionRequest(session_id=session_id, device=Device(name="a"))
+    )
+    with pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo:
+        default_service_fixture.JoinSession(
+            JoinSessionRequest(session_id=session_id, device=Device(name="a"))
+        )
+    assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+
+    with pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo:
+        default_service_fixture.LeaveSession(
+            LeaveSessionRequest(session_id=session_id, device=Device(name="b"))
+        )
+    assert excinfo.value.status_code == grpc.StatusCode.NOT_FOUND
+    default_service_fixture.LeaveSession(
+        LeaveSessionRequest(session_id=session_id, device=Device(name="a"))
+    )
+    assert list(default_service_fixture.client_sessions["session1"].info.devices) == []
+
+
+def test_leave_session_with_mismatched_device(
+    default_service_fixture: ARFlowServicer, device_fixture: Device
+):
+    default_service_fixture.client_sessions = {
+        "session1": SessionStream(
+            info=Session(id=SessionUuid(value="session1"), devices=[device_fixture]),
+            stream=MagicMock(),
+        ),
+    }
+    request = LeaveSessionRequest(
+        session_id=SessionUuid(value="session1"),
+        device=Device(uid=device_fixture.uid, name="another name"),
+    )
+    with pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo:
+        default_service_fixture.LeaveSession(request)
+    assert excinfo.value.status_code == grpc.StatusCode.NOT_FOUND
+    assert default_service_fixture.client_sessions["session1"].info.devices == [
+        device_fixture
+    ]
+
+
+def test_join_and_leave_session_concurrently(
+    default_service_fixture: ARFlowServicer,
+):
+    default_service_fixture.client_sessions = {
+        "session1": SessionStream(
+            info=Session(id=SessionUuid(value="session1")), stream=MagicMock()
+        ),
+    }
+    session_id = SessionUuid(value="session1")
+    num_threads = 8
+    devices_per_thread = 200
+
+    def join_and_leave(thread: int) -> None:
+        devices = [Device(uid=f"{thread}-{i}") for i in range(devices_per_thread)]
+        for device in devices:
+            default_service_fixture.JoinSession(
+                JoinSessionRequest(session_id=session_id, device=device)
+            )
+        # Every other device leaves again while the other threads are still joining.
+        for device in devices[::2]:
+            default_service_fixture.LeaveSession(
+                LeaveSessionRequest(session_id=session_id, device=device)
+            )
+            default_service_fixture.GetSession(GetSessionRequest(session_id=session_id))
+
+    threads = [
+        threading.Thread(target=join_and_leave, args=(thread,))
+        for thread in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    devices = default_service_fixture.client_sessions["session1"].info.devices
+    assert sorted(device.uid for device in devices) == sorted(
+        f"{thread}-{i}"
+        for thread in range(num_threads)
+        for i in range(1, devices_per_thread, 2)
+    )
+
+
 def test_save_ar_frames(
     default_service_fixture: ARFlowServicer,
     device_fixture: Device,
@@ -246,9 +380,18 @@ def test_save_ar_frames(
         patch.object(
             default_service_fixture, "on_save_audio_frames"
         ) as mock_on_save_audio_frames,
+        patch.object(
+            default_service_fixture, "on_save_imu_batch_frames"
+        ) as mock_on_save_imu_batch_frames,
+        patch.object(
+            default_service_fixture, "on_save_audio_chunk_frames"
+        ) as mock_on_save_audio_chunk_frames,
         patch.object(
             default_service_fixture, "on_save_plane_detection_frames"
         ) as mock_on_save_plane_detection_frames,
+        patch.object(
+            default_service_fixture, "on_save_point_cloud_detection_frames"
+        ) as mock_on_save_point_cloud_detection_frames,
         (Path(__file__).parent / "bunny.drc").open("rb") as draco_file,
         patch.object(
             default_service_fixture, "on_save_mesh_detection_frames"
@@ -446,6 +589,46 @@ def test_save_ar_frames(
             device=device_fixture,
         )
 
+        imu_batch_frames = [
+            ImuBatchFrame(
+                device_timestamps=np.arange(4, dtype="<i8").tobytes(),
+                samples=np.random.rand(4, 13).astype("<f4").tobytes(),
+            )
+        ]
+        audio_chunk_frames = [
+            AudioChunkFrame(
+                device_timestamp=Timestamp(seconds=0, nanos=0),
+                sample_rate=48_000,
+                samples=np.random.rand(480).astype("<f4").tobytes(),
+            )
+        ]
+        ar_frames = [
+            ARFrame(imu_batch_frame=imu_batch_frames[0]),
+            ARFrame(audio_chunk_frame=audio_chunk_frames[0]),
+        ]
+        default_service_fixture.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=SessionUuid(value="session1"),
+                device=device_fixture,
+                frames=ar_frames,
+            )
+        )
+        mock_on_save_imu_batch_frames.assert_called_once_with(
+            frames=imu_batch_frames,
+            session_stream=default_service_fixture.client_sessions["session1"],
+            device=device_fixture,
+        )
+        mock_on_save_audio_chunk_frames.assert_called_once_with(
+            frames=audio_chunk_frames,
+            session_stream=default_service_fixture.client_sessions["session1"],
+            device=device_fixture,
+        )
+        mock_on_save_ar_frames.assert_called_with(
+            frames=ar_frames,
+            session_stream=default_service_fixture.client_sessions["session1"],
+            device=device_fixture,
+        )
+
         plane_detection_frames = [
             PlaneDetectionFrame(
                 state=PlaneDetectionFrame.STATE_ADDED,
@@ -481,7 +664,43 @@ def test_save_ar_frames(
             device=device_fixture,
         )
 
-        # TODO: point cloud detection
+        point_cloud_detection_frames = [
+            PointCloudDetectionFrame(
+                state=PointCloudDetectionFrame.STATE_ADDED,
+                device_timestamp=Timestamp(seconds=0, nanos=0),
+                point_cloud=ARPointCloud(
+                    trackable=ARTrackable(
+                        trackable_id=ARTrackable.TrackableId(sub_id_1=1, sub_id_2=2),
+                    ),
+                    packed_positions=np.random.rand(100, 3).astype("<f4").tobytes(),
+                    packed_identifiers=np.arange(100, dtype="<u8").tobytes(),
+                ),
+            ),
+            PointCloudDetectionFrame(
+                state=PointCloudDetectionFrame.STATE_REMOVED,
+                device_timestamp=Timestamp(seconds=1, nanos=0),
+                point_cloud=ARPointCloud(
+                    trackable=ARTrackable(
+                        trackable_id=ARTrackable.TrackableId(sub_id_1=1, sub_id_2=2),
+                    ),
+                ),
+            ),
+        ]
+        ar_frames = [
+            ARFrame(point_cloud_detection_frame=f) for f in point_cloud_detection_frames
+        ]
+        default_service_fixture.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=SessionUuid(value="session1"),
+                device=device_fixture,
+                frames=ar_frames,
+            )
+        )
+        mock_on_save_point_cloud_detection_frames.assert_called_once_with(
+            frames=point_cloud_detection_frames,
+            session_stream=default_service_fixture.client_sessions["session1"],
+            device=device_fixture,
+        )
 
         mesh = DracoPy.decode(draco_file.read())  # pyright: ignore [reportUnknownMemberType, reportUnknownVariableType]
         mesh_detection_frames = [
@@ -522,6 +741,8 @@ def test_save_ar_frames(
             session_stream=default_service_fixture.client_sessions["session1"],
             device=device_fixture,
         )
+    # Flush now rather than when the recording is garbage collected, which can deadlock.
+    rr.disconnect(recording_stream)
 
 
 def test_save_ar_frames_with_nonexistent_session(
@@ -543,3 +764,300 @@ def test_save_ar_frames_with_nonexistent_device_in_existing_session(
     with pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo:
         default_service_fixture.SaveARFrames(invalid_frame)
     assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        ARFrame(
+            imu_batch_frame=ImuBatchFrame(
+                device_timestamps=bytes(16), samples=bytes(52)
+            )
+        ),
+        ARFrame(
+            audio_chunk_frame=AudioChunkFrame(sample_rate=48_000, samples=bytes(6))
+        ),
+        ARFrame(audio_chunk_frame=AudioChunkFrame(samples=bytes(8))),
+        ARFrame(transform_frame=TransformFrame(data=bytes(44))),
+    ],
+)
+def test_save_ar_frames_with_malformed_frames(
+    tmp_path: Path, device_fixture: Device, frame: ARFrame
+):
+    admission_controller = MagicMock(spec=AdmissionController)
+    servicer = ARFlowServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        ingest_queue_size=1,
+        admission_controller=admission_controller,
+    )
+    session = servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+    session_stream = servicer.client_sessions[session.id.value]
+    assert session_stream.ingest_queue is not None
+
+    with pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo:
+        servicer.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=session.id, device=device_fixture, frames=[frame]
+            )
+        )
+    assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+    # Rejected before it takes from the rate limits or is queued.
+    admission_controller.admit.assert_not_called()
+    assert session_stream.ingest_queue.depth == 0
+    servicer.DeleteSession(DeleteSessionRequest(session_id=session.id))
+
+
+@pytest.mark.parametrize(
+    "point_cloud",
+    [
+        ARPointCloud(packed_positions=bytes(24), packed_identifiers=bytes(8)),
+        ARPointCloud(packed_positions=bytes(26)),
+        ARPointCloud(positions=[Vector3(x=0, y=0, z=0)], confidence_values=[0.5, 0.5]),
+    ],
+)
+def test_point_clouds_with_mismatched_identifiers(
+    default_service_fixture: ARFlowServicer,
+    device_fixture: Device,
+    point_cloud: ARPointCloud,
+):
+    session = default_service_fixture.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+    frame = ARFrame(
+        point_cloud_detection_frame=PointCloudDetectionFrame(
+            state=PointCloudDetectionFrame.STATE_ADDED, point_cloud=point_cloud
+        )
+    )
+
+    with (
+        patch.object(
+            default_service_fixture, "on_save_ar_frames"
+        ) as mock_on_save_ar_frames,
+        pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo,
+    ):
+        default_service_fixture.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=session.id, device=device_fixture, frames=[frame]
+            )
+        )
+    assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+    mock_on_save_ar_frames.assert_not_called()
+
+
+def test_save_synchronized_ar_frame_with_mismatched_point_cloud(
+    default_service_fixture: ARFlowServicer, device_fixture: Device
+):
+    session = default_service_fixture.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+    frame = SynchronizedARFrame(
+        transform_frame=TransformFrame(data=bytes(48)),
+        point_cloud_detection_frame=PointCloudDetectionFrame(
+            state=PointCloudDetectionFrame.STATE_ADDED,
+            point_cloud=ARPointCloud(
+                packed_positions=bytes(24), packed_identifiers=bytes(8)
+            ),
+        ),
+    )
+
+    with (
+        patch.object(
+            default_service_fixture, "_save_synchronized_ar_frame"
+        ) as mock_save_synchronized_ar_frame,
+        pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo,
+    ):
+        default_service_fixture.SaveSynchronizedARFrame(
+            SaveSynchronizedARFrameRequest(
+                session_id=session.id, device=device_fixture, frame=frame
+            )
+        )
+    assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+    mock_save_synchronized_ar_frame.assert_not_called()
+
+
+def test_save_synchronized_ar_frame_without_transform(
+    default_service_fixture: ARFlowServicer, device_fixture: Device
+):
+    session = default_service_fixture.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+
+    with (
+        patch.object(
+            default_service_fixture, "_save_synchronized_ar_frame"
+        ) as mock_save_synchronized_ar_frame,
+        pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo,
+    ):
+        default_service_fixture.SaveSynchronizedARFrame(
+            SaveSynchronizedARFrameRequest(session_id=session.id, device=device_fixture)
+        )
+    assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+    mock_save_synchronized_ar_frame.assert_not_called()
+
+
+def test_save_ar_frames_with_ingest_queue(tmp_path: Path, device_fixture: Device):
+    servicer = ARFlowServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        ingest_queue_size=1,
+        overflow_policy=OverflowPolicy.REJECT,
+    )
+    session = servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+    session_stream = servicer.client_sessions[session.id.value]
+    assert session_stream.ingest_queue is not None
+    request = SaveARFramesRequest(
+        session_id=session.id,
+        device=device_fixture,
+        frames=[
+            ARFrame(
+                transform_frame=TransformFrame(
+                    device_timestamp=Timestamp(seconds=0, nanos=0),
+                    data=np.random.rand(12).astype(np.float32).tobytes(),
+                )
+            )
+        ],
+    )
+    hook_entered = threading.Event()
+    release_hook = threading.Event()
+
+    def block(**_: object) -> None:
+        hook_entered.set()
+        release_hook.wait()
+
+    with patch.object(
+        servicer, "on_save_ar_frames", side_effect=block
+    ) as mock_on_save_ar_frames:
+        # Returns while the consumer is still busy with the frames.
+        servicer.SaveARFrames(request)
+        hook_entered.wait()
+        servicer.SaveARFrames(request)
+        assert session_stream.ingest_queue.depth == 1
+        with pytest.raises(grpc_interceptor.exceptions.GrpcException) as excinfo:
+            servicer.SaveARFrames(request)
+        assert excinfo.value.status_code == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+        release_hook.set()
+        # Deleting the session flushes the queue.
+        servicer.DeleteSession(DeleteSessionRequest(session_id=session.id))
+        assert mock_on_save_ar_frames.call_count == 2
+
+
+def test_save_synchronized_ar_frame_with_ingest_queue(
+    tmp_path: Path, device_fixture: Device
+):
+    servicer = ARFlowServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        ingest_queue_size=2,
+    )
+    session = servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+    hook_entered = threading.Event()
+    release_hook = threading.Event()
+
+    def block(**_: object) -> None:
+        hook_entered.set()
+        release_hook.wait()
+
+    with (
+        patch.object(servicer, "on_save_ar_frames", side_effect=block),
+        patch.object(
+            servicer, "_save_synchronized_ar_frame"
+        ) as mock_save_synchronized_ar_frame,
+    ):
+        servicer.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=session.id,
+                device=device_fixture,
+                frames=[ARFrame(transform_frame=TransformFrame(data=bytes(48)))],
+            )
+        )
+        hook_entered.wait()
+        # Queued behind the frames received before it, rather than saved on this thread.
+        servicer.SaveSynchronizedARFrame(
+            SaveSynchronizedARFrameRequest(
+                session_id=session.id,
+                device=device_fixture,
+                frame=SynchronizedARFrame(
+                    transform_frame=TransformFrame(data=bytes(48))
+                ),
+            )
+        )
+        mock_save_synchronized_ar_frame.assert_not_called()
+
+        release_hook.set()
+        servicer.DeleteSession(DeleteSessionRequest(session_id=session.id))
+        mock_save_synchronized_ar_frame.assert_called_once()
+
+
+def test_reap_idle_sessions(
+    tmp_path: Path, device_fixture: Device, caplog: pytest.LogCaptureFixture
+):
+    admission_controller = MagicMock(spec=AdmissionController)
+    servicer = ARFlowServicer(
+        spawn_viewer=False,
+        save_dir=tmp_path,
+        application_id=TEST_APP_ID,
+        idle_timeout=60,
+        admission_controller=admission_controller,
+    )
+    other_device = Device(uid="other-device")
+    with patch("arflow._session_stream.time.monotonic", return_value=100.0):
+        session = servicer.CreateSession(
+            CreateSessionRequest(device=device_fixture)
+        ).session
+        servicer.JoinSession(
+            JoinSessionRequest(session_id=session.id, device=other_device)
+        )
+    with patch("arflow._session_stream.time.monotonic", return_value=150.0):
+        servicer.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=session.id,
+                device=other_device,
+                frames=[
+                    ARFrame(
+                        transform_frame=TransformFrame(
+                            device_timestamp=Timestamp(seconds=0, nanos=0),
+                            data=np.random.rand(12).astype(np.float32).tobytes(),
+                        )
+                    )
+                ],
+            )
+        )
+    session_stream = servicer.client_sessions[session.id.value]
+    assert session_stream.received_bytes > 0
+
+    with (
+        patch.object(servicer, "on_leave_session") as mock_on_leave_session,
+        patch.object(servicer, "on_delete_session") as mock_on_delete_session,
+    ):
+        # Only the device that never sent frames is idle.
+        assert servicer.reap_idle_sessions(now=180.0) == []
+        mock_on_leave_session.assert_called_once_with(
+            session_stream=session_stream, device=device_fixture
+        )
+        assert list(session_stream.info.devices) == [other_device]
+        admission_controller.forget_device.assert_called_once_with(
+            session.id.value, device_fixture.uid
+        )
+
+        with caplog.at_level(logging.INFO, logger="arflow._core"):
+            assert servicer.reap_idle_sessions(now=211.0) == [session_stream]
+        assert (
+            "Reaped 1 idle sessions, releasing 0 bytes of decoded frames and 0 stored points"
+            in caplog.text
+        )
+        mock_on_delete_session.assert_called_once_with(session_stream=session_stream)
+        assert servicer.client_sessions == {}
+        admission_controller.forget_session.assert_called_once_with(session.id.value)
+
+    servicer.on_server_exit()
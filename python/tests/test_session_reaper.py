@@ -0,0 +1,35 @@
+"""Idle session reaper tests."""
+
+# ruff:noqa: D103
+import threading
+import time
+
+import pytest
+
+from arflow._session_reaper import SessionReaper
+
+
+def test_invalid_interval():
+    with pytest.raises(ValueError):
+        SessionReaper(lambda: None, interval=0)
+
+
+def test_reaps_periodically_until_closed():
+    reaped = threading.Semaphore(0)
+    num_calls = 0
+
+    def reap() -> None:
+        nonlocal num_calls
+        num_calls += 1
+        reaped.release()
+        if num_calls == 1:
+            raise RuntimeError("A failed reap does not stop the reaper")
+
+    reaper = SessionReaper(reap, interval=0.01)
+    assert reaped.acquire(timeout=5)
+    assert reaped.acquire(timeout=5)
+    reaper.close()
+
+    num_calls_after_close = num_calls
+    time.sleep(0.05)
+    assert num_calls == num_calls_after_close
@@ -0,0 +1,635 @@
+"""Session stream logging tests."""
+
+# ruff:noqa: D103
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+import pytest
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import DepthCodec, PointCloudStore, SessionStream
+from arflow._decoded_frames import depth_to_millimeters
+from cakelab.arflow_grpc.v1.ar_point_cloud_pb2 import ARPointCloud
+from cakelab.arflow_grpc.v1.ar_trackable_pb2 import ARTrackable
+from cakelab.arflow_grpc.v1.audio_chunk_frame_pb2 import AudioChunkFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.gyroscope_frame_pb2 import GyroscopeFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
+from cakelab.arflow_grpc.v1.point_cloud_detection_frame_pb2 import (
+    PointCloudDetectionFrame,
+)
+from cakelab.arflow_grpc.v1.quaternion_pb2 import Quaternion
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.vector3_pb2 import Vector3
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+from tests.conftest import TEST_APP_ID
+
+_recordings: list[rr.RecordingStream] = []
+"""Recordings created by the running test."""
+
+
+@pytest.fixture(autouse=True)
+def disconnect_recordings() -> Iterator[None]:
+    """Disconnect each test's recordings, like the servicer does when deleting a session.
+
+    A recording that is only garbage collected can deadlock while it is flushed.
+    """
+    yield
+    while _recordings:
+        rr.disconnect(_recordings.pop())
+
+
+def new_session_stream(
+    device: Device,
+    save_dir: Path,
+    log_encoded_images: bool = False,
+    depth_codec: DepthCodec = DepthCodec.NONE,
+) -> SessionStream:
+    stream = rr.new_recording(application_id=TEST_APP_ID)
+    rr.save(save_dir / "session.rrd", recording=stream)
+    _recordings.append(stream)
+    return SessionStream(
+        info=Session(id=SessionUuid(value="session"), devices=[device]),
+        stream=stream,
+        log_encoded_images=log_encoded_images,
+        depth_codec=depth_codec,
+    )
+
+
+def depth_frame(format: XRCpuImage.Format, num_bytes: int) -> DepthFrame:
+    return DepthFrame(
+        device_timestamp=Timestamp(seconds=0),
+        image=XRCpuImage(
+            dimensions=Vector2Int(x=2, y=2),
+            format=format,
+            planes=[XRCpuImage.Plane(data=bytes(num_bytes))],
+        ),
+    )
+
+
+def test_static_components_are_logged_when_they_change(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+
+    with patch("rerun.log") as log:
+        for _ in range(2):
+            session_stream.save_depth_frames(
+                [depth_frame(XRCpuImage.FORMAT_DEPTHFLOAT32, 16)], device_fixture
+            )
+        assert log.call_count == 1
+        session_stream.save_depth_frames(
+            [depth_frame(XRCpuImage.FORMAT_DEPTHUINT16, 8)], device_fixture
+        )
+        assert log.call_count == 2
+
+
+def test_entity_paths_are_built_once_per_device(tmp_path: Path, device_fixture: Device):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    frames = [
+        TransformFrame(
+            device_timestamp=Timestamp(seconds=0),
+            data=np.zeros(12, dtype=np.float32).tobytes(),
+        )
+    ]
+
+    with patch("rerun.new_entity_path", wraps=rr.new_entity_path) as new_entity_path:
+        session_stream.save_transform_frames(frames, device_fixture)
+        session_stream.save_transform_frames(frames, device_fixture)
+        assert new_entity_path.call_count == 1
+
+        renamed_device = Device()
+        renamed_device.CopyFrom(device_fixture)
+        renamed_device.name = "renamed"
+        assert session_stream.remove_device(device_fixture)
+        assert session_stream.add_device(renamed_device)
+        session_stream.save_transform_frames(frames, renamed_device)
+        assert new_entity_path.call_count == 2
+        assert "renamed" in new_entity_path.call_args.args[0][1]
+
+
+def test_gyroscope_columns_share_exact_nanosecond_timestamps(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    # Large enough that float seconds cannot represent the nanoseconds.
+    frames = [
+        GyroscopeFrame(device_timestamp=Timestamp(seconds=1_700_000_000, nanos=i))
+        for i in range(1, 4)
+    ]
+
+    with patch("rerun.send_columns") as send_columns:
+        session_stream.save_gyroscope_frames(frames, device_fixture)
+
+    times = [call.kwargs["times"][0].times for call in send_columns.call_args_list]
+    assert len(times) == 4
+    assert all(t is times[0] for t in times)
+    np.testing.assert_array_equal(
+        times[0], [1_700_000_000_000_000_000 + i for i in range(1, 4)]
+    )
+
+
+def test_gyroscope_columns_hold_each_reading(tmp_path: Path, device_fixture: Device):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    readings = np.arange(2 * 13, dtype=np.float32).reshape((2, 13))
+    frames = [
+        GyroscopeFrame(
+            attitude=Quaternion(x=r[0], y=r[1], z=r[2], w=r[3]),
+            rotation_rate=Vector3(x=r[4], y=r[5], z=r[6]),
+            gravity=Vector3(x=r[7], y=r[8], z=r[9]),
+            acceleration=Vector3(x=r[10], y=r[11], z=r[12]),
+        )
+        for r in readings
+    ]
+
+    with patch("rerun.send_columns") as send_columns:
+        session_stream.save_gyroscope_frames(frames, device_fixture)
+
+    columns = [call.kwargs["components"][0] for call in send_columns.call_args_list]
+    expected = [
+        rr.components.RotationQuatBatch(readings[:, 0:4].tolist()),
+        rr.components.Vector3DBatch(readings[:, 4:7].tolist()),
+        rr.components.Vector3DBatch(readings[:, 7:10].tolist()),
+        rr.components.Vector3DBatch(readings[:, 10:13].tolist()),
+    ]
+    for column, expected_column in zip(columns, expected, strict=True):
+        assert column.as_arrow_array().equals(expected_column.as_arrow_array())  # pyright: ignore [reportUnknownMemberType]
+
+
+def test_imu_batch_frames_log_like_gyroscope_frames(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    readings = np.arange(3 * 13, dtype=np.float32).reshape((3, 13))
+    timestamps = 1_700_000_000_000_000_000 + np.arange(3, dtype=np.int64)
+    gyroscope_frames = [
+        GyroscopeFrame(
+            device_timestamp=Timestamp(seconds=1_700_000_000, nanos=i),
+            attitude=Quaternion(x=r[0], y=r[1], z=r[2], w=r[3]),
+            rotation_rate=Vector3(x=r[4], y=r[5], z=r[6]),
+            gravity=Vector3(x=r[7], y=r[8], z=r[9]),
+            acceleration=Vector3(x=r[10], y=r[11], z=r[12]),
+        )
+        for i, r in enumerate(readings)
+    ]
+    imu_batch_frames = [
+        ImuBatchFrame(
+            device_timestamps=timestamps[:2].astype("<i8").tobytes(),
+            samples=readings[:2].astype("<f4").tobytes(),
+        ),
+        ImuBatchFrame(
+            device_timestamps=timestamps[2:].astype("<i8").tobytes(),
+            samples=readings[2:].astype("<f4").tobytes(),
+        ),
+    ]
+
+    with patch("rerun.send_columns") as send_columns:
+        session_stream.save_gyroscope_frames(gyroscope_frames, device_fixture)
+        session_stream.save_imu_batch_frames(imu_batch_frames, device_fixture)
+
+    gyroscope_calls = send_columns.call_args_list[:4]
+    imu_batch_calls = send_columns.call_args_list[4:]
+    assert len(imu_batch_calls) == 4
+    for gyroscope_call, imu_batch_call in zip(gyroscope_calls, imu_batch_calls):
+        assert gyroscope_call.args == imu_batch_call.args
+        np.testing.assert_array_equal(
+            gyroscope_call.kwargs["times"][0].times,
+            imu_batch_call.kwargs["times"][0].times,
+        )
+        assert (
+            gyroscope_call.kwargs["components"][0]
+            .as_arrow_array()
+            .equals(imu_batch_call.kwargs["components"][0].as_arrow_array())
+        )
+
+
+def test_audio_chunk_samples_are_timed_by_the_sample_rate(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    frames = [
+        AudioChunkFrame(
+            device_timestamp=Timestamp(seconds=1_700_000_000),
+            sample_rate=48_000,
+            samples=np.array([0.5, -0.5, 0.25], dtype="<f4").tobytes(),
+        ),
+        AudioChunkFrame(
+            device_timestamp=Timestamp(seconds=1_700_000_001),
+            sample_rate=3,
+            samples=np.array([1.0, 2.0], dtype="<f4").tobytes(),
+        ),
+    ]
+
+    with patch("rerun.send_columns") as send_columns:
+        session_stream.save_audio_chunk_frames(frames, device_fixture)
+
+    np.testing.assert_array_equal(
+        send_columns.call_args.kwargs["times"][0].times,
+        [
+            1_700_000_000_000_000_000,
+            1_700_000_000_000_020_833,
+            1_700_000_000_000_041_666,
+            1_700_000_001_000_000_000,
+            1_700_000_001_333_333_333,
+        ],
+    )
+    expected = rr.components.ScalarBatch([0.5, -0.5, 0.25, 1.0, 2.0]).partition([1] * 5)
+    assert (
+        send_columns.call_args.kwargs["components"][0]
+        .as_arrow_array()
+        .equals(expected.as_arrow_array())  # pyright: ignore [reportUnknownMemberType]
+    )
+
+
+def test_packed_frames_of_the_wrong_size(tmp_path: Path, device_fixture: Device):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+
+    with pytest.raises(ValueError):
+        session_stream.save_imu_batch_frames(
+            [ImuBatchFrame(device_timestamps=bytes(16), samples=bytes(52))],
+            device_fixture,
+        )
+    with pytest.raises(ValueError):
+        session_stream.save_audio_chunk_frames(
+            [AudioChunkFrame(sample_rate=48_000, samples=bytes(6))], device_fixture
+        )
+    with pytest.raises(ValueError):
+        session_stream.save_audio_chunk_frames(
+            [AudioChunkFrame(samples=bytes(8))], device_fixture
+        )
+
+
+def test_packed_and_repeated_point_clouds_log_the_same_points(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    positions = np.arange(5 * 3, dtype=np.float32).reshape((5, 3))
+    identifiers = np.arange(10, 15, dtype=np.uint64)
+    confidence = np.linspace(0, 1, 5, dtype=np.float32)
+    trackable = ARTrackable(
+        trackable_id=ARTrackable.TrackableId(sub_id_1=1, sub_id_2=2),
+        tracking_state=ARTrackable.TRACKING_STATE_TRACKING,
+    )
+    repeated = ARPointCloud(
+        trackable=trackable,
+        positions=[Vector3(x=p[0], y=p[1], z=p[2]) for p in positions[:3]],
+        identifiers=identifiers[:3].tolist(),
+        confidence_values=confidence[:3].tolist(),
+    )
+    packed = ARPointCloud(
+        trackable=trackable,
+        packed_positions=positions[3:].astype("<f4").tobytes(),
+        packed_identifiers=identifiers[3:].astype("<u8").tobytes(),
+        packed_confidence_values=confidence[3:].astype("<f4").tobytes(),
+    )
+    frames = [
+        PointCloudDetectionFrame(
+            state=PointCloudDetectionFrame.STATE_ADDED,
+            device_timestamp=Timestamp(seconds=1),
+            point_cloud=repeated,
+        ),
+        PointCloudDetectionFrame(
+            state=PointCloudDetectionFrame.STATE_UPDATED,
+            device_timestamp=Timestamp(seconds=2),
+            point_cloud=packed,
+        ),
+    ]
+
+    with patch("rerun.send_columns") as send_columns:
+        session_stream.save_point_cloud_detection_frames(frames, device_fixture)
+
+    clear, chunk = send_columns.call_args_list
+    assert clear.args[0].endswith("/point_cloud_detection_frame/1_2")
+    # Without a budget, every update logs the cloud whole.
+    np.testing.assert_array_equal(
+        clear.kwargs["times"][0].times, [1_000_000_000, 2_000_000_000]
+    )
+    assert chunk.args[0].endswith("/point_cloud_detection_frame/1_2/0")
+    np.testing.assert_array_equal(
+        chunk.kwargs["times"][0].times, [1_000_000_000, 2_000_000_000]
+    )
+    columns = {
+        column.component_name(): column.as_arrow_array()
+        for column in chunk.kwargs["components"]
+    }
+    assert columns["rerun.components.Position3D"].to_pylist() == [
+        positions[:3].tolist(),
+        positions[3:].tolist(),
+    ]
+    assert columns["identifier"].to_pylist() == [[10, 11, 12], [13, 14]]
+    np.testing.assert_allclose(
+        np.concatenate(columns["confidence"].to_numpy(zero_copy_only=False)), confidence
+    )
+
+
+def test_point_cloud_updates_only_log_changed_chunks(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    session_stream.point_clouds = PointCloudStore(epsilon=0.01, chunk_size=2)
+    positions = np.zeros((6, 3), dtype=np.float32)
+    identifiers = np.arange(6, dtype=np.uint64)
+
+    def frame(
+        seconds: int,
+        positions: npt.NDArray[np.float32],
+        identifiers: npt.NDArray[np.uint64],
+    ) -> PointCloudDetectionFrame:
+        return PointCloudDetectionFrame(
+            state=PointCloudDetectionFrame.STATE_UPDATED,
+            device_timestamp=Timestamp(seconds=seconds),
+            point_cloud=ARPointCloud(
+                trackable=ARTrackable(
+                    trackable_id=ARTrackable.TrackableId(sub_id_1=1, sub_id_2=2)
+                ),
+                packed_positions=positions.astype("<f4").tobytes(),
+                packed_identifiers=identifiers.astype("<u8").tobytes(),
+            ),
+        )
+
+    session_stream.save_point_cloud_detection_frames(
+        [frame(1, positions, identifiers)], device_fixture
+    )
+    jittered = positions + 0.001
+    moved = jittered.copy()
+    moved[3] = 1.0
+    with patch("rerun.send_columns") as send_columns:
+        session_stream.save_point_cloud_detection_frames(
+            [
+                frame(2, jittered, identifiers),
+                frame(3, moved, identifiers),
+                frame(4, moved[1:], identifiers[1:]),
+            ],
+            device_fixture,
+        )
+
+    logged = {
+        call.args[0].rsplit("/", 1)[-1]: call.kwargs
+        for call in send_columns.call_args_list
+    }
+    assert logged.keys() == {"0", "1"}
+    np.testing.assert_array_equal(logged["1"]["times"][0].times, [3_000_000_000])
+    positions_column = logged["1"]["components"][0].as_arrow_array()
+    assert positions_column.to_pylist() == [[[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]]
+    np.testing.assert_array_equal(logged["0"]["times"][0].times, [4_000_000_000])
+    identifier_column = logged["0"]["components"][1].as_arrow_array()
+    assert identifier_column.to_pylist() == [[1]]
+
+
+def test_malformed_point_clouds_leave_the_store_unchanged(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    session_stream.point_clouds = PointCloudStore()
+    trackable = ARTrackable(
+        trackable_id=ARTrackable.TrackableId(sub_id_1=1, sub_id_2=2)
+    )
+    added = PointCloudDetectionFrame(
+        state=PointCloudDetectionFrame.STATE_ADDED,
+        device_timestamp=Timestamp(seconds=1),
+        point_cloud=ARPointCloud(
+            trackable=trackable,
+            packed_positions=bytes(24),
+            packed_identifiers=np.arange(2, dtype="<u8").tobytes(),
+        ),
+    )
+    malformed = PointCloudDetectionFrame(
+        state=PointCloudDetectionFrame.STATE_UPDATED,
+        device_timestamp=Timestamp(seconds=2),
+        point_cloud=ARPointCloud(
+            trackable=trackable,
+            packed_positions=bytes(24),
+            packed_identifiers=bytes(8),
+        ),
+    )
+
+    with patch("rerun.send_columns") as send_columns:
+        with pytest.raises(ValueError):
+            session_stream.save_point_cloud_detection_frames(
+                [added, malformed], device_fixture
+            )
+        assert len(session_stream.point_clouds) == 0
+        send_columns.assert_not_called()
+
+        # Sent again, the points are logged rather than taken as already logged.
+        session_stream.save_point_cloud_detection_frames([added], device_fixture)
+
+    clear, points = send_columns.call_args_list
+    assert clear.args[0].endswith("/point_cloud_detection_frame/1_2")
+    assert points.args[0].endswith("/point_cloud_detection_frame/1_2/0")
+    assert points.kwargs["components"][1].as_arrow_array().to_pylist() == [[0, 1]]
+
+
+def test_removed_point_clouds_clear_their_trackable(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    frame = PointCloudDetectionFrame(
+        state=PointCloudDetectionFrame.STATE_REMOVED,
+        point_cloud=ARPointCloud(
+            trackable=ARTrackable(
+                trackable_id=ARTrackable.TrackableId(sub_id_1=3, sub_id_2=4)
+            )
+        ),
+    )
+
+    with patch("rerun.send_columns") as send_columns:
+        session_stream.save_point_cloud_detection_frames([frame], device_fixture)
+
+    assert send_columns.call_args.args[0].endswith("/point_cloud_detection_frame/3_4")
+    (clear,) = send_columns.call_args.kwargs["components"]
+    assert clear.as_arrow_array().to_pylist() == [True]
+
+
+def test_forgotten_point_clouds_log_their_static_components_again(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    session_stream.point_clouds = PointCloudStore(max_points=4, chunk_size=2)
+
+    def frame(
+        sub_id: int, state: "PointCloudDetectionFrame.State"
+    ) -> PointCloudDetectionFrame:
+        return PointCloudDetectionFrame(
+            state=state,
+            point_cloud=ARPointCloud(
+                trackable=ARTrackable(
+                    trackable_id=ARTrackable.TrackableId(sub_id_1=sub_id)
+                ),
+                packed_positions=np.arange(12, dtype="<f4").tobytes(),
+                packed_identifiers=np.arange(4, dtype="<u8").tobytes(),
+            ),
+        )
+
+    added = PointCloudDetectionFrame.STATE_ADDED
+    with patch("rerun.log") as log, patch("rerun.send_columns"):
+        session_stream.save_point_cloud_detection_frames(
+            [frame(1, added)], device_fixture
+        )
+        assert log.call_count == 2
+        # The first cloud is evicted by the second, and logged again as if new.
+        session_stream.save_point_cloud_detection_frames(
+            [frame(2, added), frame(1, added)], device_fixture
+        )
+        assert log.call_count == 6
+        session_stream.save_point_cloud_detection_frames(
+            [frame(1, PointCloudDetectionFrame.STATE_REMOVED), frame(1, added)],
+            device_fixture,
+        )
+        assert log.call_count == 8
+
+
+def test_transform_columns_match_rerun_conversion(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    data = np.arange(2 * 12, dtype=np.float32).reshape((2, 12))
+    frames = [
+        TransformFrame(device_timestamp=Timestamp(seconds=i), data=data[i].tobytes())
+        for i in range(2)
+    ]
+
+    with patch("rerun.send_columns") as send_columns:
+        (batch,) = session_stream.save_transform_frames(frames, device_fixture)
+
+    rotations, translations = send_columns.call_args.kwargs["components"]
+    assert rotations.as_arrow_array().equals(
+        rr.components.TransformMat3x3Batch(batch.poses[:, :3, :3]).as_arrow_array()  # pyright: ignore [reportUnknownMemberType]
+    )
+    assert translations.as_arrow_array().equals(
+        rr.components.Translation3DBatch(batch.poses[:, :3, 3]).as_arrow_array()  # pyright: ignore [reportUnknownMemberType]
+    )
+
+
+def test_transform_frames_of_the_wrong_size(tmp_path: Path, device_fixture: Device):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    frames = [
+        TransformFrame(data=bytes(48)),
+        TransformFrame(data=bytes(44)),
+    ]
+
+    with pytest.raises(ValueError):
+        session_stream.save_transform_frames(frames, device_fixture)
+
+
+def test_encoded_images_are_logged_without_decoding(
+    tmp_path: Path, device_fixture: Device
+):
+    session_stream = new_session_stream(
+        device_fixture, tmp_path, log_encoded_images=True
+    )
+    bgr = np.arange(2 * 4 * 6 * 3, dtype=np.uint8).reshape((2, 4, 6, 3))
+    encoded = [cv2.imencode(".png", image)[1].tobytes() for image in bgr]
+    frames = [
+        ColorFrame(
+            device_timestamp=Timestamp(seconds=i),
+            image=XRCpuImage(
+                dimensions=Vector2Int(x=6, y=4),
+                format=XRCpuImage.FORMAT_PNG_RGB24,
+                planes=[XRCpuImage.Plane(data=encoded[i])],
+            ),
+        )
+        for i in range(2)
+    ]
+
+    with patch("rerun.log") as log, patch("rerun.send_columns") as send_columns:
+        (batch,) = session_stream.save_color_frames(frames, device_fixture)
+
+    assert session_stream.decoded_frames.misses == 0
+    assert rr.components.MediaType.PNG in log.call_args_list[-1].args[1]
+    (blobs,) = send_columns.call_args.kwargs["components"]
+    assert isinstance(blobs, rr.components.BlobBatch)
+    assert blobs.as_arrow_array().to_pylist() == [list(data) for data in encoded]  # pyright: ignore [reportUnknownMemberType]
+    np.testing.assert_array_equal(batch.images, bgr)
+    assert session_stream.decoded_frames.misses == 2
+
+
+def test_depth_to_millimeters_error_bounds():
+    depth = np.random.default_rng(0).uniform(0, 65.535, (64, 64)).astype(np.float32)
+    depth[0, :6] = [0.0005, 70, -1, np.nan, np.inf, -np.inf]
+
+    millimeters = depth_to_millimeters(depth)
+
+    assert millimeters.dtype == np.uint16
+    np.testing.assert_array_equal(millimeters[0, :6], [1, 65535, 0, 0, 0, 0])
+    error = np.abs(millimeters[1:] / 1000 - depth[1:].astype(np.float64))
+    assert error.max() <= 0.0005 + 1e-6
+
+
+def test_float_depth_is_stored_as_millimeters(tmp_path: Path, device_fixture: Device):
+    session_stream = new_session_stream(
+        device_fixture, tmp_path, depth_codec=DepthCodec.UINT16_MILLIMETERS
+    )
+    depth = np.array([1.2344, 0.5, 2.0, 7.0], dtype=np.float32)
+    frame = depth_frame(XRCpuImage.FORMAT_DEPTHFLOAT32, 16)
+    frame.image.planes[0].data = depth.tobytes()
+
+    with patch("rerun.log") as log, patch("rerun.send_columns") as send_columns:
+        (batch,) = session_stream.save_depth_frames([frame], device_fixture)
+
+    image_format, _ = log.call_args.args[1]
+    assert image_format.channel_datatype == rr.ChannelDatatype.U16
+    (buffers,) = send_columns.call_args.kwargs["components"]
+    np.testing.assert_array_equal(
+        np.frombuffer(
+            buffers.as_arrow_array().storage.values.to_numpy(),  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
+            dtype=np.uint16,
+        ),
+        [1234, 500, 2000, 7000],
+    )
+    np.testing.assert_array_equal(batch.depth.reshape(-1), depth)
+
+
+@pytest.mark.parametrize(
+    "format,num_bytes,depth_codec,depth_meter",
+    [
+        (XRCpuImage.FORMAT_DEPTHFLOAT32, 16, DepthCodec.NONE, 1.0),
+        (XRCpuImage.FORMAT_DEPTHUINT16, 8, DepthCodec.NONE, 1.0),
+        (XRCpuImage.FORMAT_DEPTHUINT16, 8, DepthCodec.UINT16_MILLIMETERS, 1.0),
+        (XRCpuImage.FORMAT_DEPTHFLOAT32, 16, DepthCodec.UINT16_MILLIMETERS, 1000.0),
+    ],
+)
+def test_depth_meter_matches_the_stored_depth(
+    tmp_path: Path,
+    device_fixture: Device,
+    format: XRCpuImage.Format,
+    num_bytes: int,
+    depth_codec: DepthCodec,
+    depth_meter: float,
+):
+    session_stream = new_session_stream(
+        device_fixture, tmp_path, depth_codec=depth_codec
+    )
+
+    with patch("rerun.log") as log, patch("rerun.send_columns"):
+        session_stream.save_depth_frames(
+            [depth_frame(format, num_bytes)], device_fixture
+        )
+
+    assert log.call_args.args[2] == [rr.components.DepthMeter(depth_meter)]
+
+
+def test_image_columns_match_rerun_conversion(tmp_path: Path, device_fixture: Device):
+    session_stream = new_session_stream(device_fixture, tmp_path)
+    frames = [
+        depth_frame(XRCpuImage.FORMAT_DEPTHUINT16, 8),
+        depth_frame(XRCpuImage.FORMAT_DEPTHUINT16, 8),
+    ]
+    frames[1].image.planes[0].data = bytes(range(8))
+
+    with patch("rerun.send_columns") as send_columns:
+        (batch,) = session_stream.save_depth_frames(frames, device_fixture)
+
+    (buffers,) = send_columns.call_args.kwargs["components"]
+    assert buffers.as_arrow_array().equals(
+        rr.components.ImageBufferBatch(batch.buffers).as_arrow_array()  # pyright: ignore [reportUnknownMemberType]
+    )
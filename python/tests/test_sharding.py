@@ -0,0 +1,340 @@
+"""Multi-process session sharding tests."""
+
+# ruff:noqa: D103
+# pyright: reportPrivateUsage=false
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import grpc
+import numpy as np
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+from grpc_interceptor.exceptions import GrpcException
+
+from arflow import AdmissionController, HookExecutor, ShardedARFlowServicer
+from arflow._sharding import _Shard
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.delete_session_request_pb2 import DeleteSessionRequest
+from cakelab.arflow_grpc.v1.delete_session_response_pb2 import DeleteSessionResponse
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.get_session_request_pb2 import GetSessionRequest
+from cakelab.arflow_grpc.v1.join_session_request_pb2 import JoinSessionRequest
+from cakelab.arflow_grpc.v1.leave_session_request_pb2 import LeaveSessionRequest
+from cakelab.arflow_grpc.v1.leave_session_response_pb2 import LeaveSessionResponse
+from cakelab.arflow_grpc.v1.list_sessions_request_pb2 import ListSessionsRequest
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.save_synchronized_ar_frame_request_pb2 import (
+    SaveSynchronizedARFrameRequest,
+)
+from cakelab.arflow_grpc.v1.session_pb2 import SessionUuid
+from cakelab.arflow_grpc.v1.stream_ar_frames_request_pb2 import StreamARFramesRequest
+from cakelab.arflow_grpc.v1.stream_ar_frames_response_pb2 import (
+    StreamARFramesResponse,
+)
+from cakelab.arflow_grpc.v1.synchronized_ar_frame_pb2 import SynchronizedARFrame
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from tests.conftest import TEST_APP_ID
+
+
+@pytest.fixture(scope="module")
+def sharded_servicer(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[ShardedARFlowServicer, None, None]:
+    # Spawning workers is slow, so the servicer is shared by the tests of this module.
+    servicer = ShardedARFlowServicer(
+        num_workers=2,
+        spawn_viewer=False,
+        save_dir=tmp_path_factory.mktemp("sharded"),
+        application_id=TEST_APP_ID,
+        # Long enough that the workers reap nothing during the tests.
+        idle_timeout=3600.0,
+        # Each worker gets a copy of the executor.
+        hook_executor=HookExecutor(max_workers=1, max_pending=16),
+    )
+    yield servicer
+    servicer.on_server_exit()
+
+
+def transform_frames(n: int) -> list[ARFrame]:
+    return [
+        ARFrame(
+            transform_frame=TransformFrame(
+                device_timestamp=Timestamp(seconds=i, nanos=0),
+                data=np.random.rand(12).astype(np.float32).tobytes(),
+            )
+        )
+        for i in range(n)
+    ]
+
+
+def test_invalid_num_workers():
+    with pytest.raises(ValueError):
+        ShardedARFlowServicer(num_workers=0, spawn_viewer=False, save_dir=Path())
+
+
+def test_invalid_service_arguments():
+    with pytest.raises(ValueError):
+        ShardedARFlowServicer(num_workers=1, spawn_viewer=False, save_dir=None)
+
+
+def test_invalid_idle_timeout():
+    with pytest.raises(ValueError):
+        ShardedARFlowServicer(
+            num_workers=1, spawn_viewer=False, save_dir=Path(), idle_timeout=0
+        )
+
+
+def test_sessions_are_spread_across_workers(
+    sharded_servicer: ShardedARFlowServicer, device_fixture: Device
+):
+    session_ids = [
+        sharded_servicer.CreateSession(
+            CreateSessionRequest(device=device_fixture)
+        ).session.id
+        for _ in range(2)
+    ]
+    assert [shard.num_sessions for shard in sharded_servicer.shards] == [1, 1]
+    assert len(sharded_servicer.ListSessions(ListSessionsRequest()).sessions) == 2
+
+    for session_id in session_ids:
+        sharded_servicer.DeleteSession(DeleteSessionRequest(session_id=session_id))
+    assert [shard.num_sessions for shard in sharded_servicer.shards] == [0, 0]
+    assert len(sharded_servicer.ListSessions(ListSessionsRequest()).sessions) == 0
+
+
+def test_failed_placement_frees_the_slot(
+    sharded_servicer: ShardedARFlowServicer, device_fixture: Device
+):
+    with (
+        patch.object(_Shard, "call", side_effect=RuntimeError("worker died")),
+        pytest.raises(RuntimeError),
+    ):
+        sharded_servicer.CreateSession(CreateSessionRequest(device=device_fixture))
+
+    assert [shard.num_sessions for shard in sharded_servicer.shards] == [0, 0]
+    assert len(sharded_servicer.ListSessions(ListSessionsRequest()).sessions) == 0
+
+
+def test_session_membership(
+    sharded_servicer: ShardedARFlowServicer, device_fixture: Device
+):
+    session_id = sharded_servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session.id
+    other_device = Device(uid="other-device")
+
+    sharded_servicer.JoinSession(
+        JoinSessionRequest(session_id=session_id, device=other_device)
+    )
+    session = sharded_servicer.GetSession(
+        GetSessionRequest(session_id=session_id)
+    ).session
+    assert list(session.devices) == [device_fixture, other_device]
+
+    # Errors raised by a worker reach the caller with their status code.
+    with pytest.raises(GrpcException) as excinfo:
+        sharded_servicer.JoinSession(
+            JoinSessionRequest(session_id=session_id, device=other_device)
+        )
+    assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+
+    sharded_servicer.LeaveSession(
+        LeaveSessionRequest(session_id=session_id, device=other_device)
+    )
+    session = sharded_servicer.GetSession(
+        GetSessionRequest(session_id=session_id)
+    ).session
+    assert list(session.devices) == [device_fixture]
+
+    sharded_servicer.DeleteSession(DeleteSessionRequest(session_id=session_id))
+
+
+def test_save_ar_frames(
+    sharded_servicer: ShardedARFlowServicer, device_fixture: Device
+):
+    session_id = sharded_servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session.id
+    sharded_servicer.SaveARFrames(
+        SaveARFramesRequest(
+            session_id=session_id, device=device_fixture, frames=transform_frames(3)
+        )
+    )
+
+    requests = [
+        StreamARFramesRequest(
+            session_id=session_id, device=device_fixture, frames=transform_frames(1)
+        )
+    ] + [StreamARFramesRequest(frames=transform_frames(1)) for _ in range(4)]
+    responses = list(sharded_servicer.StreamARFrames(iter(requests)))
+    assert responses == [
+        StreamARFramesResponse(credits=sharded_servicer.stream_window),
+        StreamARFramesResponse(
+            acked_messages=4, credits=sharded_servicer.stream_ack_interval
+        ),
+        StreamARFramesResponse(acked_messages=5, credits=1),
+    ]
+
+    sharded_servicer.DeleteSession(DeleteSessionRequest(session_id=session_id))
+
+
+def test_frames_are_admitted_in_the_front_process(
+    sharded_servicer: ShardedARFlowServicer, device_fixture: Device
+):
+    session_id = sharded_servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session.id
+    other_device = Device(uid="other-device")
+    sharded_servicer.JoinSession(
+        JoinSessionRequest(session_id=session_id, device=other_device)
+    )
+    frame = SynchronizedARFrame(transform_frame=transform_frames(1)[0].transform_frame)
+    admission_controller = MagicMock(spec=AdmissionController)
+
+    with patch.object(sharded_servicer, "admission_controller", admission_controller):
+        sharded_servicer.SaveSynchronizedARFrame(
+            SaveSynchronizedARFrameRequest(
+                session_id=session_id, device=device_fixture, frame=frame
+            )
+        )
+        sharded_servicer.LeaveSession(
+            LeaveSessionRequest(session_id=session_id, device=other_device)
+        )
+        sharded_servicer.DeleteSession(DeleteSessionRequest(session_id=session_id))
+
+    admission_controller.admit.assert_called_once_with(
+        session_id.value, device_fixture.uid, 1, frame.ByteSize()
+    )
+    admission_controller.forget_device.assert_called_once_with(
+        session_id.value, other_device.uid
+    )
+    admission_controller.forget_session.assert_called_once_with(session_id.value)
+
+
+def test_stream_from_device_not_in_session(
+    sharded_servicer: ShardedARFlowServicer, device_fixture: Device
+):
+    session_id = sharded_servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session.id
+
+    responses = sharded_servicer.StreamARFrames(
+        iter(
+            [
+                StreamARFramesRequest(
+                    session_id=session_id,
+                    device=Device(uid="stranger"),
+                    frames=transform_frames(1),
+                )
+            ]
+        )
+    )
+    assert next(responses) == StreamARFramesResponse(
+        credits=sharded_servicer.stream_window
+    )
+    with pytest.raises(GrpcException) as excinfo:
+        next(responses)
+    assert excinfo.value.status_code == grpc.StatusCode.NOT_FOUND
+
+    sharded_servicer.DeleteSession(DeleteSessionRequest(session_id=session_id))
+
+
+@pytest.mark.parametrize(
+    "session_id, device, code",
+    [
+        ("nonexistent", Device(), grpc.StatusCode.NOT_FOUND),
+        (None, Device(uid="nonexistent"), grpc.StatusCode.NOT_FOUND),
+    ],
+)
+def test_save_ar_frames_invalid_request(
+    sharded_servicer: ShardedARFlowServicer,
+    device_fixture: Device,
+    session_id: str | None,
+    device: Device,
+    code: grpc.StatusCode,
+):
+    created = sharded_servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session.id
+    request = SaveARFramesRequest(
+        session_id=created if session_id is None else SessionUuid(value=session_id),
+        device=device,
+        frames=transform_frames(1),
+    )
+    with pytest.raises(GrpcException) as excinfo:
+        sharded_servicer.SaveARFrames(request)
+    assert excinfo.value.status_code == code
+
+    sharded_servicer.DeleteSession(DeleteSessionRequest(session_id=created))
+
+
+def test_malformed_frames_are_rejected_before_admission(
+    sharded_servicer: ShardedARFlowServicer, device_fixture: Device
+):
+    session_id = sharded_servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session.id
+    admission_controller = MagicMock(spec=AdmissionController)
+    with (
+        patch.object(sharded_servicer, "admission_controller", admission_controller),
+        pytest.raises(GrpcException) as excinfo,
+    ):
+        sharded_servicer.SaveARFrames(
+            SaveARFramesRequest(
+                session_id=session_id,
+                device=device_fixture,
+                frames=[ARFrame(transform_frame=TransformFrame(data=bytes(44)))],
+            )
+        )
+    assert excinfo.value.status_code == grpc.StatusCode.INVALID_ARGUMENT
+    admission_controller.admit.assert_not_called()
+
+    sharded_servicer.DeleteSession(DeleteSessionRequest(session_id=session_id))
+
+
+def test_sessions_reaped_by_workers_are_forgotten(
+    sharded_servicer: ShardedARFlowServicer, device_fixture: Device
+):
+    assert sharded_servicer.forget_reaped_sessions() == []
+    reaped_id, kept_id = (
+        sharded_servicer.CreateSession(
+            CreateSessionRequest(device=device_fixture)
+        ).session.id
+        for _ in range(2)
+    )
+    idle_device = Device(uid="idle-device")
+    sharded_servicer.JoinSession(
+        JoinSessionRequest(session_id=kept_id, device=idle_device)
+    )
+    assert sharded_servicer.forget_reaped_sessions() == []
+
+    # Reaps behind the back of the router, as the reaper of a worker does.
+    reaped_shard = sharded_servicer._get_shard(reaped_id.value)
+    reaped_shard.call(
+        "DeleteSession",
+        DeleteSessionRequest(session_id=reaped_id),
+        DeleteSessionResponse,
+    )
+    sharded_servicer._get_shard(kept_id.value).call(
+        "LeaveSession",
+        LeaveSessionRequest(session_id=kept_id, device=idle_device),
+        LeaveSessionResponse,
+    )
+
+    admission_controller = MagicMock(spec=AdmissionController)
+    with patch.object(sharded_servicer, "admission_controller", admission_controller):
+        assert sharded_servicer.forget_reaped_sessions() == [reaped_id.value]
+    assert reaped_shard.num_sessions == 0
+    admission_controller.forget_session.assert_called_once_with(reaped_id.value)
+    admission_controller.forget_device.assert_called_once_with(
+        kept_id.value, idle_device.uid
+    )
+    with pytest.raises(GrpcException) as excinfo:
+        sharded_servicer.GetSession(GetSessionRequest(session_id=reaped_id))
+    assert excinfo.value.status_code == grpc.StatusCode.NOT_FOUND
+    session = sharded_servicer.GetSession(GetSessionRequest(session_id=kept_id)).session
+    assert list(session.devices) == [device_fixture]
+
+    sharded_servicer.DeleteSession(DeleteSessionRequest(session_id=kept_id))
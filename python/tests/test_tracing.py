@@ -0,0 +1,171 @@
+"""Tracing tests."""
+
+# ruff:noqa: D103
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import ARFlowServicer, Tracer, tracer
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.create_session_request_pb2 import CreateSessionRequest
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.save_ar_frames_request_pb2 import SaveARFramesRequest
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+from tests.conftest import TEST_APP_ID
+
+
+@pytest.fixture
+def enabled_tracer() -> Iterator[Tracer]:
+    tracer.enable()
+    try:
+        yield tracer
+    finally:
+        tracer.disable()
+        tracer.clear()
+
+
+def spans(tracer: Tracer) -> list[dict[str, Any]]:
+    return [event for event in tracer.events() if event["ph"] == "X"]
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        Tracer(capacity=0)
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    function = MagicMock()
+
+    with tracer.span("stage", frames=1):
+        pass
+
+    assert tracer.traced("stage", function) is function
+    assert tracer.events() == []
+
+
+def test_nested_spans():
+    tracer = Tracer()
+    tracer.enable()
+
+    with tracer.span("outer", frames=2):
+        with tracer.span("inner"):
+            pass
+    with pytest.raises(RuntimeError):
+        with tracer.span("failing"):
+            raise RuntimeError
+    tracer.traced("traced", lambda: None)()
+    tracer.disable()
+    with tracer.span("after disable"):
+        pass
+
+    inner, outer, failing, traced = spans(tracer)
+    assert [inner["name"], outer["name"], failing["name"], traced["name"]] == [
+        "inner",
+        "outer",
+        "failing",
+        "traced",
+    ]
+    assert outer["args"] == {"frames": 2}
+    assert "args" not in inner
+    assert failing["args"] == {"error": "RuntimeError"}
+    assert inner["tid"] == outer["tid"]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert [event["ph"] for event in tracer.events()].count("M") == 1
+
+
+def test_ring_buffer_drops_oldest_spans():
+    tracer = Tracer(capacity=2)
+    tracer.enable()
+
+    for name in ("first", "second", "third"):
+        with tracer.span(name):
+            pass
+
+    assert [span["name"] for span in spans(tracer)] == ["second", "third"]
+    tracer.clear()
+    assert tracer.events() == []
+
+
+def test_write_chrome_trace(tmp_path: Path):
+    tracer = Tracer()
+    tracer.enable()
+    with tracer.span("stage"):
+        pass
+
+    trace_file = tmp_path / "trace.json"
+    tracer.write_chrome_trace(trace_file)
+
+    with trace_file.open() as f:
+        trace = json.load(f)
+    assert trace["traceEvents"] == tracer.events()
+
+
+def test_save_ar_frames_spans(
+    enabled_tracer: Tracer, tmp_path: Path, device_fixture: Device
+):
+    servicer = ARFlowServicer(
+        spawn_viewer=False, save_dir=tmp_path, application_id=TEST_APP_ID
+    )
+    session = servicer.CreateSession(
+        CreateSessionRequest(device=device_fixture)
+    ).session
+    servicer.SaveARFrames(
+        SaveARFramesRequest(
+            session_id=session.id,
+            device=device_fixture,
+            frames=[
+                ARFrame(
+                    transform_frame=TransformFrame(
+                        device_timestamp=Timestamp(seconds=0, nanos=0),
+                        data=np.random.rand(12).astype(np.float32).tobytes(),
+                    )
+                ),
+                ARFrame(
+                    color_frame=ColorFrame(
+                        device_timestamp=Timestamp(seconds=0, nanos=0),
+                        image=XRCpuImage(
+                            dimensions=Vector2Int(x=4, y=2),
+                            format=XRCpuImage.FORMAT_RGB24,
+                            planes=[XRCpuImage.Plane(data=bytes(4 * 2 * 3))],
+                        ),
+                    )
+                ),
+            ],
+        )
+    )
+    servicer.on_server_exit()
+
+    recorded = spans(enabled_tracer)
+    names = {span["name"] for span in recorded}
+    assert {
+        "admit_frames",
+        "save_ar_frames",
+        "classify_frames",
+        "save_transform_frames",
+        "on_save_transform_frames",
+        "save_color_frames",
+        "np.frombuffer",
+        "new_entity_path",
+        "log_static",
+        "send_columns",
+        "on_save_color_frames",
+        "on_save_ar_frames",
+    } <= names
+    (root,) = [span for span in recorded if span["name"] == "save_ar_frames"]
+    assert root["args"] == {"frames": 2}
+    for span in recorded:
+        if span["name"] == "admit_frames":
+            continue
+        assert root["ts"] <= span["ts"]
+        assert span["ts"] + span["dur"] <= root["ts"] + root["dur"]
@@ -0,0 +1,89 @@
+"""Frame grouping tests."""
+
+# ruff:noqa: D103
+from arflow._utils import classify_frames, frames_byte_size
+from cakelab.arflow_grpc.v1.ar_frame_pb2 import ARFrame
+from cakelab.arflow_grpc.v1.audio_frame_pb2 import AudioFrame
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.depth_frame_pb2 import DepthFrame
+from cakelab.arflow_grpc.v1.imu_batch_frame_pb2 import ImuBatchFrame
+from cakelab.arflow_grpc.v1.transform_frame_pb2 import TransformFrame
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+
+
+def color_frame(format: XRCpuImage.Format, width: int, height: int) -> ColorFrame:
+    return ColorFrame(
+        image=XRCpuImage(format=format, dimensions=Vector2Int(x=width, y=height))
+    )
+
+
+def depth_frame(smoothed: bool) -> DepthFrame:
+    return DepthFrame(
+        image=XRCpuImage(
+            format=XRCpuImage.FORMAT_DEPTHFLOAT32, dimensions=Vector2Int(x=2, y=2)
+        ),
+        environment_depth_temporal_smoothing_enabled=smoothed,
+    )
+
+
+def test_classify_frames():
+    transform_frames = [TransformFrame(data=bytes([i])) for i in range(2)]
+    color_frames = [
+        color_frame(XRCpuImage.FORMAT_RGB24, 4, 4),
+        color_frame(XRCpuImage.FORMAT_JPEG_RGB24, 4, 4),
+        color_frame(XRCpuImage.FORMAT_RGB24, 4, 4),
+        color_frame(XRCpuImage.FORMAT_RGB24, 8, 4),
+    ]
+    depth_frames = [depth_frame(True), depth_frame(False), depth_frame(True)]
+    audio_frame = AudioFrame(data=[1.0])
+    imu_batch_frame = ImuBatchFrame(device_timestamps=bytes(8), samples=bytes(52))
+    frames = [
+        ARFrame(color_frame=color_frames[0]),
+        ARFrame(transform_frame=transform_frames[0]),
+        ARFrame(depth_frame=depth_frames[0]),
+        ARFrame(color_frame=color_frames[1]),
+        ARFrame(audio_frame=audio_frame),
+        ARFrame(imu_batch_frame=imu_batch_frame),
+        ARFrame(depth_frame=depth_frames[1]),
+        ARFrame(color_frame=color_frames[2]),
+        ARFrame(),
+        ARFrame(transform_frame=transform_frames[1]),
+        ARFrame(depth_frame=depth_frames[2]),
+        ARFrame(color_frame=color_frames[3]),
+    ]
+
+    classified = classify_frames(frames)
+
+    assert classified.transform_frames == transform_frames
+    assert classified.color_frames == color_frames
+    assert classified.depth_frames == depth_frames
+    assert classified.audio_frames == [audio_frame]
+    assert classified.gyroscope_frames == []
+    assert classified.plane_detection_frames == []
+    assert classified.point_cloud_detection_frames == []
+    assert classified.mesh_detection_frames == []
+    assert classified.imu_batch_frames == [imu_batch_frame]
+    assert classified.audio_chunk_frames == []
+    assert dict(classified.color_frame_groups) == {
+        (XRCpuImage.FORMAT_RGB24, 4, 4): [color_frames[0], color_frames[2]],
+        (XRCpuImage.FORMAT_JPEG_RGB24, 4, 4): [color_frames[1]],
+        (XRCpuImage.FORMAT_RGB24, 8, 4): [color_frames[3]],
+    }
+    assert dict(classified.depth_frame_groups) == {
+        (XRCpuImage.FORMAT_DEPTHFLOAT32, 2, 2, True): [
+            depth_frames[0],
+            depth_frames[2],
+        ],
+        (XRCpuImage.FORMAT_DEPTHFLOAT32, 2, 2, False): [depth_frames[1]],
+    }
+
+
+def test_frames_byte_size():
+    frames = [
+        ARFrame(transform_frame=TransformFrame(data=bytes(48))),
+        ARFrame(color_frame=ColorFrame()),
+    ]
+
+    assert frames_byte_size(frames) == sum(frame.ByteSize() for frame in frames)
+    assert frames_byte_size([]) == 0
@@ -0,0 +1,317 @@
+"""YUV_420_888 conversion tests."""
+
+# ruff:noqa: D103
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+import pytest
+import rerun as rr
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from arflow import SessionStream, YuvLayout
+from arflow._decoded_frames import DecodedFrameCache
+from arflow._yuv import YuvBufferPool, write_i420, write_nv12, yuv_layout, yuv_size
+from cakelab.arflow_grpc.v1.color_frame_pb2 import ColorFrame
+from cakelab.arflow_grpc.v1.device_pb2 import Device
+from cakelab.arflow_grpc.v1.session_pb2 import Session, SessionUuid
+from cakelab.arflow_grpc.v1.vector2_int_pb2 import Vector2Int
+from cakelab.arflow_grpc.v1.xr_cpu_image_pb2 import XRCpuImage
+from tests.conftest import TEST_APP_ID
+
+WIDTH = 6
+HEIGHT = 4
+ROW_STRIDE = 8
+
+
+def planes(value: int = 0) -> tuple[npt.NDArray[np.uint8], ...]:
+    y = (np.arange(HEIGHT * WIDTH) + value).astype(np.uint8).reshape((HEIGHT, WIDTH))
+    u = (np.arange(HEIGHT * WIDTH // 4) + 100 + value).astype(np.uint8)
+    v = (np.arange(HEIGHT * WIDTH // 4) + 200 + value).astype(np.uint8)
+    return y, u.reshape((HEIGHT // 2, WIDTH // 2)), v.reshape((HEIGHT // 2, WIDTH // 2))
+
+
+def padded_y_plane(y: npt.NDArray[np.uint8]) -> XRCpuImage.Plane:
+    rows = np.full((HEIGHT, ROW_STRIDE), 255, dtype=np.uint8)
+    rows[:, :WIDTH] = y
+    return XRCpuImage.Plane(
+        data=rows.tobytes()[: -(ROW_STRIDE - WIDTH)],
+        row_stride=ROW_STRIDE,
+        pixel_stride=1,
+    )
+
+
+def interleaved_image(layout: YuvLayout, value: int = 0) -> XRCpuImage:
+    """An image whose chroma planes view one buffer, the way Android cameras send them."""
+    y, u, v = planes(value)
+    first, second = (u, v) if layout == YuvLayout.NV12 else (v, u)
+    chroma = np.full((HEIGHT // 2, ROW_STRIDE), 255, dtype=np.uint8)
+    chroma[:, 0:WIDTH:2] = first
+    chroma[:, 1:WIDTH:2] = second
+    # Both planes end at their last sample.
+    data = chroma.reshape(-1)[: (HEIGHT // 2 - 1) * ROW_STRIDE + WIDTH]
+    first_plane = XRCpuImage.Plane(
+        data=data[:-1].tobytes(), row_stride=ROW_STRIDE, pixel_stride=2
+    )
+    second_plane = XRCpuImage.Plane(
+        data=data[1:].tobytes(), row_stride=ROW_STRIDE, pixel_stride=2
+    )
+    u_plane, v_plane = (
+        (first_plane, second_plane)
+        if layout == YuvLayout.NV12
+        else (second_plane, first_plane)
+    )
+    return XRCpuImage(
+        dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+        format=XRCpuImage.FORMAT_ANDROID_YUV_420_888,
+        planes=[padded_y_plane(y), u_plane, v_plane],
+    )
+
+
+def biplanar_image(value: int = 0) -> XRCpuImage:
+    """An image in the layout iOS cameras send, with a Y and an interleaved CbCr plane."""
+    y, u, v = planes(value)
+    cbcr = np.full((HEIGHT // 2, ROW_STRIDE), 255, dtype=np.uint8)
+    cbcr[:, 0:WIDTH:2] = u
+    cbcr[:, 1:WIDTH:2] = v
+    return XRCpuImage(
+        dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+        format=XRCpuImage.FORMAT_IOS_YP_CBCR_420_8BI_PLANAR_FULL_RANGE,
+        planes=[
+            padded_y_plane(y),
+            XRCpuImage.Plane(
+                data=cbcr.tobytes(), row_stride=ROW_STRIDE, pixel_stride=2
+            ),
+        ],
+    )
+
+
+def planar_image() -> XRCpuImage:
+    y, u, v = planes()
+    return XRCpuImage(
+        dimensions=Vector2Int(x=WIDTH, y=HEIGHT),
+        format=XRCpuImage.FORMAT_ANDROID_YUV_420_888,
+        planes=[
+            padded_y_plane(y),
+            XRCpuImage.Plane(data=u.tobytes(), row_stride=WIDTH // 2, pixel_stride=1),
+            XRCpuImage.Plane(data=v.tobytes(), row_stride=WIDTH // 2, pixel_stride=1),
+        ],
+    )
+
+
+def expected_i420(value: int = 0) -> npt.NDArray[np.uint8]:
+    return np.concatenate([plane.reshape(-1) for plane in planes(value)])
+
+
+def expected_nv12() -> npt.NDArray[np.uint8]:
+    y, u, v = planes()
+    return np.concatenate([y.reshape(-1), np.stack([u, v], axis=-1).reshape(-1)])
+
+
+@pytest.mark.parametrize(
+    "image,layout",
+    [
+        (interleaved_image(YuvLayout.NV12), YuvLayout.NV12),
+        (interleaved_image(YuvLayout.NV21), YuvLayout.NV21),
+        (biplanar_image(), YuvLayout.I420),
+        (planar_image(), YuvLayout.I420),
+    ],
+)
+def test_layouts_convert_to_i420(image: XRCpuImage, layout: YuvLayout):
+    out = np.empty(yuv_size(WIDTH, HEIGHT), dtype=np.uint8)
+
+    write_i420(image, out)
+
+    assert yuv_layout(image) == layout
+    np.testing.assert_array_equal(out, expected_i420())
+
+
+def odd_image() -> XRCpuImage:
+    image = interleaved_image(YuvLayout.NV12)
+    image.dimensions.x = WIDTH - 1
+    return image
+
+
+def single_sample_chroma_image() -> XRCpuImage:
+    image = interleaved_image(YuvLayout.NV12)
+    for plane in image.planes[1:]:
+        plane.data = plane.data[:1]
+    return image
+
+
+def separate_strided_chroma_image() -> XRCpuImage:
+    image = interleaved_image(YuvLayout.NV12)
+    image.planes[2].data = bytes(len(image.planes[2].data))
+    return image
+
+
+@pytest.mark.parametrize(
+    "image",
+    [odd_image(), single_sample_chroma_image(), separate_strided_chroma_image()],
+    ids=["odd", "single_sample", "separate"],
+)
+def test_layout_falls_back_to_i420(image: XRCpuImage):
+    assert yuv_layout(image) == YuvLayout.I420
+
+
+@pytest.mark.parametrize("write", [write_i420, write_nv12])
+def test_images_missing_planes_are_zero(
+    write: Callable[[XRCpuImage, npt.NDArray[np.uint8]], None],
+    caplog: pytest.LogCaptureFixture,
+):
+    image = interleaved_image(YuvLayout.NV12)
+    del image.planes[2]
+    out = np.full(yuv_size(WIDTH, HEIGHT), 7, dtype=np.uint8)
+
+    write(image, out)
+
+    assert not out.any()
+    assert "Expected 3 planes, got 2" in caplog.text
+
+
+def test_nv12_is_copied_without_deinterleaving():
+    out = np.empty(yuv_size(WIDTH, HEIGHT), dtype=np.uint8)
+
+    write_nv12(interleaved_image(YuvLayout.NV12), out)
+
+    np.testing.assert_array_equal(out, expected_nv12())
+    np.testing.assert_array_equal(
+        cv2.cvtColor(out.reshape((HEIGHT * 3 // 2, WIDTH)), cv2.COLOR_YUV2RGB_NV12),
+        cv2.cvtColor(
+            expected_i420().reshape((HEIGHT * 3 // 2, WIDTH)), cv2.COLOR_YUV2RGB_I420
+        ),
+    )
+
+
+def test_full_range_samples_keep_their_range():
+    image = biplanar_image()
+    image.planes[0].data = bytes([0, 255, 128, 1, 254, 0, 0, 0]) * HEIGHT
+    image.planes[1].data = bytes([0, 255, 128, 128, 1, 254, 0, 0]) * (HEIGHT // 2)
+    out = np.empty(yuv_size(WIDTH, HEIGHT), dtype=np.uint8)
+
+    write_i420(image, out)
+
+    np.testing.assert_array_equal(
+        out[: WIDTH * HEIGHT].reshape((HEIGHT, WIDTH))[0], [0, 255, 128, 1, 254, 0]
+    )
+    np.testing.assert_array_equal(
+        out[WIDTH * HEIGHT :].reshape((2, HEIGHT // 2, WIDTH // 2))[:, 0],
+        [[0, 128, 1], [255, 128, 254]],
+    )
+
+
+def test_missing_samples_are_zero():
+    image = planar_image()
+    image.planes[1].data = image.planes[1].data[:-1]
+    out = np.empty(yuv_size(WIDTH, HEIGHT), dtype=np.uint8)
+
+    write_i420(image, out)
+
+    expected = expected_i420()
+    u_end = WIDTH * HEIGHT + WIDTH * HEIGHT // 4
+    expected[u_end - 1] = 0
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_pool_reuses_buffers_once_unreferenced():
+    pool = YuvBufferPool(buffers_per_size=1)
+
+    first = pool.take(WIDTH, HEIGHT, 2)
+    first.flags.writeable = False
+    row = first[0]
+    del first
+    second = pool.take(WIDTH, HEIGHT, 2)
+    assert not np.shares_memory(row, second)
+    del row, second
+
+    third = pool.take(WIDTH, HEIGHT, 1)
+    assert third.shape == (1, yuv_size(WIDTH, HEIGHT))
+    assert third.flags.writeable
+    assert pool.reuses == 1
+    del third
+    assert pool.take(WIDTH, HEIGHT, 3).shape == (3, yuv_size(WIDTH, HEIGHT))
+    assert pool.allocations == 3
+
+    pool.clear()
+    pool.take(WIDTH, HEIGHT, 1)
+    assert pool.allocations == 4
+
+
+def test_interleaved_frames_are_logged_as_nv12(tmp_path: Path, device_fixture: Device):
+    stream = rr.new_recording(application_id=TEST_APP_ID)
+    rr.save(tmp_path / "session.rrd", recording=stream)
+    session_stream = SessionStream(
+        info=Session(id=SessionUuid(value="session"), devices=[device_fixture]),
+        stream=stream,
+    )
+
+    def save(layout: YuvLayout):
+        frames = [
+            ColorFrame(
+                device_timestamp=Timestamp(seconds=i),
+                image=interleaved_image(layout, value=i),
+            )
+            for i in range(2)
+        ]
+        (batch,) = session_stream.save_color_frames(frames, device_fixture)
+        return batch
+
+    nv12_batch = save(YuvLayout.NV12)
+    nv21_batch = save(YuvLayout.NV21)
+
+    assert nv12_batch.yuv_layout == YuvLayout.NV12
+    assert nv21_batch.yuv_layout == YuvLayout.I420
+    np.testing.assert_array_equal(nv21_batch.buffers[1], expected_i420(value=1))
+    (decoded, _) = nv12_batch.decoded_frames
+    assert np.shares_memory(decoded.nv12(), nv12_batch.buffers)
+    np.testing.assert_array_equal(
+        decoded.rgb(),
+        cv2.cvtColor(
+            expected_i420().reshape((HEIGHT * 3 // 2, WIDTH)), cv2.COLOR_YUV2RGB_I420
+        ),
+    )
+
+
+def test_ios_frames_are_logged_as_full_range_i420(
+    tmp_path: Path, device_fixture: Device
+):
+    stream = rr.new_recording(application_id=TEST_APP_ID)
+    rr.save(tmp_path / "session.rrd", recording=stream)
+    session_stream = SessionStream(
+        info=Session(id=SessionUuid(value="session"), devices=[device_fixture]),
+        stream=stream,
+    )
+    frames = [ColorFrame(image=biplanar_image(value=i)) for i in range(2)]
+
+    with patch.object(
+        rr.components, "ImageFormat", wraps=rr.components.ImageFormat
+    ) as mock_image_format:
+        (batch,) = session_stream.save_color_frames(frames, device_fixture)
+
+    assert (
+        mock_image_format.call_args.kwargs["pixel_format"]
+        == rr.PixelFormat.Y_U_V12_FullRange
+    )
+    assert batch.yuv_layout == YuvLayout.I420
+    assert batch.images.shape == (2, HEIGHT * 3 // 2, WIDTH)
+    np.testing.assert_array_equal(batch.buffers[0], expected_i420())
+    np.testing.assert_array_equal(
+        batch.decoded_frames[1].i420(), expected_i420(value=1)
+    )
+
+
+def test_full_range_frames_convert_to_rgb_in_the_full_range():
+    image = biplanar_image()
+    # Full-range black is 0 and white is 255, where the limited range clips them to 16 and 235.
+    image.planes[0].data = bytes([0, 0, 0, 255, 255, 255, 0, 0]) * HEIGHT
+    image.planes[1].data = bytes([128] * ROW_STRIDE) * (HEIGHT // 2)
+    decoded = DecodedFrameCache().get(ColorFrame(image=image))
+
+    rgb = decoded.rgb()
+
+    np.testing.assert_array_equal(rgb[:, :3], 0)
+    np.testing.assert_array_equal(rgb[:, 3:], 255)
+    np.testing.assert_array_equal(decoded.bgr(), rgb)
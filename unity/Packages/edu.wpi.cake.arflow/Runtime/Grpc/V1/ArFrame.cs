@@ -25,39 +25,45 @@ public static partial class ArFrameReflection {
       byte[] descriptorData = global::System.Convert.FromBase64String(
           string.Concat(
             "CiVjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2FyX2ZyYW1lLnByb3RvEhZjYWtl",
-            "bGFiLmFyZmxvd19ncnBjLnYxGihjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2F1",
-            "ZGlvX2ZyYW1lLnByb3RvGihjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2NvbG9y",
-            "X2ZyYW1lLnByb3RvGihjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2RlcHRoX2Zy",
-            "YW1lLnByb3RvGixjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2d5cm9zY29wZV9m",
-            "cmFtZS5wcm90bxoxY2FrZWxhYi9hcmZsb3dfZ3JwYy92MS9tZXNoX2RldGVj",
-            "dGlvbl9mcmFtZS5wcm90bxoyY2FrZWxhYi9hcmZsb3dfZ3JwYy92MS9wbGFu",
-            "ZV9kZXRlY3Rpb25fZnJhbWUucHJvdG8aOGNha2VsYWIvYXJmbG93X2dycGMv",
-            "djEvcG9pbnRfY2xvdWRfZGV0ZWN0aW9uX2ZyYW1lLnByb3RvGixjYWtlbGFi",
-            "L2FyZmxvd19ncnBjL3YxL3RyYW5zZm9ybV9mcmFtZS5wcm90byLCBQoHQVJG",
-            "cmFtZRJRCg90cmFuc2Zvcm1fZnJhbWUYASABKAsyJi5jYWtlbGFiLmFyZmxv",
-            "d19ncnBjLnYxLlRyYW5zZm9ybUZyYW1lSABSDnRyYW5zZm9ybUZyYW1lEkUK",
-            "C2NvbG9yX2ZyYW1lGAIgASgLMiIuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5D",
-            "b2xvckZyYW1lSABSCmNvbG9yRnJhbWUSRQoLZGVwdGhfZnJhbWUYAyABKAsy",
-            "Ii5jYWtlbGFiLmFyZmxvd19ncnBjLnYxLkRlcHRoRnJhbWVIAFIKZGVwdGhG",
-            "cmFtZRJRCg9neXJvc2NvcGVfZnJhbWUYBCABKAsyJi5jYWtlbGFiLmFyZmxv",
-            "d19ncnBjLnYxLkd5cm9zY29wZUZyYW1lSABSDmd5cm9zY29wZUZyYW1lEkUK",
-            "C2F1ZGlvX2ZyYW1lGAUgASgLMiIuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5B",
-            "dWRpb0ZyYW1lSABSCmF1ZGlvRnJhbWUSYQoVcGxhbmVfZGV0ZWN0aW9uX2Zy",
-            "YW1lGAYgASgLMisuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5QbGFuZURldGVj",
-            "dGlvbkZyYW1lSABSE3BsYW5lRGV0ZWN0aW9uRnJhbWUScQobcG9pbnRfY2xv",
-            "dWRfZGV0ZWN0aW9uX2ZyYW1lGAcgASgLMjAuY2FrZWxhYi5hcmZsb3dfZ3Jw",
-            "Yy52MS5Qb2ludENsb3VkRGV0ZWN0aW9uRnJhbWVIAFIYcG9pbnRDbG91ZERl",
-            "dGVjdGlvbkZyYW1lEl4KFG1lc2hfZGV0ZWN0aW9uX2ZyYW1lGAggASgLMiou",
-            "Y2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5NZXNoRGV0ZWN0aW9uRnJhbWVIAFIS",
-            "bWVzaERldGVjdGlvbkZyYW1lQgYKBGRhdGFCoQEKGmNvbS5jYWtlbGFiLmFy",
-            "Zmxvd19ncnBjLnYxQgxBckZyYW1lUHJvdG9QAaICA0NBWKoCFkNha2VMYWIu",
-            "QVJGbG93LkdycGMuVjHKAhVDYWtlbGFiXEFyZmxvd0dycGNcVjHiAiFDYWtl",
-            "bGFiXEFyZmxvd0dycGNcVjFcR1BCTWV0YWRhdGHqAhdDYWtlbGFiOjpBcmZs",
-            "b3dHcnBjOjpWMWIGcHJvdG8z"));
+            "bGFiLmFyZmxvd19ncnBjLnYxGi5jYWtlbGFiL2FyZmxvd19ncnBjL3YxL2F1",
+            "ZGlvX2NodW5rX2ZyYW1lLnByb3RvGihjYWtlbGFiL2FyZmxvd19ncnBjL3Yx",
+            "L2F1ZGlvX2ZyYW1lLnByb3RvGihjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2Nv",
+            "bG9yX2ZyYW1lLnByb3RvGihjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2RlcHRo",
+            "X2ZyYW1lLnByb3RvGixjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2d5cm9zY29w",
+            "ZV9mcmFtZS5wcm90bxosY2FrZWxhYi9hcmZsb3dfZ3JwYy92MS9pbXVfYmF0",
+            "Y2hfZnJhbWUucHJvdG8aMWNha2VsYWIvYXJmbG93X2dycGMvdjEvbWVzaF9k",
+            "ZXRlY3Rpb25fZnJhbWUucHJvdG8aMmNha2VsYWIvYXJmbG93X2dycGMvdjEv",
+            "cGxhbmVfZGV0ZWN0aW9uX2ZyYW1lLnByb3RvGjhjYWtlbGFiL2FyZmxvd19n",
+            "cnBjL3YxL3BvaW50X2Nsb3VkX2RldGVjdGlvbl9mcmFtZS5wcm90bxosY2Fr",
+            "ZWxhYi9hcmZsb3dfZ3JwYy92MS90cmFuc2Zvcm1fZnJhbWUucHJvdG8i6gYK",
+            "B0FSRnJhbWUSUQoPdHJhbnNmb3JtX2ZyYW1lGAEgASgLMiYuY2FrZWxhYi5h",
+            "cmZsb3dfZ3JwYy52MS5UcmFuc2Zvcm1GcmFtZUgAUg50cmFuc2Zvcm1GcmFt",
+            "ZRJFCgtjb2xvcl9mcmFtZRgCIAEoCzIiLmNha2VsYWIuYXJmbG93X2dycGMu",
+            "djEuQ29sb3JGcmFtZUgAUgpjb2xvckZyYW1lEkUKC2RlcHRoX2ZyYW1lGAMg",
+            "ASgLMiIuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5EZXB0aEZyYW1lSABSCmRl",
+            "cHRoRnJhbWUSUQoPZ3lyb3Njb3BlX2ZyYW1lGAQgASgLMiYuY2FrZWxhYi5h",
+            "cmZsb3dfZ3JwYy52MS5HeXJvc2NvcGVGcmFtZUgAUg5neXJvc2NvcGVGcmFt",
+            "ZRJFCgthdWRpb19mcmFtZRgFIAEoCzIiLmNha2VsYWIuYXJmbG93X2dycGMu",
+            "djEuQXVkaW9GcmFtZUgAUgphdWRpb0ZyYW1lEmEKFXBsYW5lX2RldGVjdGlv",
+            "bl9mcmFtZRgGIAEoCzIrLmNha2VsYWIuYXJmbG93X2dycGMudjEuUGxhbmVE",
+            "ZXRlY3Rpb25GcmFtZUgAUhNwbGFuZURldGVjdGlvbkZyYW1lEnEKG3BvaW50",
+            "X2Nsb3VkX2RldGVjdGlvbl9mcmFtZRgHIAEoCzIwLmNha2VsYWIuYXJmbG93",
+            "X2dycGMudjEuUG9pbnRDbG91ZERldGVjdGlvbkZyYW1lSABSGHBvaW50Q2xv",
+            "dWREZXRlY3Rpb25GcmFtZRJeChRtZXNoX2RldGVjdGlvbl9mcmFtZRgIIAEo",
+            "CzIqLmNha2VsYWIuYXJmbG93X2dycGMudjEuTWVzaERldGVjdGlvbkZyYW1l",
+            "SABSEm1lc2hEZXRlY3Rpb25GcmFtZRJPCg9pbXVfYmF0Y2hfZnJhbWUYCSAB",
+            "KAsyJS5jYWtlbGFiLmFyZmxvd19ncnBjLnYxLkltdUJhdGNoRnJhbWVIAFIN",
+            "aW11QmF0Y2hGcmFtZRJVChFhdWRpb19jaHVua19mcmFtZRgKIAEoCzInLmNh",
+            "a2VsYWIuYXJmbG93X2dycGMudjEuQXVkaW9DaHVua0ZyYW1lSABSD2F1ZGlv",
+            "Q2h1bmtGcmFtZUIGCgRkYXRhQqEBChpjb20uY2FrZWxhYi5hcmZsb3dfZ3Jw",
+            "Yy52MUIMQXJGcmFtZVByb3RvUAGiAgNDQViqAhZDYWtlTGFiLkFSRmxvdy5H",
+            "cnBjLlYxygIVQ2FrZWxhYlxBcmZsb3dHcnBjXFYx4gIhQ2FrZWxhYlxBcmZs",
+            "b3dHcnBjXFYxXEdQQk1ldGFkYXRh6gIXQ2FrZWxhYjo6QXJmbG93R3JwYzo6",
+            "VjFiBnByb3RvMw=="));
       descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
-          new pbr::FileDescriptor[] { global::CakeLab.ARFlow.Grpc.V1.AudioFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.ColorFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.DepthFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.GyroscopeFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.MeshDetectionFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.PlaneDetectionFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.PointCloudDetectionFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.TransformFrameReflection.Descriptor, },
+          new pbr::FileDescriptor[] { global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.AudioFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.ColorFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.DepthFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.GyroscopeFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.MeshDetectionFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.PlaneDetectionFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.PointCloudDetectionFrameReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.TransformFrameReflection.Descriptor, },
           new pbr::GeneratedClrTypeInfo(null, null, new pbr::GeneratedClrTypeInfo[] {
-            new pbr::GeneratedClrTypeInfo(typeof(global::CakeLab.ARFlow.Grpc.V1.ARFrame), global::CakeLab.ARFlow.Grpc.V1.ARFrame.Parser, new[]{ "TransformFrame", "ColorFrame", "DepthFrame", "GyroscopeFrame", "AudioFrame", "PlaneDetectionFrame", "PointCloudDetectionFrame", "MeshDetectionFrame" }, new[]{ "Data" }, null, null, null)
+            new pbr::GeneratedClrTypeInfo(typeof(global::CakeLab.ARFlow.Grpc.V1.ARFrame), global::CakeLab.ARFlow.Grpc.V1.ARFrame.Parser, new[]{ "TransformFrame", "ColorFrame", "DepthFrame", "GyroscopeFrame", "AudioFrame", "PlaneDetectionFrame", "PointCloudDetectionFrame", "MeshDetectionFrame", "ImuBatchFrame", "AudioChunkFrame" }, new[]{ "Data" }, null, null, null)
           }));
     }
     #endregion
@@ -124,6 +130,12 @@ public sealed partial class ARFrame : pb::IMessage<ARFrame>
         case DataOneofCase.MeshDetectionFrame:
           MeshDetectionFrame = other.MeshDetectionFrame.Clone();
           break;
+        case DataOneofCase.ImuBatchFrame:
+          ImuBatchFrame = other.ImuBatchFrame.Clone();
+          break;
+        case DataOneofCase.AudioChunkFrame:
+          AudioChunkFrame = other.AudioChunkFrame.Clone();
+          break;
       }
 
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
@@ -231,6 +243,30 @@ public sealed partial class ARFrame : pb::IMessage<ARFrame>
       }
     }
 
+    /// <summary>Field number for the "imu_batch_frame" field.</summary>
+    public const int ImuBatchFrameFieldNumber = 9;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame ImuBatchFrame {
+      get { return dataCase_ == DataOneofCase.ImuBatchFrame ? (global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame) data_ : null; }
+      set {
+        data_ = value;
+        dataCase_ = value == null ? DataOneofCase.None : DataOneofCase.ImuBatchFrame;
+      }
+    }
+
+    /// <summary>Field number for the "audio_chunk_frame" field.</summary>
+    public const int AudioChunkFrameFieldNumber = 10;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame AudioChunkFrame {
+      get { return dataCase_ == DataOneofCase.AudioChunkFrame ? (global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame) data_ : null; }
+      set {
+        data_ = value;
+        dataCase_ = value == null ? DataOneofCase.None : DataOneofCase.AudioChunkFrame;
+      }
+    }
+
     private object data_;
     /// <summary>Enum of possible cases for the "data" oneof.</summary>
     public enum DataOneofCase {
@@ -243,6 +279,8 @@ public enum DataOneofCase {
       PlaneDetectionFrame = 6,
       PointCloudDetectionFrame = 7,
       MeshDetectionFrame = 8,
+      ImuBatchFrame = 9,
+      AudioChunkFrame = 10,
     }
     private DataOneofCase dataCase_ = DataOneofCase.None;
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
@@ -281,6 +319,8 @@ public enum DataOneofCase {
       if (!object.Equals(PlaneDetectionFrame, other.PlaneDetectionFrame)) return false;
       if (!object.Equals(PointCloudDetectionFrame, other.PointCloudDetectionFrame)) return false;
       if (!object.Equals(MeshDetectionFrame, other.MeshDetectionFrame)) return false;
+      if (!object.Equals(ImuBatchFrame, other.ImuBatchFrame)) return false;
+      if (!object.Equals(AudioChunkFrame, other.AudioChunkFrame)) return false;
       if (DataCase != other.DataCase) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
@@ -297,6 +337,8 @@ public enum DataOneofCase {
       if (dataCase_ == DataOneofCase.PlaneDetectionFrame) hash ^= PlaneDetectionFrame.GetHashCode();
       if (dataCase_ == DataOneofCase.PointCloudDetectionFrame) hash ^= PointCloudDetectionFrame.GetHashCode();
       if (dataCase_ == DataOneofCase.MeshDetectionFrame) hash ^= MeshDetectionFrame.GetHashCode();
+      if (dataCase_ == DataOneofCase.ImuBatchFrame) hash ^= ImuBatchFrame.GetHashCode();
+      if (dataCase_ == DataOneofCase.AudioChunkFrame) hash ^= AudioChunkFrame.GetHashCode();
       hash ^= (int) dataCase_;
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
@@ -348,6 +390,14 @@ public enum DataOneofCase {
         output.WriteRawTag(66);
         output.WriteMessage(MeshDetectionFrame);
       }
+      if (dataCase_ == DataOneofCase.ImuBatchFrame) {
+        output.WriteRawTag(74);
+        output.WriteMessage(ImuBatchFrame);
+      }
+      if (dataCase_ == DataOneofCase.AudioChunkFrame) {
+        output.WriteRawTag(82);
+        output.WriteMessage(AudioChunkFrame);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
       }
@@ -390,6 +440,14 @@ public enum DataOneofCase {
         output.WriteRawTag(66);
         output.WriteMessage(MeshDetectionFrame);
       }
+      if (dataCase_ == DataOneofCase.ImuBatchFrame) {
+        output.WriteRawTag(74);
+        output.WriteMessage(ImuBatchFrame);
+      }
+      if (dataCase_ == DataOneofCase.AudioChunkFrame) {
+        output.WriteRawTag(82);
+        output.WriteMessage(AudioChunkFrame);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(ref output);
       }
@@ -424,6 +482,12 @@ public enum DataOneofCase {
       if (dataCase_ == DataOneofCase.MeshDetectionFrame) {
         size += 1 + pb::CodedOutputStream.ComputeMessageSize(MeshDetectionFrame);
       }
+      if (dataCase_ == DataOneofCase.ImuBatchFrame) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(ImuBatchFrame);
+      }
+      if (dataCase_ == DataOneofCase.AudioChunkFrame) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(AudioChunkFrame);
+      }
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
       }
@@ -485,6 +549,18 @@ public enum DataOneofCase {
           }
           MeshDetectionFrame.MergeFrom(other.MeshDetectionFrame);
           break;
+        case DataOneofCase.ImuBatchFrame:
+          if (ImuBatchFrame == null) {
+            ImuBatchFrame = new global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame();
+          }
+          ImuBatchFrame.MergeFrom(other.ImuBatchFrame);
+          break;
+        case DataOneofCase.AudioChunkFrame:
+          if (AudioChunkFrame == null) {
+            AudioChunkFrame = new global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame();
+          }
+          AudioChunkFrame.MergeFrom(other.AudioChunkFrame);
+          break;
       }
 
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
@@ -578,6 +654,24 @@ public enum DataOneofCase {
             MeshDetectionFrame = subBuilder;
             break;
           }
+          case 74: {
+            global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame subBuilder = new global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame();
+            if (dataCase_ == DataOneofCase.ImuBatchFrame) {
+              subBuilder.MergeFrom(ImuBatchFrame);
+            }
+            input.ReadMessage(subBuilder);
+            ImuBatchFrame = subBuilder;
+            break;
+          }
+          case 82: {
+            global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame subBuilder = new global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame();
+            if (dataCase_ == DataOneofCase.AudioChunkFrame) {
+              subBuilder.MergeFrom(AudioChunkFrame);
+            }
+            input.ReadMessage(subBuilder);
+            AudioChunkFrame = subBuilder;
+            break;
+          }
         }
       }
     #endif
@@ -669,6 +763,24 @@ public enum DataOneofCase {
             MeshDetectionFrame = subBuilder;
             break;
           }
+          case 74: {
+            global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame subBuilder = new global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame();
+            if (dataCase_ == DataOneofCase.ImuBatchFrame) {
+              subBuilder.MergeFrom(ImuBatchFrame);
+            }
+            input.ReadMessage(subBuilder);
+            ImuBatchFrame = subBuilder;
+            break;
+          }
+          case 82: {
+            global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame subBuilder = new global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame();
+            if (dataCase_ == DataOneofCase.AudioChunkFrame) {
+              subBuilder.MergeFrom(AudioChunkFrame);
+            }
+            input.ReadMessage(subBuilder);
+            AudioChunkFrame = subBuilder;
+            break;
+          }
         }
       }
     }
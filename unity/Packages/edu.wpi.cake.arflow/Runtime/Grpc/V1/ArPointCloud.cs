@@ -27,20 +27,23 @@ public static partial class ArPointCloudReflection {
             "CitjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2FyX3BvaW50X2Nsb3VkLnByb3Rv",
             "EhZjYWtlbGFiLmFyZmxvd19ncnBjLnYxGiljYWtlbGFiL2FyZmxvd19ncnBj",
             "L3YxL2FyX3RyYWNrYWJsZS5wcm90bxokY2FrZWxhYi9hcmZsb3dfZ3JwYy92",
-            "MS92ZWN0b3IzLnByb3RvIt8BCgxBUlBvaW50Q2xvdWQSQQoJdHJhY2thYmxl",
+            "MS92ZWN0b3IzLnByb3RvIvMCCgxBUlBvaW50Q2xvdWQSQQoJdHJhY2thYmxl",
             "GAEgASgLMiMuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5BUlRyYWNrYWJsZVIJ",
             "dHJhY2thYmxlEisKEWNvbmZpZGVuY2VfdmFsdWVzGAIgAygCUhBjb25maWRl",
             "bmNlVmFsdWVzEiAKC2lkZW50aWZpZXJzGAMgAygEUgtpZGVudGlmaWVycxI9",
             "Cglwb3NpdGlvbnMYBCADKAsyHy5jYWtlbGFiLmFyZmxvd19ncnBjLnYxLlZl",
-            "Y3RvcjNSCXBvc2l0aW9uc0KmAQoaY29tLmNha2VsYWIuYXJmbG93X2dycGMu",
-            "djFCEUFyUG9pbnRDbG91ZFByb3RvUAGiAgNDQViqAhZDYWtlTGFiLkFSRmxv",
-            "dy5HcnBjLlYxygIVQ2FrZWxhYlxBcmZsb3dHcnBjXFYx4gIhQ2FrZWxhYlxB",
-            "cmZsb3dHcnBjXFYxXEdQQk1ldGFkYXRh6gIXQ2FrZWxhYjo6QXJmbG93R3Jw",
-            "Yzo6VjFiBnByb3RvMw=="));
+            "Y3RvcjNSCXBvc2l0aW9ucxIpChBwYWNrZWRfcG9zaXRpb25zGAUgASgMUg9w",
+            "YWNrZWRQb3NpdGlvbnMSLQoScGFja2VkX2lkZW50aWZpZXJzGAYgASgMUhFw",
+            "YWNrZWRJZGVudGlmaWVycxI4ChhwYWNrZWRfY29uZmlkZW5jZV92YWx1ZXMY",
+            "ByABKAxSFnBhY2tlZENvbmZpZGVuY2VWYWx1ZXNCpgEKGmNvbS5jYWtlbGFi",
+            "LmFyZmxvd19ncnBjLnYxQhFBclBvaW50Q2xvdWRQcm90b1ABogIDQ0FYqgIW",
+            "Q2FrZUxhYi5BUkZsb3cuR3JwYy5WMcoCFUNha2VsYWJcQXJmbG93R3JwY1xW",
+            "MeICIUNha2VsYWJcQXJmbG93R3JwY1xWMVxHUEJNZXRhZGF0YeoCF0Nha2Vs",
+            "YWI6OkFyZmxvd0dycGM6OlYxYgZwcm90bzM="));
       descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
           new pbr::FileDescriptor[] { global::CakeLab.ARFlow.Grpc.V1.ArTrackableReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.Vector3Reflection.Descriptor, },
           new pbr::GeneratedClrTypeInfo(null, null, new pbr::GeneratedClrTypeInfo[] {
-            new pbr::GeneratedClrTypeInfo(typeof(global::CakeLab.ARFlow.Grpc.V1.ARPointCloud), global::CakeLab.ARFlow.Grpc.V1.ARPointCloud.Parser, new[]{ "Trackable", "ConfidenceValues", "Identifiers", "Positions" }, null, null, null, null)
+            new pbr::GeneratedClrTypeInfo(typeof(global::CakeLab.ARFlow.Grpc.V1.ARPointCloud), global::CakeLab.ARFlow.Grpc.V1.ARPointCloud.Parser, new[]{ "Trackable", "ConfidenceValues", "Identifiers", "Positions", "PackedPositions", "PackedIdentifiers", "PackedConfidenceValues" }, null, null, null, null)
           }));
     }
     #endregion
@@ -89,6 +92,9 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
       confidenceValues_ = other.confidenceValues_.Clone();
       identifiers_ = other.identifiers_.Clone();
       positions_ = other.positions_.Clone();
+      packedPositions_ = other.packedPositions_;
+      packedIdentifiers_ = other.packedIdentifiers_;
+      packedConfidenceValues_ = other.packedConfidenceValues_;
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
@@ -143,6 +149,53 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
       get { return positions_; }
     }
 
+    /// <summary>Field number for the "packed_positions" field.</summary>
+    public const int PackedPositionsFieldNumber = 5;
+    private pb::ByteString packedPositions_ = pb::ByteString.Empty;
+    /// <summary>
+    ///*
+    /// Packed in place of `positions`, which the server then ignores: x, y, z of every point as
+    /// little-endian float32.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString PackedPositions {
+      get { return packedPositions_; }
+      set {
+        packedPositions_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "packed_identifiers" field.</summary>
+    public const int PackedIdentifiersFieldNumber = 6;
+    private pb::ByteString packedIdentifiers_ = pb::ByteString.Empty;
+    /// <summary>
+    ///&#x2F; Packed in place of `identifiers`: one little-endian uint64 per point.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString PackedIdentifiers {
+      get { return packedIdentifiers_; }
+      set {
+        packedIdentifiers_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "packed_confidence_values" field.</summary>
+    public const int PackedConfidenceValuesFieldNumber = 7;
+    private pb::ByteString packedConfidenceValues_ = pb::ByteString.Empty;
+    /// <summary>
+    ///&#x2F; Packed in place of `confidence_values`: one little-endian float32 per point.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString PackedConfidenceValues {
+      get { return packedConfidenceValues_; }
+      set {
+        packedConfidenceValues_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public override bool Equals(object other) {
@@ -162,6 +215,9 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
       if(!confidenceValues_.Equals(other.confidenceValues_)) return false;
       if(!identifiers_.Equals(other.identifiers_)) return false;
       if(!positions_.Equals(other.positions_)) return false;
+      if (PackedPositions != other.PackedPositions) return false;
+      if (PackedIdentifiers != other.PackedIdentifiers) return false;
+      if (PackedConfidenceValues != other.PackedConfidenceValues) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
 
@@ -173,6 +229,9 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
       hash ^= confidenceValues_.GetHashCode();
       hash ^= identifiers_.GetHashCode();
       hash ^= positions_.GetHashCode();
+      if (PackedPositions.Length != 0) hash ^= PackedPositions.GetHashCode();
+      if (PackedIdentifiers.Length != 0) hash ^= PackedIdentifiers.GetHashCode();
+      if (PackedConfidenceValues.Length != 0) hash ^= PackedConfidenceValues.GetHashCode();
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
       }
@@ -198,6 +257,18 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
       confidenceValues_.WriteTo(output, _repeated_confidenceValues_codec);
       identifiers_.WriteTo(output, _repeated_identifiers_codec);
       positions_.WriteTo(output, _repeated_positions_codec);
+      if (PackedPositions.Length != 0) {
+        output.WriteRawTag(42);
+        output.WriteBytes(PackedPositions);
+      }
+      if (PackedIdentifiers.Length != 0) {
+        output.WriteRawTag(50);
+        output.WriteBytes(PackedIdentifiers);
+      }
+      if (PackedConfidenceValues.Length != 0) {
+        output.WriteRawTag(58);
+        output.WriteBytes(PackedConfidenceValues);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
       }
@@ -215,6 +286,18 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
       confidenceValues_.WriteTo(ref output, _repeated_confidenceValues_codec);
       identifiers_.WriteTo(ref output, _repeated_identifiers_codec);
       positions_.WriteTo(ref output, _repeated_positions_codec);
+      if (PackedPositions.Length != 0) {
+        output.WriteRawTag(42);
+        output.WriteBytes(PackedPositions);
+      }
+      if (PackedIdentifiers.Length != 0) {
+        output.WriteRawTag(50);
+        output.WriteBytes(PackedIdentifiers);
+      }
+      if (PackedConfidenceValues.Length != 0) {
+        output.WriteRawTag(58);
+        output.WriteBytes(PackedConfidenceValues);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(ref output);
       }
@@ -231,6 +314,15 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
       size += confidenceValues_.CalculateSize(_repeated_confidenceValues_codec);
       size += identifiers_.CalculateSize(_repeated_identifiers_codec);
       size += positions_.CalculateSize(_repeated_positions_codec);
+      if (PackedPositions.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(PackedPositions);
+      }
+      if (PackedIdentifiers.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(PackedIdentifiers);
+      }
+      if (PackedConfidenceValues.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(PackedConfidenceValues);
+      }
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
       }
@@ -252,6 +344,15 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
       confidenceValues_.Add(other.confidenceValues_);
       identifiers_.Add(other.identifiers_);
       positions_.Add(other.positions_);
+      if (other.PackedPositions.Length != 0) {
+        PackedPositions = other.PackedPositions;
+      }
+      if (other.PackedIdentifiers.Length != 0) {
+        PackedIdentifiers = other.PackedIdentifiers;
+      }
+      if (other.PackedConfidenceValues.Length != 0) {
+        PackedConfidenceValues = other.PackedConfidenceValues;
+      }
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
     }
 
@@ -292,6 +393,18 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
             positions_.AddEntriesFrom(input, _repeated_positions_codec);
             break;
           }
+          case 42: {
+            PackedPositions = input.ReadBytes();
+            break;
+          }
+          case 50: {
+            PackedIdentifiers = input.ReadBytes();
+            break;
+          }
+          case 58: {
+            PackedConfidenceValues = input.ReadBytes();
+            break;
+          }
         }
       }
     #endif
@@ -332,6 +445,18 @@ public sealed partial class ARPointCloud : pb::IMessage<ARPointCloud>
             positions_.AddEntriesFrom(ref input, _repeated_positions_codec);
             break;
           }
+          case 42: {
+            PackedPositions = input.ReadBytes();
+            break;
+          }
+          case 50: {
+            PackedIdentifiers = input.ReadBytes();
+            break;
+          }
+          case 58: {
+            PackedConfidenceValues = input.ReadBytes();
+            break;
+          }
         }
       }
     }
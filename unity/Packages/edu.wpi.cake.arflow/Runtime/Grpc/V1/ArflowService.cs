@@ -44,33 +44,38 @@ public static partial class ArflowServiceReflection {
             "d19ncnBjL3YxL3NhdmVfYXJfZnJhbWVzX3Jlc3BvbnNlLnByb3RvGj9jYWtl",
             "bGFiL2FyZmxvd19ncnBjL3YxL3NhdmVfc3luY2hyb25pemVkX2FyX2ZyYW1l",
             "X3JlcXVlc3QucHJvdG8aQGNha2VsYWIvYXJmbG93X2dycGMvdjEvc2F2ZV9z",
-            "eW5jaHJvbml6ZWRfYXJfZnJhbWVfcmVzcG9uc2UucHJvdG8yhgcKDUFSRmxv",
-            "d1NlcnZpY2USbAoNQ3JlYXRlU2Vzc2lvbhIsLmNha2VsYWIuYXJmbG93X2dy",
-            "cGMudjEuQ3JlYXRlU2Vzc2lvblJlcXVlc3QaLS5jYWtlbGFiLmFyZmxvd19n",
-            "cnBjLnYxLkNyZWF0ZVNlc3Npb25SZXNwb25zZRJsCg1EZWxldGVTZXNzaW9u",
-            "EiwuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5EZWxldGVTZXNzaW9uUmVxdWVz",
-            "dBotLmNha2VsYWIuYXJmbG93X2dycGMudjEuRGVsZXRlU2Vzc2lvblJlc3Bv",
-            "bnNlEmMKCkdldFNlc3Npb24SKS5jYWtlbGFiLmFyZmxvd19ncnBjLnYxLkdl",
-            "dFNlc3Npb25SZXF1ZXN0GiouY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5HZXRT",
-            "ZXNzaW9uUmVzcG9uc2USaQoMTGlzdFNlc3Npb25zEisuY2FrZWxhYi5hcmZs",
-            "b3dfZ3JwYy52MS5MaXN0U2Vzc2lvbnNSZXF1ZXN0GiwuY2FrZWxhYi5hcmZs",
-            "b3dfZ3JwYy52MS5MaXN0U2Vzc2lvbnNSZXNwb25zZRJmCgtKb2luU2Vzc2lv",
-            "bhIqLmNha2VsYWIuYXJmbG93X2dycGMudjEuSm9pblNlc3Npb25SZXF1ZXN0",
-            "GisuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5Kb2luU2Vzc2lvblJlc3BvbnNl",
-            "EmkKDExlYXZlU2Vzc2lvbhIrLmNha2VsYWIuYXJmbG93X2dycGMudjEuTGVh",
-            "dmVTZXNzaW9uUmVxdWVzdBosLmNha2VsYWIuYXJmbG93X2dycGMudjEuTGVh",
-            "dmVTZXNzaW9uUmVzcG9uc2USaQoMU2F2ZUFSRnJhbWVzEisuY2FrZWxhYi5h",
-            "cmZsb3dfZ3JwYy52MS5TYXZlQVJGcmFtZXNSZXF1ZXN0GiwuY2FrZWxhYi5h",
-            "cmZsb3dfZ3JwYy52MS5TYXZlQVJGcmFtZXNSZXNwb25zZRKKAQoXU2F2ZVN5",
-            "bmNocm9uaXplZEFSRnJhbWUSNi5jYWtlbGFiLmFyZmxvd19ncnBjLnYxLlNh",
-            "dmVTeW5jaHJvbml6ZWRBUkZyYW1lUmVxdWVzdBo3LmNha2VsYWIuYXJmbG93",
-            "X2dycGMudjEuU2F2ZVN5bmNocm9uaXplZEFSRnJhbWVSZXNwb25zZUKnAQoa",
-            "Y29tLmNha2VsYWIuYXJmbG93X2dycGMudjFCEkFyZmxvd1NlcnZpY2VQcm90",
-            "b1ABogIDQ0FYqgIWQ2FrZUxhYi5BUkZsb3cuR3JwYy5WMcoCFUNha2VsYWJc",
-            "QXJmbG93R3JwY1xWMeICIUNha2VsYWJcQXJmbG93R3JwY1xWMVxHUEJNZXRh",
-            "ZGF0YeoCF0Nha2VsYWI6OkFyZmxvd0dycGM6OlYxYgZwcm90bzM="));
+            "eW5jaHJvbml6ZWRfYXJfZnJhbWVfcmVzcG9uc2UucHJvdG8aNWNha2VsYWIv",
+            "YXJmbG93X2dycGMvdjEvc3RyZWFtX2FyX2ZyYW1lc19yZXF1ZXN0LnByb3Rv",
+            "GjZjYWtlbGFiL2FyZmxvd19ncnBjL3YxL3N0cmVhbV9hcl9mcmFtZXNfcmVz",
+            "cG9uc2UucHJvdG8y+wcKDUFSRmxvd1NlcnZpY2USbAoNQ3JlYXRlU2Vzc2lv",
+            "bhIsLmNha2VsYWIuYXJmbG93X2dycGMudjEuQ3JlYXRlU2Vzc2lvblJlcXVl",
+            "c3QaLS5jYWtlbGFiLmFyZmxvd19ncnBjLnYxLkNyZWF0ZVNlc3Npb25SZXNw",
+            "b25zZRJsCg1EZWxldGVTZXNzaW9uEiwuY2FrZWxhYi5hcmZsb3dfZ3JwYy52",
+            "MS5EZWxldGVTZXNzaW9uUmVxdWVzdBotLmNha2VsYWIuYXJmbG93X2dycGMu",
+            "djEuRGVsZXRlU2Vzc2lvblJlc3BvbnNlEmMKCkdldFNlc3Npb24SKS5jYWtl",
+            "bGFiLmFyZmxvd19ncnBjLnYxLkdldFNlc3Npb25SZXF1ZXN0GiouY2FrZWxh",
+            "Yi5hcmZsb3dfZ3JwYy52MS5HZXRTZXNzaW9uUmVzcG9uc2USaQoMTGlzdFNl",
+            "c3Npb25zEisuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5MaXN0U2Vzc2lvbnNS",
+            "ZXF1ZXN0GiwuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5MaXN0U2Vzc2lvbnNS",
+            "ZXNwb25zZRJmCgtKb2luU2Vzc2lvbhIqLmNha2VsYWIuYXJmbG93X2dycGMu",
+            "djEuSm9pblNlc3Npb25SZXF1ZXN0GisuY2FrZWxhYi5hcmZsb3dfZ3JwYy52",
+            "MS5Kb2luU2Vzc2lvblJlc3BvbnNlEmkKDExlYXZlU2Vzc2lvbhIrLmNha2Vs",
+            "YWIuYXJmbG93X2dycGMudjEuTGVhdmVTZXNzaW9uUmVxdWVzdBosLmNha2Vs",
+            "YWIuYXJmbG93X2dycGMudjEuTGVhdmVTZXNzaW9uUmVzcG9uc2USaQoMU2F2",
+            "ZUFSRnJhbWVzEisuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5TYXZlQVJGcmFt",
+            "ZXNSZXF1ZXN0GiwuY2FrZWxhYi5hcmZsb3dfZ3JwYy52MS5TYXZlQVJGcmFt",
+            "ZXNSZXNwb25zZRJzCg5TdHJlYW1BUkZyYW1lcxItLmNha2VsYWIuYXJmbG93",
+            "X2dycGMudjEuU3RyZWFtQVJGcmFtZXNSZXF1ZXN0Gi4uY2FrZWxhYi5hcmZs",
+            "b3dfZ3JwYy52MS5TdHJlYW1BUkZyYW1lc1Jlc3BvbnNlKAEwARKKAQoXU2F2",
+            "ZVN5bmNocm9uaXplZEFSRnJhbWUSNi5jYWtlbGFiLmFyZmxvd19ncnBjLnYx",
+            "LlNhdmVTeW5jaHJvbml6ZWRBUkZyYW1lUmVxdWVzdBo3LmNha2VsYWIuYXJm",
+            "bG93X2dycGMudjEuU2F2ZVN5bmNocm9uaXplZEFSRnJhbWVSZXNwb25zZUKn",
+            "AQoaY29tLmNha2VsYWIuYXJmbG93X2dycGMudjFCEkFyZmxvd1NlcnZpY2VQ",
+            "cm90b1ABogIDQ0FYqgIWQ2FrZUxhYi5BUkZsb3cuR3JwYy5WMcoCFUNha2Vs",
+            "YWJcQXJmbG93R3JwY1xWMeICIUNha2VsYWJcQXJmbG93R3JwY1xWMVxHUEJN",
+            "ZXRhZGF0YeoCF0Nha2VsYWI6OkFyZmxvd0dycGM6OlYxYgZwcm90bzM="));
       descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
-          new pbr::FileDescriptor[] { global::CakeLab.ARFlow.Grpc.V1.CreateSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.CreateSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.DeleteSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.DeleteSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.GetSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.GetSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.JoinSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.JoinSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.LeaveSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.LeaveSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.ListSessionsRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.ListSessionsResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.SaveArFramesRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.SaveArFramesResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedArFrameRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedArFrameResponseReflection.Descriptor, },
+          new pbr::FileDescriptor[] { global::CakeLab.ARFlow.Grpc.V1.CreateSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.CreateSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.DeleteSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.DeleteSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.GetSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.GetSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.JoinSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.JoinSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.LeaveSessionRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.LeaveSessionResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.ListSessionsRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.ListSessionsResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.SaveArFramesRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.SaveArFramesResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedArFrameRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedArFrameResponseReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.StreamArFramesRequestReflection.Descriptor, global::CakeLab.ARFlow.Grpc.V1.StreamArFramesResponseReflection.Descriptor, },
           new pbr::GeneratedClrTypeInfo(null, null, null));
     }
     #endregion
@@ -78,6 +78,10 @@ static class __Helper_MessageCache<T>
     [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
     static readonly grpc::Marshaller<global::CakeLab.ARFlow.Grpc.V1.SaveARFramesResponse> __Marshaller_cakelab_arflow_grpc_v1_SaveARFramesResponse = grpc::Marshallers.Create(__Helper_SerializeMessage, context => __Helper_DeserializeMessage(context, global::CakeLab.ARFlow.Grpc.V1.SaveARFramesResponse.Parser));
     [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
+    static readonly grpc::Marshaller<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesRequest> __Marshaller_cakelab_arflow_grpc_v1_StreamARFramesRequest = grpc::Marshallers.Create(__Helper_SerializeMessage, context => __Helper_DeserializeMessage(context, global::CakeLab.ARFlow.Grpc.V1.StreamARFramesRequest.Parser));
+    [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
+    static readonly grpc::Marshaller<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse> __Marshaller_cakelab_arflow_grpc_v1_StreamARFramesResponse = grpc::Marshallers.Create(__Helper_SerializeMessage, context => __Helper_DeserializeMessage(context, global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse.Parser));
+    [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
     static readonly grpc::Marshaller<global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameRequest> __Marshaller_cakelab_arflow_grpc_v1_SaveSynchronizedARFrameRequest = grpc::Marshallers.Create(__Helper_SerializeMessage, context => __Helper_DeserializeMessage(context, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameRequest.Parser));
     [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
     static readonly grpc::Marshaller<global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameResponse> __Marshaller_cakelab_arflow_grpc_v1_SaveSynchronizedARFrameResponse = grpc::Marshallers.Create(__Helper_SerializeMessage, context => __Helper_DeserializeMessage(context, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameResponse.Parser));
@@ -138,6 +142,14 @@ static class __Helper_MessageCache<T>
         __Marshaller_cakelab_arflow_grpc_v1_SaveARFramesRequest,
         __Marshaller_cakelab_arflow_grpc_v1_SaveARFramesResponse);
 
+    [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
+    static readonly grpc::Method<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesRequest, global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse> __Method_StreamARFrames = new grpc::Method<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesRequest, global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse>(
+        grpc::MethodType.DuplexStreaming,
+        __ServiceName,
+        "StreamARFrames",
+        __Marshaller_cakelab_arflow_grpc_v1_StreamARFramesRequest,
+        __Marshaller_cakelab_arflow_grpc_v1_StreamARFramesResponse);
+
     [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
     static readonly grpc::Method<global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameRequest, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameResponse> __Method_SaveSynchronizedARFrame = new grpc::Method<global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameRequest, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameResponse>(
         grpc::MethodType.Unary,
@@ -240,6 +252,21 @@ public abstract partial class ARFlowServiceBase
         throw new grpc::RpcException(new grpc::Status(grpc::StatusCode.Unimplemented, ""));
       }
 
+      /// <summary>
+      ///&#x2F; Stream AR frames from a device to its session's recording stream. The session and
+      ///&#x2F; device are bound once by the first request message. The server replies with an
+      ///&#x2F; initial credit grant and then with periodic acks that replenish the credits.
+      /// </summary>
+      /// <param name="requestStream">Used for reading requests from the client.</param>
+      /// <param name="responseStream">Used for sending responses back to the client.</param>
+      /// <param name="context">The context of the server-side call handler being invoked.</param>
+      /// <returns>A task indicating completion of the handler.</returns>
+      [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
+      public virtual global::System.Threading.Tasks.Task StreamARFrames(grpc::IAsyncStreamReader<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesRequest> requestStream, grpc::IServerStreamWriter<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse> responseStream, grpc::ServerCallContext context)
+      {
+        throw new grpc::RpcException(new grpc::Status(grpc::StatusCode.Unimplemented, ""));
+      }
+
       /// <summary>
       ///&#x2F; Save an synchronized AR frame from a device to its session's recording stream.
       ///&#x2F; This is our old approach and we're keeping this for benchmarking purposes.
@@ -619,6 +646,32 @@ protected ARFlowServiceClient(ClientBaseConfiguration configuration) : base(conf
         return CallInvoker.AsyncUnaryCall(__Method_SaveARFrames, null, options, request);
       }
       /// <summary>
+      ///&#x2F; Stream AR frames from a device to its session's recording stream. The session and
+      ///&#x2F; device are bound once by the first request message. The server replies with an
+      ///&#x2F; initial credit grant and then with periodic acks that replenish the credits.
+      /// </summary>
+      /// <param name="headers">The initial metadata to send with the call. This parameter is optional.</param>
+      /// <param name="deadline">An optional deadline for the call. The call will be cancelled if deadline is hit.</param>
+      /// <param name="cancellationToken">An optional token for canceling the call.</param>
+      /// <returns>The call object.</returns>
+      [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
+      public virtual grpc::AsyncDuplexStreamingCall<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesRequest, global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse> StreamARFrames(grpc::Metadata headers = null, global::System.DateTime? deadline = null, global::System.Threading.CancellationToken cancellationToken = default(global::System.Threading.CancellationToken))
+      {
+        return StreamARFrames(new grpc::CallOptions(headers, deadline, cancellationToken));
+      }
+      /// <summary>
+      ///&#x2F; Stream AR frames from a device to its session's recording stream. The session and
+      ///&#x2F; device are bound once by the first request message. The server replies with an
+      ///&#x2F; initial credit grant and then with periodic acks that replenish the credits.
+      /// </summary>
+      /// <param name="options">The options for the call.</param>
+      /// <returns>The call object.</returns>
+      [global::System.CodeDom.Compiler.GeneratedCode("grpc_csharp_plugin", null)]
+      public virtual grpc::AsyncDuplexStreamingCall<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesRequest, global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse> StreamARFrames(grpc::CallOptions options)
+      {
+        return CallInvoker.AsyncDuplexStreamingCall(__Method_StreamARFrames, null, options);
+      }
+      /// <summary>
       ///&#x2F; Save an synchronized AR frame from a device to its session's recording stream.
       ///&#x2F; This is our old approach and we're keeping this for benchmarking purposes.
       /// </summary>
@@ -691,6 +744,7 @@ protected override ARFlowServiceClient NewInstance(ClientBaseConfiguration confi
           .AddMethod(__Method_JoinSession, serviceImpl.JoinSession)
           .AddMethod(__Method_LeaveSession, serviceImpl.LeaveSession)
           .AddMethod(__Method_SaveARFrames, serviceImpl.SaveARFrames)
+          .AddMethod(__Method_StreamARFrames, serviceImpl.StreamARFrames)
           .AddMethod(__Method_SaveSynchronizedARFrame, serviceImpl.SaveSynchronizedARFrame).Build();
     }
 
@@ -708,6 +762,7 @@ public static void BindService(grpc::ServiceBinderBase serviceBinder, ARFlowServ
       serviceBinder.AddMethod(__Method_JoinSession, serviceImpl == null ? null : new grpc::UnaryServerMethod<global::CakeLab.ARFlow.Grpc.V1.JoinSessionRequest, global::CakeLab.ARFlow.Grpc.V1.JoinSessionResponse>(serviceImpl.JoinSession));
       serviceBinder.AddMethod(__Method_LeaveSession, serviceImpl == null ? null : new grpc::UnaryServerMethod<global::CakeLab.ARFlow.Grpc.V1.LeaveSessionRequest, global::CakeLab.ARFlow.Grpc.V1.LeaveSessionResponse>(serviceImpl.LeaveSession));
       serviceBinder.AddMethod(__Method_SaveARFrames, serviceImpl == null ? null : new grpc::UnaryServerMethod<global::CakeLab.ARFlow.Grpc.V1.SaveARFramesRequest, global::CakeLab.ARFlow.Grpc.V1.SaveARFramesResponse>(serviceImpl.SaveARFrames));
+      serviceBinder.AddMethod(__Method_StreamARFrames, serviceImpl == null ? null : new grpc::DuplexStreamingServerMethod<global::CakeLab.ARFlow.Grpc.V1.StreamARFramesRequest, global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse>(serviceImpl.StreamARFrames));
       serviceBinder.AddMethod(__Method_SaveSynchronizedARFrame, serviceImpl == null ? null : new grpc::UnaryServerMethod<global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameRequest, global::CakeLab.ARFlow.Grpc.V1.SaveSynchronizedARFrameResponse>(serviceImpl.SaveSynchronizedARFrame));
     }
 
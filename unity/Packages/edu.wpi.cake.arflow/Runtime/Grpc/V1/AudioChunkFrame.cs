@@ -0,0 +1,346 @@
+// <auto-generated>
+//     Generated by the protocol buffer compiler.  DO NOT EDIT!
+//     source: cakelab/arflow_grpc/v1/audio_chunk_frame.proto
+// </auto-generated>
+#pragma warning disable 1591, 0612, 3021, 8981
+#region Designer generated code
+
+using pb = global::Google.Protobuf;
+using pbc = global::Google.Protobuf.Collections;
+using pbr = global::Google.Protobuf.Reflection;
+using scg = global::System.Collections.Generic;
+namespace CakeLab.ARFlow.Grpc.V1 {
+
+  /// <summary>Holder for reflection information generated from cakelab/arflow_grpc/v1/audio_chunk_frame.proto</summary>
+  public static partial class AudioChunkFrameReflection {
+
+    #region Descriptor
+    /// <summary>File descriptor for cakelab/arflow_grpc/v1/audio_chunk_frame.proto</summary>
+    public static pbr::FileDescriptor Descriptor {
+      get { return descriptor; }
+    }
+    private static pbr::FileDescriptor descriptor;
+
+    static AudioChunkFrameReflection() {
+      byte[] descriptorData = global::System.Convert.FromBase64String(
+          string.Concat(
+            "Ci5jYWtlbGFiL2FyZmxvd19ncnBjL3YxL2F1ZGlvX2NodW5rX2ZyYW1lLnBy",
+            "b3RvEhZjYWtlbGFiLmFyZmxvd19ncnBjLnYxGh9nb29nbGUvcHJvdG9idWYv",
+            "dGltZXN0YW1wLnByb3RvIpMBCg9BdWRpb0NodW5rRnJhbWUSRQoQZGV2aWNl",
+            "X3RpbWVzdGFtcBgBIAEoCzIaLmdvb2dsZS5wcm90b2J1Zi5UaW1lc3RhbXBS",
+            "D2RldmljZVRpbWVzdGFtcBIfCgtzYW1wbGVfcmF0ZRgCIAEoDVIKc2FtcGxl",
+            "UmF0ZRIYCgdzYW1wbGVzGAMgASgMUgdzYW1wbGVzQqkBChpjb20uY2FrZWxh",
+            "Yi5hcmZsb3dfZ3JwYy52MUIUQXVkaW9DaHVua0ZyYW1lUHJvdG9QAaICA0NB",
+            "WKoCFkNha2VMYWIuQVJGbG93LkdycGMuVjHKAhVDYWtlbGFiXEFyZmxvd0dy",
+            "cGNcVjHiAiFDYWtlbGFiXEFyZmxvd0dycGNcVjFcR1BCTWV0YWRhdGHqAhdD",
+            "YWtlbGFiOjpBcmZsb3dHcnBjOjpWMWIGcHJvdG8z"));
+      descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
+          new pbr::FileDescriptor[] { global::Google.Protobuf.WellKnownTypes.TimestampReflection.Descriptor, },
+          new pbr::GeneratedClrTypeInfo(null, null, new pbr::GeneratedClrTypeInfo[] {
+            new pbr::GeneratedClrTypeInfo(typeof(global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame), global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrame.Parser, new[]{ "DeviceTimestamp", "SampleRate", "Samples" }, null, null, null, null)
+          }));
+    }
+    #endregion
+
+  }
+  #region Messages
+  /// <summary>
+  ///*
+  /// A chunk of audio samples packed into a byte array, in place of the `repeated float` of
+  /// `AudioFrame`, so that the server reads the chunk without touching its samples one by one.
+  /// </summary>
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class AudioChunkFrame : pb::IMessage<AudioChunkFrame>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<AudioChunkFrame> _parser = new pb::MessageParser<AudioChunkFrame>(() => new AudioChunkFrame());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<AudioChunkFrame> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::CakeLab.ARFlow.Grpc.V1.AudioChunkFrameReflection.Descriptor.MessageTypes[0]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public AudioChunkFrame() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public AudioChunkFrame(AudioChunkFrame other) : this() {
+      deviceTimestamp_ = other.deviceTimestamp_ != null ? other.deviceTimestamp_.Clone() : null;
+      sampleRate_ = other.sampleRate_;
+      samples_ = other.samples_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public AudioChunkFrame Clone() {
+      return new AudioChunkFrame(this);
+    }
+
+    /// <summary>Field number for the "device_timestamp" field.</summary>
+    public const int DeviceTimestampFieldNumber = 1;
+    private global::Google.Protobuf.WellKnownTypes.Timestamp deviceTimestamp_;
+    /// <summary>
+    ///&#x2F; Device timestamp of the first sample.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Google.Protobuf.WellKnownTypes.Timestamp DeviceTimestamp {
+      get { return deviceTimestamp_; }
+      set {
+        deviceTimestamp_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "sample_rate" field.</summary>
+    public const int SampleRateFieldNumber = 2;
+    private uint sampleRate_;
+    /// <summary>
+    ///&#x2F; Number of samples per second.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public uint SampleRate {
+      get { return sampleRate_; }
+      set {
+        sampleRate_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "samples" field.</summary>
+    public const int SamplesFieldNumber = 3;
+    private pb::ByteString samples_ = pb::ByteString.Empty;
+    /// <summary>
+    ///&#x2F; Mono samples as little-endian float32.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString Samples {
+      get { return samples_; }
+      set {
+        samples_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as AudioChunkFrame);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(AudioChunkFrame other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (!object.Equals(DeviceTimestamp, other.DeviceTimestamp)) return false;
+      if (SampleRate != other.SampleRate) return false;
+      if (Samples != other.Samples) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (deviceTimestamp_ != null) hash ^= DeviceTimestamp.GetHashCode();
+      if (SampleRate != 0) hash ^= SampleRate.GetHashCode();
+      if (Samples.Length != 0) hash ^= Samples.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (deviceTimestamp_ != null) {
+        output.WriteRawTag(10);
+        output.WriteMessage(DeviceTimestamp);
+      }
+      if (SampleRate != 0) {
+        output.WriteRawTag(16);
+        output.WriteUInt32(SampleRate);
+      }
+      if (Samples.Length != 0) {
+        output.WriteRawTag(26);
+        output.WriteBytes(Samples);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (deviceTimestamp_ != null) {
+        output.WriteRawTag(10);
+        output.WriteMessage(DeviceTimestamp);
+      }
+      if (SampleRate != 0) {
+        output.WriteRawTag(16);
+        output.WriteUInt32(SampleRate);
+      }
+      if (Samples.Length != 0) {
+        output.WriteRawTag(26);
+        output.WriteBytes(Samples);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (deviceTimestamp_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(DeviceTimestamp);
+      }
+      if (SampleRate != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeUInt32Size(SampleRate);
+      }
+      if (Samples.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(Samples);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(AudioChunkFrame other) {
+      if (other == null) {
+        return;
+      }
+      if (other.deviceTimestamp_ != null) {
+        if (deviceTimestamp_ == null) {
+          DeviceTimestamp = new global::Google.Protobuf.WellKnownTypes.Timestamp();
+        }
+        DeviceTimestamp.MergeFrom(other.DeviceTimestamp);
+      }
+      if (other.SampleRate != 0) {
+        SampleRate = other.SampleRate;
+      }
+      if (other.Samples.Length != 0) {
+        Samples = other.Samples;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+      if ((tag & 7) == 4) {
+        // Abort on any end group tag.
+        return;
+      }
+      switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            if (deviceTimestamp_ == null) {
+              DeviceTimestamp = new global::Google.Protobuf.WellKnownTypes.Timestamp();
+            }
+            input.ReadMessage(DeviceTimestamp);
+            break;
+          }
+          case 16: {
+            SampleRate = input.ReadUInt32();
+            break;
+          }
+          case 26: {
+            Samples = input.ReadBytes();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+      if ((tag & 7) == 4) {
+        // Abort on any end group tag.
+        return;
+      }
+      switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            if (deviceTimestamp_ == null) {
+              DeviceTimestamp = new global::Google.Protobuf.WellKnownTypes.Timestamp();
+            }
+            input.ReadMessage(DeviceTimestamp);
+            break;
+          }
+          case 16: {
+            SampleRate = input.ReadUInt32();
+            break;
+          }
+          case 26: {
+            Samples = input.ReadBytes();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  #endregion
+
+}
+
+#endregion Designer generated code
@@ -0,0 +1,297 @@
+// <auto-generated>
+//     Generated by the protocol buffer compiler.  DO NOT EDIT!
+//     source: cakelab/arflow_grpc/v1/imu_batch_frame.proto
+// </auto-generated>
+#pragma warning disable 1591, 0612, 3021, 8981
+#region Designer generated code
+
+using pb = global::Google.Protobuf;
+using pbc = global::Google.Protobuf.Collections;
+using pbr = global::Google.Protobuf.Reflection;
+using scg = global::System.Collections.Generic;
+namespace CakeLab.ARFlow.Grpc.V1 {
+
+  /// <summary>Holder for reflection information generated from cakelab/arflow_grpc/v1/imu_batch_frame.proto</summary>
+  public static partial class ImuBatchFrameReflection {
+
+    #region Descriptor
+    /// <summary>File descriptor for cakelab/arflow_grpc/v1/imu_batch_frame.proto</summary>
+    public static pbr::FileDescriptor Descriptor {
+      get { return descriptor; }
+    }
+    private static pbr::FileDescriptor descriptor;
+
+    static ImuBatchFrameReflection() {
+      byte[] descriptorData = global::System.Convert.FromBase64String(
+          string.Concat(
+            "CixjYWtlbGFiL2FyZmxvd19ncnBjL3YxL2ltdV9iYXRjaF9mcmFtZS5wcm90",
+            "bxIWY2FrZWxhYi5hcmZsb3dfZ3JwYy52MSJWCg1JbXVCYXRjaEZyYW1lEisK",
+            "EWRldmljZV90aW1lc3RhbXBzGAEgASgMUhBkZXZpY2VUaW1lc3RhbXBzEhgK",
+            "B3NhbXBsZXMYAiABKAxSB3NhbXBsZXNCpwEKGmNvbS5jYWtlbGFiLmFyZmxv",
+            "d19ncnBjLnYxQhJJbXVCYXRjaEZyYW1lUHJvdG9QAaICA0NBWKoCFkNha2VM",
+            "YWIuQVJGbG93LkdycGMuVjHKAhVDYWtlbGFiXEFyZmxvd0dycGNcVjHiAiFD",
+            "YWtlbGFiXEFyZmxvd0dycGNcVjFcR1BCTWV0YWRhdGHqAhdDYWtlbGFiOjpB",
+            "cmZsb3dHcnBjOjpWMWIGcHJvdG8z"));
+      descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
+          new pbr::FileDescriptor[] { },
+          new pbr::GeneratedClrTypeInfo(null, null, new pbr::GeneratedClrTypeInfo[] {
+            new pbr::GeneratedClrTypeInfo(typeof(global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame), global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrame.Parser, new[]{ "DeviceTimestamps", "Samples" }, null, null, null, null)
+          }));
+    }
+    #endregion
+
+  }
+  #region Messages
+  /// <summary>
+  ///*
+  /// Many gyroscope readings packed into two byte arrays, in place of one `GyroscopeFrame` per
+  /// reading, so that the server reads a whole batch without touching its readings one by one.
+  /// </summary>
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class ImuBatchFrame : pb::IMessage<ImuBatchFrame>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<ImuBatchFrame> _parser = new pb::MessageParser<ImuBatchFrame>(() => new ImuBatchFrame());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<ImuBatchFrame> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::CakeLab.ARFlow.Grpc.V1.ImuBatchFrameReflection.Descriptor.MessageTypes[0]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public ImuBatchFrame() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public ImuBatchFrame(ImuBatchFrame other) : this() {
+      deviceTimestamps_ = other.deviceTimestamps_;
+      samples_ = other.samples_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public ImuBatchFrame Clone() {
+      return new ImuBatchFrame(this);
+    }
+
+    /// <summary>Field number for the "device_timestamps" field.</summary>
+    public const int DeviceTimestampsFieldNumber = 1;
+    private pb::ByteString deviceTimestamps_ = pb::ByteString.Empty;
+    /// <summary>
+    ///&#x2F; Device timestamp of each reading, in nanoseconds since the Unix epoch, as little-endian int64.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString DeviceTimestamps {
+      get { return deviceTimestamps_; }
+      set {
+        deviceTimestamps_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "samples" field.</summary>
+    public const int SamplesFieldNumber = 2;
+    private pb::ByteString samples_ = pb::ByteString.Empty;
+    /// <summary>
+    ///*
+    /// 13 little-endian float32 per reading, in the order of `GyroscopeFrame`: attitude x, y, z, w,
+    /// rotation rate x, y, z, gravity x, y, z, and acceleration x, y, z.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString Samples {
+      get { return samples_; }
+      set {
+        samples_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as ImuBatchFrame);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(ImuBatchFrame other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (DeviceTimestamps != other.DeviceTimestamps) return false;
+      if (Samples != other.Samples) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (DeviceTimestamps.Length != 0) hash ^= DeviceTimestamps.GetHashCode();
+      if (Samples.Length != 0) hash ^= Samples.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (DeviceTimestamps.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteBytes(DeviceTimestamps);
+      }
+      if (Samples.Length != 0) {
+        output.WriteRawTag(18);
+        output.WriteBytes(Samples);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (DeviceTimestamps.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteBytes(DeviceTimestamps);
+      }
+      if (Samples.Length != 0) {
+        output.WriteRawTag(18);
+        output.WriteBytes(Samples);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (DeviceTimestamps.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(DeviceTimestamps);
+      }
+      if (Samples.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(Samples);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(ImuBatchFrame other) {
+      if (other == null) {
+        return;
+      }
+      if (other.DeviceTimestamps.Length != 0) {
+        DeviceTimestamps = other.DeviceTimestamps;
+      }
+      if (other.Samples.Length != 0) {
+        Samples = other.Samples;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+      if ((tag & 7) == 4) {
+        // Abort on any end group tag.
+        return;
+      }
+      switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            DeviceTimestamps = input.ReadBytes();
+            break;
+          }
+          case 18: {
+            Samples = input.ReadBytes();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+      if ((tag & 7) == 4) {
+        // Abort on any end group tag.
+        return;
+      }
+      switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            DeviceTimestamps = input.ReadBytes();
+            break;
+          }
+          case 18: {
+            Samples = input.ReadBytes();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  #endregion
+
+}
+
+#endregion Designer generated code
@@ -0,0 +1,290 @@
+// <auto-generated>
+//     Generated by the protocol buffer compiler.  DO NOT EDIT!
+//     source: cakelab/arflow_grpc/v1/stream_ar_frames_response.proto
+// </auto-generated>
+#pragma warning disable 1591, 0612, 3021, 8981
+#region Designer generated code
+
+using pb = global::Google.Protobuf;
+using pbc = global::Google.Protobuf.Collections;
+using pbr = global::Google.Protobuf.Reflection;
+using scg = global::System.Collections.Generic;
+namespace CakeLab.ARFlow.Grpc.V1 {
+
+  /// <summary>Holder for reflection information generated from cakelab/arflow_grpc/v1/stream_ar_frames_response.proto</summary>
+  public static partial class StreamArFramesResponseReflection {
+
+    #region Descriptor
+    /// <summary>File descriptor for cakelab/arflow_grpc/v1/stream_ar_frames_response.proto</summary>
+    public static pbr::FileDescriptor Descriptor {
+      get { return descriptor; }
+    }
+    private static pbr::FileDescriptor descriptor;
+
+    static StreamArFramesResponseReflection() {
+      byte[] descriptorData = global::System.Convert.FromBase64String(
+          string.Concat(
+            "CjZjYWtlbGFiL2FyZmxvd19ncnBjL3YxL3N0cmVhbV9hcl9mcmFtZXNfcmVz",
+            "cG9uc2UucHJvdG8SFmNha2VsYWIuYXJmbG93X2dycGMudjEiWQoWU3RyZWFt",
+            "QVJGcmFtZXNSZXNwb25zZRIlCg5hY2tlZF9tZXNzYWdlcxgBIAEoBFINYWNr",
+            "ZWRNZXNzYWdlcxIYCgdjcmVkaXRzGAIgASgNUgdjcmVkaXRzQrABChpjb20u",
+            "Y2FrZWxhYi5hcmZsb3dfZ3JwYy52MUIbU3RyZWFtQXJGcmFtZXNSZXNwb25z",
+            "ZVByb3RvUAGiAgNDQViqAhZDYWtlTGFiLkFSRmxvdy5HcnBjLlYxygIVQ2Fr",
+            "ZWxhYlxBcmZsb3dHcnBjXFYx4gIhQ2FrZWxhYlxBcmZsb3dHcnBjXFYxXEdQ",
+            "Qk1ldGFkYXRh6gIXQ2FrZWxhYjo6QXJmbG93R3JwYzo6VjFiBnByb3RvMw=="));
+      descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
+          new pbr::FileDescriptor[] { },
+          new pbr::GeneratedClrTypeInfo(null, null, new pbr::GeneratedClrTypeInfo[] {
+            new pbr::GeneratedClrTypeInfo(typeof(global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse), global::CakeLab.ARFlow.Grpc.V1.StreamARFramesResponse.Parser, new[]{ "AckedMessages", "Credits" }, null, null, null, null)
+          }));
+    }
+    #endregion
+
+  }
+  #region Messages
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class StreamARFramesResponse : pb::IMessage<StreamARFramesResponse>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<StreamARFramesResponse> _parser = new pb::MessageParser<StreamARFramesResponse>(() => new StreamARFramesResponse());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<StreamARFramesResponse> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::CakeLab.ARFlow.Grpc.V1.StreamArFramesResponseReflection.Descriptor.MessageTypes[0]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public StreamARFramesResponse() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public StreamARFramesResponse(StreamARFramesResponse other) : this() {
+      ackedMessages_ = other.ackedMessages_;
+      credits_ = other.credits_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public StreamARFramesResponse Clone() {
+      return new StreamARFramesResponse(this);
+    }
+
+    /// <summary>Field number for the "acked_messages" field.</summary>
+    public const int AckedMessagesFieldNumber = 1;
+    private ulong ackedMessages_;
+    /// <summary>
+    ///&#x2F; Total number of request messages processed on this stream so far.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public ulong AckedMessages {
+      get { return ackedMessages_; }
+      set {
+        ackedMessages_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "credits" field.</summary>
+    public const int CreditsFieldNumber = 2;
+    private uint credits_;
+    /// <summary>
+    ///&#x2F; Number of additional request messages the client may send before waiting for the next response.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public uint Credits {
+      get { return credits_; }
+      set {
+        credits_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as StreamARFramesResponse);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(StreamARFramesResponse other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (AckedMessages != other.AckedMessages) return false;
+      if (Credits != other.Credits) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (AckedMessages != 0UL) hash ^= AckedMessages.GetHashCode();
+      if (Credits != 0) hash ^= Credits.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (AckedMessages != 0UL) {
+        output.WriteRawTag(8);
+        output.WriteUInt64(AckedMessages);
+      }
+      if (Credits != 0) {
+        output.WriteRawTag(16);
+        output.WriteUInt32(Credits);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (AckedMessages != 0UL) {
+        output.WriteRawTag(8);
+        output.WriteUInt64(AckedMessages);
+      }
+      if (Credits != 0) {
+        output.WriteRawTag(16);
+        output.WriteUInt32(Credits);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (AckedMessages != 0UL) {
+        size += 1 + pb::CodedOutputStream.ComputeUInt64Size(AckedMessages);
+      }
+      if (Credits != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeUInt32Size(Credits);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(StreamARFramesResponse other) {
+      if (other == null) {
+        return;
+      }
+      if (other.AckedMessages != 0UL) {
+        AckedMessages = other.AckedMessages;
+      }
+      if (other.Credits != 0) {
+        Credits = other.Credits;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+      if ((tag & 7) == 4) {
+        // Abort on any end group tag.
+        return;
+      }
+      switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 8: {
+            AckedMessages = input.ReadUInt64();
+            break;
+          }
+          case 16: {
+            Credits = input.ReadUInt32();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+      if ((tag & 7) == 4) {
+        // Abort on any end group tag.
+        return;
+      }
+      switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 8: {
+            AckedMessages = input.ReadUInt64();
+            break;
+          }
+          case 16: {
+            Credits = input.ReadUInt32();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  #endregion
+
+}
+
+#endregion Designer generated code